@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+EventBus Pipeline Latency Benchmark
+
+Measures end-to-end latency of a candle -> indicators -> signal -> order chain
+where each stage is an EventBus handler publishing the next event. Compares:
+- polling: the previous dispatcher, which slept 10ms whenever the queue was empty
+- event-driven: the current dispatcher, woken by publish()
+
+Candles arrive at a fixed interval, as they would from the exchange feed, so
+the dispatcher is idle between candles.
+
+Usage:
+    python scripts/benchmarks/event_bus_latency.py
+    python scripts/benchmarks/event_bus_latency.py --candles 500 --interval-ms 5
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.core.constants import EventType  # noqa: E402
+from src.core.events import Event, EventBus, EventHandler, EventPartition  # noqa: E402
+
+PIPELINE = [
+    EventType.CANDLE_RECEIVED,
+    EventType.INDICATORS_UPDATED,
+    EventType.SIGNAL_GENERATED,
+    EventType.ORDER_PLACED,
+]
+
+
+class PollingEventBus(EventBus):
+    """EventBus with the previous sleep-polling dispatcher loop."""
+
+    async def _dispatch_loop(self, partition: EventPartition) -> None:
+        while self._running:
+            if partition.queue.empty():
+                await asyncio.sleep(0.01)
+                continue
+            event, _ = partition.queue.pop_nowait()
+            self._queued -= 1
+            await self._dispatch_event(event)
+
+
+class ForwardingHandler(EventHandler):
+    """Publishes the next pipeline event, carrying the candle start time."""
+
+    def __init__(self, bus: EventBus, next_type: EventType):
+        super().__init__(f"Forward-{next_type.value}")
+        self.bus = bus
+        self.next_type = next_type
+
+    async def handle(self, event: Event) -> None:
+        await self.bus.publish(Event(priority=5, event_type=self.next_type, data=event.data))
+
+
+class SinkHandler(EventHandler):
+    """Records end-to-end latency of the final pipeline stage."""
+
+    def __init__(self):
+        super().__init__("Sink")
+        self.latencies_ms: List[float] = []
+
+    async def handle(self, event: Event) -> None:
+        self.latencies_ms.append((time.perf_counter() - event.data["started_at"]) * 1000)
+
+
+def percentile(values: List[float], q: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(q / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+async def measure(bus: EventBus, candles: int, interval_ms: float) -> List[float]:
+    for current, following in zip(PIPELINE, PIPELINE[1:]):
+        bus.subscribe(current, ForwardingHandler(bus, following))
+    sink = SinkHandler()
+    bus.subscribe(PIPELINE[-1], sink)
+
+    await bus.start()
+    for _ in range(candles):
+        await bus.publish(
+            Event(
+                priority=5,
+                event_type=PIPELINE[0],
+                data={"started_at": time.perf_counter()},
+            )
+        )
+        await asyncio.sleep(interval_ms / 1000)
+
+    deadline = time.perf_counter() + 5
+    while len(sink.latencies_ms) < candles and time.perf_counter() < deadline:
+        await asyncio.sleep(0.01)
+    await bus.stop()
+    return sink.latencies_ms
+
+
+async def run(candles: int, interval_ms: float) -> None:
+    print(
+        f"End-to-end latency, {len(PIPELINE) - 1} hops, {candles} candles " f"every {interval_ms}ms"
+    )
+    print(f"{'dispatcher':>14} {'p50 ms':>9} {'p99 ms':>9} {'mean ms':>9}")
+
+    for name, bus in (("polling", PollingEventBus()), ("event-driven", EventBus())):
+        latencies = await measure(bus, candles, interval_ms)
+        print(
+            f"{name:>14} {percentile(latencies, 50):>9.3f} {percentile(latencies, 99):>9.3f} "
+            f"{statistics.mean(latencies):>9.3f}"
+        )
+        if name == "event-driven":
+            stats = bus.get_stats()["latency"]
+            print(f"  publish->dispatch: {stats['publish_to_dispatch']}")
+            print(f"  dispatch->done:    {stats['dispatch_to_done']}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark EventBus pipeline latency")
+    parser.add_argument("--candles", type=int, default=200)
+    parser.add_argument("--interval-ms", type=float, default=23.0)
+    args = parser.parse_args()
+
+    asyncio.run(run(args.candles, args.interval_ms))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Liquidity Sweep Detection Microbenchmark
+
+Compares the previous candles x levels x candidates scan in
+LiquiditySweepDetector.detect_sweeps with the price-indexed implementation:
+- scan: every candle tests every active level, and every level is compared
+  field by field against every pending candidate
+- indexed: each candle bisects per-side price-sorted levels for the breach
+  band, and candidates are looked up by level id
+
+Usage:
+    python scripts/benchmarks/liquidity_sweep.py
+    python scripts/benchmarks/liquidity_sweep.py --levels 50 200 1000 --candles 500
+"""
+
+import argparse
+import logging
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.core.constants import TimeFrame  # noqa: E402
+from src.indicators.liquidity_sweep import LiquiditySweep, LiquiditySweepDetector  # noqa: E402
+from src.indicators.liquidity_zone import (  # noqa: E402
+    LiquidityLevel,
+    LiquidityState,
+    LiquidityType,
+)
+from src.models.candle import Candle  # noqa: E402
+
+PIP_SIZE = 0.01
+
+
+class ScanSweepDetector(LiquiditySweepDetector):
+    """Previous implementation of detect_sweeps."""
+
+    def detect_sweeps(self, candles, liquidity_levels, start_index=0):
+        sweeps_detected = []
+        active_levels = [
+            level
+            for level in liquidity_levels
+            if level.state in (LiquidityState.ACTIVE, LiquidityState.PARTIAL)
+        ]
+        for i in range(start_index, len(candles)):
+            candle = candles[i]
+            for level in active_levels:
+                if level.origin_candle_index >= i:
+                    continue
+                if any(c.level == level for c in self._candidates):
+                    continue
+                candidate = self._check_breach(candle, level, i)
+                if candidate:
+                    self._candidates.append(candidate)
+                    self._candidate_ids[level.level_id] = candidate
+            self._update_candidates(candle, i, candles)
+            sweeps_detected.extend(self._check_completions())
+        self._cleanup_candidates(len(candles) - 1)
+        return sweeps_detected
+
+
+def generate_candles(count: int, seed: int = 7) -> List[Candle]:
+    """Generate a reproducible random-walk candle series around 100."""
+    rnd = random.Random(seed)
+    price = 100.0
+    candles = []
+    for i in range(count):
+        open_price = price
+        close = max(1.0, open_price + rnd.gauss(0, 0.08))
+        candles.append(
+            Candle(
+                symbol="BTCUSDT",
+                timeframe=TimeFrame.M1,
+                timestamp=1704067200000 + i * 60000,
+                open=open_price,
+                high=max(open_price, close) + abs(rnd.gauss(0, 0.04)),
+                low=min(open_price, close) - abs(rnd.gauss(0, 0.04)),
+                close=close,
+                volume=rnd.uniform(1, 100),
+                is_closed=True,
+            )
+        )
+        price = close
+    return candles
+
+
+def generate_levels(count: int, candles: List[Candle], seed: int = 11) -> List[LiquidityLevel]:
+    """Generate distinct levels spread over the traded price range."""
+    rnd = random.Random(seed)
+    low = min(c.low for c in candles)
+    high = max(c.high for c in candles)
+    levels = {}
+    while len(levels) < count:
+        origin = rnd.randrange(0, len(candles) // 4)
+        level = LiquidityLevel(
+            type=rnd.choice([LiquidityType.BUY_SIDE, LiquidityType.SELL_SIDE]),
+            price=round(rnd.uniform(low, high), 2),
+            origin_timestamp=candles[origin].timestamp,
+            origin_candle_index=origin,
+            symbol="BTCUSDT",
+            timeframe=TimeFrame.M1,
+        )
+        levels.setdefault(level.level_id, level)
+    return list(levels.values())
+
+
+def fresh_levels(levels: List[LiquidityLevel]) -> List[LiquidityLevel]:
+    """Copy levels so each run starts with every level active."""
+    return [
+        LiquidityLevel(
+            type=lvl.type,
+            price=lvl.price,
+            origin_timestamp=lvl.origin_timestamp,
+            origin_candle_index=lvl.origin_candle_index,
+            symbol=lvl.symbol,
+            timeframe=lvl.timeframe,
+        )
+        for lvl in levels
+    ]
+
+
+def detect(detector_class, candles, levels) -> List[LiquiditySweep]:
+    detector = detector_class(pip_size=PIP_SIZE, min_reversal_strength=0.0)
+    return detector.detect_sweeps(candles, levels)
+
+
+def time_call(func: Callable[[], None], repeat: int) -> float:
+    """Return the best wall time of one call in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def run(level_counts: List[int], candle_count: int, repeat: int) -> None:
+    candles = generate_candles(candle_count)
+    print(f"detect_sweeps over {candle_count} candles (best of {repeat})")
+    print(f"{'levels':>8} {'sweeps':>8} {'scan ms':>10} {'indexed ms':>11} {'speedup':>8}")
+
+    for count in level_counts:
+        levels = generate_levels(count, candles)
+
+        # Sanity check: both implementations find the same sweeps
+        expected = detect(ScanSweepDetector, candles, fresh_levels(levels))
+        actual = detect(LiquiditySweepDetector, candles, fresh_levels(levels))
+        assert [s.to_dict() for s in actual] == [s.to_dict() for s in expected]
+
+        copies = [fresh_levels(levels) for _ in range(2 * repeat)]
+        scan_ms = time_call(lambda: detect(ScanSweepDetector, candles, copies.pop()), repeat)
+        indexed_ms = time_call(
+            lambda: detect(LiquiditySweepDetector, candles, copies.pop()), repeat
+        )
+
+        print(
+            f"{count:>8} {len(expected):>8} {scan_ms:>10.2f} {indexed_ms:>11.2f} "
+            f"{scan_ms / indexed_ms:>7.1f}x"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark liquidity sweep detection")
+    parser.add_argument("--levels", type=int, nargs="+", default=[50, 200, 1000])
+    parser.add_argument("--candles", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    run(args.levels, args.candles, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+SQLite Mixed Read/Write Load Benchmark
+
+Simulates live trading writes (position mark-to-market updates and closed
+trades) running alongside API dashboard clients that poll strategy P&L and
+open positions. Compares the SQLite profiles of database.engine:
+- default: a fresh connection per session, rollback journal
+- performance: one pooled writer connection and a read-only pool, WAL mode,
+  tuned synchronous/cache_size/mmap_size and prepared-statement caching
+
+Writes use get_session() and dashboard queries use get_read_session(), as
+the application does. Each profile runs on a new database file seeded with
+the same trade history.
+
+Usage:
+    python scripts/benchmarks/sqlite_mixed_load.py
+    python scripts/benchmarks/sqlite_mixed_load.py --duration 20 --readers 8 --trades 50000
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from pathlib import Path
+from typing import Dict, List
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.core.constants import TimeFrame  # noqa: E402
+from src.database import engine as db_engine  # noqa: E402
+from src.database.dao import PositionDAO, TradeDAO  # noqa: E402
+
+STRATEGIES = ["MACD", "ICT", "RSI", "BREAKOUT"]
+SYMBOLS = ["BTCUSDT", "ETHUSDT", "SOLUSDT", "BNBUSDT", "XRPUSDT"]
+
+
+def make_trade(rng: random.Random, exit_time: datetime) -> Dict:
+    entry_price = Decimal(str(round(rng.uniform(100, 50000), 2)))
+    pnl = Decimal(str(round(rng.gauss(5, 50), 2)))
+    return {
+        "symbol": rng.choice(SYMBOLS),
+        "strategy": rng.choice(STRATEGIES),
+        "timeframe": TimeFrame.M15,
+        "entry_time": exit_time - timedelta(minutes=rng.randint(5, 600)),
+        "entry_price": entry_price,
+        "exit_time": exit_time,
+        "exit_price": entry_price + pnl,
+        "quantity": Decimal("0.1"),
+        "leverage": 1,
+        "side": rng.choice(["LONG", "SHORT"]),
+        "pnl": pnl,
+        "fees": Decimal("0.5"),
+        "status": "CLOSED",
+        "exit_reason": "TP" if pnl > 0 else "SL",
+    }
+
+
+async def seed(trades: int, positions: int) -> List[int]:
+    rng = random.Random(7)
+    now = datetime.now(timezone.utc)
+    async with db_engine.get_session() as session:
+        await TradeDAO(session).import_trades(
+            [make_trade(rng, now - timedelta(minutes=i)) for i in range(trades)]
+        )
+        created = await PositionDAO(session).bulk_insert(
+            [
+                {
+                    "symbol": SYMBOLS[i % len(SYMBOLS)],
+                    "strategy": STRATEGIES[i % len(STRATEGIES)],
+                    "timeframe": TimeFrame.M15,
+                    "side": "LONG",
+                    "size": Decimal("0.1"),
+                    "entry_price": Decimal("1000"),
+                    "current_price": Decimal("1000"),
+                    "leverage": 1,
+                    "status": "OPEN",
+                    "opened_at": now,
+                }
+                for i in range(positions)
+            ]
+        )
+        return [position.id for position in created]
+
+
+def percentile(values: List[float], q: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(q / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+async def trading_writer(
+    position_ids: List[int], interval_ms: float, stop_at: float, latencies: List[float]
+) -> None:
+    """Mark positions to market every tick and close a trade every tenth tick."""
+    rng = random.Random(11)
+    tick = 0
+    while time.perf_counter() < stop_at:
+        started = time.perf_counter()
+        async with db_engine.get_session() as session:
+            position_dao = PositionDAO(session)
+            for position_id in position_ids:
+                price = Decimal(str(round(1000 + rng.gauss(0, 10), 2)))
+                await position_dao.update_unrealized_pnl(position_id, price)
+            if tick % 10 == 0:
+                await TradeDAO(session).import_trades([make_trade(rng, datetime.now(timezone.utc))])
+        latencies.append((time.perf_counter() - started) * 1000)
+        tick += 1
+        await asyncio.sleep(max(0.0, interval_ms / 1000 - (time.perf_counter() - started)))
+
+
+async def dashboard_reader(seed_value: int, stop_at: float, latencies: List[float]) -> None:
+    """Poll the dashboard queries back to back."""
+    rng = random.Random(seed_value)
+    since = datetime.now(timezone.utc) - timedelta(days=30)
+    while time.perf_counter() < stop_at:
+        started = time.perf_counter()
+        async with db_engine.get_read_session() as session:
+            await TradeDAO(session).calculate_strategy_pnl(rng.choice(STRATEGIES), since)
+            await PositionDAO(session).get_current_positions()
+        latencies.append((time.perf_counter() - started) * 1000)
+        await asyncio.sleep(0)
+
+
+async def measure(profile: str, args: argparse.Namespace) -> Dict[str, List[float]]:
+    with tempfile.TemporaryDirectory() as directory:
+        url = f"sqlite+aiosqlite:///{Path(directory) / 'bench.db'}"
+        await db_engine.init_db(url, sqlite_profile=profile)
+        try:
+            position_ids = await seed(args.trades, args.positions)
+            writes: List[float] = []
+            reads: List[float] = []
+            stop_at = time.perf_counter() + args.duration
+            await asyncio.gather(
+                trading_writer(position_ids, args.write_interval_ms, stop_at, writes),
+                *(dashboard_reader(i, stop_at, reads) for i in range(args.readers)),
+            )
+        finally:
+            await db_engine.close_db()
+    return {"write": writes, "read": reads}
+
+
+async def run(args: argparse.Namespace) -> None:
+    print(
+        f"{args.duration}s mixed load: {args.positions} positions marked every "
+        f"{args.write_interval_ms}ms, {args.readers} dashboard readers, "
+        f"{args.trades} seeded trades"
+    )
+    print(
+        f"{'profile':>12} {'op':>6} {'ops/s':>8} {'p50 ms':>9} {'p95 ms':>9} "
+        f"{'p99 ms':>9} {'mean ms':>9}"
+    )
+    for profile in ("default", "performance"):
+        results = await measure(profile, args)
+        for op, latencies in results.items():
+            if not latencies:
+                print(f"{profile:>12} {op:>6} {'no operations completed':>30}")
+                continue
+            print(
+                f"{profile:>12} {op:>6} {len(latencies) / args.duration:>8.1f} "
+                f"{percentile(latencies, 50):>9.2f} {percentile(latencies, 95):>9.2f} "
+                f"{percentile(latencies, 99):>9.2f} {statistics.mean(latencies):>9.2f}"
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark SQLite profiles under mixed load")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds per profile")
+    parser.add_argument("--readers", type=int, default=4, help="Concurrent dashboard clients")
+    parser.add_argument("--positions", type=int, default=10, help="Open positions to update")
+    parser.add_argument("--trades", type=int, default=20000, help="Seeded trade history")
+    parser.add_argument("--write-interval-ms", type=float, default=100.0)
+    args = parser.parse_args()
+
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Swing Detection Microbenchmark
+
+Compares the previous per-detector loop implementation of swing high/low
+detection with the shared vectorized kernel:
+- loop: nested all() scan, run once per detector (Order Block, Liquidity, Trend)
+- kernel: vectorized scan over candles converted to arrays, once per detector
+- cached: buffer-backed candles, computed once and shared by all detectors
+
+Usage:
+    python scripts/benchmarks/swing_detection.py
+    python scripts/benchmarks/swing_detection.py --sizes 500 1000 5000 --lookback 3
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.core.constants import TimeFrame  # noqa: E402
+from src.indicators.swing_kernel import clear_swing_cache, get_swing_indices  # noqa: E402
+from src.models.candle import Candle  # noqa: E402
+from src.models.candle_buffer import CandleBuffer  # noqa: E402
+
+DETECTORS_PER_UPDATE = 3
+
+
+def generate_candles(count: int, seed: int = 7) -> List[Candle]:
+    """Generate a reproducible random-walk candle series."""
+    rnd = random.Random(seed)
+    price = 40000.0
+    candles = []
+    for i in range(count):
+        open_price = price
+        close = max(1.0, open_price + rnd.gauss(0, 25))
+        candles.append(
+            Candle(
+                symbol="BTCUSDT",
+                timeframe=TimeFrame.M1,
+                timestamp=1704067200000 + i * 60000,
+                open=open_price,
+                high=max(open_price, close) + abs(rnd.gauss(0, 10)),
+                low=min(open_price, close) - abs(rnd.gauss(0, 10)),
+                close=close,
+                volume=rnd.uniform(1, 100),
+                is_closed=True,
+            )
+        )
+        price = close
+    return candles
+
+
+def loop_swings(candles: List[Candle], lookback: int):
+    """Previous implementation: nested all() scans for highs and lows."""
+    highs, lows = [], []
+    for i in range(lookback, len(candles) - lookback):
+        current_high = candles[i].high
+        if all(current_high > candles[j].high for j in range(i - lookback, i)) and all(
+            current_high > candles[j].high for j in range(i + 1, i + lookback + 1)
+        ):
+            highs.append(i)
+        current_low = candles[i].low
+        if all(current_low < candles[j].low for j in range(i - lookback, i)) and all(
+            current_low < candles[j].low for j in range(i + 1, i + lookback + 1)
+        ):
+            lows.append(i)
+    return highs, lows
+
+
+def time_update(func: Callable[[], None], repeat: int) -> float:
+    """Return the best wall time of one update in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def run(sizes: List[int], lookback: int, repeat: int) -> None:
+    print(
+        f"Swing detection per update ({DETECTORS_PER_UPDATE} detectors, "
+        f"lookback={lookback}, best of {repeat})"
+    )
+    print(f"{'candles':>8} {'loop ms':>10} {'kernel ms':>10} {'cached ms':>10} {'speedup':>8}")
+
+    for size in sizes:
+        candles = generate_candles(size)
+        buffer = CandleBuffer(size, keep_objects=True)
+        for candle in candles:
+            buffer.append(candle)
+        snapshot = buffer.snapshot()
+
+        # Sanity check: all implementations agree
+        expected = loop_swings(candles, lookback)
+        kernel_result = get_swing_indices(candles, lookback)
+        assert [r.tolist() for r in kernel_result] == list(expected)
+
+        def loop_update():
+            for _ in range(DETECTORS_PER_UPDATE):
+                loop_swings(candles, lookback)
+
+        def kernel_update():
+            for _ in range(DETECTORS_PER_UPDATE):
+                get_swing_indices(candles, lookback)
+
+        def cached_update():
+            clear_swing_cache()
+            for _ in range(DETECTORS_PER_UPDATE):
+                get_swing_indices(snapshot, lookback)
+
+        loop_ms = time_update(loop_update, repeat)
+        kernel_ms = time_update(kernel_update, repeat)
+        cached_ms = time_update(cached_update, repeat)
+
+        print(
+            f"{size:>8} {loop_ms:>10.3f} {kernel_ms:>10.3f} {cached_ms:>10.3f} "
+            f"{loop_ms / cached_ms:>7.1f}x"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark swing point detection")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[500, 1000, 5000])
+    parser.add_argument("--lookback", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    run(args.sizes, args.lookback, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
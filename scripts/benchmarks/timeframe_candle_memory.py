@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Candle Retention Memory Benchmark
+
+Measures the memory held per retained candle and the cost of reading the
+candle window after each append for:
+- list: a plain List[Candle] window
+- timeframe: TimeframeData (List[Candle] trimmed in place)
+- columns: CandleBuffer without objects, as used by CandleStorage
+
+Usage:
+    python scripts/benchmarks/timeframe_candle_memory.py
+    python scripts/benchmarks/timeframe_candle_memory.py --sizes 1000 5000 --repeat 200
+"""
+
+import argparse
+import gc
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, List
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.core.constants import TimeFrame  # noqa: E402
+from src.indicators.multi_timeframe_engine import TimeframeData  # noqa: E402
+from src.models.candle import Candle  # noqa: E402
+from src.models.candle_buffer import CandleBuffer  # noqa: E402
+
+
+def generate_candles(count: int, seed: int = 7) -> List[Candle]:
+    """Generate a reproducible random-walk candle series."""
+    rnd = random.Random(seed)
+    price = 40000.0
+    candles = []
+    for i in range(count):
+        open_price = price
+        close = max(1.0, open_price + rnd.gauss(0, 25))
+        candles.append(
+            Candle(
+                symbol="BTCUSDT",
+                timeframe=TimeFrame.M1,
+                timestamp=1704067200000 + i * 60000,
+                open=open_price,
+                high=max(open_price, close) + abs(rnd.gauss(0, 10)),
+                low=min(open_price, close) - abs(rnd.gauss(0, 10)),
+                close=close,
+                volume=rnd.uniform(1, 100),
+                is_closed=True,
+            )
+        )
+        price = close
+    return candles
+
+
+def retained_bytes(build: Callable[[], object]) -> int:
+    """Return the bytes still allocated by the object build() returns."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    holder = build()  # noqa: F841 - keeps the built object alive while measuring
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return after - before
+
+
+def read_after_append_us(data: TimeframeData, candles: List[Candle], repeat: int) -> float:
+    """Return the mean time of append + candles read in microseconds."""
+    start = time.perf_counter()
+    for candle in candles[:repeat]:
+        data.add_candle(candle)
+        data.candles
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def run(sizes: List[int], repeat: int) -> None:
+    print("Retained memory per candle (bytes) and append + window read per update")
+    print(f"{'candles':>8} {'list B':>8} {'timeframe B':>12} {'columns B':>10} {'update us':>10}")
+
+    for size in sizes:
+        # Fresh candles for every structure so the objects themselves are counted
+        def build_list():
+            return generate_candles(size)
+
+        def build_timeframe():
+            data = TimeframeData(timeframe=TimeFrame.M1, max_candles=size)
+            for candle in generate_candles(size):
+                data.add_candle(candle)
+            return data
+
+        def build_columns():
+            buffer = CandleBuffer(size, timeframe=TimeFrame.M1)
+            for candle in generate_candles(size):
+                buffer.append(candle)
+            return buffer
+
+        list_bytes = retained_bytes(build_list) / size
+        timeframe_bytes = retained_bytes(build_timeframe) / size
+        column_bytes = retained_bytes(build_columns) / size
+
+        data = build_timeframe()
+        extra = generate_candles(size + repeat)[size:]
+        update_us = read_after_append_us(data, extra, repeat)
+
+        print(
+            f"{size:>8} {list_bytes:>8.0f} {timeframe_bytes:>12.0f} {column_bytes:>10.0f} "
+            f"{update_us:>10.1f}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark candle retention memory")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[500, 1000, 5000])
+    parser.add_argument("--repeat", type=int, default=500)
+    args = parser.parse_args()
+
+    run(args.sizes, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
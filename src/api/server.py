@@ -16,6 +16,7 @@ from fastapi import (
     Depends,
     FastAPI,
     HTTPException,
+    Query,
     Security,
     WebSocket,
     WebSocketDisconnect,
@@ -25,6 +26,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse, Response
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from pydantic import BaseModel, Field
+from sqlalchemy import text
 
 from src.api.logging_middleware import LoggingMiddleware
 from src.api.middleware import SecurityHeadersMiddleware, configure_security_middleware
@@ -34,6 +36,7 @@ from src.core.events import EventBus
 from src.core.metrics import MetricsCollector, MonitoringSystem
 from src.core.orchestrator import TradingSystemOrchestrator
 from src.core.security import SecurityManager
+from src.database.dao import DailyPnLDAO, TradeDAO
 
 logger = logging.getLogger(__name__)
 
@@ -382,10 +385,11 @@ async def readiness_check() -> HealthResponse:
 
         # Check database connectivity
         try:
-            from src.database.engine import get_session
+            from src.database.engine import get_read_session
 
-            async with get_session() as session:
-                await session.execute("SELECT 1")
+            # Probe on the read pool so readiness never queues behind trading writes
+            async with get_read_session() as session:
+                await session.execute(text("SELECT 1"))
             components["database"] = "healthy"
         except Exception as db_error:
             logger.error(f"Database readiness check failed: {db_error}")
@@ -987,6 +991,81 @@ async def get_component_metrics(
         )
 
 
+# ============================================================================
+# Performance Endpoints
+# ============================================================================
+# Dashboard queries use read sessions, which run on the read-only connection
+# pool of the SQLite performance profile instead of the single writer
+
+
+@app.get(
+    "/api/strategies/{strategy}/pnl",
+    summary="Strategy P&L",
+    description="Get P&L statistics of a strategy's closed trades",
+    tags=["Performance"],
+)
+async def get_strategy_pnl(
+    strategy: str,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    _user: Dict[str, Any] = Depends(verify_token),
+) -> Dict[str, Any]:
+    """
+    Get P&L statistics of a strategy.
+
+    Args:
+        strategy: Strategy name
+        start_date: Only include trades closed at or after this time
+        end_date: Only include trades closed at or before this time
+    """
+    from src.database.engine import get_read_session
+
+    try:
+        async with get_read_session() as session:
+            stats = await TradeDAO(session).calculate_strategy_pnl(strategy, start_date, end_date)
+        return {"strategy": strategy, "stats": stats, "timestamp": datetime.now()}
+    except RuntimeError as e:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e))
+    except Exception as e:
+        logger.error(f"Failed to get P&L of strategy '{strategy}': {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to retrieve strategy P&L: {str(e)}",
+        )
+
+
+@app.get(
+    "/api/pnl/summary",
+    summary="Daily P&L Summary",
+    description="Get a summary of recent daily trading sessions",
+    tags=["Performance"],
+)
+async def get_pnl_summary(
+    days: int = Query(30, ge=1, le=365, description="Number of days to summarize"),
+    _user: Dict[str, Any] = Depends(verify_token),
+) -> Dict[str, Any]:
+    """
+    Get a summary of the daily P&L sessions of the last days.
+
+    Args:
+        days: Number of days to summarize
+    """
+    from src.database.engine import get_read_session
+
+    try:
+        async with get_read_session() as session:
+            summary = await DailyPnLDAO(session).get_performance_summary(days)
+        return {"days": days, "summary": summary, "timestamp": datetime.now()}
+    except RuntimeError as e:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e))
+    except Exception as e:
+        logger.error(f"Failed to get daily P&L summary: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to retrieve daily P&L summary: {str(e)}",
+        )
+
+
 # ============================================================================
 # WebSocket Endpoints
 # ============================================================================
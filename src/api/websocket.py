@@ -19,6 +19,7 @@ from pydantic import BaseModel, Field
 
 from src.core.constants import EventType
 from src.core.events import Event, EventBus, EventHandler
+from src.indicators.snapshot import serialize_payload
 
 logger = logging.getLogger(__name__)
 
@@ -425,6 +426,10 @@ class WebSocketManager:
             )
         )
 
+    def has_subscribers(self, topic: SubscriptionTopic) -> bool:
+        """Check whether any connected client is subscribed to a topic."""
+        return any(connection.is_subscribed(topic) for connection in self.connections.values())
+
     async def broadcast(
         self,
         message_type: MessageType,
@@ -543,6 +548,14 @@ class WebSocketEventHandler(EventHandler):
                 MessageType.INDICATOR_UPDATE,
                 SubscriptionTopic.INDICATORS,
             ),
+            EventType.LIQUIDITY_STRENGTH_CALCULATED: (
+                MessageType.INDICATOR_UPDATE,
+                SubscriptionTopic.INDICATORS,
+            ),
+            EventType.MARKET_STATE_CHANGED: (
+                MessageType.INDICATOR_UPDATE,
+                SubscriptionTopic.INDICATORS,
+            ),
             # Signal events → SIGNALS topic
             EventType.SIGNAL_GENERATED: (MessageType.SIGNAL, SubscriptionTopic.SIGNALS),
             # Order events → ORDERS topic
@@ -569,12 +582,16 @@ class WebSocketEventHandler(EventHandler):
 
         message_type, topic = self.event_mapping[event.event_type]
 
+        # Indicator payloads are serialized here, and only if someone listens
+        if not self.ws_manager.has_subscribers(topic):
+            return
+
         # Prepare broadcast data
         broadcast_data = {
             "event_type": event.event_type.value,
             "source": event.source,
             "timestamp": event.timestamp.isoformat(),
-            **event.data,
+            **serialize_payload(event.data),
         }
 
         # Broadcast to subscribed clients
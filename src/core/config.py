@@ -75,6 +75,15 @@ class TradingConfig(BaseSettings):
     risk_per_trade_percent: float = Field(
         1.0, description="Risk per trade as percentage of capital"
     )
+    account_state_max_staleness: float = Field(
+        30.0, description="Seconds a cached account balance may be used for risk checks"
+    )
+    account_state_refresh_interval: float = Field(
+        10.0, description="Seconds without balance updates before refreshing over REST"
+    )
+    account_state_use_stream: bool = Field(
+        True, description="Update the cached account balance from the user data stream"
+    )
 
     model_config = SettingsConfigDict(env_prefix="TRADING_", env_file=".env", extra="ignore")
 
@@ -83,6 +92,19 @@ class DatabaseConfig(BaseSettings):
     """Database configuration."""
 
     path: str = Field("data/tradingbot.db", description="SQLite database file path")
+    sqlite_profile: str = Field(
+        "default", description="SQLite tuning profile: default or performance"
+    )
+    read_pool_size: int = Field(
+        4, description="Read-only SQLite connections of the performance profile"
+    )
+    write_behind_flush_interval: float = Field(
+        1.0,
+        description="Seconds between write-behind flushes of position updates (0 = write-through)",
+    )
+    write_behind_max_pending: int = Field(
+        500, description="Pending row updates that trigger an early write-behind flush"
+    )
 
     model_config = SettingsConfigDict(env_prefix="DATABASE_", env_file=".env", extra="ignore")
 
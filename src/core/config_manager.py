@@ -235,9 +235,18 @@ class ConfigurationManager:
                 "default_leverage": self.settings.trading.default_leverage,
                 "max_position_size_usdt": self.settings.trading.max_position_size_usdt,
                 "risk_per_trade_percent": self.settings.trading.risk_per_trade_percent,
+                "account_state_max_staleness": self.settings.trading.account_state_max_staleness,
+                "account_state_refresh_interval": (
+                    self.settings.trading.account_state_refresh_interval
+                ),
+                "account_state_use_stream": self.settings.trading.account_state_use_stream,
             },
             "database": {
                 "path": self.settings.database.path,
+                "sqlite_profile": self.settings.database.sqlite_profile,
+                "read_pool_size": self.settings.database.read_pool_size,
+                "write_behind_flush_interval": self.settings.database.write_behind_flush_interval,
+                "write_behind_max_pending": self.settings.database.write_behind_max_pending,
             },
             "logging": {
                 "level": self.settings.logging.level,
@@ -8,10 +8,15 @@ for decoupling components and handling asynchronous event processing.
 import asyncio
 import heapq
 import logging
+import time
+import zlib
 from abc import ABC, abstractmethod
+from bisect import bisect_left
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Set
+from enum import Enum
+from typing import Any, Callable, Deque, Dict, Hashable, List, Optional, Set, Tuple
 
 from src.core.constants import EventType
 
@@ -106,13 +111,98 @@ class EventQueue:
 
     Events with lower priority values are processed first.
     Events with the same priority are processed in FIFO order.
+
+    The queue is owned by a single event loop, and heap operations never
+    await, so no lock is needed around them.
+
+    Queued entries can be replaced or discarded in place (lazy deletion):
+    a discarded entry stays in the heap until it reaches the top and is
+    skipped, so both operations are O(1).
     """
 
+    # Entry layout: [-priority, counter, timestamp, event, enqueued_at]
+    _EVENT = 3
+
     def __init__(self):
         """Initialize the priority queue."""
-        self._queue: List[Event] = []
+        self._queue: List[List[Any]] = []
         self._counter = 0  # For stable sorting when priorities are equal
-        self._lock = asyncio.Lock()
+        self._size = 0  # Live entries (excludes discarded ones)
+
+    def put_nowait(self, event: Event) -> List[Any]:
+        """
+        Add an event to the queue, recording when it was enqueued.
+
+        Args:
+            event: The event to add
+
+        Returns:
+            Queue entry, usable with replace() and discard()
+        """
+        # Use negative priority for max-heap behavior (higher priority first)
+        # Use counter for stable FIFO ordering within same priority
+        entry = [-event.priority, self._counter, event.timestamp, event, time.perf_counter()]
+        heapq.heappush(self._queue, entry)
+        self._counter += 1
+        self._size += 1
+        return entry
+
+    def replace(self, entry: List[Any], event: Event) -> bool:
+        """
+        Swap the event held by a queued entry, keeping its queue position.
+
+        Args:
+            entry: Entry returned by put_nowait()
+            event: Event replacing the queued one
+
+        Returns:
+            True if replaced, False if the entry was already dispatched or discarded
+        """
+        if entry[self._EVENT] is None:
+            return False
+        entry[self._EVENT] = event
+        return True
+
+    def discard(self, entry: List[Any]) -> bool:
+        """
+        Remove a queued entry without dispatching it.
+
+        Args:
+            entry: Entry returned by put_nowait()
+
+        Returns:
+            True if removed, False if the entry was already dispatched or discarded
+        """
+        if entry[self._EVENT] is None:
+            return False
+        entry[self._EVENT] = None
+        self._size -= 1
+        return True
+
+    def _drop_discarded(self) -> None:
+        """Pop discarded entries off the top of the heap."""
+        while self._queue and self._queue[0][self._EVENT] is None:
+            heapq.heappop(self._queue)
+
+    def pop_nowait(self) -> Tuple[Event, float]:
+        """
+        Remove the highest priority event from the queue.
+
+        Returns:
+            Tuple of (event, time.perf_counter() value when it was enqueued)
+
+        Raises:
+            IndexError: If the queue is empty
+        """
+        self._drop_discarded()
+        if not self._queue:
+            raise IndexError("Queue is empty")
+        entry = heapq.heappop(self._queue)
+        event = entry[self._EVENT]
+        # Mark as consumed so later replace()/discard() calls are no-ops
+        entry[self._EVENT] = None
+        self._size -= 1
+        return event, entry[4]
 
     async def put(self, event: Event) -> None:
         """
@@ -121,11 +211,7 @@ class EventQueue:
         Args:
             event: The event to add
         """
-        async with self._lock:
-            # Use negative priority for max-heap behavior (higher priority first)
-            # Use counter for stable FIFO ordering within same priority
-            heapq.heappush(self._queue, (-event.priority, self._counter, event.timestamp, event))
-            self._counter += 1
+        self.put_nowait(event)
 
     async def get(self) -> Event:
         """
@@ -137,11 +223,7 @@ class EventQueue:
         Raises:
             IndexError: If the queue is empty
         """
-        async with self._lock:
-            if not self._queue:
-                raise IndexError("Queue is empty")
-            _, _, _, event = heapq.heappop(self._queue)
-            return event
+        return self.pop_nowait()[0]
 
     async def peek(self) -> Optional[Event]:
         """
@@ -150,10 +232,10 @@ class EventQueue:
         Returns:
             The highest priority event or None if queue is empty
         """
-        async with self._lock:
-            if not self._queue:
-                return None
-            return self._queue[0][3]
+        self._drop_discarded()
+        if not self._queue:
+            return None
+        return self._queue[0][self._EVENT]
 
     def empty(self) -> bool:
         """
@@ -162,7 +244,7 @@ class EventQueue:
         Returns:
             True if the queue is empty
         """
-        return len(self._queue) == 0
+        return self._size == 0
 
     def size(self) -> int:
         """
@@ -171,13 +253,232 @@ class EventQueue:
         Returns:
             Number of events in the queue
         """
-        return len(self._queue)
+        return self._size
 
     async def clear(self) -> None:
         """Clear all events from the queue."""
-        async with self._lock:
-            self._queue.clear()
-            self._counter = 0
+        for entry in self._queue:
+            entry[self._EVENT] = None
+        self._queue.clear()
+        self._counter = 0
+        self._size = 0
+
+
+class LatencyHistogram:
+    """
+    Fixed-bucket latency histogram with O(1) recording.
+
+    Bucket bounds grow by a factor of sqrt(2) from 10 microseconds to about
+    10 seconds, so reported percentiles are within one bucket of the true value.
+    """
+
+    BUCKET_BOUNDS_MS: Tuple[float, ...] = tuple(0.01 * 2 ** (i / 2) for i in range(41))
+
+    def __init__(self):
+        """Initialize an empty histogram."""
+        self._counts = [0] * (len(self.BUCKET_BOUNDS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, latency_ms: float) -> None:
+        """
+        Record one latency sample.
+
+        Args:
+            latency_ms: Latency in milliseconds
+        """
+        self._counts[bisect_left(self.BUCKET_BOUNDS_MS, latency_ms)] += 1
+        self.count += 1
+        self.total_ms += latency_ms
+        if latency_ms > self.max_ms:
+            self.max_ms = latency_ms
+
+    def percentile(self, q: float) -> float:
+        """
+        Get an upper bound for the q-th percentile.
+
+        Args:
+            q: Percentile between 0 and 100
+
+        Returns:
+            Bucket upper bound containing the percentile in milliseconds (0.0 if empty)
+        """
+        if self.count == 0:
+            return 0.0
+
+        rank = max(1, int(round(q / 100 * self.count)))
+        cumulative = 0
+        for index, bucket_count in enumerate(self._counts):
+            cumulative += bucket_count
+            if cumulative >= rank:
+                if index < len(self.BUCKET_BOUNDS_MS):
+                    return min(self.BUCKET_BOUNDS_MS[index], self.max_ms)
+                break
+        return self.max_ms
+
+    def reset(self) -> None:
+        """Discard all recorded samples."""
+        self._counts = [0] * (len(self.BUCKET_BOUNDS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def to_dict(self) -> Dict[str, float]:
+        """Convert histogram summary to dictionary."""
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total_ms / self.count, 4) if self.count else 0.0,
+            "p50_ms": round(self.percentile(50), 4),
+            "p90_ms": round(self.percentile(90), 4),
+            "p99_ms": round(self.percentile(99), 4),
+            "max_ms": round(self.max_ms, 4),
+        }
+
+
+def symbol_partition_key(event: Event) -> Optional[str]:
+    """
+    Default ordering key: the symbol carried in the event data.
+
+    Args:
+        event: Event being published
+
+    Returns:
+        Symbol string, or None for events that are not tied to a symbol
+    """
+    symbol = event.data.get("symbol")
+    return str(symbol).upper() if symbol else None
+
+
+class OverflowPolicy(str, Enum):
+    """How events of one type are queued when bounds are reached."""
+
+    DROP_NEW = "drop_new"  # Reject the incoming event while the bus is full
+    DROP_OLDEST = "drop_oldest"  # Evict the oldest queued event of the same type
+    COALESCE = "coalesce"  # Replace the queued event with the same coalesce key
+    NEVER_DROP = "never_drop"  # Always queue, even beyond max_queue_size
+
+
+@dataclass(frozen=True)
+class QueuePolicy:
+    """
+    Queueing policy for one event type.
+
+    Attributes:
+        overflow: Behaviour when the bus (or the per-type bound) is full
+        max_queued: Per-type bound for DROP_OLDEST (None = bus capacity only)
+        coalesce_key: For COALESCE, returns the key under which a queued event
+            is replaced by a newer one; events keyed None are queued normally
+        shed_under_backpressure: Drop new events of this type while the bus
+            is in backpressure mode
+    """
+
+    overflow: OverflowPolicy = OverflowPolicy.DROP_NEW
+    max_queued: Optional[int] = None
+    coalesce_key: Optional[Callable[[Event], Optional[Hashable]]] = None
+    shed_under_backpressure: bool = False
+
+    def __post_init__(self):
+        """Validate policy settings."""
+        if self.max_queued is not None and self.max_queued < 1:
+            raise ValueError(f"max_queued must be at least 1, got {self.max_queued}")
+        if self.overflow == OverflowPolicy.COALESCE and self.coalesce_key is None:
+            raise ValueError("COALESCE policy requires a coalesce_key")
+
+
+def forming_candle_key(event: Event) -> Optional[Hashable]:
+    """
+    Coalescing key for in-progress candle updates.
+
+    Updates of the same candle (symbol, timeframe, open time) replace each
+    other; the first update of a new candle gets a new key, so the final
+    update of the previous candle is never overwritten. Closed candles are
+    not coalesced.
+
+    Args:
+        event: CANDLE_RECEIVED event
+
+    Returns:
+        (symbol, timeframe, timestamp) tuple, or None if the event must not coalesce
+    """
+    data = event.data
+    if data.get("is_closed") or data.get("symbol") is None:
+        return None
+    return (data["symbol"], data.get("timeframe"), data.get("timestamp"))
+
+
+def symbol_coalesce_key(event: Event) -> Optional[Hashable]:
+    """
+    Coalescing key keeping only the latest event per symbol.
+
+    Args:
+        event: Event being published
+
+    Returns:
+        Symbol, or None for events without one
+    """
+    return symbol_partition_key(event)
+
+
+_DEFAULT_POLICY = QueuePolicy()
+_NEVER_DROP = QueuePolicy(overflow=OverflowPolicy.NEVER_DROP)
+
+# Policies installed by the orchestrator. Market data is coalesced so tick
+# storms cannot fill the queue; order, position and risk events are never dropped.
+DEFAULT_EVENT_POLICIES: Dict[EventType, QueuePolicy] = {
+    EventType.CANDLE_RECEIVED: QueuePolicy(
+        overflow=OverflowPolicy.COALESCE, coalesce_key=forming_candle_key
+    ),
+    EventType.ORDERBOOK_UPDATE: QueuePolicy(
+        overflow=OverflowPolicy.COALESCE,
+        coalesce_key=symbol_coalesce_key,
+        shed_under_backpressure=True,
+    ),
+    EventType.ORDER_PLACED: _NEVER_DROP,
+    EventType.ORDER_FILLED: _NEVER_DROP,
+    EventType.ORDER_CANCELLED: _NEVER_DROP,
+    EventType.ORDER_FAILED: _NEVER_DROP,
+    EventType.POSITION_OPENED: _NEVER_DROP,
+    EventType.POSITION_CLOSED: _NEVER_DROP,
+    EventType.POSITION_UPDATED: _NEVER_DROP,
+    EventType.POSITION_MODIFIED: _NEVER_DROP,
+    EventType.STOP_LOSS_HIT: _NEVER_DROP,
+    EventType.TAKE_PROFIT_HIT: _NEVER_DROP,
+    EventType.RISK_LIMIT_EXCEEDED: _NEVER_DROP,
+    EventType.DAILY_LOSS_LIMIT_REACHED: _NEVER_DROP,
+    EventType.RISK_CHECK_FAILED: _NEVER_DROP,
+}
+
+
+@dataclass
+class EventPartition:
+    """
+    One dispatch partition: a priority queue drained by a single worker.
+
+    Attributes:
+        index: Partition number
+        queue: Pending events for this partition
+        wakeup: Set when events are queued (or the bus stops)
+        task: Worker task draining the queue
+        processed: Number of events dispatched by this partition
+        high_watermark: Largest queue depth observed
+    """
+
+    index: int
+    queue: EventQueue = field(default_factory=EventQueue)
+    wakeup: asyncio.Event = field(default_factory=asyncio.Event)
+    task: Optional[asyncio.Task] = None
+    processed: int = 0
+    high_watermark: int = 0
+
+    def to_dict(self) -> Dict[str, int]:
+        """Convert partition metrics to dictionary."""
+        return {
+            "partition": self.index,
+            "queue_size": self.queue.size(),
+            "high_watermark": self.high_watermark,
+            "processed": self.processed,
+        }
 
 
 class EventBus:
@@ -186,24 +487,134 @@ class EventBus:
 
     Handles event publishing, subscription management, and asynchronous
     event dispatching with error isolation.
+
+    Events are routed to ``num_workers`` partitions by an ordering key
+    (the event's symbol by default). Each partition is drained by its own
+    worker, so events sharing a key are handled in order while different
+    keys are processed concurrently. Events without a key go to partition 0.
+    With the default single worker, all events are dispatched in global
+    priority order.
+
+    Per-event-type QueuePolicy entries decide what happens under load:
+    coalescing, bounded drop-oldest, or never dropping. Event types without
+    a policy are dropped once the queue holds ``max_queue_size`` events.
     """
 
-    def __init__(self, max_queue_size: int = 10000):
+    def __init__(
+        self,
+        max_queue_size: int = 10000,
+        num_workers: int = 1,
+        partition_key: Optional[Callable[[Event], Optional[str]]] = None,
+        policies: Optional[Dict[EventType, QueuePolicy]] = None,
+    ):
         """
         Initialize the event bus.
 
         Args:
-            max_queue_size: Maximum number of events in the queue
+            max_queue_size: Maximum number of events queued across all partitions
+            num_workers: Number of dispatch workers (one partition per worker)
+            partition_key: Function returning an event's ordering key
+                (defaults to symbol_partition_key)
+            policies: Queueing policy per event type (see DEFAULT_EVENT_POLICIES)
         """
+        if num_workers < 1:
+            raise ValueError(f"num_workers must be at least 1, got {num_workers}")
+
         self._subscribers: Dict[EventType, Set[EventHandler]] = {}
         self._global_handlers: Set[EventHandler] = set()
-        self._queue = EventQueue()
+        self._partitions = [EventPartition(index=i) for i in range(num_workers)]
+        self._partition_key = partition_key or symbol_partition_key
+        self._queued = 0
         self._max_queue_size = max_queue_size
         self._running = False
-        self._dispatcher_task: Optional[asyncio.Task] = None
-        self._stats = {"published": 0, "processed": 0, "errors": 0, "dropped": 0}
+        self._stats = {
+            "published": 0,
+            "processed": 0,
+            "errors": 0,
+            "dropped": 0,
+            "coalesced": 0,
+        }
+        self._policies: Dict[EventType, QueuePolicy] = dict(policies or {})
+        self._backpressure = False
+        # Queued entries by coalesce key, and in FIFO order per DROP_OLDEST type
+        self._coalesce_index: Dict[Tuple[EventType, Hashable], Tuple[EventQueue, list]] = {}
+        self._type_entries: Dict[EventType, Deque[Tuple[EventQueue, list]]] = {}
+        self._type_counts: Dict[EventType, int] = {}
+        self._dropped_by_type: Dict[str, int] = {}
+        self._queue_empty = asyncio.Event()
+        self._queue_empty.set()
+        self._queue_latency = LatencyHistogram()
+        self._handler_latency = LatencyHistogram()
         self.logger = logging.getLogger(f"{__name__}.EventBus")
 
+    @property
+    def num_workers(self) -> int:
+        """Number of dispatch workers."""
+        return len(self._partitions)
+
+    @property
+    def backpressure_active(self) -> bool:
+        """Whether events with shed_under_backpressure are being dropped."""
+        return self._backpressure
+
+    def set_backpressure(self, active: bool) -> None:
+        """
+        Enter or leave backpressure mode.
+
+        While active, new events whose policy sets shed_under_backpressure
+        are dropped at publish time.
+
+        Args:
+            active: True to start shedding, False to stop
+        """
+        if active != self._backpressure:
+            self._backpressure = active
+            self.logger.info(f"Event bus backpressure mode {'on' if active else 'off'}")
+
+    def set_policy(self, event_type: EventType, policy: Optional[QueuePolicy]) -> None:
+        """
+        Set or remove the queueing policy for an event type.
+
+        Args:
+            event_type: Event type to configure
+            policy: Policy to apply, or None to restore the default (drop new when full)
+        """
+        if policy is None:
+            self._policies.pop(event_type, None)
+        else:
+            self._policies[event_type] = policy
+
+    def get_policy(self, event_type: EventType) -> QueuePolicy:
+        """
+        Get the queueing policy applied to an event type.
+
+        Args:
+            event_type: Event type to look up
+
+        Returns:
+            Configured policy, or the default drop-new policy
+        """
+        return self._policies.get(event_type, _DEFAULT_POLICY)
+
+    def _get_partition(self, event: Event) -> EventPartition:
+        """
+        Select the partition for an event from its ordering key.
+
+        Args:
+            event: Event being published
+
+        Returns:
+            Partition that must dispatch the event
+        """
+        if len(self._partitions) == 1:
+            return self._partitions[0]
+
+        key = self._partition_key(event)
+        if key is None:
+            return self._partitions[0]
+        # crc32 keeps the key-to-partition mapping stable across processes
+        return self._partitions[zlib.crc32(key.encode()) % len(self._partitions)]
+
     def subscribe(self, event_type: EventType, handler: EventHandler) -> None:
         """
         Subscribe a handler to a specific event type.
@@ -260,58 +671,182 @@ class EventBus:
             event: The event to publish
 
         Returns:
-            True if the event was queued, False if dropped due to full queue
+            True if the event was queued (or replaced a queued event with the
+            same coalesce key), False if it was dropped
         """
-        if self._queue.size() >= self._max_queue_size:
-            self.logger.warning(
-                f"Event queue full ({self._max_queue_size}), dropping event {event.event_type}"
-            )
-            self._stats["dropped"] += 1
+        policy = self._policies.get(event.event_type, _DEFAULT_POLICY)
+
+        if policy.shed_under_backpressure and self._backpressure:
+            self._drop(event, "shed under backpressure")
             return False
 
-        await self._queue.put(event)
+        coalesce_key = None
+        if policy.overflow == OverflowPolicy.COALESCE:
+            key = policy.coalesce_key(event)
+            if key is not None:
+                coalesce_key = (event.event_type, key)
+                queued = self._coalesce_index.get(coalesce_key)
+                if queued is not None and queued[0].replace(queued[1], event):
+                    self._stats["coalesced"] += 1
+                    return True
+
+        if policy.overflow == OverflowPolicy.DROP_OLDEST:
+            limit = policy.max_queued or self._max_queue_size
+            if self._type_counts.get(event.event_type, 0) >= limit:
+                self._evict_oldest(event.event_type)
+
+        if self._queued >= self._max_queue_size and policy.overflow != OverflowPolicy.NEVER_DROP:
+            if policy.overflow == OverflowPolicy.DROP_OLDEST and self._type_counts.get(
+                event.event_type
+            ):
+                self._evict_oldest(event.event_type)
+            else:
+                self._drop(event, f"event queue full ({self._max_queue_size})")
+                return False
+
+        partition = self._get_partition(event)
+        entry = partition.queue.put_nowait(event)
+        if coalesce_key is not None:
+            self._coalesce_index[coalesce_key] = (partition.queue, entry)
+        if policy.overflow == OverflowPolicy.DROP_OLDEST:
+            self._type_entries.setdefault(event.event_type, deque()).append(
+                (partition.queue, entry)
+            )
+            self._type_counts[event.event_type] = self._type_counts.get(event.event_type, 0) + 1
+
+        partition.high_watermark = max(partition.high_watermark, partition.queue.size())
+        self._queued += 1
+        self._queue_empty.clear()
+        partition.wakeup.set()
         self._stats["published"] += 1
         self.logger.debug(f"Published event {event.event_type} with priority {event.priority}")
         return True
 
+    def _drop(self, event: Event, reason: str) -> None:
+        """
+        Record a dropped event.
+
+        Args:
+            event: Event that was not queued (or was evicted)
+            reason: Why it was dropped, for the log
+        """
+        self.logger.warning(f"Dropping event {event.event_type}: {reason}")
+        self._stats["dropped"] += 1
+        name = event.event_type.value
+        self._dropped_by_type[name] = self._dropped_by_type.get(name, 0) + 1
+
+    def _evict_oldest(self, event_type: EventType) -> None:
+        """
+        Discard the oldest still-queued event of a DROP_OLDEST type.
+
+        Args:
+            event_type: Event type being evicted
+        """
+        entries = self._type_entries.get(event_type)
+        while entries:
+            queue, entry = entries.popleft()
+            event = entry[EventQueue._EVENT]
+            if queue.discard(entry):
+                self._type_counts[event_type] -= 1
+                self._queued -= 1
+                if self._queued == 0:
+                    self._queue_empty.set()
+                self._drop(event, f"evicted by newer {event_type}")
+                return
+
+    def _forget_dispatched(self, event: Event) -> None:
+        """
+        Remove bookkeeping for an event leaving the queue.
+
+        Args:
+            event: Event popped by a dispatcher
+        """
+        policy = self._policies.get(event.event_type)
+        if policy is None:
+            return
+        if policy.overflow == OverflowPolicy.COALESCE:
+            key = policy.coalesce_key(event)
+            if key is not None:
+                queued = self._coalesce_index.get((event.event_type, key))
+                if queued is not None and queued[1][EventQueue._EVENT] is None:
+                    del self._coalesce_index[(event.event_type, key)]
+        elif policy.overflow == OverflowPolicy.DROP_OLDEST:
+            entries = self._type_entries.get(event.event_type)
+            if not entries:
+                return  # Queued before the policy was set
+            self._type_counts[event.event_type] = max(0, self._type_counts[event.event_type] - 1)
+            # Consumed entries are usually at the left end; priorities and
+            # partitions can reorder dispatch, so compact when stale ones pile up
+            while entries and entries[0][1][EventQueue._EVENT] is None:
+                entries.popleft()
+            if len(entries) > 2 * self._type_counts[event.event_type] + 16:
+                self._type_entries[event.event_type] = deque(
+                    item for item in entries if item[1][EventQueue._EVENT] is not None
+                )
+
     async def start(self) -> None:
-        """Start the event dispatcher."""
+        """Start the dispatch workers."""
         if self._running:
             self.logger.warning("Event bus already running")
             return
 
         self._running = True
-        self._dispatcher_task = asyncio.create_task(self._dispatch_loop())
-        self.logger.info("Event bus started")
+        # Bind wakeup primitives to the loop running the workers
+        self._queue_empty = asyncio.Event()
+        if self._queued == 0:
+            self._queue_empty.set()
+        for partition in self._partitions:
+            partition.wakeup = asyncio.Event()
+            if not partition.queue.empty():
+                partition.wakeup.set()
+            partition.task = asyncio.create_task(self._dispatch_loop(partition))
+        self.logger.info(f"Event bus started with {len(self._partitions)} worker(s)")
 
     async def stop(self) -> None:
-        """Stop the event dispatcher and wait for completion."""
+        """Stop the dispatch workers and wait for completion."""
         if not self._running:
             return
 
         self._running = False
-        if self._dispatcher_task:
-            await self._dispatcher_task
+        for partition in self._partitions:
+            partition.wakeup.set()
+        await asyncio.gather(*(partition.task for partition in self._partitions if partition.task))
+        for partition in self._partitions:
+            partition.task = None
         self.logger.info("Event bus stopped")
 
-    async def _dispatch_loop(self) -> None:
+    async def _dispatch_loop(self, partition: EventPartition) -> None:
         """
-        Main event dispatcher loop.
+        Event dispatcher loop for one partition.
+
+        Sleeps until publish() (or stop()) signals the partition's wakeup
+        event, then processes its queued events one at a time and dispatches
+        them to registered handlers with error isolation.
 
-        Continuously processes events from the queue and dispatches them
-        to registered handlers with error isolation.
+        Args:
+            partition: Partition drained by this worker
         """
-        self.logger.info("Event dispatcher loop started")
+        self.logger.info(f"Event dispatcher loop {partition.index} started")
+        queue = partition.queue
 
         while self._running:
             try:
-                # Wait for events with a timeout to allow clean shutdown
-                if self._queue.empty():
-                    await asyncio.sleep(0.01)
+                if queue.empty():
+                    # No await between the check and clear, so no wakeup is lost
+                    partition.wakeup.clear()
+                    await partition.wakeup.wait()
                     continue
 
-                event = await self._queue.get()
+                event, enqueued_at = queue.pop_nowait()
+                self._queued -= 1
+                if self._policies:
+                    self._forget_dispatched(event)
+                if self._queued == 0:
+                    self._queue_empty.set()
+
+                self._queue_latency.record((time.perf_counter() - enqueued_at) * 1000)
                 await self._dispatch_event(event)
+                partition.processed += 1
 
             except asyncio.CancelledError:
                 self.logger.info("Dispatcher loop cancelled")
@@ -320,7 +855,7 @@ class EventBus:
                 self.logger.error(f"Error in dispatcher loop: {e}", exc_info=True)
                 await asyncio.sleep(0.1)  # Brief pause on error
 
-        self.logger.info("Event dispatcher loop stopped")
+        self.logger.info(f"Event dispatcher loop {partition.index} stopped")
 
     async def _dispatch_event(self, event: Event) -> None:
         """
@@ -350,9 +885,11 @@ class EventBus:
             return
 
         # Dispatch to all handlers concurrently with error isolation
+        dispatched_at = time.perf_counter()
         tasks = [self._safe_handle(handler, event) for handler in handlers]
 
         await asyncio.gather(*tasks, return_exceptions=True)
+        self._handler_latency.record((time.perf_counter() - dispatched_at) * 1000)
         self._stats["processed"] += 1
 
     async def _safe_handle(self, handler: EventHandler, event: Event) -> None:
@@ -375,20 +912,35 @@ class EventBus:
                     exc_info=True,
                 )
 
-    def get_stats(self) -> Dict[str, int]:
+    def get_stats(self) -> Dict[str, Any]:
         """
         Get event bus statistics.
 
         Returns:
-            Dictionary with statistics (published, processed, errors, dropped)
+            Dictionary with statistics (published, processed, errors, dropped,
+            coalesced), drops per event type, per-partition queue depth and
+            latency histograms for publish->dispatch and dispatch->handlers done
         """
         return {
             **self._stats,
-            "queue_size": self._queue.size(),
+            "dropped_by_type": dict(self._dropped_by_type),
+            "backpressure": self._backpressure,
+            "queue_size": self._queued,
+            "num_workers": len(self._partitions),
+            "partitions": [partition.to_dict() for partition in self._partitions],
             "subscriber_count": sum(len(handlers) for handlers in self._subscribers.values()),
             "global_handler_count": len(self._global_handlers),
+            "latency": {
+                "publish_to_dispatch": self._queue_latency.to_dict(),
+                "dispatch_to_done": self._handler_latency.to_dict(),
+            },
         }
 
+    def reset_latency_stats(self) -> None:
+        """Discard recorded latency samples."""
+        self._queue_latency.reset()
+        self._handler_latency.reset()
+
     async def wait_empty(self, timeout: Optional[float] = None) -> bool:
         """
         Wait for the event queue to be empty.
@@ -399,11 +951,11 @@ class EventBus:
         Returns:
             True if queue became empty, False if timeout occurred
         """
-        start_time = asyncio.get_event_loop().time()
-
-        while not self._queue.empty():
-            if timeout and (asyncio.get_event_loop().time() - start_time) > timeout:
-                return False
-            await asyncio.sleep(0.01)
+        if self._queued == 0:
+            return True
 
+        try:
+            await asyncio.wait_for(self._queue_empty.wait(), timeout or None)
+        except asyncio.TimeoutError:
+            return False
         return True
@@ -9,19 +9,24 @@ import asyncio
 import logging
 from dataclasses import dataclass, field
 from datetime import datetime
+from decimal import Decimal
 from enum import Enum
 from threading import Lock
 from typing import Any, Callable, Dict, List, Optional
 
+from sqlalchemy.ext.asyncio import AsyncSession
+
 from src.core.background_tasks import BackgroundTaskManager
-from src.core.config import BinanceConfig
+from src.core.config import BinanceConfig, settings
 from src.core.config_manager import ConfigurationManager
-from src.core.constants import EventType
-from src.core.events import Event, EventBus, EventHandler
+from src.core.constants import EventType, OrderSide
+from src.core.events import DEFAULT_EVENT_POLICIES, Event, EventBus, EventHandler
 from src.core.parallel_processor import DataPipelineParallelProcessor
 from src.database import engine as db_engine
+from src.database.write_behind import WriteBehindQueue
 from src.indicators.multi_timeframe_engine import MultiTimeframeIndicatorEngine
 from src.services.candle_storage import CandleStorage
+from src.services.exchange.account_state import AccountStateService
 from src.services.exchange.binance_manager import BinanceManager
 from src.services.exchange.order_executor import OrderExecutor
 from src.services.position.position_manager import PositionManager
@@ -417,7 +422,7 @@ class OrderToPositionHandler(EventHandler):
     """
     Handler for updating positions after order execution.
 
-    Receives ORDER_FILLED events and updates position tracking.
+    Receives ORDER_FILLED events and applies the fills to position tracking.
     """
 
     def __init__(self, position_manager: PositionManager, metrics: PipelineMetrics):
@@ -434,20 +439,28 @@ class OrderToPositionHandler(EventHandler):
 
     async def handle(self, event: Event) -> None:
         """Process order filled event."""
-        if event.event_type not in [EventType.ORDER_FILLED, EventType.ORDER_PLACED]:
+        if event.event_type != EventType.ORDER_FILLED:
             return
 
         start_time = datetime.now()
 
         try:
-            # Extract order data
-            order_data = event.data.get("order")
-            if not order_data:
-                self.logger.error(f"No order data in {event.event_type} event")
+            # Extract fill data
+            data = event.data or {}
+            quantity = data.get("filled_quantity") or data.get("quantity")
+            price = data.get("average_price") or data.get("price")
+            if not (data.get("symbol") and data.get("side") and quantity and price):
+                self.logger.error(f"Incomplete fill data in {event.event_type} event: {data}")
                 return
 
             # Update position tracking
-            await self.position_manager.update_from_order(order_data)
+            await self.position_manager.apply_fill(
+                symbol=data["symbol"],
+                side=OrderSide(str(data["side"]).upper()),
+                quantity=Decimal(str(quantity)),
+                price=Decimal(str(price)),
+                reduce_only=bool(data.get("reduce_only", False)),
+            )
 
             duration = (datetime.now() - start_time).total_seconds()
             self.metrics.record_processing_time("order_to_position", duration)
@@ -462,6 +475,8 @@ class BackpressureMonitor:
     Monitor and control pipeline backpressure.
 
     Tracks event queue sizes and processing rates to prevent overload.
+    While throttled, the event bus is put in backpressure mode so event types
+    whose QueuePolicy allows shedding are dropped at publish time.
     """
 
     def __init__(
@@ -503,11 +518,13 @@ class BackpressureMonitor:
                 )
                 self.is_throttled = True
                 self.throttle_count += 1
+                self.event_bus.set_backpressure(True)
             return True
         else:
             if self.is_throttled:
                 self.logger.info("Backpressure relieved")
                 self.is_throttled = False
+                self.event_bus.set_backpressure(False)
             return False
 
     def get_stats(self) -> Dict[str, Any]:
@@ -522,6 +539,9 @@ class BackpressureMonitor:
             "queue_fullness": (queue_size / max_size * 100) if max_size > 0 else 0,
             "queue_size": queue_size,
             "max_queue_size": max_size,
+            "dropped": stats.get("dropped", 0),
+            "coalesced": stats.get("coalesced", 0),
+            "dropped_by_type": stats.get("dropped_by_type", {}),
         }
 
 
@@ -557,6 +577,7 @@ class TradingSystemOrchestrator:
         enable_testnet: bool = True,
         max_event_queue_size: int = 10000,
         config_manager: Optional[ConfigurationManager] = None,
+        event_dispatch_workers: int = 1,
     ):
         """
         Initialize trading system orchestrator.
@@ -566,8 +587,12 @@ class TradingSystemOrchestrator:
             enable_testnet: Whether to use testnet environment
             max_event_queue_size: Maximum event queue size
             config_manager: Global configuration manager (created if None)
+            event_dispatch_workers: Number of EventBus dispatch workers; events
+                are partitioned by symbol so each symbol stays ordered
         """
         self.config = config or BinanceConfig()
+        self.max_event_queue_size = max_event_queue_size
+        self.event_dispatch_workers = event_dispatch_workers
         self.config.testnet = enable_testnet
 
         # System state
@@ -588,9 +613,11 @@ class TradingSystemOrchestrator:
         self.candle_storage: Optional[CandleStorage] = None
         self.multi_timeframe_engine: Optional[MultiTimeframeIndicatorEngine] = None
         self.strategy_layer: Optional[StrategyIntegrationLayer] = None
+        self.account_state: Optional[AccountStateService] = None
         self.risk_validator: Optional[RiskValidator] = None
         self.order_executor: Optional[OrderExecutor] = None
         self.position_manager: Optional[PositionManager] = None
+        self._position_session: Optional[AsyncSession] = None
 
         # Pipeline components (initialized in _setup_pipeline_handlers)
         self._pipeline_metrics: Optional[PipelineMetrics] = None
@@ -621,7 +648,7 @@ class TradingSystemOrchestrator:
         4. CandleStorage (no dependencies)
         5. MultiTimeframeEngine (depends on CandleStorage, EventBus)
         6. StrategyIntegrationLayer (depends on MultiTimeframeEngine)
-        7. Risk components (depends on Database)
+        7. Account state and risk components (depends on BinanceManager, Database)
         8. OrderExecutor (depends on BinanceManager, EventBus)
         9. PositionManager (depends on Database, EventBus)
         10. Pipeline Handlers (depends on all above components)
@@ -678,7 +705,11 @@ class TradingSystemOrchestrator:
     async def _initialize_event_bus(self) -> None:
         """Initialize event bus (no dependencies)."""
         logger.info("Initializing EventBus...")
-        self.event_bus = EventBus(max_queue_size=10000)
+        self.event_bus = EventBus(
+            max_queue_size=self.max_event_queue_size,
+            num_workers=self.event_dispatch_workers,
+            policies=DEFAULT_EVENT_POLICIES,
+        )
 
         self._services["event_bus"] = ServiceInfo(
             name="event_bus",
@@ -770,6 +801,27 @@ class TradingSystemOrchestrator:
         position_sizer = PositionSizer(
             binance_manager=self.binance_manager, risk_percentage=2.0, leverage=5
         )
+
+        # Cached account balances keep balance fetches off the signal path
+        trading = (self.config_manager.settings if self.config_manager else settings).trading
+        self.account_state = AccountStateService(
+            binance_manager=self.binance_manager,
+            max_staleness=trading.account_state_max_staleness,
+            refresh_interval=trading.account_state_refresh_interval,
+            use_stream=trading.account_state_use_stream,
+            leverage=position_sizer.leverage,
+        )
+        position_sizer.account_state = self.account_state
+
+        self._services["account_state"] = ServiceInfo(
+            name="account_state",
+            instance=self.account_state,
+            state=ServiceState.INITIALIZED,
+            dependencies=["binance_manager"],
+            start_callback=self.account_state.start,
+            stop_callback=self.account_state.stop,
+        )
+
         stop_loss_calculator = StopLossCalculator(position_sizer=position_sizer)
         take_profit_calculator = TakeProfitCalculator()
         daily_loss_monitor = DailyLossMonitor(event_bus=self.event_bus, daily_loss_limit_pct=5.0)
@@ -787,7 +839,7 @@ class TradingSystemOrchestrator:
             name="risk_validator",
             instance=self.risk_validator,
             state=ServiceState.INITIALIZED,
-            dependencies=["binance_manager", "database", "event_bus"],
+            dependencies=["binance_manager", "account_state", "database", "event_bus"],
         )
         logger.info("Risk components initialized")
 
@@ -809,15 +861,29 @@ class TradingSystemOrchestrator:
     async def _initialize_position_manager(self) -> None:
         """Initialize position manager (depends on Database, EventBus)."""
         logger.info("Initializing PositionManager...")
-        # Get a database session for position manager
-        async with db_engine.get_session() as session:
-            self.position_manager = PositionManager(db_session=session, event_bus=self.event_bus)
+        database = (self.config_manager.settings if self.config_manager else settings).database
+
+        # Long-lived database session of the position manager, closed on stop
+        self._position_session = db_engine.get_session_factory()()
+
+        # Price-tick position updates are coalesced and committed in batches
+        write_queue = WriteBehindQueue(
+            self._position_session,
+            flush_interval=database.write_behind_flush_interval,
+            max_pending=database.write_behind_max_pending,
+            name="positions",
+        )
+        self.position_manager = PositionManager(
+            db_session=self._position_session, event_bus=self.event_bus, write_queue=write_queue
+        )
 
         self._services["position_manager"] = ServiceInfo(
             name="position_manager",
             instance=self.position_manager,
             state=ServiceState.INITIALIZED,
             dependencies=["database", "event_bus"],
+            start_callback=self.position_manager.start,
+            stop_callback=self._stop_position_manager,
         )
         logger.info("PositionManager initialized")
 
@@ -868,7 +934,6 @@ class TradingSystemOrchestrator:
         self.event_bus.subscribe(EventType.SIGNAL_GENERATED, signal_handler)
         self.event_bus.subscribe(EventType.RISK_CHECK_PASSED, risk_handler)
         self.event_bus.subscribe(EventType.ORDER_FILLED, order_handler)
-        self.event_bus.subscribe(EventType.ORDER_PLACED, order_handler)
 
         # Store handlers for cleanup
         self._pipeline_handlers = [
@@ -879,6 +944,12 @@ class TradingSystemOrchestrator:
             order_handler,
         ]
 
+        # Apply our fills to the cached account state
+        if self.account_state is not None:
+            self.event_bus.subscribe(EventType.ORDER_FILLED, self.account_state)
+            self.event_bus.subscribe(EventType.POSITION_CLOSED, self.account_state)
+            self._pipeline_handlers.append(self.account_state)
+
         logger.info(f"Data pipeline configured with {len(self._pipeline_handlers)} handlers")
 
     async def _initialize_background_task_manager(self) -> None:
@@ -1247,6 +1318,13 @@ class TradingSystemOrchestrator:
         """Stop Binance manager and close connections."""
         await self.binance_manager.close()
 
+    async def _stop_position_manager(self) -> None:
+        """Write pending position updates and close the position session."""
+        try:
+            await self.position_manager.stop()
+        finally:
+            await self._position_session.close()
+
     # Status and monitoring methods
 
     def get_system_state(self) -> SystemState:
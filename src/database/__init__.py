@@ -6,10 +6,12 @@ for storing trade history, positions, statistics, and backtest results.
 """
 
 from src.database.engine import (
+    SQLiteProfile,
     close_db,
     create_all_tables,
     drop_all_tables,
     get_engine,
+    get_read_session,
     get_session,
     get_session_factory,
     health_check,
@@ -29,9 +31,11 @@ __all__ = [
     "init_db",
     "close_db",
     "get_session",
+    "get_read_session",
     "get_engine",
     "get_session_factory",
     "create_all_tables",
     "drop_all_tables",
     "health_check",
+    "SQLiteProfile",
 ]
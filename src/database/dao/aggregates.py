@@ -0,0 +1,64 @@
+"""
+Reusable SQL aggregate expressions for trade analytics.
+
+The analytics DAOs compute their summaries in the database with a single
+aggregate query instead of loading ORM rows and summing Decimals in Python.
+This module holds the expressions they share.
+"""
+
+from decimal import Decimal
+from typing import Any, List, Optional
+
+from sqlalchemy import case, func
+from sqlalchemy.sql.elements import ColumnElement
+
+
+def trade_summary_columns(pnl: ColumnElement, fees: ColumnElement) -> List[ColumnElement]:
+    """
+    Build labeled aggregate columns summarizing closed trades.
+
+    Trades without P&L count towards total_trades only, matching the
+    previous in-Python calculations.
+
+    Args:
+        pnl: Realized P&L column
+        fees: Fees column
+
+    Returns:
+        Columns labeled total_trades, winning_trades, losing_trades, total_pnl,
+        gross_profit, gross_loss, avg_win, avg_loss, largest_win, largest_loss
+        and total_fees
+    """
+    win = case((pnl > 0, pnl))
+    loss = case((pnl < 0, pnl))
+    return [
+        func.count().label("total_trades"),
+        func.count(win).label("winning_trades"),
+        func.count(loss).label("losing_trades"),
+        func.coalesce(func.sum(pnl), 0).label("total_pnl"),
+        func.coalesce(func.sum(win), 0).label("gross_profit"),
+        func.coalesce(func.sum(loss), 0).label("gross_loss"),
+        func.avg(win, type_=pnl.type).label("avg_win"),
+        func.avg(loss, type_=pnl.type).label("avg_loss"),
+        func.max(win).label("largest_win"),
+        func.min(loss).label("largest_loss"),
+        func.coalesce(func.sum(fees), 0).label("total_fees"),
+    ]
+
+
+def to_decimal(value: Any) -> Optional[Decimal]:
+    """
+    Convert an aggregate result to Decimal.
+
+    Backends differ in what SUM/AVG over a NUMERIC column return (SQLite
+    yields floats for literal defaults), so results are normalized here.
+
+    Args:
+        value: Aggregate value or None
+
+    Returns:
+        Decimal value, or None if value is None
+    """
+    if value is None or isinstance(value, Decimal):
+        return value
+    return Decimal(str(value))
@@ -6,9 +6,24 @@ async CRUD operations, pagination support, and transaction management.
 """
 
 import logging
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar
-
-from sqlalchemy import delete, func, select
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Type,
+    TypeVar,
+    Union,
+    overload,
+)
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -19,6 +34,15 @@ logger = logging.getLogger(__name__)
 # Generic type variable for SQLAlchemy models
 ModelType = TypeVar("ModelType", bound=Base)
 
+# Dialect-specific INSERT constructs providing ON CONFLICT DO UPDATE
+UPSERT_INSERTS: Dict[str, Callable[..., Any]] = {
+    "postgresql": postgresql_insert,
+    "sqlite": sqlite_insert,
+}
+
+# Rows per INSERT statement of the bulk operations
+DEFAULT_CHUNK_SIZE = 1000
+
 
 class BaseDAO(Generic[ModelType]):
     """
@@ -338,17 +362,193 @@ class BaseDAO(Generic[ModelType]):
             ...     {'symbol': 'ETHUSDT', 'entry_price': 3000},
             ... ])
         """
-        try:
-            instances = [self.model(**item) for item in items]
-            self.session.add_all(instances)
-            await self.session.flush()
+        return await self.bulk_insert(items)
+
+    @overload
+    async def bulk_insert(
+        self,
+        items: Sequence[Dict[str, Any]],
+        chunk_size: int = ...,
+        returning: Literal[True] = ...,
+    ) -> List[ModelType]: ...
+
+    @overload
+    async def bulk_insert(
+        self,
+        items: Sequence[Dict[str, Any]],
+        chunk_size: int = ...,
+        *,
+        returning: Literal[False],
+    ) -> int: ...
+
+    @overload
+    async def bulk_insert(
+        self,
+        items: Sequence[Dict[str, Any]],
+        chunk_size: int = ...,
+        returning: bool = ...,
+    ) -> Union[List[ModelType], int]: ...
+
+    async def bulk_insert(
+        self,
+        items: Sequence[Dict[str, Any]],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        returning: bool = True,
+    ) -> Union[List[ModelType], int]:
+        """
+        Insert many records with multi-row INSERT statements.
+
+        Rows are sent in chunks of chunk_size per statement. Generated values
+        (IDs, server defaults) come back through INSERT ... RETURNING instead
+        of one refresh round-trip per record.
+
+        Args:
+            items: Dictionaries containing field values
+            chunk_size: Maximum number of rows per statement
+            returning: Return the created model instances; if False only the
+                number of inserted rows is returned, which is faster for imports
+
+        Returns:
+            List of created model instances, or the row count if returning is False
+
+        Raises:
+            ValueError: If chunk_size is not positive
+            SQLAlchemyError: If database operation fails
+
+        Example:
+            >>> count = await trade_dao.bulk_insert(rows, chunk_size=5000, returning=False)
+        """
+        return await self._bulk_execute(insert(self.model), items, chunk_size, returning)
+
+    @overload
+    async def bulk_upsert(
+        self,
+        items: Sequence[Dict[str, Any]],
+        conflict_columns: Sequence[str],
+        update_columns: Optional[Sequence[str]] = ...,
+        chunk_size: int = ...,
+        returning: Literal[True] = ...,
+    ) -> List[ModelType]: ...
+
+    @overload
+    async def bulk_upsert(
+        self,
+        items: Sequence[Dict[str, Any]],
+        conflict_columns: Sequence[str],
+        update_columns: Optional[Sequence[str]] = ...,
+        chunk_size: int = ...,
+        *,
+        returning: Literal[False],
+    ) -> int: ...
+
+    @overload
+    async def bulk_upsert(
+        self,
+        items: Sequence[Dict[str, Any]],
+        conflict_columns: Sequence[str],
+        update_columns: Optional[Sequence[str]] = ...,
+        chunk_size: int = ...,
+        returning: bool = ...,
+    ) -> Union[List[ModelType], int]: ...
+
+    async def bulk_upsert(
+        self,
+        items: Sequence[Dict[str, Any]],
+        conflict_columns: Sequence[str],
+        update_columns: Optional[Sequence[str]] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        returning: bool = True,
+    ) -> Union[List[ModelType], int]:
+        """
+        Insert many records, updating existing ones on a unique key conflict.
+
+        Uses INSERT ... ON CONFLICT DO UPDATE (SQLite and PostgreSQL).
+
+        Args:
+            items: Dictionaries containing field values
+            conflict_columns: Columns of the unique constraint identifying a record
+            update_columns: Columns overwritten on conflict (default: all given
+                columns except the conflict columns and the primary key; every
+                row must then give the same columns)
+            chunk_size: Maximum number of rows per statement
+            returning: Return the inserted or updated model instances; if False
+                only the number of written rows is returned
 
-            # Refresh all instances to get generated IDs
-            for instance in instances:
-                await self.session.refresh(instance)
+        Returns:
+            List of model instances, or the row count if returning is False
 
-            logger.debug(f"Bulk created {len(instances)} {self.model.__name__} records")
-            return instances
+        Raises:
+            ValueError: If chunk_size is not positive, or update_columns is
+                omitted and the rows give different columns
+            NotImplementedError: If the database dialect has no upsert support
+            SQLAlchemyError: If database operation fails
+
+        Example:
+            >>> sessions = await daily_pnl_dao.bulk_upsert(rows, conflict_columns=['date'])
+        """
+        if not items:
+            return [] if returning else 0
+
+        dialect = self.session.get_bind().dialect.name
+        if dialect not in UPSERT_INSERTS:
+            raise NotImplementedError(f"bulk_upsert does not support '{dialect}'")
+
+        if update_columns is None:
+            # Inferred from the first row, so every row must give the same columns
+            columns = set(items[0])
+            for index, item in enumerate(items):
+                if set(item) != columns:
+                    raise ValueError(
+                        f"Row {index} gives columns {sorted(item)}, expected {sorted(columns)}; "
+                        "pass update_columns for rows with different columns"
+                    )
+            skipped = {*conflict_columns, "id"}
+            update_columns = [column for column in items[0] if column not in skipped]
+
+        stmt = UPSERT_INSERTS[dialect](self.model)
+        updates = {column: stmt.excluded[column] for column in update_columns}
+        if "updated_at" in self.model.__table__.c and "updated_at" not in updates:
+            updates["updated_at"] = func.now()
+
+        if updates:
+            stmt = stmt.on_conflict_do_update(index_elements=list(conflict_columns), set_=updates)
+        else:
+            stmt = stmt.on_conflict_do_nothing(index_elements=list(conflict_columns))
+
+        return await self._bulk_execute(stmt, items, chunk_size, returning)
+
+    async def _bulk_execute(
+        self,
+        stmt: Any,
+        items: Sequence[Dict[str, Any]],
+        chunk_size: int,
+        returning: bool,
+    ) -> Union[List[ModelType], int]:
+        """Execute a bulk INSERT statement chunk by chunk."""
+        if chunk_size <= 0:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+
+        try:
+            instances: List[ModelType] = []
+            count = 0
+            if returning:
+                # Refresh instances already in the session with the returned rows
+                stmt = stmt.returning(self.model).execution_options(populate_existing=True)
+
+            for start in range(0, len(items), chunk_size):
+                chunk = list(items[start : start + chunk_size])
+                if returning:
+                    result = await self.session.scalars(stmt, chunk)
+                    instances.extend(result.all())
+                else:
+                    await self.session.execute(stmt, chunk)
+                    count += len(chunk)
+
+            logger.debug(
+                f"Bulk wrote {len(items)} {self.model.__name__} records "
+                f"in chunks of {chunk_size}"
+            )
+            return instances if returning else count
         except SQLAlchemyError as e:
-            logger.error(f"Error bulk creating {self.model.__name__}: {e}")
+            logger.error(f"Error bulk writing {self.model.__name__}: {e}")
             raise
@@ -8,13 +8,13 @@ tracking data, including session history and loss limit breach records.
 import logging
 from datetime import datetime, timedelta
 from decimal import Decimal
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
-from sqlalchemy import and_, desc, select
+from sqlalchemy import and_, case, desc, func, select
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.database.dao.base import BaseDAO
+from src.database.dao.base import DEFAULT_CHUNK_SIZE, BaseDAO
 from src.database.models import DailyPnL
 
 logger = logging.getLogger(__name__)
@@ -156,6 +156,35 @@ class DailyPnLDAO(BaseDAO[DailyPnL]):
             logger.error(f"Error updating session for {date_str}: {e}")
             raise
 
+    async def upsert_sessions(
+        self, sessions: List[Dict[str, Any]], chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> List[DailyPnL]:
+        """
+        Create or update many daily sessions at once.
+
+        Sessions are matched by their 'date'; given fields of existing
+        sessions are overwritten.
+
+        Args:
+            sessions: Dictionaries of DailyPnL fields, each including 'date'
+            chunk_size: Maximum number of sessions per statement
+
+        Returns:
+            Created or updated DailyPnL records
+
+        Raises:
+            SQLAlchemyError: If database operation fails
+        """
+        try:
+            records = await self.bulk_upsert(
+                sessions, conflict_columns=["date"], chunk_size=chunk_size
+            )
+            logger.debug(f"Upserted {len(records)} daily sessions")
+            return records
+        except SQLAlchemyError as e:
+            logger.error(f"Error upserting daily sessions: {e}")
+            raise
+
     async def get_session_by_date(self, date_str: str) -> Optional[DailyPnL]:
         """
         Get daily session by date.
@@ -264,34 +293,29 @@ class DailyPnLDAO(BaseDAO[DailyPnL]):
         """
         try:
             cutoff_date = (datetime.now().date() - timedelta(days=days)).strftime("%Y-%m-%d")
-            stmt = select(DailyPnL).where(DailyPnL.date >= cutoff_date)
-            result = await self.session.execute(stmt)
-            sessions = list(result.scalars().all())
-
-            if not sessions:
-                return {
-                    "total_sessions": 0,
-                    "total_pnl": 0.0,
-                    "avg_pnl": 0.0,
-                    "winning_sessions": 0,
-                    "losing_sessions": 0,
-                    "loss_limit_breaches": 0,
-                    "win_rate": 0.0,
-                }
-
-            total_pnl = sum(float(s.total_pnl) for s in sessions)
-            winning_sessions = sum(1 for s in sessions if s.total_pnl > 0)
-            losing_sessions = sum(1 for s in sessions if s.total_pnl < 0)
-            loss_limit_breaches = sum(1 for s in sessions if s.loss_limit_reached)
-
+            stmt = select(
+                func.count().label("total_sessions"),
+                func.coalesce(func.sum(DailyPnL.total_pnl), 0).label("total_pnl"),
+                func.count(case((DailyPnL.total_pnl > 0, 1))).label("winning_sessions"),
+                func.count(case((DailyPnL.total_pnl < 0, 1))).label("losing_sessions"),
+                func.count(case((DailyPnL.loss_limit_reached.is_(True), 1))).label(
+                    "loss_limit_breaches"
+                ),
+            ).where(DailyPnL.date >= cutoff_date)
+            row = (await self.session.execute(stmt)).one()
+
+            total_sessions = row.total_sessions
+            total_pnl = float(row.total_pnl)
             return {
-                "total_sessions": len(sessions),
+                "total_sessions": total_sessions,
                 "total_pnl": total_pnl,
-                "avg_pnl": total_pnl / len(sessions),
-                "winning_sessions": winning_sessions,
-                "losing_sessions": losing_sessions,
-                "loss_limit_breaches": loss_limit_breaches,
-                "win_rate": (winning_sessions / len(sessions)) * 100 if sessions else 0.0,
+                "avg_pnl": total_pnl / total_sessions if total_sessions else 0.0,
+                "winning_sessions": row.winning_sessions,
+                "losing_sessions": row.losing_sessions,
+                "loss_limit_breaches": row.loss_limit_breaches,
+                "win_rate": (
+                    (row.winning_sessions / total_sessions) * 100 if total_sessions else 0.0
+                ),
             }
 
         except SQLAlchemyError as e:
@@ -10,7 +10,7 @@ from datetime import datetime
 from decimal import Decimal
 from typing import Dict, List, Optional
 
-from sqlalchemy import and_, select
+from sqlalchemy import Float, and_, case, cast, select, update
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -140,36 +140,34 @@ class PositionDAO(BaseDAO[Position]):
             ... )
         """
         try:
-            position = await self.get_by_id(position_id)
-            if not position:
-                logger.warning(f"Position {position_id} not found for P&L update")
-                return None
+            # Recalculate in a single UPDATE ... RETURNING instead of get, flush and refresh
+            price_diff = (current_price - Position.entry_price) * case(
+                (Position.side == "SHORT", -1), else_=1
+            )
+            stmt = (
+                update(Position)
+                .where(and_(Position.id == position_id, Position.status == "OPEN"))
+                .values(
+                    current_price=current_price,
+                    unrealized_pnl=price_diff * Position.size * Position.leverage,
+                    unrealized_pnl_percent=cast(price_diff * 100 / Position.entry_price, Float),
+                )
+                .returning(Position)
+                .execution_options(populate_existing=True)
+            )
+            position = (await self.session.execute(stmt)).scalar_one_or_none()
 
-            if position.status != "OPEN":
+            if position is None:
+                position = await self.get_by_id(position_id)
+                if not position:
+                    logger.warning(f"Position {position_id} not found for P&L update")
+                    return None
                 logger.warning(f"Position {position_id} is not open (status: {position.status})")
                 return position
 
-            # Calculate unrealized P&L
-            price_diff = current_price - position.entry_price
-            if position.side == "SHORT":
-                price_diff = -price_diff
-
-            unrealized_pnl = price_diff * position.size * position.leverage
-            unrealized_pnl_percent = (
-                (price_diff / position.entry_price * 100) if position.entry_price else 0
-            )
-
-            # Update position
-            position.current_price = current_price
-            position.unrealized_pnl = unrealized_pnl
-            position.unrealized_pnl_percent = float(unrealized_pnl_percent)
-
-            await self.session.flush()
-            await self.session.refresh(position)
-
             logger.debug(
                 f"Updated position {position_id} unrealized P&L: "
-                f"{unrealized_pnl} ({unrealized_pnl_percent:.2f}%)"
+                f"{position.unrealized_pnl} ({position.unrealized_pnl_percent:.2f}%)"
             )
             return position
         except SQLAlchemyError as e:
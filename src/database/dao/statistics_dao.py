@@ -6,16 +6,17 @@ including daily/monthly aggregations, performance tracking, and trend analysis.
 """
 
 import logging
-from datetime import datetime
+from datetime import datetime, timedelta
 from decimal import Decimal
 from typing import Any, Dict, List, Optional
 
-from sqlalchemy import and_, select
+from sqlalchemy import and_, case, func, literal, select
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.database.dao.base import BaseDAO
-from src.database.models import Statistics
+from src.database.dao.aggregates import to_decimal, trade_summary_columns
+from src.database.dao.base import UPSERT_INSERTS, BaseDAO
+from src.database.models import Statistics, Trade
 
 logger = logging.getLogger(__name__)
 
@@ -187,7 +188,10 @@ class StatisticsDAO(BaseDAO[Statistics]):
         Create or update daily statistics for a strategy on a specific date.
 
         This method should be called at the end of each trading day to
-        aggregate that day's trading performance.
+        aggregate that day's trading performance. The closed trades of the
+        day (by exit time) are rolled up and upserted into the statistics
+        table by a single INSERT ... SELECT ... ON CONFLICT statement, so
+        recalculating a day overwrites its previous record.
 
         Args:
             strategy: Strategy name
@@ -196,21 +200,113 @@ class StatisticsDAO(BaseDAO[Statistics]):
         Returns:
             Dictionary with calculated statistics
 
-        Note:
-            This is a helper method that would typically integrate with
-            TradeDAO to calculate stats from actual trades. Implementation
-            would query trades for the day and aggregate metrics.
+        Raises:
+            NotImplementedError: If the database dialect has no upsert support
 
         Example:
             >>> stats = await stats_dao.calculate_daily_stats('MACD', datetime.now())
         """
-        # This is a placeholder that demonstrates the structure
-        # In a real implementation, this would:
-        # 1. Query all closed trades for the day
-        # 2. Calculate all metrics
-        # 3. Create or update Statistics record
-        logger.info(f"Calculate daily stats called for strategy '{strategy}' on {date}")
-        raise NotImplementedError("calculate_daily_stats requires integration with TradeDAO")
+        period_start = date.replace(hour=0, minute=0, second=0, microsecond=0)
+        period_end = period_start + timedelta(days=1) - timedelta(microseconds=1)
+
+        dialect = self.session.bind.dialect.name
+        if dialect not in UPSERT_INSERTS:
+            raise NotImplementedError(f"calculate_daily_stats does not support '{dialect}'")
+        insert = UPSERT_INSERTS[dialect]
+
+        try:
+            day_filter = and_(
+                Trade.strategy == strategy,
+                Trade.status == "CLOSED",
+                Trade.exit_time >= period_start,
+                Trade.exit_time <= period_end,
+            )
+
+            # Streaks: consecutive trades with the same outcome share
+            # row_number() - row_number() partitioned by outcome
+            outcome = case((Trade.pnl > 0, 1), (Trade.pnl < 0, -1), else_=0)
+            order = (Trade.exit_time, Trade.id)
+            ranked = (
+                select(
+                    outcome.label("outcome"),
+                    (
+                        func.row_number().over(order_by=order)
+                        - func.row_number().over(partition_by=outcome, order_by=order)
+                    ).label("run"),
+                )
+                .where(day_filter)
+                .subquery("ranked")
+            )
+            runs = (
+                select(ranked.c.outcome, func.count().label("length"))
+                .group_by(ranked.c.outcome, ranked.c.run)
+                .subquery("runs")
+            )
+
+            def longest_run(value: int):
+                return (
+                    select(func.max(runs.c.length)).where(runs.c.outcome == value).scalar_subquery()
+                )
+
+            summary = {
+                column.name: column for column in trade_summary_columns(Trade.pnl, Trade.fees)
+            }
+            total_trades = summary["total_trades"].element
+            gross_profit = summary["gross_profit"].element
+            gross_loss = summary["gross_loss"].element
+
+            values = {
+                "strategy": literal(strategy, Statistics.strategy.type),
+                "period_type": literal("DAILY", Statistics.period_type.type),
+                "period_start": literal(period_start, Statistics.period_start.type),
+                "period_end": literal(period_end, Statistics.period_end.type),
+                **{name: column.element for name, column in summary.items()},
+                "win_rate": summary["winning_trades"].element
+                * 100.0
+                / func.nullif(total_trades, 0),
+                "profit_factor": case((gross_loss < 0, gross_profit / -gross_loss)),
+                "max_consecutive_wins": longest_run(1),
+                "max_consecutive_losses": longest_run(-1),
+                "total_volume": func.coalesce(
+                    func.sum(Trade.quantity * func.coalesce(Trade.exit_price, Trade.entry_price)),
+                    0,
+                ),
+            }
+            rollup = select(*(value.label(name) for name, value in values.items())).where(
+                day_filter
+            )
+
+            stmt = insert(Statistics).from_select(list(values), rollup)
+            key = ("strategy", "period_type", "period_start")
+            stmt = stmt.on_conflict_do_update(
+                index_elements=list(key),
+                set_={
+                    **{name: stmt.excluded[name] for name in values if name not in key},
+                    "updated_at": func.now(),
+                },
+            )
+            await self.session.execute(stmt)
+
+            result = await self.session.execute(
+                select(Statistics)
+                .where(
+                    and_(
+                        Statistics.strategy == strategy,
+                        Statistics.period_type == "DAILY",
+                        Statistics.period_start == period_start,
+                    )
+                )
+                .execution_options(populate_existing=True)
+            )
+            stats = result.scalar_one()
+            logger.info(
+                f"Calculated daily stats for strategy '{strategy}' on "
+                f"{period_start.date()}: {stats.total_trades} trades, P&L {stats.total_pnl}"
+            )
+            return {name: getattr(stats, name) for name in ("id", *values)}
+        except SQLAlchemyError as e:
+            logger.error(f"Error calculating daily stats for strategy '{strategy}': {e}")
+            raise
 
     async def get_strategy_comparison(
         self,
@@ -238,49 +334,52 @@ class StatisticsDAO(BaseDAO[Statistics]):
             ... )
         """
         try:
-            results = {}
-
-            for strategy in strategies:
-                query = select(Statistics).where(
+            query = (
+                select(
+                    Statistics.strategy,
+                    func.count().label("periods_count"),
+                    func.sum(Statistics.total_trades).label("total_trades"),
+                    func.sum(Statistics.winning_trades).label("winning_trades"),
+                    func.sum(Statistics.total_pnl).label("total_pnl"),
+                    # Zero ratios are treated as unset, like missing values
+                    func.max(func.nullif(Statistics.sharpe_ratio, 0)).label("best_sharpe"),
+                    func.min(func.nullif(Statistics.max_drawdown, 0)).label("max_drawdown"),
+                )
+                .where(
                     and_(
-                        Statistics.strategy == strategy,
+                        Statistics.strategy.in_(strategies),
                         Statistics.period_type == period_type,
                     )
                 )
+                .group_by(Statistics.strategy)
+            )
 
-                if start_date:
-                    query = query.where(Statistics.period_start >= start_date)
-                if end_date:
-                    query = query.where(Statistics.period_start <= end_date)
+            if start_date:
+                query = query.where(Statistics.period_start >= start_date)
+            if end_date:
+                query = query.where(Statistics.period_start <= end_date)
 
-                result = await self.session.execute(query)
-                stats_list = result.scalars().all()
+            rows = {row.strategy: row for row in await self.session.execute(query)}
 
-                if not stats_list:
+            results = {}
+            for strategy in strategies:
+                row = rows.get(strategy)
+                if row is None:
                     results[strategy] = None
                     continue
 
-                # Aggregate metrics
-                total_trades = sum(s.total_trades for s in stats_list)
-                total_pnl = sum(s.total_pnl for s in stats_list)
-                winning_trades = sum(s.winning_trades for s in stats_list)
-
+                total_trades = row.total_trades
+                total_pnl = to_decimal(row.total_pnl)
                 results[strategy] = {
                     "total_trades": total_trades,
                     "total_pnl": total_pnl,
                     "win_rate": (
-                        (winning_trades / total_trades * 100) if total_trades > 0 else 0.0
-                    ),
-                    "avg_pnl_per_period": (
-                        total_pnl / len(stats_list) if stats_list else Decimal("0")
-                    ),
-                    "periods_count": len(stats_list),
-                    "best_sharpe": max(
-                        (s.sharpe_ratio for s in stats_list if s.sharpe_ratio), default=None
-                    ),
-                    "max_drawdown": min(
-                        (s.max_drawdown for s in stats_list if s.max_drawdown), default=None
+                        (row.winning_trades / total_trades * 100) if total_trades > 0 else 0.0
                     ),
+                    "avg_pnl_per_period": total_pnl / row.periods_count,
+                    "periods_count": row.periods_count,
+                    "best_sharpe": row.best_sharpe,
+                    "max_drawdown": row.max_drawdown,
                 }
 
             logger.debug(f"Compared {len(strategies)} strategies")
@@ -370,9 +469,52 @@ class StatisticsDAO(BaseDAO[Statistics]):
             >>> trend = await stats_dao.get_performance_trend('MACD', lookback_periods=14)
         """
         try:
-            stats = await self.get_latest_stats(strategy, period_type, limit=lookback_periods)
-
-            if not stats:
+            recent = (
+                select(
+                    Statistics.period_start,
+                    Statistics.total_pnl,
+                    Statistics.win_rate,
+                    Statistics.total_trades,
+                )
+                .where(
+                    and_(
+                        Statistics.strategy == strategy,
+                        Statistics.period_type == period_type,
+                    )
+                )
+                .order_by(Statistics.period_start.desc())
+                .limit(lookback_periods)
+                .subquery("recent")
+            )
+            numbered = select(
+                recent,
+                func.row_number().over(order_by=recent.c.period_start).label("position"),
+                func.count().over().label("periods"),
+            ).subquery("numbered")
+
+            # Half sums over the chronological window; the first half holds
+            # the oldest len // 2 periods
+            first_half = numbered.c.position * 2 <= numbered.c.periods
+            win_rate = func.coalesce(numbered.c.win_rate, 0)
+            query = select(
+                numbered.c.period_start,
+                numbered.c.total_pnl,
+                numbered.c.win_rate,
+                numbered.c.total_trades,
+                numbered.c.periods,
+                func.sum(numbered.c.total_pnl).over().label("sum_pnl"),
+                func.coalesce(func.sum(case((first_half, numbered.c.total_pnl))).over(), 0).label(
+                    "first_half_pnl"
+                ),
+                func.coalesce(func.sum(case((first_half, win_rate))).over(), 0).label(
+                    "first_half_wr"
+                ),
+                func.sum(win_rate).over().label("sum_wr"),
+            ).order_by(numbered.c.period_start.asc())
+
+            rows = (await self.session.execute(query)).all()
+
+            if not rows:
                 return {
                     "periods": [],
                     "avg_pnl": Decimal("0"),
@@ -381,16 +523,16 @@ class StatisticsDAO(BaseDAO[Statistics]):
                     "total_pnl": Decimal("0"),
                 }
 
-            # Reverse to chronological order
-            stats = list(reversed(stats))
-
-            total_pnl = sum(s.total_pnl for s in stats)
-            avg_pnl = total_pnl / len(stats)
+            summary = rows[0]
+            periods = summary.periods
+            total_pnl = to_decimal(summary.sum_pnl)
+            avg_pnl = total_pnl / periods
 
             # Simple trend analysis (compare first half vs second half)
-            mid = len(stats) // 2
-            first_half_pnl = sum(s.total_pnl for s in stats[:mid]) / mid if mid > 0 else 0
-            second_half_pnl = sum(s.total_pnl for s in stats[mid:]) / (len(stats) - mid)
+            mid = periods // 2
+            first_sum = to_decimal(summary.first_half_pnl)
+            first_half_pnl = first_sum / mid if mid > 0 else 0
+            second_half_pnl = (total_pnl - first_sum) / (periods - mid)
 
             pnl_trend = (
                 "improving"
@@ -399,8 +541,9 @@ class StatisticsDAO(BaseDAO[Statistics]):
             )
 
             # Win rate trend
-            first_half_wr = sum(s.win_rate or 0 for s in stats[:mid]) / mid if mid > 0 else 0
-            second_half_wr = sum(s.win_rate or 0 for s in stats[mid:]) / (len(stats) - mid)
+            first_wr = float(summary.first_half_wr)
+            first_half_wr = first_wr / mid if mid > 0 else 0
+            second_half_wr = (float(summary.sum_wr) - first_wr) / (periods - mid)
 
             win_rate_trend = (
                 "improving"
@@ -411,12 +554,12 @@ class StatisticsDAO(BaseDAO[Statistics]):
             result = {
                 "periods": [
                     {
-                        "date": s.period_start,
-                        "pnl": s.total_pnl,
-                        "win_rate": s.win_rate,
-                        "trades": s.total_trades,
+                        "date": row.period_start,
+                        "pnl": row.total_pnl,
+                        "win_rate": row.win_rate,
+                        "trades": row.total_trades,
                     }
-                    for s in stats
+                    for row in rows
                 ],
                 "avg_pnl": avg_pnl,
                 "pnl_trend": pnl_trend,
@@ -14,6 +14,7 @@ from sqlalchemy import and_, select
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.database.dao.aggregates import to_decimal, trade_summary_columns
 from src.database.dao.base import BaseDAO
 from src.database.models import Trade
 
@@ -212,7 +213,7 @@ class TradeDAO(BaseDAO[Trade]):
             >>> print(f"Win rate: {stats['win_rate']}%")
         """
         try:
-            query = select(Trade).where(
+            query = select(*trade_summary_columns(Trade.pnl, Trade.fees)).where(
                 and_(
                     Trade.strategy == strategy,
                     Trade.status == "CLOSED",
@@ -224,49 +225,20 @@ class TradeDAO(BaseDAO[Trade]):
             if end_date:
                 query = query.where(Trade.exit_time <= end_date)
 
-            result = await self.session.execute(query)
-            trades = result.scalars().all()
-
-            if not trades:
-                return {
-                    "total_pnl": Decimal("0"),
-                    "total_trades": 0,
-                    "winning_trades": 0,
-                    "losing_trades": 0,
-                    "win_rate": 0.0,
-                    "avg_pnl": Decimal("0"),
-                    "avg_win": Decimal("0"),
-                    "avg_loss": Decimal("0"),
-                    "total_fees": Decimal("0"),
-                }
-
-            winning_trades = [t for t in trades if t.pnl and t.pnl > 0]
-            losing_trades = [t for t in trades if t.pnl and t.pnl < 0]
-
-            total_pnl = sum(t.pnl for t in trades if t.pnl) or Decimal("0")
-            total_fees = sum(t.fees for t in trades if t.fees) or Decimal("0")
-
-            avg_win = (
-                sum(t.pnl for t in winning_trades) / len(winning_trades)
-                if winning_trades
-                else Decimal("0")
-            )
-            avg_loss = (
-                sum(t.pnl for t in losing_trades) / len(losing_trades)
-                if losing_trades
-                else Decimal("0")
-            )
+            row = (await self.session.execute(query)).one()
+            total_trades = row.total_trades
+            total_pnl = to_decimal(row.total_pnl)
 
             stats = {
                 "total_pnl": total_pnl,
-                "total_trades": len(trades),
-                "winning_trades": len(winning_trades),
-                "losing_trades": len(losing_trades),
-                "win_rate": (len(winning_trades) / len(trades) * 100) if trades else 0.0,
-                "avg_pnl": total_pnl / len(trades) if trades else Decimal("0"),
-                "avg_win": avg_win,
-                "avg_loss": avg_loss,
-                "total_fees": total_fees,
+                "total_trades": total_trades,
+                "winning_trades": row.winning_trades,
+                "losing_trades": row.losing_trades,
+                "win_rate": (row.winning_trades / total_trades * 100) if total_trades else 0.0,
+                "avg_pnl": total_pnl / total_trades if total_trades else Decimal("0"),
+                "avg_win": to_decimal(row.avg_win) or Decimal("0"),
+                "avg_loss": to_decimal(row.avg_loss) or Decimal("0"),
+                "total_fees": to_decimal(row.total_fees),
             }
 
             logger.debug(f"Calculated P&L stats for strategy '{strategy}': {stats}")
@@ -275,6 +247,24 @@ class TradeDAO(BaseDAO[Trade]):
             logger.error(f"Error calculating strategy P&L: {e}")
             raise
 
+    async def import_trades(self, trades: List[Dict[str, Any]], chunk_size: int = 5000) -> int:
+        """
+        Import historical trades without loading them back into the session.
+
+        Args:
+            trades: Dictionaries of Trade fields
+            chunk_size: Maximum number of trades per INSERT statement
+
+        Returns:
+            Number of imported trades
+
+        Example:
+            >>> imported = await trade_dao.import_trades(exchange_history)
+        """
+        imported = await self.bulk_insert(trades, chunk_size=chunk_size, returning=False)
+        logger.info(f"Imported {imported} trades")
+        return imported
+
     async def get_best_trades(
         self,
         limit: int = 10,
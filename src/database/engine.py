@@ -3,30 +3,101 @@ Database engine configuration and session management.
 
 This module provides async SQLAlchemy engine setup, session factory,
 and connection pool management for the trading bot database.
+
+SQLite databases can run with a performance profile (SQLiteProfile) that
+replaces connection-per-session with a single pooled writer connection and
+a small pool of read-only connections, with WAL journaling so readers never
+block the writer. Select it with the database.sqlite_profile setting or the
+sqlite_profile argument of init_db().
 """
 
 import logging
 import os
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator, Optional
+from dataclasses import dataclass
+from typing import AsyncGenerator, List, Optional, Union
 
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
-from sqlalchemy.pool import NullPool, QueuePool
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, QueuePool
 
 from src.database.models import Base
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class SQLiteProfile:
+    """
+    SQLite connection tuning.
+
+    Attributes:
+        journal_mode: Journal mode; WAL lets readers run alongside the writer
+        synchronous: Sync mode; NORMAL is durable across application crashes in
+            WAL mode and only skips fsync on every commit
+        cache_size_kb: Page cache per connection in KiB
+        mmap_size_mb: Memory-mapped I/O size in MiB
+        busy_timeout_ms: Time to wait for a lock before failing
+        read_pool_size: Number of read-only connections
+        statement_cache_size: Prepared statements cached per connection
+        query_cache_size: Compiled SQL statements cached by SQLAlchemy
+    """
+
+    journal_mode: str = "WAL"
+    synchronous: str = "NORMAL"
+    cache_size_kb: int = 64 * 1024
+    mmap_size_mb: int = 256
+    busy_timeout_ms: int = 5000
+    read_pool_size: int = 4
+    statement_cache_size: int = 256
+    query_cache_size: int = 1200
+
+    def pragmas(self, read_only: bool = False) -> List[str]:
+        """
+        Get the PRAGMA statements run on every new connection.
+
+        Args:
+            read_only: Whether the connection is a read-only reader
+
+        Returns:
+            List of PRAGMA statements
+        """
+        pragmas = [
+            f"PRAGMA synchronous={self.synchronous}",
+            f"PRAGMA cache_size=-{self.cache_size_kb}",
+            f"PRAGMA mmap_size={self.mmap_size_mb * 1024 * 1024}",
+            f"PRAGMA busy_timeout={self.busy_timeout_ms}",
+            "PRAGMA temp_store=MEMORY",
+        ]
+        if read_only:
+            pragmas.append("PRAGMA query_only=ON")
+        else:
+            # Journal mode is persistent; the writer sets it for the database
+            pragmas.insert(0, f"PRAGMA journal_mode={self.journal_mode}")
+        return pragmas
+
+
+# Selectable SQLite profiles (None keeps a fresh connection per session)
+SQLITE_PROFILES = {
+    "default": None,
+    "performance": SQLiteProfile(),
+}
+
+
 # Global engine and session factory
 _engine: Optional[AsyncEngine] = None
 _session_factory: Optional[async_sessionmaker[AsyncSession]] = None
 
+# Read-only engine and session factory of the SQLite performance profile
+_read_engine: Optional[AsyncEngine] = None
+_read_session_factory: Optional[async_sessionmaker[AsyncSession]] = None
+
 
 def get_database_url() -> str:
     """
@@ -56,12 +127,94 @@ def get_database_url() -> str:
     return f"sqlite+aiosqlite:///{db_path}"
 
 
+def resolve_sqlite_profile(
+    profile: Union[str, SQLiteProfile, None] = None,
+) -> Optional[SQLiteProfile]:
+    """
+    Resolve a SQLite profile by name.
+
+    Args:
+        profile: Profile, profile name, or None to use the database.sqlite_profile
+            setting (with database.read_pool_size)
+
+    Returns:
+        SQLiteProfile, or None for the default connection-per-session setup
+
+    Raises:
+        ValueError: If the profile name is unknown
+    """
+    if isinstance(profile, SQLiteProfile):
+        return profile
+
+    read_pool_size = None
+    if profile is None:
+        from src.core.config import settings
+
+        profile = settings.database.sqlite_profile
+        read_pool_size = settings.database.read_pool_size
+
+    if profile not in SQLITE_PROFILES:
+        raise ValueError(
+            f"Unknown SQLite profile '{profile}'. Expected one of {sorted(SQLITE_PROFILES)}"
+        )
+    resolved = SQLITE_PROFILES[profile]
+    if resolved is not None and read_pool_size is not None:
+        resolved = SQLiteProfile(
+            **{**resolved.__dict__, "read_pool_size": read_pool_size},
+        )
+    return resolved
+
+
+def _is_file_sqlite(database_url: str) -> bool:
+    """Whether the URL points to an SQLite database file (not in-memory)."""
+    url = make_url(database_url)
+    return (
+        url.get_backend_name() == "sqlite"
+        and url.database not in (None, "", ":memory:")
+        and "mode=memory" not in database_url
+    )
+
+
+def _create_sqlite_engine(
+    database_url: str, echo: bool, profile: SQLiteProfile, read_only: bool
+) -> AsyncEngine:
+    """Create a pooled SQLite engine applying the profile's PRAGMAs."""
+    engine = create_async_engine(
+        database_url,
+        echo=echo,
+        poolclass=AsyncAdaptedQueuePool,
+        # A single writer connection serializes writes in the application
+        # instead of contending for the database lock
+        pool_size=profile.read_pool_size if read_only else 1,
+        max_overflow=0,
+        query_cache_size=profile.query_cache_size,
+        connect_args={
+            "check_same_thread": False,
+            "cached_statements": profile.statement_cache_size,
+        },
+    )
+    pragmas = profile.pragmas(read_only=read_only)
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _apply_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for pragma in pragmas:
+            cursor.execute(pragma)
+        cursor.close()
+
+    role = "read-only" if read_only else "writer"
+    logger.info(f"Created SQLite {role} engine with performance profile: {database_url}")
+    return engine
+
+
 def create_engine(
     database_url: Optional[str] = None,
     echo: bool = False,
     pool_size: int = 10,
     max_overflow: int = 20,
     pool_pre_ping: bool = True,
+    sqlite_profile: Optional[SQLiteProfile] = None,
+    read_only: bool = False,
 ) -> AsyncEngine:
     """
     Create async SQLAlchemy engine with connection pooling.
@@ -72,6 +225,9 @@ def create_engine(
         pool_size: Number of connections to maintain in pool
         max_overflow: Maximum overflow connections beyond pool_size
         pool_pre_ping: Enable connection health checks
+        sqlite_profile: Tuning profile for SQLite database files; ignored for
+            other databases and in-memory SQLite
+        read_only: Create the read-only engine of the SQLite profile
 
     Returns:
         Configured async SQLAlchemy engine
@@ -79,6 +235,9 @@ def create_engine(
     if database_url is None:
         database_url = get_database_url()
 
+    if sqlite_profile is not None and _is_file_sqlite(database_url):
+        return _create_sqlite_engine(database_url, echo, sqlite_profile, read_only)
+
     # SQLite doesn't support connection pooling
     if database_url.startswith("sqlite"):
         engine = create_async_engine(
@@ -137,6 +296,7 @@ async def init_db(
     database_url: Optional[str] = None,
     echo: bool = False,
     create_tables: bool = True,
+    sqlite_profile: Union[str, SQLiteProfile, None] = None,
 ) -> None:
     """
     Initialize database engine, session factory, and optionally create tables.
@@ -147,14 +307,24 @@ async def init_db(
         database_url: Database connection URL (uses get_database_url() if None)
         echo: Enable SQL query logging
         create_tables: Whether to create all tables on initialization
+        sqlite_profile: SQLite profile or profile name ('default' or
+            'performance'); None uses the database.sqlite_profile setting
+
+    Raises:
+        ValueError: If the profile name is unknown
 
     Example:
         >>> await init_db(echo=True, create_tables=True)
+        >>> await init_db(sqlite_profile="performance")
     """
-    global _engine, _session_factory
+    global _engine, _session_factory, _read_engine, _read_session_factory
+
+    if database_url is None:
+        database_url = get_database_url()
+    profile = resolve_sqlite_profile(sqlite_profile)
 
     # Create engine
-    _engine = create_engine(database_url, echo=echo)
+    _engine = create_engine(database_url, echo=echo, sqlite_profile=profile)
 
     # Create session factory
     _session_factory = async_sessionmaker(
@@ -165,6 +335,24 @@ async def init_db(
         autoflush=False,
     )
 
+    # Read-only connections of the SQLite profile
+    if profile is not None and _is_file_sqlite(database_url):
+        _read_engine = create_engine(
+            database_url, echo=echo, sqlite_profile=profile, read_only=True
+        )
+        _read_session_factory = async_sessionmaker(
+            _read_engine,
+            class_=AsyncSession,
+            expire_on_commit=False,
+            autocommit=False,
+            autoflush=False,
+        )
+    else:
+        if profile is not None:
+            logger.warning("SQLite profile only applies to SQLite database files; ignoring it")
+        _read_engine = None
+        _read_session_factory = None
+
     logger.info("Database engine and session factory initialized")
 
     # Create tables if requested
@@ -214,7 +402,12 @@ async def close_db() -> None:
 
     This should be called on application shutdown.
     """
-    global _engine, _session_factory
+    global _engine, _session_factory, _read_engine, _read_session_factory
+
+    if _read_engine is not None:
+        await _read_engine.dispose()
+        _read_engine = None
+        _read_session_factory = None
 
     if _engine is not None:
         await _engine.dispose()
@@ -255,6 +448,35 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
         await session.close()
 
 
+@asynccontextmanager
+async def get_read_session() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Get async database session for read-only queries.
+
+    With the SQLite performance profile the session uses the read-only
+    connection pool, so dashboard queries run alongside trading writes.
+    Otherwise it is a regular session. Nothing is committed.
+
+    Yields:
+        AsyncSession instance
+
+    Example:
+        >>> async with get_read_session() as session:
+        ...     stats = await TradeDAO(session).calculate_strategy_pnl('MACD')
+
+    Raises:
+        RuntimeError: If session factory hasn't been initialized
+    """
+    factory = _read_session_factory or get_session_factory()
+    session = factory()
+
+    try:
+        yield session
+    finally:
+        await session.rollback()
+        await session.close()
+
+
 async def health_check() -> bool:
     """
     Check database connection health.
@@ -91,6 +91,7 @@ class Trade(Base):
         Index("idx_trade_exit_time", "exit_time"),
         Index("idx_trade_status", "status"),
         Index("idx_trade_pnl", "pnl"),
+        Index("idx_trade_strategy_status_exit", "strategy", "status", "exit_time"),
         CheckConstraint("quantity > 0", name="check_quantity_positive"),
         CheckConstraint("leverage > 0", name="check_leverage_positive"),
         CheckConstraint("side IN ('LONG', 'SHORT')", name="check_valid_side"),
@@ -0,0 +1,383 @@
+"""
+Write-behind persistence of frequent row updates.
+
+Price ticks update the same position rows many times per second. Committing
+each mutation costs one SELECT, one UPDATE and one COMMIT per row per tick.
+WriteBehindQueue keeps pending column updates in memory and coalesces repeated
+updates of the same row, so only the latest values are written. It flushes
+everything in one transaction once the flush interval elapsed or the queue
+reached its size threshold.
+
+Critical transitions (e.g. closing a position) are staged as durable: they
+flush the queue immediately, together with all earlier updates, so they are
+committed when stage() returns and never overtaken by older writes.
+
+The queue works on a sync Session or an AsyncSession. With an AsyncSession
+the writes run through AsyncSession.run_sync, and all use of the session
+(flushes and execute()) is serialized by the queue.
+
+Updates of rows deleted after they were staged are dropped when flushed;
+the remaining updates are still written.
+
+With the default flush_interval of 0 every update is written through
+immediately, which preserves commit-per-update behavior.
+"""
+
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass
+from typing import Any, AsyncIterator, Callable, Dict, Optional, Tuple, Type, TypeVar, Union
+
+from sqlalchemy import select, update
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.exc import StaleDataError
+
+from src.database.models import Base
+from src.monitoring.metrics import record_persistence_flush, update_persistence_queue_depth
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+async def run_on_session(
+    session: Union[Session, AsyncSession], fn: Callable[..., T], *args: Any
+) -> T:
+    """
+    Run fn(sync_session, *args) on a sync or async session.
+
+    Args:
+        session: Sync Session, or AsyncSession whose sync session is passed
+        fn: Function using the sync session API
+        *args: Additional arguments of fn
+
+    Returns:
+        Result of fn
+    """
+    if isinstance(session, AsyncSession):
+        return await session.run_sync(fn, *args)
+    return fn(session, *args)
+
+
+@dataclass
+class WriteBehindStats:
+    """
+    Counters of a write-behind queue.
+
+    Attributes:
+        staged: Row updates staged
+        coalesced: Staged updates merged into an already pending row update
+        flushes: Successful flushes
+        failed_flushes: Flushes rolled back because of a database error
+        dropped: Row updates discarded because the row no longer exists
+        rows_written: Row updates written by successful flushes
+        last_flush_ms: Duration of the last successful flush
+        max_flush_ms: Longest successful flush
+        total_flush_ms: Total duration of successful flushes
+    """
+
+    staged: int = 0
+    coalesced: int = 0
+    flushes: int = 0
+    failed_flushes: int = 0
+    dropped: int = 0
+    rows_written: int = 0
+    last_flush_ms: float = 0.0
+    max_flush_ms: float = 0.0
+    total_flush_ms: float = 0.0
+
+    @property
+    def avg_flush_ms(self) -> float:
+        """Average duration of successful flushes."""
+        return self.total_flush_ms / self.flushes if self.flushes else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary format."""
+        return {**asdict(self), "avg_flush_ms": self.avg_flush_ms}
+
+
+class WriteBehindQueue:
+    """
+    Coalescing queue of primary-key row updates, flushed in batched commits.
+
+    Updates are written with ORM bulk UPDATE by primary key and committed on
+    the given session, so each flush is a single transaction.
+
+    Example:
+        >>> queue = WriteBehindQueue(session, flush_interval=1.0, max_pending=500)
+        >>> await queue.stage(Position, 42, {"current_price": price, "unrealized_pnl": pnl})
+        >>> await queue.stage(Position, 42, {"status": "CLOSED"}, durable=True)  # committed
+    """
+
+    def __init__(
+        self,
+        session: Union[Session, AsyncSession],
+        flush_interval: float = 0.0,
+        max_pending: int = 500,
+        name: str = "default",
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize queue.
+
+        Args:
+            session: Sync or async database session the updates are written and
+                committed on
+            flush_interval: Seconds between flushes (0 writes every update through)
+            max_pending: Number of pending rows that triggers a flush
+            name: Queue name used in logs and metrics
+            clock: Time source in seconds, monotonic by default
+
+        Raises:
+            ValueError: If flush_interval is negative or max_pending is not positive
+        """
+        if flush_interval < 0:
+            raise ValueError(f"flush_interval must be non-negative, got {flush_interval}")
+        if max_pending <= 0:
+            raise ValueError(f"max_pending must be positive, got {max_pending}")
+
+        self.session = session
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.name = name
+        self.stats = WriteBehindStats()
+
+        self._clock = clock
+        self._pending: Dict[Tuple[Type[Base], Any], Dict[str, Any]] = {}
+        self._last_flush = clock()
+        self._hold = 0
+        self._lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def depth(self) -> int:
+        """Number of rows with pending updates."""
+        return len(self._pending)
+
+    async def stage(
+        self,
+        model: Type[Base],
+        row_id: Any,
+        values: Dict[str, Any],
+        durable: bool = False,
+    ) -> None:
+        """
+        Stage column updates of one row.
+
+        Later values of a column replace earlier pending ones.
+
+        Args:
+            model: Model class of the row
+            row_id: Primary key of the row
+            values: Column values to write
+            durable: Flush immediately; the update (and all earlier ones) is
+                committed when this returns
+
+        Raises:
+            SQLAlchemyError: If a triggered flush fails (updates stay pending)
+        """
+        key = (model, row_id)
+        pending = self._pending.get(key)
+        if pending is None:
+            self._pending[key] = dict(values)
+        else:
+            pending.update(values)
+            self.stats.coalesced += 1
+        self.stats.staged += 1
+        update_persistence_queue_depth(self.name, len(self._pending))
+
+        if durable or (not self._hold and self._is_due()):
+            await self.flush()
+
+    def _is_due(self) -> bool:
+        return (
+            len(self._pending) >= self.max_pending
+            or self._clock() - self._last_flush >= self.flush_interval
+        )
+
+    @asynccontextmanager
+    async def batch(self) -> AsyncIterator["WriteBehindQueue"]:
+        """
+        Defer interval and size flushes until the block ends.
+
+        Updates staged inside the block are written in one transaction when
+        it exits (if a flush is due). Durable updates still flush at once.
+        """
+        self._hold += 1
+        try:
+            yield self
+        finally:
+            self._hold -= 1
+            if not self._hold and self._pending and self._is_due():
+                await self.flush()
+
+    async def flush(self) -> int:
+        """
+        Write all pending updates in one transaction.
+
+        Updates of rows that no longer exist are dropped and the rest are
+        written in a new transaction.
+
+        Returns:
+            Number of rows written
+
+        Raises:
+            SQLAlchemyError: If writing fails; the transaction is rolled back
+                and the updates stay pending for the next flush
+        """
+        async with self._lock:
+            return await self._flush()
+
+    async def execute(self, fn: Callable[..., T], *args: Any) -> T:
+        """
+        Flush pending updates, then run fn(sync_session, *args) on the session.
+
+        Use it for other writes on the queue's session (e.g. inserting a row)
+        so they are ordered after the staged updates and never overlap a
+        background flush.
+
+        Args:
+            fn: Function using the sync session API
+            *args: Additional arguments of fn
+
+        Returns:
+            Result of fn
+
+        Raises:
+            SQLAlchemyError: If the flush or fn fails
+        """
+        async with self._lock:
+            await self._flush()
+            return await run_on_session(self.session, fn, *args)
+
+    async def _flush(self) -> int:
+        """Flush pending updates; the caller holds the lock."""
+        self._last_flush = self._clock()
+        if not self._pending:
+            return 0
+
+        pending, self._pending = self._pending, {}
+        by_model: Dict[Type[Base], list] = {}
+        for (model, row_id), values in pending.items():
+            by_model.setdefault(model, []).append({"id": row_id, **values})
+
+        start = time.perf_counter()
+        try:
+            await run_on_session(self.session, self._write_pending, pending, by_model)
+        except SQLAlchemyError as e:
+            # Keep failed updates, without overriding updates staged meanwhile
+            for key, values in pending.items():
+                self._pending[key] = {**values, **self._pending.get(key, {})}
+            self.stats.failed_flushes += 1
+            logger.error(
+                f"Write-behind queue '{self.name}' failed to flush {len(pending)} rows: {e}"
+            )
+            raise
+
+        duration_ms = (time.perf_counter() - start) * 1000
+        self.stats.flushes += 1
+        self.stats.rows_written += len(pending)
+        self.stats.last_flush_ms = duration_ms
+        self.stats.max_flush_ms = max(self.stats.max_flush_ms, duration_ms)
+        self.stats.total_flush_ms += duration_ms
+        record_persistence_flush(self.name, duration_ms / 1000)
+        update_persistence_queue_depth(self.name, len(self._pending))
+
+        logger.debug(
+            f"Write-behind queue '{self.name}' flushed {len(pending)} rows "
+            f"in {duration_ms:.2f}ms"
+        )
+        return len(pending)
+
+    def _write_pending(
+        self,
+        session: Session,
+        pending: Dict[Tuple[Type[Base], Any], Dict[str, Any]],
+        by_model: Dict[Type[Base], list],
+    ) -> None:
+        """Write and commit the updates; roll back if writing fails."""
+        try:
+            try:
+                self._write(session, by_model)
+            except StaleDataError:
+                # A deleted row fails the whole bulk UPDATE; drop it and write the rest
+                session.rollback()
+                self._drop_missing_rows(session, pending, by_model)
+                self._write(session, by_model)
+        except SQLAlchemyError:
+            session.rollback()
+            raise
+
+    def _write(self, session: Session, by_model: Dict[Type[Base], list]) -> None:
+        for model, rows in by_model.items():
+            if rows:
+                session.execute(update(model), rows)
+        session.commit()
+
+    def _drop_missing_rows(
+        self,
+        session: Session,
+        pending: Dict[Tuple[Type[Base], Any], Dict[str, Any]],
+        by_model: Dict[Type[Base], list],
+    ) -> None:
+        """Remove updates of rows that no longer exist from pending and by_model."""
+        for model, rows in by_model.items():
+            ids = [row["id"] for row in rows]
+            existing = set(session.scalars(select(model.id).where(model.id.in_(ids))))
+            missing = [row_id for row_id in ids if row_id not in existing]
+            if not missing:
+                continue
+
+            by_model[model] = [row for row in rows if row["id"] in existing]
+            for row_id in missing:
+                del pending[(model, row_id)]
+            self.stats.dropped += len(missing)
+            logger.warning(
+                f"Write-behind queue '{self.name}' dropped updates of {len(missing)} "
+                f"missing {model.__name__} rows: {missing}"
+            )
+
+    def start(self) -> None:
+        """Start flushing on the interval in the background (requires a running loop)."""
+        if self._task is None and self.flush_interval > 0:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the background flushing and write the remaining updates."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+    async def _run(self) -> None:
+        """Flush pending updates that no new update triggered (idle periods)."""
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            if self._pending and not self._hold and self._is_due():
+                try:
+                    await self.flush()
+                except SQLAlchemyError:
+                    pass  # Logged by flush(); retried on the next interval
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get queue statistics.
+
+        Returns:
+            Dictionary with the counters, flush latencies and current 'depth'
+        """
+        return {**self.stats.to_dict(), "depth": self.depth}
+
+    def __repr__(self) -> str:
+        return (
+            f"WriteBehindQueue(name={self.name}, flush_interval={self.flush_interval}, "
+            f"depth={self.depth})"
+        )
@@ -3,6 +3,7 @@ ICT Indicators module for technical analysis.
 """
 
 from src.indicators.breaker_block import BreakerBlock, BreakerBlockDetector, BreakerBlockType
+from src.indicators.engine_pool import IndicatorDelta, IndicatorEnginePool
 from src.indicators.expiration_manager import (
     ExpirationConfig,
     ExpirationRules,
@@ -10,6 +11,7 @@ from src.indicators.expiration_manager import (
     IndicatorExpirationManager,
 )
 from src.indicators.fair_value_gap import FairValueGap, FVGDetector, FVGState, FVGType
+from src.indicators.incremental import IncrementalIndicatorState, SwingTracker
 from src.indicators.liquidity_sweep import (
     LiquiditySweep,
     LiquiditySweepDetector,
@@ -37,6 +39,21 @@ from src.indicators.order_block import (
     OrderBlockType,
     SwingPoint,
 )
+from src.indicators.primitives import (
+    RollingATR,
+    RollingExtremes,
+    RollingMean,
+    StreamingPrimitives,
+)
+from src.indicators.snapshot import (
+    IndicatorSnapshot,
+    SnapshotBuilder,
+    SnapshotDelta,
+    diff_snapshots,
+    indicator_id,
+    serialize_payload,
+)
+from src.indicators.zone_index import ZoneIndex
 
 __all__ = [
     "OrderBlock",
@@ -55,6 +72,10 @@ __all__ = [
     "TimeframeIndicators",
     "TimeframeData",
     "IndicatorType",
+    "IndicatorEnginePool",
+    "IndicatorDelta",
+    "IncrementalIndicatorState",
+    "SwingTracker",
     "IndicatorExpirationManager",
     "ExpirationRules",
     "ExpirationConfig",
@@ -69,4 +90,15 @@ __all__ = [
     "SweepDirection",
     "SweepState",
     "SweepCandidate",
+    "ZoneIndex",
+    "StreamingPrimitives",
+    "RollingATR",
+    "RollingExtremes",
+    "RollingMean",
+    "IndicatorSnapshot",
+    "SnapshotBuilder",
+    "serialize_payload",
+    "SnapshotDelta",
+    "diff_snapshots",
+    "indicator_id",
 ]
@@ -0,0 +1,252 @@
+"""
+Streaming aggregation of base candles into higher-timeframe candles.
+
+CandleAggregator keeps one running OHLCV accumulator per target timeframe, so
+every base candle costs O(1) per target instead of re-slicing the last N base
+candles at each period boundary. Periods are aligned like
+Candle.normalize_timestamp (UTC epoch), which makes any chain of timeframes
+that are multiples of the base valid, e.g. 1m → 5m → 15m → 1h → 4h → 1d from a
+single 1m stream.
+
+Gaps are tolerated: a period missing base candles is closed from what it
+received, either when its last base candle arrives or when the first candle
+of a later period does. The forming (not yet closed) bar of each target is
+available at any time, including the in-progress base candle.
+"""
+
+import logging
+from typing import Dict, Iterable, List, Optional
+
+from src.core.constants import TimeFrame
+from src.models.candle import Candle
+
+logger = logging.getLogger(__name__)
+
+
+class _Bar:
+    """Running OHLCV of one forming higher-timeframe period."""
+
+    __slots__ = ("timestamp", "open", "high", "low", "close", "volume", "last_timestamp")
+
+    def __init__(self, timestamp: int, candle: Candle):
+        self.timestamp = timestamp
+        self.open = candle.open
+        self.high = candle.high
+        self.low = candle.low
+        self.close = candle.close
+        self.volume = candle.volume
+        self.last_timestamp = candle.timestamp
+
+    def add(self, candle: Candle) -> None:
+        if candle.high > self.high:
+            self.high = candle.high
+        if candle.low < self.low:
+            self.low = candle.low
+        self.close = candle.close
+        self.volume += candle.volume
+        self.last_timestamp = candle.timestamp
+
+    def to_candle(
+        self, symbol: str, timeframe: TimeFrame, is_closed: bool, live: Optional[Candle] = None
+    ) -> Candle:
+        high, low, close, volume = self.high, self.low, self.close, self.volume
+        if live is not None:
+            high = max(high, live.high)
+            low = min(low, live.low)
+            close = live.close
+            volume += live.volume
+        return Candle(
+            symbol=symbol,
+            timeframe=timeframe,
+            timestamp=self.timestamp,
+            open=self.open,
+            high=high,
+            low=low,
+            close=close,
+            volume=volume,
+            is_closed=is_closed,
+        )
+
+
+class CandleAggregator:
+    """
+    Incrementally builds higher-timeframe candles from one base timeframe.
+
+    Example:
+        >>> aggregator = CandleAggregator(TimeFrame.M1, [TimeFrame.M15, TimeFrame.H1])
+        >>> for candle in one_minute_stream:
+        ...     for closed in aggregator.update(candle):
+        ...         handle(closed)
+        >>> aggregator.forming_bar(TimeFrame.H1)
+    """
+
+    def __init__(
+        self,
+        base_timeframe: TimeFrame,
+        target_timeframes: List[TimeFrame],
+        symbol: Optional[str] = None,
+    ):
+        """
+        Initialize aggregator.
+
+        Args:
+            base_timeframe: Timeframe of the input candles
+            target_timeframes: Higher timeframes to build
+            symbol: Symbol of the candles (taken from the first candle if None)
+
+        Raises:
+            ValueError: If a target is not a larger multiple of the base timeframe
+        """
+        self.base_timeframe = base_timeframe
+        self.symbol = symbol
+        self._base_ms = Candle.get_timeframe_milliseconds(base_timeframe)
+
+        self._targets: List[tuple] = []
+        for target in sorted(target_timeframes, key=Candle.get_timeframe_milliseconds):
+            target_ms = Candle.get_timeframe_milliseconds(target)
+            if target_ms <= self._base_ms or target_ms % self._base_ms:
+                raise ValueError(
+                    f"Cannot aggregate {base_timeframe.value} candles into {target.value}"
+                )
+            self._targets.append((target, target_ms))
+
+        self._bars: Dict[TimeFrame, _Bar] = {}
+        # Open time of the last period emitted per target, to drop late candles
+        self._last_closed: Dict[TimeFrame, int] = {}
+        self._live: Optional[Candle] = None
+
+    @property
+    def target_timeframes(self) -> List[TimeFrame]:
+        """Target timeframes in ascending order."""
+        return [target for target, _ in self._targets]
+
+    def update(self, candle: Candle) -> List[Candle]:
+        """
+        Add a base candle.
+
+        Closed candles are accumulated; an in-progress candle only replaces
+        the live candle shown in forming bars.
+
+        Args:
+            candle: Candle of the base timeframe
+
+        Returns:
+            Higher-timeframe candles closed by this candle, smallest timeframe first
+
+        Raises:
+            ValueError: If the candle is not of the base timeframe
+        """
+        if candle.timeframe != self.base_timeframe:
+            raise ValueError(
+                f"Expected {self.base_timeframe.value} candle, got {candle.timeframe.value}"
+            )
+        if self.symbol is None:
+            self.symbol = candle.symbol
+
+        if not candle.is_closed:
+            self._live = candle
+            return []
+        if self._live is not None and self._live.timestamp <= candle.timestamp:
+            self._live = None
+
+        completed = []
+        end = candle.timestamp + self._base_ms
+        for target, target_ms in self._targets:
+            start = candle.timestamp - candle.timestamp % target_ms
+            last_closed = self._last_closed.get(target)
+            if last_closed is not None and start <= last_closed:
+                logger.warning(
+                    f"Ignoring late {self.base_timeframe.value} candle at {candle.timestamp} "
+                    f"for closed {target.value} period"
+                )
+                continue
+
+            bar = self._bars.get(target)
+            if bar is not None and bar.timestamp != start:
+                # The previous period ended without its last base candle (gap)
+                completed.append(self._close(target, bar))
+                bar = None
+
+            if bar is None:
+                bar = _Bar(start, candle)
+                self._bars[target] = bar
+            elif candle.timestamp <= bar.last_timestamp:
+                continue  # Duplicate or out-of-order candle inside the period
+            else:
+                bar.add(candle)
+
+            if end >= start + target_ms:
+                completed.append(self._close(target, bar))
+
+        return completed
+
+    def seed(self, candles: Iterable[Candle]) -> None:
+        """
+        Warm up the forming bars from earlier base candles (completed bars are discarded).
+
+        Args:
+            candles: Earlier closed base candles in chronological order
+        """
+        for candle in candles:
+            if candle.is_closed:
+                self.update(candle)
+
+    def _close(self, target: TimeFrame, bar: _Bar) -> Candle:
+        del self._bars[target]
+        self._last_closed[target] = bar.timestamp
+        return bar.to_candle(self.symbol, target, is_closed=True)
+
+    def forming_bar(self, target: TimeFrame) -> Optional[Candle]:
+        """
+        Get the forming (not yet closed) bar of a target timeframe.
+
+        Args:
+            target: Target timeframe
+
+        Returns:
+            Candle with is_closed=False including the in-progress base candle,
+            or None if the current period has no data yet
+        """
+        target_ms = dict(self._targets).get(target)
+        if target_ms is None:
+            return None
+
+        bar = self._bars.get(target)
+        live = self._live
+        if live is not None:
+            live_start = live.timestamp - live.timestamp % target_ms
+            if bar is not None and (
+                live_start != bar.timestamp or live.timestamp <= bar.last_timestamp
+            ):
+                live = None
+            elif bar is None:
+                if self._last_closed.get(target, -1) >= live_start:
+                    return None
+                return _Bar(live_start, live).to_candle(self.symbol, target, is_closed=False)
+
+        if bar is None:
+            return None
+        return bar.to_candle(self.symbol, target, is_closed=False, live=live)
+
+    def reset_target(self, target: TimeFrame) -> None:
+        """
+        Forget the forming bar of one target timeframe.
+
+        Base candles added afterwards start a new bar for the current period.
+
+        Args:
+            target: Target timeframe
+        """
+        self._bars.pop(target, None)
+
+    def reset(self) -> None:
+        """Forget all forming bars and the live candle."""
+        self._bars.clear()
+        self._last_closed.clear()
+        self._live = None
+
+    def __repr__(self) -> str:
+        return (
+            f"CandleAggregator(base={self.base_timeframe.value}, "
+            f"targets={[target.value for target in self.target_timeframes]})"
+        )
@@ -15,6 +15,7 @@ from typing import Any, Dict, List, Optional
 
 from src.core.constants import TimeFrame
 from src.indicators.order_block import OrderBlock, OrderBlockState, OrderBlockType
+from src.indicators.zone_index import ZoneIndex
 from src.models.candle import Candle
 
 logger = logging.getLogger(__name__)
@@ -346,7 +347,11 @@ class BreakerBlockDetector:
         return breaker_block
 
     def detect_breaker_blocks(
-        self, order_blocks: List[OrderBlock], candles: List[Candle], start_index: int = 0
+        self,
+        order_blocks: List[OrderBlock],
+        candles: List[Candle],
+        start_index: int = 0,
+        order_block_index: Optional[ZoneIndex] = None,
     ) -> List[BreakerBlock]:
         """
         Detect Breaker Blocks from Order Blocks and candle data.
@@ -358,6 +363,9 @@ class BreakerBlockDetector:
             order_blocks: List of Order Blocks to monitor
             candles: Full candle data for breach detection
             start_index: Starting index in candles to check for breaches
+            order_block_index: Price index over order_blocks; when given, each
+                candle only checks the blocks it traded through and broken
+                blocks are dropped from the index
 
         Returns:
             List of detected Breaker Blocks
@@ -376,7 +384,16 @@ class BreakerBlockDetector:
         for i in range(start_index, len(candles)):
             candle = candles[i]
 
-            for ob in active_obs:
+            if order_block_index is not None:
+                candidates = [
+                    ob
+                    for ob in order_block_index.reached_by(candle.low, candle.high)
+                    if ob.state == OrderBlockState.ACTIVE
+                ]
+            else:
+                candidates = active_obs
+
+            for ob in candidates:
                 # Skip if OB was formed after this candle
                 if ob.origin_candle_index >= i:
                     continue
@@ -393,6 +410,8 @@ class BreakerBlockDetector:
 
                     # Mark original OB as broken
                     ob.mark_broken()
+                    if order_block_index is not None:
+                        order_block_index.update(ob)
 
                     self.logger.debug(
                         f"Breach detected at index {i}: {ob.type.value} OB → "
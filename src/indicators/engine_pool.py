@@ -0,0 +1,531 @@
+"""
+Symbol-sharded pool of MultiTimeframeIndicatorEngine instances.
+
+Each symbol gets its own engine, so timeframe state is never shared between
+symbols. Engines either live in the calling process (workers=0) or are
+sharded across worker processes, each owning the engines of its symbols.
+
+Worker processes exchange compact tuples instead of pickled objects:
+
+    candle in:  (symbol, timeframe, timestamp, open, high, low, close, volume, is_closed)
+    delta out:  (symbol, timeframe, indicator_type, payload)
+
+where timeframe and indicator_type are the enum values and payload is the
+indicator's to_dict(). Candles are sent in batches, one message per shard,
+and each processed batch is answered with its deltas and timing.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import queue
+import time
+from collections import defaultdict
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from src.core.constants import EventType, TimeFrame
+from src.core.events import Event, EventBus
+from src.indicators.multi_timeframe_engine import IndicatorType, MultiTimeframeIndicatorEngine
+from src.models.candle import Candle
+
+logger = logging.getLogger(__name__)
+
+CandleMessage = Tuple[str, str, int, float, float, float, float, float, bool]
+DeltaMessage = Tuple[str, str, str, Dict[str, Any]]
+
+# Indicator types forwarded as deltas and the events they are published as
+_DELTA_EVENTS: Dict[IndicatorType, Tuple[EventType, str]] = {
+    IndicatorType.ORDER_BLOCK: (EventType.ORDER_BLOCK_DETECTED, "order_blocks"),
+    IndicatorType.FAIR_VALUE_GAP: (EventType.FVG_DETECTED, "fair_value_gaps"),
+    IndicatorType.BREAKER_BLOCK: (EventType.BREAKER_BLOCK_DETECTED, "breaker_blocks"),
+    IndicatorType.LIQUIDITY_SWEEP: (EventType.LIQUIDITY_SWEEP_DETECTED, "liquidity_sweeps"),
+}
+
+
+class IndicatorDelta(NamedTuple):
+    """A newly detected indicator for one symbol and timeframe."""
+
+    symbol: str
+    timeframe: TimeFrame
+    indicator_type: IndicatorType
+    payload: Dict[str, Any]
+
+    @classmethod
+    def from_message(cls, message: DeltaMessage) -> "IndicatorDelta":
+        symbol, timeframe, indicator_type, payload = message
+        return cls(symbol, TimeFrame(timeframe), IndicatorType(indicator_type), payload)
+
+
+def _candle_to_message(candle: Candle) -> CandleMessage:
+    return (
+        candle.symbol,
+        candle.timeframe.value,
+        candle.timestamp,
+        candle.open,
+        candle.high,
+        candle.low,
+        candle.close,
+        candle.volume,
+        candle.is_closed,
+    )
+
+
+def _message_to_candle(message: CandleMessage) -> Candle:
+    symbol, timeframe, timestamp, open_, high, low, close, volume, is_closed = message
+    return Candle(
+        symbol=symbol,
+        timeframe=TimeFrame(timeframe),
+        timestamp=timestamp,
+        open=open_,
+        high=high,
+        low=low,
+        close=close,
+        volume=volume,
+        is_closed=is_closed,
+    )
+
+
+def _create_engine(
+    symbol: str,
+    engine_config: Dict[str, Any],
+    deltas: List[DeltaMessage],
+    event_bus: Optional[EventBus] = None,
+) -> MultiTimeframeIndicatorEngine:
+    """Create a symbol-bound engine whose detections are appended to deltas."""
+    engine = MultiTimeframeIndicatorEngine(**engine_config, event_bus=event_bus, symbol=symbol)
+    for indicator_type in _DELTA_EVENTS:
+
+        def on_detect(
+            timeframe: TimeFrame, indicator: Any, indicator_type: IndicatorType = indicator_type
+        ) -> None:
+            deltas.append((symbol, timeframe.value, indicator_type.value, indicator.to_dict()))
+
+        engine.register_callback(indicator_type, on_detect)
+    return engine
+
+
+def _shard_worker(
+    shard_id: int,
+    engine_config: Dict[str, Any],
+    inbox: "multiprocessing.Queue[Any]",
+    outbox: "multiprocessing.Queue[Any]",
+) -> None:
+    """
+    Worker process loop: apply candle batches to per-symbol engines.
+
+    Replies to every batch with (shard_id, processed, errors, busy_seconds, deltas).
+    A None message stops the worker.
+    """
+    logging.getLogger("src").setLevel(logging.WARNING)
+    engines: Dict[str, MultiTimeframeIndicatorEngine] = {}
+    deltas: List[DeltaMessage] = []
+
+    while True:
+        batch = inbox.get()
+        if batch is None:
+            break
+
+        started = time.perf_counter()
+        errors = 0
+        for message in batch:
+            try:
+                candle = _message_to_candle(message)
+                engine = engines.get(candle.symbol)
+                if engine is None:
+                    engine = _create_engine(candle.symbol, engine_config, deltas)
+                    engines[candle.symbol] = engine
+                engine.add_candle(candle)
+            except Exception as e:
+                errors += 1
+                logger.error(f"Shard {shard_id} failed to process candle {message}: {e}")
+
+        # Engine callbacks append to this list, so send a copy and reuse it
+        outbox.put((shard_id, len(batch), errors, time.perf_counter() - started, list(deltas)))
+        deltas.clear()
+
+
+class _ShardState:
+    """Bookkeeping for one shard, kept in the parent process."""
+
+    def __init__(self, shard_id: int):
+        self.shard_id = shard_id
+        self.symbols: List[str] = []
+        self.candles_submitted = 0
+        self.candles_processed = 0
+        self.errors = 0
+        self.busy_seconds = 0.0
+        self.deltas = 0
+        self.inbox: Optional["multiprocessing.Queue[Any]"] = None
+        self.process: Optional[multiprocessing.Process] = None
+
+    def send(self, message: Any) -> None:
+        """
+        Queue a message for the worker process.
+
+        Raises:
+            RuntimeError: If the worker process has not been started
+        """
+        if self.inbox is None:
+            raise RuntimeError(f"Indicator shard {self.shard_id} has no worker process")
+        self.inbox.put(message)
+
+    @property
+    def backlog(self) -> int:
+        return self.candles_submitted - self.candles_processed
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "shard": self.shard_id,
+            "symbols": list(self.symbols),
+            "symbol_count": len(self.symbols),
+            "candles_submitted": self.candles_submitted,
+            "candles_processed": self.candles_processed,
+            "backlog": self.backlog,
+            "errors": self.errors,
+            "busy_seconds": round(self.busy_seconds, 6),
+            "deltas": self.deltas,
+            "alive": self.process.is_alive() if self.process is not None else True,
+        }
+
+
+class IndicatorEnginePool:
+    """
+    Per-symbol indicator engines, optionally sharded across worker processes.
+
+    Symbols are assigned to the shard with the fewest symbols when first
+    seen and stay there, so every candle of a symbol is processed in order by
+    the same engine. With workers=0 all engines run in the calling process as
+    a single shard and remain directly accessible through get_engine().
+
+    Detections are delivered as IndicatorDelta objects by collect() or
+    flush(), to registered callbacks, and - with an event bus - as the
+    matching *_DETECTED events carrying the symbol.
+
+    Example:
+        >>> pool = IndicatorEnginePool(workers=4, engine_config={"incremental": True})
+        >>> pool.start()
+        >>> pool.add_candles(candles)
+        >>> deltas = pool.flush()
+        >>> pool.get_shard_stats()
+        >>> pool.stop()
+    """
+
+    def __init__(
+        self,
+        workers: int = 0,
+        engine_config: Optional[Dict[str, Any]] = None,
+        event_bus: Optional[EventBus] = None,
+        mp_context: Any = None,
+    ):
+        """
+        Initialize the pool.
+
+        Args:
+            workers: Worker processes; 0 runs all engines in this process
+            engine_config: Keyword arguments for each MultiTimeframeIndicatorEngine
+                (must be picklable when workers > 0)
+            event_bus: Event bus for publishing detections (optional)
+            mp_context: multiprocessing context for workers (default platform start method)
+
+        Raises:
+            ValueError: If workers is negative
+        """
+        if workers < 0:
+            raise ValueError(f"workers must be non-negative, got {workers}")
+
+        self.workers = workers
+        self.engine_config = dict(engine_config or {})
+        self.event_bus = event_bus
+        self._mp_context = mp_context or multiprocessing.get_context()
+
+        self._shards = [_ShardState(i) for i in range(max(workers, 1))]
+        self._assignments: Dict[str, int] = {}
+        self._engines: Dict[str, MultiTimeframeIndicatorEngine] = {}
+        self._pending: List[DeltaMessage] = []
+        self._outbox: Optional["multiprocessing.Queue[Any]"] = None
+        self._callbacks: Dict[IndicatorType, List[Callable[[IndicatorDelta], None]]] = defaultdict(
+            list
+        )
+        self._running = False
+
+        logger.info(
+            f"IndicatorEnginePool initialized "
+            f"({'in-process' if workers == 0 else f'{workers} worker processes'})"
+        )
+
+    @property
+    def symbols(self) -> List[str]:
+        """Symbols seen so far."""
+        return sorted(self._assignments)
+
+    @property
+    def is_running(self) -> bool:
+        """Whether worker processes are running (always True in-process)."""
+        return self.workers == 0 or self._running
+
+    def start(self) -> None:
+        """Start worker processes (no-op for in-process pools)."""
+        if self.workers == 0 or self._running:
+            return
+
+        self._outbox = self._mp_context.Queue()
+        for shard in self._shards:
+            shard.inbox = self._mp_context.Queue()
+            shard.process = self._mp_context.Process(
+                target=_shard_worker,
+                args=(shard.shard_id, self.engine_config, shard.inbox, self._outbox),
+                name=f"indicator-shard-{shard.shard_id}",
+                daemon=True,
+            )
+            shard.process.start()
+
+        self._running = True
+        logger.info(f"Started {self.workers} indicator shard processes")
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """
+        Stop worker processes after they finish queued batches.
+
+        Deltas produced before stopping remain available to collect().
+
+        Args:
+            timeout: Seconds to wait for each worker before terminating it
+        """
+        if self.workers == 0 or not self._running:
+            return
+
+        for shard in self._shards:
+            shard.send(None)
+        for shard in self._shards:
+            process = shard.process
+            if process is None:
+                continue
+            # Keep draining so workers are not blocked on a full result queue
+            deadline = time.monotonic() + timeout
+            while process.is_alive() and time.monotonic() < deadline:
+                self._receive(timeout=0.05)
+            if process.is_alive():
+                logger.warning(f"Terminating unresponsive indicator shard {shard.shard_id}")
+                process.terminate()
+            process.join()
+        self._receive(timeout=0)
+
+        self._running = False
+        logger.info("Stopped indicator shard processes")
+
+    def __enter__(self) -> "IndicatorEnginePool":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self.stop()
+
+    def register_callback(
+        self, indicator_type: IndicatorType, callback: Callable[[IndicatorDelta], None]
+    ) -> None:
+        """
+        Register a callback for detections of one indicator type.
+
+        Callbacks run in the calling process from collect() and flush().
+
+        Args:
+            indicator_type: Type of indicator to listen for
+            callback: Function called with each IndicatorDelta
+        """
+        self._callbacks[indicator_type].append(callback)
+
+    def assign(self, symbol: str) -> int:
+        """
+        Get the shard of a symbol, assigning it to the least-loaded shard if new.
+
+        Args:
+            symbol: Trading pair symbol
+
+        Returns:
+            Shard index
+        """
+        shard_id = self._assignments.get(symbol)
+        if shard_id is None:
+            shard = min(self._shards, key=lambda s: (len(s.symbols), s.shard_id))
+            shard.symbols.append(symbol)
+            shard_id = self._assignments[symbol] = shard.shard_id
+        return shard_id
+
+    def add_candle(self, candle: Candle) -> None:
+        """
+        Route a candle to the engine of its symbol.
+
+        Args:
+            candle: New candle data
+        """
+        self.add_candles([candle])
+
+    def add_candles(self, candles: Iterable[Candle]) -> None:
+        """
+        Route candles to the engines of their symbols.
+
+        In-process pools apply the candles immediately; otherwise one batch
+        per shard is queued and processed asynchronously.
+
+        Args:
+            candles: Candles of any symbols, in per-symbol chronological order
+
+        Raises:
+            RuntimeError: If worker processes have not been started
+        """
+        if self.workers == 0:
+            for candle in candles:
+                self.assign(candle.symbol)
+                started = time.perf_counter()
+                self._in_process_engine(candle.symbol).add_candle(candle)
+                shard = self._shards[0]
+                shard.busy_seconds += time.perf_counter() - started
+                shard.candles_submitted += 1
+                shard.candles_processed += 1
+            return
+
+        if not self._running:
+            raise RuntimeError("IndicatorEnginePool workers are not running; call start()")
+
+        batches: Dict[int, List[CandleMessage]] = defaultdict(list)
+        for candle in candles:
+            batches[self.assign(candle.symbol)].append(_candle_to_message(candle))
+        for shard_id, batch in batches.items():
+            shard = self._shards[shard_id]
+            shard.send(batch)
+            shard.candles_submitted += len(batch)
+
+    def _in_process_engine(self, symbol: str) -> MultiTimeframeIndicatorEngine:
+        engine = self._engines.get(symbol)
+        if engine is None:
+            engine = _create_engine(symbol, self.engine_config, self._pending, self.event_bus)
+            self._engines[symbol] = engine
+        return engine
+
+    def get_engine(self, symbol: str) -> Optional[MultiTimeframeIndicatorEngine]:
+        """
+        Get the engine of a symbol (in-process pools only).
+
+        Args:
+            symbol: Trading pair symbol
+
+        Returns:
+            Engine, or None if no candle of the symbol was added yet
+
+        Raises:
+            RuntimeError: If engines live in worker processes
+        """
+        if self.workers > 0:
+            raise RuntimeError("Engines live in worker processes; use collect() for deltas")
+        return self._engines.get(symbol)
+
+    def _receive(self, timeout: float) -> bool:
+        """Read one worker reply into the pending deltas; False if none arrived."""
+        if self._outbox is None:
+            return False
+        try:
+            if timeout > 0:
+                reply = self._outbox.get(timeout=timeout)
+            else:
+                reply = self._outbox.get_nowait()
+        except queue.Empty:
+            return False
+
+        shard_id, processed, errors, busy_seconds, deltas = reply
+        shard = self._shards[shard_id]
+        shard.candles_processed += processed
+        shard.errors += errors
+        shard.busy_seconds += busy_seconds
+        self._pending.extend(deltas)
+        return True
+
+    def collect(self, timeout: float = 0.0) -> List[IndicatorDelta]:
+        """
+        Deliver the deltas produced so far.
+
+        Args:
+            timeout: Seconds to wait for the first worker reply if none is queued
+
+        Returns:
+            IndicatorDelta objects in arrival order
+        """
+        if self.workers > 0 and self._receive(timeout):
+            while self._receive(0):
+                pass
+
+        deltas = [IndicatorDelta.from_message(message) for message in self._pending]
+        self._pending.clear()
+        for delta in deltas:
+            self._shards[self._assignments[delta.symbol]].deltas += 1
+            self._dispatch(delta)
+        return deltas
+
+    def flush(self, timeout: float = 30.0) -> List[IndicatorDelta]:
+        """
+        Wait until every submitted candle is processed and deliver the deltas.
+
+        Args:
+            timeout: Maximum seconds to wait
+
+        Returns:
+            IndicatorDelta objects in arrival order
+
+        Raises:
+            TimeoutError: If shards still have a backlog after the timeout
+        """
+        deadline = time.monotonic() + timeout
+        while any(shard.backlog for shard in self._shards):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                backlog = {s.shard_id: s.backlog for s in self._shards if s.backlog}
+                raise TimeoutError(f"Indicator shards did not drain in {timeout}s: {backlog}")
+            self._receive(min(remaining, 0.1))
+        return self.collect()
+
+    def _dispatch(self, delta: IndicatorDelta) -> None:
+        """Run callbacks and publish the delta event."""
+        for callback in self._callbacks[delta.indicator_type]:
+            try:
+                callback(delta)
+            except Exception as e:
+                logger.error(
+                    f"Error in callback for {delta.indicator_type.value}: {e}", exc_info=True
+                )
+
+        # In-process engines already publish through their own event bus
+        if self.event_bus is None or self.workers == 0:
+            return
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return
+
+        event_type, key = _DELTA_EVENTS[delta.indicator_type]
+        event = Event(
+            priority=7,
+            event_type=event_type,
+            data={
+                "symbol": delta.symbol,
+                "timeframe": delta.timeframe.value,
+                "count": 1,
+                key: [delta.payload],
+            },
+            source="IndicatorEnginePool",
+        )
+        asyncio.create_task(self.event_bus.publish(event))
+
+    def get_shard_stats(self) -> List[Dict[str, Any]]:
+        """
+        Get per-shard load.
+
+        Returns:
+            One dictionary per shard with its symbols, submitted/processed
+            candle counts, backlog, errors, busy time and delta count
+        """
+        return [shard.to_dict() for shard in self._shards]
+
+    def __repr__(self) -> str:
+        return (
+            f"IndicatorEnginePool(workers={self.workers}, symbols={len(self._assignments)}, "
+            f"running={self.is_running})"
+        )
@@ -21,6 +21,7 @@ from typing import Any, Dict, List, Optional
 from src.indicators.breaker_block import BreakerBlock, BreakerBlockType
 from src.indicators.fair_value_gap import FairValueGap, FVGState, FVGType
 from src.indicators.order_block import OrderBlock, OrderBlockState, OrderBlockType
+from src.indicators.zone_index import ZoneIndex
 from src.models.candle import Candle
 
 logger = logging.getLogger(__name__)
@@ -259,7 +260,12 @@ class IndicatorExpirationManager:
         return should_expire
 
     def expire_order_blocks(
-        self, order_blocks: List[OrderBlock], current_candle: Candle, candle_history_length: int
+        self,
+        order_blocks: List[OrderBlock],
+        current_candle: Candle,
+        candle_history_length: int,
+        zone_index: Optional[ZoneIndex] = None,
+        timeframe_ms: Optional[int] = None,
     ) -> List[OrderBlock]:
         """
         Check and expire Order Blocks, optionally removing them.
@@ -268,28 +274,54 @@ class IndicatorExpirationManager:
             order_blocks: List of Order Blocks to check
             current_candle: Current market candle
             candle_history_length: Total number of candles in history
+            zone_index: Price index over the list; when given, only indicators the
+                candle reached or that are old enough are checked
+            timeframe_ms: Candle duration; when given, ages are measured from
+                timestamps instead of candle indices (required once the candle
+                history is a sliding window, whose indices shift)
 
         Returns:
             List of active Order Blocks (expired ones removed if auto_remove_expired)
         """
-        active_obs = []
+        if zone_index is None:
+            candidates = order_blocks
+        else:
+            candidates = self._expiration_candidates(
+                self.expiration_rules.order_block,
+                zone_index,
+                current_candle,
+                candle_history_length,
+                timeframe_ms,
+            )
 
-        for ob in order_blocks:
-            candles_since = candle_history_length - ob.origin_candle_index
+        expired = set()
+        for ob in candidates:
+            candles_since = self._candles_since(
+                candle_history_length,
+                ob.origin_candle_index,
+                ob.origin_timestamp,
+                current_candle,
+                timeframe_ms,
+            )
 
             if self.check_order_block_expiration(ob, current_candle, candles_since):
                 ob.mark_expired()
                 self.expiration_stats["order_blocks_expired"] += 1
+                expired.add(id(ob))
+                if zone_index is not None:
+                    zone_index.discard(ob)
 
-                if not self.auto_remove_expired:
-                    active_obs.append(ob)
-            else:
-                active_obs.append(ob)
-
-        return active_obs
+        if expired and self.auto_remove_expired:
+            return [ob for ob in order_blocks if id(ob) not in expired]
+        return list(order_blocks)
 
     def expire_fair_value_gaps(
-        self, fvgs: List[FairValueGap], current_candle: Candle, candle_history_length: int
+        self,
+        fvgs: List[FairValueGap],
+        current_candle: Candle,
+        candle_history_length: int,
+        zone_index: Optional[ZoneIndex] = None,
+        timeframe_ms: Optional[int] = None,
     ) -> List[FairValueGap]:
         """
         Check and expire Fair Value Gaps, optionally removing them.
@@ -298,28 +330,54 @@ class IndicatorExpirationManager:
             fvgs: List of FVGs to check
             current_candle: Current market candle
             candle_history_length: Total number of candles in history
+            zone_index: Price index over the list; when given, only indicators the
+                candle reached or that are old enough are checked
+            timeframe_ms: Candle duration; when given, ages are measured from
+                timestamps instead of candle indices (required once the candle
+                history is a sliding window, whose indices shift)
 
         Returns:
             List of active FVGs (expired ones removed if auto_remove_expired)
         """
-        active_fvgs = []
+        if zone_index is None:
+            candidates = fvgs
+        else:
+            candidates = self._expiration_candidates(
+                self.expiration_rules.fair_value_gap,
+                zone_index,
+                current_candle,
+                candle_history_length,
+                timeframe_ms,
+            )
 
-        for fvg in fvgs:
-            candles_since = candle_history_length - fvg.origin_candle_index
+        expired = set()
+        for fvg in candidates:
+            candles_since = self._candles_since(
+                candle_history_length,
+                fvg.origin_candle_index,
+                fvg.origin_timestamp,
+                current_candle,
+                timeframe_ms,
+            )
 
             if self.check_fvg_expiration(fvg, current_candle, candles_since):
                 fvg.mark_expired()
                 self.expiration_stats["fair_value_gaps_expired"] += 1
+                expired.add(id(fvg))
+                if zone_index is not None:
+                    zone_index.discard(fvg)
 
-                if not self.auto_remove_expired:
-                    active_fvgs.append(fvg)
-            else:
-                active_fvgs.append(fvg)
-
-        return active_fvgs
+        if expired and self.auto_remove_expired:
+            return [fvg for fvg in fvgs if id(fvg) not in expired]
+        return list(fvgs)
 
     def expire_breaker_blocks(
-        self, breaker_blocks: List[BreakerBlock], current_candle: Candle, candle_history_length: int
+        self,
+        breaker_blocks: List[BreakerBlock],
+        current_candle: Candle,
+        candle_history_length: int,
+        zone_index: Optional[ZoneIndex] = None,
+        timeframe_ms: Optional[int] = None,
     ) -> List[BreakerBlock]:
         """
         Check and expire Breaker Blocks, optionally removing them.
@@ -328,25 +386,107 @@ class IndicatorExpirationManager:
             breaker_blocks: List of Breaker Blocks to check
             current_candle: Current market candle
             candle_history_length: Total number of candles in history
+            zone_index: Price index over the list; when given, only indicators the
+                candle reached or that are old enough are checked
+            timeframe_ms: Candle duration; when given, ages are measured from
+                timestamps instead of candle indices (required once the candle
+                history is a sliding window, whose indices shift)
 
         Returns:
             List of active Breaker Blocks (expired ones removed if auto_remove_expired)
         """
-        active_bbs = []
+        if zone_index is None:
+            candidates = breaker_blocks
+        else:
+            candidates = self._expiration_candidates(
+                self.expiration_rules.breaker_block,
+                zone_index,
+                current_candle,
+                candle_history_length,
+                timeframe_ms,
+            )
 
-        for bb in breaker_blocks:
-            candles_since = candle_history_length - bb.transition_candle_index
+        expired = set()
+        for bb in candidates:
+            candles_since = self._candles_since(
+                candle_history_length,
+                bb.transition_candle_index,
+                bb.transition_timestamp,
+                current_candle,
+                timeframe_ms,
+            )
 
             if self.check_breaker_block_expiration(bb, current_candle, candles_since):
                 bb.mark_expired()
                 self.expiration_stats["breaker_blocks_expired"] += 1
+                expired.add(id(bb))
+                if zone_index is not None:
+                    zone_index.discard(bb)
+
+        if expired and self.auto_remove_expired:
+            return [bb for bb in breaker_blocks if id(bb) not in expired]
+        return list(breaker_blocks)
 
-                if not self.auto_remove_expired:
-                    active_bbs.append(bb)
+    def _expiration_candidates(
+        self,
+        config: ExpirationConfig,
+        zone_index: ZoneIndex,
+        current_candle: Candle,
+        candle_history_length: int,
+        timeframe_ms: Optional[int] = None,
+    ) -> List[Any]:
+        """
+        Indexed indicators that may expire on this candle.
+
+        Only indicators the candle traded beyond (price expiration) or that
+        reached the configured age (time expiration) can expire; all others
+        would pass both checks unchanged.
+        """
+        timestamp_cutoff = (
+            current_candle.timestamp - config.max_age_ms if config.max_age_ms is not None else None
+        )
+        index_cutoff = None
+        if config.max_age_candles is not None:
+            if timeframe_ms:
+                # Formed at least max_age_candles candles ago (see _candles_since)
+                age_cutoff = current_candle.timestamp - (config.max_age_candles - 1) * timeframe_ms
+                timestamp_cutoff = (
+                    age_cutoff if timestamp_cutoff is None else max(timestamp_cutoff, age_cutoff)
+                )
             else:
-                active_bbs.append(bb)
+                index_cutoff = candle_history_length - config.max_age_candles
+
+        candidates = {}
+        for zone in zone_index.reached_by(current_candle.low, current_candle.high):
+            candidates[id(zone)] = zone
+        for zone in zone_index.aged(timestamp_cutoff, index_cutoff):
+            candidates[id(zone)] = zone
+        return list(candidates.values())
+
+    @staticmethod
+    def _candles_since(
+        candle_history_length: int,
+        candle_index: int,
+        timestamp: int,
+        current_candle: Candle,
+        timeframe_ms: Optional[int],
+    ) -> int:
+        """
+        Age of an indicator in candles, counting the current candle.
 
-        return active_bbs
+        Args:
+            candle_history_length: Total number of candles in history
+            candle_index: Candle index the indicator formed at
+            timestamp: Timestamp the indicator formed at
+            current_candle: Current market candle
+            timeframe_ms: Candle duration, None to use candle indices
+
+        Returns:
+            Number of candles from formation up to and including the current one
+        """
+        if timeframe_ms:
+            return (current_candle.timestamp - timestamp) // timeframe_ms + 1
+        return candle_history_length - candle_index
 
     def _check_time_expiration(
         self,
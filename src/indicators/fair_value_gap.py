@@ -13,6 +13,7 @@ from enum import Enum
 from typing import Any, Dict, List, Optional
 
 from src.core.constants import TimeFrame
+from src.indicators.zone_index import ZoneIndex
 from src.models.candle import Candle
 
 logger = logging.getLogger(__name__)
@@ -431,14 +432,31 @@ class FVGDetector:
 
         return fvgs
 
-    def update_fvg_states(self, fvgs: List[FairValueGap], current_candles: List[Candle]) -> None:
+    def update_fvg_states(
+        self,
+        fvgs: List[FairValueGap],
+        current_candles: List[Candle],
+        fvg_index: Optional[ZoneIndex] = None,
+    ) -> None:
         """
         Update the state of FVGs based on current price action.
 
         Args:
             fvgs: List of FVGs to update
             current_candles: Recent candles to check against FVGs
+            fvg_index: Price index over fvgs; when given, only gaps the candles
+                reached are visited and filled gaps are dropped from the index
         """
+        if fvg_index is not None:
+            if not current_candles:
+                return
+            # Zones reached by the combined range are exactly those reached by
+            # at least one candle, so one lookup replaces one per candle
+            fvgs = fvg_index.reached_by(
+                min(candle.low for candle in current_candles),
+                max(candle.high for candle in current_candles),
+            )
+
         for fvg in fvgs:
             if fvg.state == FVGState.FILLED or fvg.state == FVGState.EXPIRED:
                 continue
@@ -457,3 +475,6 @@ class FVGDetector:
                 elif fvg.type == FVGType.BEARISH and candle.high > fvg.high:
                     fvg.state = FVGState.FILLED
                     fvg.filled_percentage = 100.0
+
+            if fvg_index is not None:
+                fvg_index.update(fvg)
@@ -0,0 +1,496 @@
+"""
+Incremental (streaming) indicator detection for the multi-timeframe engine.
+
+The batch detectors re-scan the whole candle window on every update, which is
+O(n * lookback) per candle and quadratic over a session. The classes in this
+module keep streaming state instead (confirmed swing points, pending Order Block
+swings, the trailing FVG triple, a running volume sum) and only examine the
+newly appended candle, while reusing the batch detectors for the actual
+pattern rules so both paths produce identical results.
+
+All incremental state is expressed in absolute candle positions (the number of
+candles appended before a candle) and translated to window-relative indices at
+read time, so trimming the candle window never invalidates it.
+"""
+
+import logging
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque, Dict, List, Optional, Tuple
+
+from src.indicators.fair_value_gap import FairValueGap, FVGDetector
+from src.indicators.liquidity_zone import (
+    LiquidityLevel,
+    LiquidityLevelClusters,
+    LiquidityZoneDetector,
+    SwingPoint,
+)
+from src.indicators.order_block import OrderBlock, OrderBlockDetector
+from src.indicators.trend_recognition import (
+    TrendDirection,
+    TrendRecognitionEngine,
+    TrendStructure,
+)
+from src.models.candle import Candle
+
+logger = logging.getLogger(__name__)
+
+
+class SwingTracker:
+    """
+    Streaming swing high/low detection for a single lookback.
+
+    A candle becomes a swing high (low) once `lookback` candles on each side
+    have strictly lower highs (higher lows). The tracker checks exactly one
+    candidate per appended candle - the candle `lookback` positions back - so
+    each update costs O(lookback) regardless of the window size.
+    """
+
+    def __init__(self, lookback: int):
+        """
+        Initialize swing tracker.
+
+        Args:
+            lookback: Number of candles to check on each side
+        """
+        if lookback <= 0:
+            raise ValueError(f"lookback must be positive, got {lookback}")
+
+        self.lookback = lookback
+        # (absolute position, candle) pairs in chronological order
+        self._highs: Deque[Tuple[int, Candle]] = deque()
+        self._lows: Deque[Tuple[int, Candle]] = deque()
+
+    def on_candle(self, candles: List[Candle], offset: int) -> Tuple[bool, bool]:
+        """
+        Process the most recently appended candle.
+
+        Args:
+            candles: Current candle window (last element is the new candle)
+            offset: Absolute position of candles[0]
+
+        Returns:
+            Tuple of (new swing high confirmed, new swing low confirmed)
+        """
+        lookback = self.lookback
+        center = len(candles) - 1 - lookback
+
+        # Batch detection only considers window indices >= lookback
+        if center < lookback:
+            return False, False
+
+        candidate = candles[center]
+        before = candles[center - lookback : center]
+        after = candles[center + 1 : center + lookback + 1]
+
+        high = candidate.high
+        is_high = all(high > c.high for c in before) and all(high > c.high for c in after)
+
+        low = candidate.low
+        is_low = all(low < c.low for c in before) and all(low < c.low for c in after)
+
+        if is_high:
+            self._highs.append((offset + center, candidate))
+        if is_low:
+            self._lows.append((offset + center, candidate))
+
+        return is_high, is_low
+
+    def _prune(self, offset: int) -> None:
+        """Drop swings that have slid too close to the start of the window."""
+        threshold = offset + self.lookback
+        while self._highs and self._highs[0][0] < threshold:
+            self._highs.popleft()
+        while self._lows and self._lows[0][0] < threshold:
+            self._lows.popleft()
+
+    def get_swing_highs(self, offset: int, since: int = 0) -> List[SwingPoint]:
+        """
+        Get swing highs with window-relative candle indices.
+
+        Args:
+            offset: Absolute position of the first candle in the window
+            since: Only return swings at or after this absolute position
+
+        Returns:
+            Swing highs in chronological order
+        """
+        self._prune(offset)
+        lookback = self.lookback
+        # Positional arguments: this runs for every tracked swing on every update
+        return [
+            SwingPoint(c.high, c.timestamp, pos - offset, True, lookback, c.volume)
+            for pos, c in self._since(self._highs, since)
+        ]
+
+    def get_swing_lows(self, offset: int, since: int = 0) -> List[SwingPoint]:
+        """
+        Get swing lows with window-relative candle indices.
+
+        Args:
+            offset: Absolute position of the first candle in the window
+            since: Only return swings at or after this absolute position
+
+        Returns:
+            Swing lows in chronological order
+        """
+        self._prune(offset)
+        lookback = self.lookback
+        # Positional arguments: this runs for every tracked swing on every update
+        return [
+            SwingPoint(c.low, c.timestamp, pos - offset, False, lookback, c.volume)
+            for pos, c in self._since(self._lows, since)
+        ]
+
+    @staticmethod
+    def _since(swings: Deque[Tuple[int, Candle]], since: int) -> List[Tuple[int, Candle]]:
+        """Trailing swings at or after an absolute position, walking from the newest."""
+        if not swings or swings[0][0] >= since:
+            return list(swings)
+        tail = []
+        for swing in reversed(swings):
+            if swing[0] < since:
+                break
+            tail.append(swing)
+        tail.reverse()
+        return tail
+
+    def reset(self) -> None:
+        """Forget all tracked swings."""
+        self._highs.clear()
+        self._lows.clear()
+
+
+class IncrementalOrderBlockDetector:
+    """
+    Streaming wrapper around OrderBlockDetector.
+
+    An Order Block is anchored to a swing point, so it can only appear once the
+    swing is confirmed. Its confirmation window (up to two candles after the
+    swing) may still grow for very small lookbacks, so the swing is re-evaluated
+    on each candle until that window is complete, exactly like the batch scan.
+    """
+
+    def __init__(self, detector: OrderBlockDetector, swing_tracker: SwingTracker):
+        """
+        Initialize incremental Order Block detection.
+
+        Args:
+            detector: Batch detector providing the Order Block rules
+            swing_tracker: Tracker using detector.min_swing_strength as lookback
+        """
+        self.detector = detector
+        self.swing_tracker = swing_tracker
+        # (absolute swing position, is_high) awaiting a complete confirmation window
+        self._pending: List[Tuple[int, bool]] = []
+
+    def on_candle(
+        self, candles: List[Candle], offset: int, new_high: bool, new_low: bool
+    ) -> List[OrderBlock]:
+        """
+        Detect Order Blocks made detectable by the newly appended candle.
+
+        Args:
+            candles: Current candle window
+            offset: Absolute position of candles[0]
+            new_high: Whether the swing tracker just confirmed a swing high
+            new_low: Whether the swing tracker just confirmed a swing low
+
+        Returns:
+            Order Blocks found on this candle (may repeat earlier results for
+            swings whose confirmation window is still growing)
+        """
+        center = offset + len(candles) - 1 - self.swing_tracker.lookback
+        if new_high:
+            self._pending.append((center, True))
+        if new_low:
+            self._pending.append((center, False))
+
+        if not self._pending:
+            return []
+
+        end = offset + len(candles)
+        order_blocks = []
+        still_pending = []
+
+        for position, is_high in self._pending:
+            index = position - offset
+            if index < 0:
+                continue
+
+            swing = [SwingPoint(price=0.0, timestamp=0, candle_index=index, is_high=is_high)]
+            if is_high:
+                order_blocks.extend(self.detector.detect_bearish_order_blocks(candles, swing))
+            else:
+                order_blocks.extend(self.detector.detect_bullish_order_blocks(candles, swing))
+
+            # Confirmation window candles[i + 1 : swing + 3] is complete
+            if end < position + 3:
+                still_pending.append((position, is_high))
+
+        self._pending = still_pending
+        return order_blocks
+
+    def reset(self) -> None:
+        """Forget pending swings."""
+        self._pending.clear()
+
+
+class IncrementalFVGDetector:
+    """
+    Streaming wrapper around FVGDetector.
+
+    A Fair Value Gap is a property of three consecutive candles, so each new
+    candle only needs the triple it completes.
+    """
+
+    def __init__(self, detector: FVGDetector):
+        """
+        Initialize incremental FVG detection.
+
+        Args:
+            detector: Batch detector providing the FVG rules
+        """
+        self.detector = detector
+
+    def on_candle(self, candles: List[Candle]) -> List[FairValueGap]:
+        """
+        Detect the FVG completed by the newly appended candle, if any.
+
+        Args:
+            candles: Current candle window
+
+        Returns:
+            Zero or one Fair Value Gaps
+        """
+        start = len(candles) - 3
+        if start < 0:
+            return []
+
+        fvgs = []
+        bullish_fvg = self.detector.detect_bullish_fvg(candles, start)
+        if bullish_fvg:
+            fvgs.append(bullish_fvg)
+
+        bearish_fvg = self.detector.detect_bearish_fvg(candles, start)
+        if bearish_fvg:
+            fvgs.append(bearish_fvg)
+
+        return fvgs
+
+
+@dataclass
+class IncrementalIndicatorState:
+    """
+    Streaming detector state for one timeframe of the indicator engine.
+
+    Attributes:
+        ob_detector: Incremental Order Block detection
+        fvg_detector: Incremental FVG detection
+        liquidity_zone_detector: Batch detector used to build liquidity levels
+        trend_engine: Batch engine used to build trend structures
+        swing_trackers: Swing trackers keyed by lookback (shared between detectors)
+        processed_candles: Absolute number of candles consumed so far
+        volume_sum: Running sum of volume over the current candle window
+        liquidity_clusters: Persistent clustered liquidity levels, or None to
+            rebuild levels from all tracked swings on every update
+    """
+
+    ob_detector: IncrementalOrderBlockDetector
+    fvg_detector: IncrementalFVGDetector
+    liquidity_zone_detector: LiquidityZoneDetector
+    trend_engine: TrendRecognitionEngine
+    swing_trackers: Dict[int, SwingTracker]
+    processed_candles: int = 0
+    volume_sum: float = 0.0
+    liquidity_clusters: Optional[LiquidityLevelClusters] = None
+    _window_start: int = 0
+    _volumes: Deque[float] = field(default_factory=deque)
+    _new_order_blocks: List[OrderBlock] = field(default_factory=list)
+    _new_fvgs: List[FairValueGap] = field(default_factory=list)
+
+    @classmethod
+    def create(
+        cls,
+        ob_detector: OrderBlockDetector,
+        fvg_detector: FVGDetector,
+        liquidity_zone_detector: LiquidityZoneDetector,
+        trend_engine: TrendRecognitionEngine,
+        persistent_liquidity: bool = False,
+    ) -> "IncrementalIndicatorState":
+        """
+        Create streaming state wired to the engine's batch detectors.
+
+        Args:
+            ob_detector: Order Block detector
+            fvg_detector: FVG detector
+            liquidity_zone_detector: Liquidity Zone detector
+            trend_engine: Trend Recognition engine
+            persistent_liquidity: If True, merge new swings into persistent
+                liquidity levels instead of re-clustering all swings each update
+
+        Returns:
+            New incremental state
+        """
+        trackers: Dict[int, SwingTracker] = {}
+        for lookback in (
+            ob_detector.min_swing_strength,
+            liquidity_zone_detector.min_swing_strength,
+            trend_engine.min_swing_strength,
+        ):
+            trackers.setdefault(lookback, SwingTracker(lookback))
+
+        return cls(
+            ob_detector=IncrementalOrderBlockDetector(
+                ob_detector, trackers[ob_detector.min_swing_strength]
+            ),
+            fvg_detector=IncrementalFVGDetector(fvg_detector),
+            liquidity_zone_detector=liquidity_zone_detector,
+            trend_engine=trend_engine,
+            swing_trackers=trackers,
+            liquidity_clusters=(
+                LiquidityLevelClusters(liquidity_zone_detector) if persistent_liquidity else None
+            ),
+        )
+
+    def advance(self, candles: List[Candle], total_candles: int) -> None:
+        """
+        Consume candles appended since the previous call.
+
+        Normally exactly one candle is new. Candles trimmed from the front of
+        the window are removed from the running volume sum.
+
+        Args:
+            candles: Current candle window
+            total_candles: Absolute number of candles ever appended to the window
+        """
+        offset = total_candles - len(candles)
+
+        # Forget volumes of processed candles that were trimmed from the window
+        while self._volumes and self._window_start < offset:
+            self.volume_sum -= self._volumes.popleft()
+            self._window_start += 1
+        self._window_start = offset
+
+        ob_lookback = self.ob_detector.swing_tracker.lookback
+
+        for position in range(max(self.processed_candles, offset), total_candles):
+            if position == total_candles - 1:
+                window = candles
+            else:
+                window = candles[: position - offset + 1]
+
+            volume = window[-1].volume
+            self._volumes.append(volume)
+            self.volume_sum += volume
+
+            confirmed: Dict[int, Tuple[bool, bool]] = {
+                lookback: tracker.on_candle(window, offset)
+                for lookback, tracker in self.swing_trackers.items()
+            }
+
+            new_high, new_low = confirmed[ob_lookback]
+            self._new_order_blocks.extend(
+                self.ob_detector.on_candle(window, offset, new_high, new_low)
+            )
+            self._new_fvgs.extend(self.fvg_detector.on_candle(window))
+
+        self.processed_candles = total_candles
+
+    def take_new_order_blocks(self) -> List[OrderBlock]:
+        """
+        Return Order Blocks detected since the previous call.
+
+        Returns:
+            Newly detected Order Blocks sorted by origin timestamp
+        """
+        order_blocks = sorted(self._new_order_blocks, key=lambda ob: ob.origin_timestamp)
+        self._new_order_blocks = []
+        return order_blocks
+
+    def take_new_fvgs(self) -> List[FairValueGap]:
+        """
+        Return Fair Value Gaps detected since the previous call.
+
+        Returns:
+            Newly detected Fair Value Gaps sorted by origin timestamp
+        """
+        fvgs = sorted(self._new_fvgs, key=lambda fvg: fvg.origin_timestamp)
+        self._new_fvgs = []
+        return fvgs
+
+    def detect_liquidity_levels(
+        self, candles: List[Candle]
+    ) -> Tuple[List[LiquidityLevel], List[LiquidityLevel]]:
+        """
+        Build liquidity levels from the tracked swing points.
+
+        With persistent liquidity only swings confirmed since the previous call
+        are merged, and the same level objects are returned across calls.
+
+        Args:
+            candles: Current candle window
+
+        Returns:
+            Tuple of (buy_side_levels, sell_side_levels)
+        """
+        tracker = self.swing_trackers[self.liquidity_zone_detector.min_swing_strength]
+        offset = self._window_start
+        avg_volume = self.volume_sum / len(candles) if candles else 1.0
+
+        clusters = self.liquidity_clusters
+        if clusters is not None:
+            since = clusters.last_position + 1
+            return clusters.update(
+                candles,
+                tracker.get_swing_highs(offset, since),
+                tracker.get_swing_lows(offset, since),
+                offset,
+                avg_volume=avg_volume,
+            )
+
+        return self.liquidity_zone_detector.build_liquidity_levels(
+            candles,
+            tracker.get_swing_highs(offset),
+            tracker.get_swing_lows(offset),
+            avg_volume=avg_volume,
+        )
+
+    def analyze_trend_patterns(
+        self, candles: List[Candle], atr: Optional[float] = None
+    ) -> Tuple[List[TrendStructure], TrendDirection]:
+        """
+        Build trend structures from the tracked swing points.
+
+        Args:
+            candles: Current candle window
+            atr: Streaming ATR of the window, None to calculate it from the last candles
+
+        Returns:
+            Tuple of (trend structures, overall trend direction)
+        """
+        engine = self.trend_engine
+        tracker = self.swing_trackers[engine.min_swing_strength]
+        offset = self._window_start
+
+        if atr is None:
+            # ATR only depends on the last `atr_period` true ranges
+            atr = engine.calculate_atr(candles[-(engine.atr_period + 1) :])
+
+        return engine.analyze_swing_points(
+            tracker.get_swing_highs(offset), tracker.get_swing_lows(offset), atr
+        )
+
+    def reset(self) -> None:
+        """Forget all streaming state (used when the candle window is cleared)."""
+        for tracker in self.swing_trackers.values():
+            tracker.reset()
+        self.ob_detector.reset()
+        if self.liquidity_clusters is not None:
+            self.liquidity_clusters.reset()
+        self.processed_candles = 0
+        self.volume_sum = 0.0
+        self._window_start = 0
+        self._volumes.clear()
+        self._new_order_blocks = []
+        self._new_fvgs = []
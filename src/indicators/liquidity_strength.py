@@ -8,6 +8,7 @@ This module implements real-time tracking of:
 """
 
 import logging
+import math
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
@@ -194,7 +195,11 @@ class LiquidityStrengthCalculator:
         self.logger = logging.getLogger(f"{__name__}.LiquidityStrengthCalculator")
 
     def calculate_strength(
-        self, level: LiquidityLevel, candles: List[Candle], current_index: int
+        self,
+        level: LiquidityLevel,
+        candles: List[Candle],
+        current_index: int,
+        avg_volume: Optional[float] = None,
     ) -> LiquidityStrengthMetrics:
         """
         Calculate comprehensive strength for a liquidity level.
@@ -203,6 +208,8 @@ class LiquidityStrengthCalculator:
             level: The liquidity level to analyze
             candles: All candles for context
             current_index: Current candle index
+            avg_volume: Precomputed average candle volume (e.g.
+                StreamingPrimitives.avg_volume), None to average candles
 
         Returns:
             LiquidityStrengthMetrics with detailed strength breakdown
@@ -214,7 +221,7 @@ class LiquidityStrengthCalculator:
         touch_strength = self._calculate_touch_strength(level)
 
         # Volume strength (0-100 based on volume profile)
-        volume_strength = self._calculate_volume_strength(level, candles)
+        volume_strength = self._calculate_volume_strength(level, candles, avg_volume)
 
         # Recency strength (0-100 based on age)
         recency_strength = self._calculate_recency_strength(level, current_index)
@@ -260,12 +267,12 @@ class LiquidityStrengthCalculator:
 
         # Each touch adds less value than the previous
         # 1 touch = 20, 2 = 35, 3 = 50, 5 = 65, 10 = 85, 20 = 100
-        import math
-
         touch_score = 20 * math.log(level.touch_count + 1) / math.log(1.5)
         return min(100, max(0, touch_score))
 
-    def _calculate_volume_strength(self, level: LiquidityLevel, candles: List[Candle]) -> float:
+    def _calculate_volume_strength(
+        self, level: LiquidityLevel, candles: List[Candle], avg_volume: Optional[float] = None
+    ) -> float:
         """
         Calculate strength from volume profile.
 
@@ -274,6 +281,7 @@ class LiquidityStrengthCalculator:
         Args:
             level: Liquidity level
             candles: All candles for average calculation
+            avg_volume: Precomputed average volume, None to average candles
 
         Returns:
             Volume strength score (0-100)
@@ -281,7 +289,8 @@ class LiquidityStrengthCalculator:
         if not candles:
             return 0.0
 
-        avg_volume = sum(c.volume for c in candles) / len(candles)
+        if avg_volume is None:
+            avg_volume = sum(c.volume for c in candles) / len(candles)
         if avg_volume == 0:
             return 50.0  # Neutral if no volume data
 
@@ -338,7 +347,11 @@ class LiquidityStrengthCalculator:
             return LiquidityStrengthLevel.VERY_WEAK
 
     def calculate_all_strengths(
-        self, levels: List[LiquidityLevel], candles: List[Candle], current_index: int
+        self,
+        levels: List[LiquidityLevel],
+        candles: List[Candle],
+        current_index: int,
+        avg_volume: Optional[float] = None,
     ) -> List[LiquidityStrengthMetrics]:
         """
         Calculate strength for all liquidity levels.
@@ -347,16 +360,81 @@ class LiquidityStrengthCalculator:
             levels: List of liquidity levels
             candles: All candles
             current_index: Current candle index
+            avg_volume: Precomputed average candle volume, None to average candles
 
         Returns:
             List of strength metrics for each level
         """
+        if not candles:
+            return [
+                self.calculate_strength(level, candles, current_index, avg_volume)
+                for level in levels
+                if level.state in (LiquidityState.ACTIVE, LiquidityState.PARTIAL)
+            ]
+
+        # Average volume once for all levels instead of once per level
+        if avg_volume is None:
+            avg_volume = sum(c.volume for c in candles) / len(candles)
+
+        # Same scoring as calculate_strength, inlined because the indicator
+        # engine scores every active level on every update
+        timestamp = candles[current_index].timestamp
+        base_weight = self.base_weight
+        touch_weight = self.touch_weight
+        volume_weight = self.volume_weight
+        recency_weight = self.recency_weight
+        max_age = self.max_age_candles
+        log_base = math.log(1.5)
+        classify = self._classify_strength
+
         metrics = []
         for level in levels:
             # Only calculate for active/partial levels
-            if level.state in (LiquidityState.ACTIVE, LiquidityState.PARTIAL):
-                strength_metrics = self.calculate_strength(level, candles, current_index)
-                metrics.append(strength_metrics)
+            if level.state not in (LiquidityState.ACTIVE, LiquidityState.PARTIAL):
+                continue
+
+            touches = level.touch_count
+            if touches == 0:
+                touch_strength = 0.0
+            else:
+                touch_strength = min(100, max(0, 20 * math.log(touches + 1) / log_base))
+
+            if avg_volume == 0:
+                volume_strength = 50.0
+            else:
+                volume_ratio = level.volume_profile / avg_volume
+                volume_strength = min(100, max(0, 25 + (volume_ratio - 0.5) * 50))
+
+            age_candles = current_index - level.origin_candle_index
+            if age_candles < 0:
+                recency_strength = 100.0
+            else:
+                recency_strength = max(0, min(1, 1.0 - (age_candles / max_age))) * 100
+
+            base_strength = level.strength
+            total_strength = min(
+                100,
+                max(
+                    0,
+                    base_strength * base_weight
+                    + touch_strength * touch_weight
+                    + volume_strength * volume_weight
+                    + recency_strength * recency_weight,
+                ),
+            )
+
+            metrics.append(
+                LiquidityStrengthMetrics(
+                    level=level,
+                    base_strength=base_strength,
+                    touch_strength=touch_strength,
+                    volume_strength=volume_strength,
+                    recency_strength=recency_strength,
+                    total_strength=total_strength,
+                    strength_level=classify(total_strength),
+                    last_calculated=timestamp,
+                )
+            )
 
         return metrics
 
@@ -438,11 +516,11 @@ class MarketStateTracker:
             trend_state, bms_list, buy_side_levels, sell_side_levels
         )
 
-        # Build liquidity profile
-        liquidity_profile = self._build_liquidity_profile(buy_side_levels, sell_side_levels)
-
         # Check for state change
         if self._should_change_state(new_market_state, confidence):
+            # Build liquidity profile (only kept with a new state)
+            liquidity_profile = self._build_liquidity_profile(buy_side_levels, sell_side_levels)
+
             # Count BMS in recent period
             recent_bms = [
                 bms
@@ -11,10 +11,11 @@ institutional activity and potential high-probability reversal points.
 """
 
 import logging
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Hashable, List, Optional
 
 from src.core.constants import EventType, TimeFrame
 from src.core.events import Event, EventBus
@@ -130,6 +131,58 @@ class SweepCandidate:
     close_timestamp: Optional[int] = None
 
 
+class _LevelPriceIndex:
+    """
+    Liquidity levels sorted by price, one list per side.
+
+    A candle can only breach buy-side levels a limited distance below its
+    high and sell-side levels a limited distance above its low, so each
+    candle bisects both lists instead of testing every level.
+    """
+
+    def __init__(self, levels: List[LiquidityLevel]):
+        self.levels = levels
+        buy_side = sorted(
+            (level.price, pos)
+            for pos, level in enumerate(levels)
+            if level.type == LiquidityType.BUY_SIDE
+        )
+        sell_side = sorted(
+            (level.price, pos)
+            for pos, level in enumerate(levels)
+            if level.type != LiquidityType.BUY_SIDE
+        )
+        self._buy_prices = [price for price, _ in buy_side]
+        self._buy_positions = [pos for _, pos in buy_side]
+        self._sell_prices = [price for price, _ in sell_side]
+        self._sell_positions = [pos for _, pos in sell_side]
+
+    def breach_window(
+        self, candle: Candle, min_distance: float, max_distance: float
+    ) -> List[LiquidityLevel]:
+        """
+        Get levels the candle may breach, in their original order.
+
+        Args:
+            candle: Candle to probe with
+            min_distance: Smallest breach distance in price units
+            max_distance: Largest breach distance in price units
+
+        Returns:
+            Levels whose price lies within the breach distance band
+        """
+        buy_lo = bisect_left(self._buy_prices, candle.high - max_distance)
+        buy_hi = bisect_right(self._buy_prices, candle.high - min_distance)
+        sell_lo = bisect_left(self._sell_prices, candle.low + min_distance)
+        sell_hi = bisect_right(self._sell_prices, candle.low + max_distance)
+        if buy_hi <= buy_lo and sell_hi <= sell_lo:
+            return []
+
+        positions = self._buy_positions[buy_lo:buy_hi] + self._sell_positions[sell_lo:sell_hi]
+        positions.sort()
+        return [self.levels[pos] for pos in positions]
+
+
 class LiquiditySweepDetector:
     """
     Detects Liquidity Sweep patterns in real-time.
@@ -169,6 +222,7 @@ class LiquiditySweepDetector:
         self.event_bus = event_bus
 
         self._candidates: List[SweepCandidate] = []
+        self._candidate_ids: Dict[Hashable, SweepCandidate] = {}
         self._completed_sweeps: List[LiquiditySweep] = []
 
         self.logger = logging.getLogger(f"{__name__}.LiquiditySweepDetector")
@@ -197,35 +251,46 @@ class LiquiditySweepDetector:
 
         sweeps_detected = []
 
-        # Filter active levels only
-        active_levels = [
-            level
-            for level in liquidity_levels
-            if level.state in (LiquidityState.ACTIVE, LiquidityState.PARTIAL)
-        ]
+        # Filter active levels only and index them by price
+        level_index = _LevelPriceIndex(
+            [
+                level
+                for level in liquidity_levels
+                if level.state in (LiquidityState.ACTIVE, LiquidityState.PARTIAL)
+            ]
+        )
+
+        # Breach band in price units, widened by a pip so rounding never drops
+        # a level that _check_breach would accept
+        min_distance = (self.min_breach_distance_pips - 1) * self.pip_size
+        max_distance = (self.max_breach_distance_pips + 1) * self.pip_size
 
         for i in range(start_index, len(candles)):
             candle = candles[i]
 
-            # Check for new breaches
-            for level in active_levels:
+            # Check for new breaches among levels within breach distance
+            for level in level_index.breach_window(candle, min_distance, max_distance):
                 # Skip if level was formed after this candle
                 if level.origin_candle_index >= i:
                     continue
 
                 # Check if we already have a candidate for this level
-                if any(c.level == level for c in self._candidates):
+                if level.level_id in self._candidate_ids:
                     continue
 
                 # Detect breach
                 candidate = self._check_breach(candle, level, i)
                 if candidate:
                     self._candidates.append(candidate)
+                    self._candidate_ids[level.level_id] = candidate
                     self.logger.debug(
                         f"New sweep candidate: {level.type.value} level at {level.price:.5f} "
                         f"breached at index {i}"
                     )
 
+            if not self._candidates:
+                continue
+
             # Update existing candidates
             self._update_candidates(candle, i, candles)
 
@@ -447,6 +512,9 @@ class LiquiditySweepDetector:
         Returns:
             List of completed sweeps
         """
+        if all(c.state != SweepState.SWEEP_COMPLETED for c in self._candidates):
+            return []
+
         completed = []
         remaining_candidates = []
 
@@ -486,7 +554,7 @@ class LiquiditySweepDetector:
                 # Keep candidates that are still pending
                 remaining_candidates.append(candidate)
 
-        self._candidates = remaining_candidates
+        self._set_candidates(remaining_candidates)
         return completed
 
     def _cleanup_candidates(self, current_index: int) -> None:
@@ -515,7 +583,12 @@ class LiquiditySweepDetector:
         if removed_count > 0:
             self.logger.debug(f"Cleaned up {removed_count} stale sweep candidates")
 
-        self._candidates = active_candidates
+        self._set_candidates(active_candidates)
+
+    def _set_candidates(self, candidates: List[SweepCandidate]) -> None:
+        """Replace the pending candidates and their level id lookup."""
+        self._candidates = candidates
+        self._candidate_ids = {c.level.level_id: c for c in candidates}
 
     def _publish_sweep_event(self, sweep: LiquiditySweep) -> None:
         """
@@ -583,4 +656,5 @@ class LiquiditySweepDetector:
         """Clear completed sweeps and candidates history."""
         self._completed_sweeps.clear()
         self._candidates.clear()
+        self._candidate_ids.clear()
         self.logger.debug("Cleared sweep detection history")
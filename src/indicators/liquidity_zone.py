@@ -7,12 +7,15 @@ and pending orders accumulate, often becoming targets for institutional traders.
 """
 
 import logging
+from bisect import bisect_left, insort
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
+from itertools import count
 from typing import Any, Dict, List, Optional, Tuple
 
 from src.core.constants import TimeFrame
+from src.indicators.swing_kernel import get_swing_indices
 from src.models.candle import Candle
 
 logger = logging.getLogger(__name__)
@@ -100,6 +103,16 @@ class LiquidityLevel:
         tolerance = tolerance_pips * pip_size
         return abs(price - self.price) <= tolerance
 
+    @property
+    def level_id(self) -> Tuple[LiquidityType, float, int, str, TimeFrame]:
+        """
+        Identity of the level that survives recalculation.
+
+        Excludes mutable state (touches, strength, sweep state) and the
+        candle index, which shifts as the candle window slides.
+        """
+        return (self.type, self.price, self.origin_timestamp, self.symbol, self.timeframe)
+
     def mark_touched(self, timestamp: int) -> None:
         """
         Mark the level as touched by price.
@@ -249,36 +262,19 @@ class LiquidityZoneDetector:
             )
             return []
 
-        swing_highs = []
-
-        for i in range(lookback, len(candles) - lookback):
-            current_high = candles[i].high
-
-            # Check if this is higher than all previous lookback candles
-            is_swing_high = all(current_high > candles[j].high for j in range(i - lookback, i))
-
-            # Check if this is higher than all following lookback candles
-            if is_swing_high:
-                is_swing_high = all(
-                    current_high > candles[j].high
-                    for j in range(i + 1, min(i + lookback + 1, len(candles)))
-                )
-
-            if is_swing_high:
-                swing_highs.append(
-                    SwingPoint(
-                        price=current_high,
-                        timestamp=candles[i].timestamp,
-                        candle_index=i,
-                        is_high=True,
-                        strength=lookback,
-                        volume=candles[i].volume,
-                    )
-                )
-                self.logger.debug(
-                    f"Swing high detected at index {i}: "
-                    f"price={current_high:.5f}, time={candles[i].get_datetime_iso()}"
-                )
+        high_indices, _ = get_swing_indices(candles, lookback)
+        swing_highs = [
+            SwingPoint(
+                price=candles[i].high,
+                timestamp=candles[i].timestamp,
+                candle_index=i,
+                is_high=True,
+                strength=lookback,
+                volume=candles[i].volume,
+            )
+            for i in high_indices.tolist()
+        ]
+        self.logger.debug(f"Detected {len(swing_highs)} swing highs (lookback={lookback})")
 
         return swing_highs
 
@@ -307,36 +303,19 @@ class LiquidityZoneDetector:
             )
             return []
 
-        swing_lows = []
-
-        for i in range(lookback, len(candles) - lookback):
-            current_low = candles[i].low
-
-            # Check if this is lower than all previous lookback candles
-            is_swing_low = all(current_low < candles[j].low for j in range(i - lookback, i))
-
-            # Check if this is lower than all following lookback candles
-            if is_swing_low:
-                is_swing_low = all(
-                    current_low < candles[j].low
-                    for j in range(i + 1, min(i + lookback + 1, len(candles)))
-                )
-
-            if is_swing_low:
-                swing_lows.append(
-                    SwingPoint(
-                        price=current_low,
-                        timestamp=candles[i].timestamp,
-                        candle_index=i,
-                        is_high=False,
-                        strength=lookback,
-                        volume=candles[i].volume,
-                    )
-                )
-                self.logger.debug(
-                    f"Swing low detected at index {i}: "
-                    f"price={current_low:.5f}, time={candles[i].get_datetime_iso()}"
-                )
+        _, low_indices = get_swing_indices(candles, lookback)
+        swing_lows = [
+            SwingPoint(
+                price=candles[i].low,
+                timestamp=candles[i].timestamp,
+                candle_index=i,
+                is_high=False,
+                strength=lookback,
+                volume=candles[i].volume,
+            )
+            for i in low_indices.tolist()
+        ]
+        self.logger.debug(f"Detected {len(swing_lows)} swing lows (lookback={lookback})")
 
         return swing_lows
 
@@ -361,7 +340,12 @@ class LiquidityZoneDetector:
         return sum(c.volume for c in relevant_candles) / len(relevant_candles)
 
     def calculate_liquidity_strength(
-        self, swing_point: SwingPoint, candles: List[Candle], touch_count: int = 0
+        self,
+        swing_point: SwingPoint,
+        candles: List[Candle],
+        touch_count: int = 0,
+        avg_volume: Optional[float] = None,
+        volume_profile: Optional[float] = None,
     ) -> float:
         """
         Calculate strength score for a liquidity level.
@@ -376,6 +360,8 @@ class LiquidityZoneDetector:
             swing_point: The swing point forming the liquidity level
             candles: Full list of candles for context
             touch_count: Number of times price has touched this level
+            avg_volume: Precomputed average volume of candles (computed if None)
+            volume_profile: Precomputed volume profile of the swing (computed if None)
 
         Returns:
             Strength score between 0 and 100
@@ -388,8 +374,10 @@ class LiquidityZoneDetector:
         touch_score = min(40, touch_count * 10)
 
         # Volume factor (0-30 points)
-        volume_profile = self.calculate_volume_profile(candles, swing_point.candle_index)
-        avg_volume = sum(c.volume for c in candles) / len(candles) if candles else 1.0
+        if volume_profile is None:
+            volume_profile = self.calculate_volume_profile(candles, swing_point.candle_index)
+        if avg_volume is None:
+            avg_volume = sum(c.volume for c in candles) / len(candles) if candles else 1.0
         volume_ratio = (
             (swing_point.volume + volume_profile) / (2 * avg_volume) if avg_volume > 0 else 1.0
         )
@@ -419,23 +407,25 @@ class LiquidityZoneDetector:
         clustered = []
 
         current_cluster = [sorted_levels[0]]
+        cluster_price_sum = sorted_levels[0].price
         tolerance = self.proximity_tolerance_pips * self.pip_size
 
+        # Single sweep in price order with a running cluster mean
         for level in sorted_levels[1:]:
-            # Check if this level is close to the current cluster
-            cluster_price = sum(l.price for l in current_cluster) / len(current_cluster)
+            cluster_price = cluster_price_sum / len(current_cluster)
 
             if abs(level.price - cluster_price) <= tolerance:
                 # Add to current cluster
                 current_cluster.append(level)
+                cluster_price_sum += level.price
             else:
                 # Finalize current cluster and start new one
                 clustered.append(self._merge_cluster(current_cluster))
                 current_cluster = [level]
+                cluster_price_sum = level.price
 
         # Don't forget the last cluster
-        if current_cluster:
-            clustered.append(self._merge_cluster(current_cluster))
+        clustered.append(self._merge_cluster(current_cluster))
 
         return clustered
 
@@ -524,41 +514,44 @@ class LiquidityZoneDetector:
 
         self.logger.info(f"Found {len(swing_highs)} swing highs and {len(swing_lows)} swing lows")
 
+        return self.build_liquidity_levels(candles, swing_highs, swing_lows)
+
+    def build_liquidity_levels(
+        self,
+        candles: List[Candle],
+        swing_highs: List[SwingPoint],
+        swing_lows: List[SwingPoint],
+        avg_volume: Optional[float] = None,
+    ) -> Tuple[List[LiquidityLevel], List[LiquidityLevel]]:
+        """
+        Convert detected swing points into clustered liquidity levels.
+
+        Shared by the batch path (detect_liquidity_levels) and the incremental
+        engine, which maintains swing points as candles stream in.
+
+        Args:
+            candles: Candles the swing point indices refer to
+            swing_highs: Swing highs (become buy-side liquidity)
+            swing_lows: Swing lows (become sell-side liquidity)
+            avg_volume: Precomputed average volume of candles (computed if None)
+
+        Returns:
+            Tuple of (buy_side_levels, sell_side_levels)
+        """
+        if avg_volume is None:
+            avg_volume = sum(c.volume for c in candles) / len(candles) if candles else 1.0
+
         # Convert swing highs to buy-side liquidity (above highs)
-        buy_side_levels = []
-        for swing_high in swing_highs:
-            strength = self.calculate_liquidity_strength(swing_high, candles)
-            volume_profile = self.calculate_volume_profile(candles, swing_high.candle_index)
-
-            level = LiquidityLevel(
-                type=LiquidityType.BUY_SIDE,
-                price=swing_high.price,
-                origin_timestamp=swing_high.timestamp,
-                origin_candle_index=swing_high.candle_index,
-                symbol=candles[0].symbol,
-                timeframe=candles[0].timeframe,
-                strength=strength,
-                volume_profile=volume_profile,
-            )
-            buy_side_levels.append(level)
+        buy_side_levels = [
+            self._create_level(LiquidityType.BUY_SIDE, swing_high, candles, avg_volume)
+            for swing_high in swing_highs
+        ]
 
         # Convert swing lows to sell-side liquidity (below lows)
-        sell_side_levels = []
-        for swing_low in swing_lows:
-            strength = self.calculate_liquidity_strength(swing_low, candles)
-            volume_profile = self.calculate_volume_profile(candles, swing_low.candle_index)
-
-            level = LiquidityLevel(
-                type=LiquidityType.SELL_SIDE,
-                price=swing_low.price,
-                origin_timestamp=swing_low.timestamp,
-                origin_candle_index=swing_low.candle_index,
-                symbol=candles[0].symbol,
-                timeframe=candles[0].timeframe,
-                strength=strength,
-                volume_profile=volume_profile,
-            )
-            sell_side_levels.append(level)
+        sell_side_levels = [
+            self._create_level(LiquidityType.SELL_SIDE, swing_low, candles, avg_volume)
+            for swing_low in swing_lows
+        ]
 
         # Cluster nearby levels
         buy_side_levels = self.cluster_nearby_levels(buy_side_levels)
@@ -571,6 +564,41 @@ class LiquidityZoneDetector:
 
         return buy_side_levels, sell_side_levels
 
+    def _create_level(
+        self,
+        liquidity_type: LiquidityType,
+        swing_point: SwingPoint,
+        candles: List[Candle],
+        avg_volume: float,
+    ) -> LiquidityLevel:
+        """
+        Create an unclustered liquidity level for a single swing point.
+
+        Args:
+            liquidity_type: Buy-side (swing high) or sell-side (swing low)
+            swing_point: Swing point forming the level
+            candles: Candles the swing point index refers to
+            avg_volume: Average volume of candles
+
+        Returns:
+            New liquidity level
+        """
+        volume_profile = self.calculate_volume_profile(candles, swing_point.candle_index)
+        strength = self.calculate_liquidity_strength(
+            swing_point, candles, avg_volume=avg_volume, volume_profile=volume_profile
+        )
+
+        return LiquidityLevel(
+            type=liquidity_type,
+            price=swing_point.price,
+            origin_timestamp=swing_point.timestamp,
+            origin_candle_index=swing_point.candle_index,
+            symbol=candles[0].symbol,
+            timeframe=candles[0].timeframe,
+            strength=strength,
+            volume_profile=volume_profile,
+        )
+
     def update_liquidity_states(
         self,
         buy_side_levels: List[LiquidityLevel],
@@ -628,3 +656,183 @@ class LiquidityZoneDetector:
                             )
                         else:
                             level.mark_touched(candle.timestamp)
+
+
+@dataclass
+class _LevelCluster:
+    """Running aggregates of the swing levels merged into one liquidity level."""
+
+    level: LiquidityLevel
+    count: int
+    price_sum: float
+    weighted_price_sum: float
+    strength_sum: float
+    base_strength: float
+    first_position: int
+    last_position: int
+
+    @property
+    def mean_price(self) -> float:
+        """Unweighted mean price of the members (used for cluster membership)."""
+        return self.price_sum / self.count
+
+
+class LiquidityLevelClusters:
+    """
+    Clustered liquidity levels maintained incrementally from streaming swings.
+
+    cluster_nearby_levels() rebuilds every level from scratch, so touch counts
+    and sweep state are lost on each recalculation. This class keeps one
+    LiquidityLevel object per cluster and folds each newly confirmed swing
+    point into the cluster with the nearest mean price within the detector's
+    proximity tolerance, or starts a new cluster. Members are combined like
+    LiquidityZoneDetector._merge_cluster, so levels keep their identity,
+    touches and state across updates.
+
+    Swing positions are absolute candle positions (candles appended before the
+    swing), so origin_candle_index is re-derived as the window slides. A level
+    is dropped once all of its swings have left the window.
+    """
+
+    def __init__(self, detector: LiquidityZoneDetector):
+        """
+        Initialize clustered level state.
+
+        Args:
+            detector: Detector providing clustering tolerance and level scoring
+        """
+        self.detector = detector
+        self.last_position = -1
+        self._seq = count()
+        self._clusters: Dict[LiquidityType, Dict[int, _LevelCluster]] = {
+            liquidity_type: {} for liquidity_type in LiquidityType
+        }
+        # (mean price, seq) per side, sorted for nearest-cluster lookup
+        self._means: Dict[LiquidityType, List[Tuple[float, int]]] = {
+            liquidity_type: [] for liquidity_type in LiquidityType
+        }
+
+    def update(
+        self,
+        candles: List[Candle],
+        swing_highs: List[SwingPoint],
+        swing_lows: List[SwingPoint],
+        offset: int,
+        avg_volume: Optional[float] = None,
+    ) -> Tuple[List[LiquidityLevel], List[LiquidityLevel]]:
+        """
+        Merge newly confirmed swing points and return the current levels.
+
+        Args:
+            candles: Current candle window the swing indices refer to
+            swing_highs: Swing highs confirmed since the previous update
+            swing_lows: Swing lows confirmed since the previous update
+            offset: Absolute position of candles[0]
+            avg_volume: Precomputed average volume of candles (computed if None)
+
+        Returns:
+            Tuple of (buy_side_levels, sell_side_levels) sorted by price
+        """
+        if avg_volume is None:
+            avg_volume = sum(c.volume for c in candles) / len(candles) if candles else 1.0
+
+        for liquidity_type, swings in (
+            (LiquidityType.BUY_SIDE, swing_highs),
+            (LiquidityType.SELL_SIDE, swing_lows),
+        ):
+            for swing in swings:
+                position = offset + swing.candle_index
+                level = self.detector._create_level(liquidity_type, swing, candles, avg_volume)
+                self._merge(liquidity_type, level, position)
+                self.last_position = max(self.last_position, position)
+
+        # Swings closer than the lookback to the window start are no longer detectable
+        self._prune(offset + self.detector.min_swing_strength)
+
+        sides = []
+        for liquidity_type in (LiquidityType.BUY_SIDE, LiquidityType.SELL_SIDE):
+            levels = []
+            for cluster in self._clusters[liquidity_type].values():
+                cluster.level.origin_candle_index = cluster.first_position - offset
+                levels.append(cluster.level)
+            levels.sort(key=lambda l: l.price)
+            sides.append(levels)
+
+        return sides[0], sides[1]
+
+    def _merge(self, liquidity_type: LiquidityType, level: LiquidityLevel, position: int) -> None:
+        """Fold a single-swing level into the nearest cluster or start a new one."""
+        clusters = self._clusters[liquidity_type]
+        means = self._means[liquidity_type]
+        tolerance = self.detector.proximity_tolerance_pips * self.detector.pip_size
+
+        # The nearest cluster mean is one of the two neighbours of the price
+        nearest = None
+        pos = bisect_left(means, (level.price, -1))
+        for key in means[max(pos - 1, 0) : pos + 1]:
+            distance = abs(level.price - key[0])
+            if distance <= tolerance and (
+                nearest is None or distance < abs(level.price - nearest[0])
+            ):
+                nearest = key
+
+        if nearest is None:
+            seq = next(self._seq)
+            clusters[seq] = _LevelCluster(
+                level=level,
+                count=1,
+                price_sum=level.price,
+                weighted_price_sum=level.price * level.strength,
+                strength_sum=level.strength,
+                base_strength=level.strength,
+                first_position=position,
+                last_position=position,
+            )
+            insort(means, (level.price, seq))
+            return
+
+        seq = nearest[1]
+        cluster = clusters[seq]
+        means.pop(bisect_left(means, nearest))
+
+        cluster.count += 1
+        cluster.price_sum += level.price
+        cluster.weighted_price_sum += level.price * level.strength
+        cluster.strength_sum += level.strength
+        cluster.base_strength = max(cluster.base_strength, level.strength)
+        cluster.last_position = max(cluster.last_position, position)
+
+        merged = cluster.level
+        if cluster.strength_sum > 0:
+            merged.price = cluster.weighted_price_sum / cluster.strength_sum
+        else:
+            merged.price = cluster.mean_price
+        merged.strength = min(
+            100, cluster.base_strength + 0.3 * (cluster.strength_sum - cluster.base_strength)
+        )
+        merged.touch_count += level.touch_count
+        merged.volume_profile = max(merged.volume_profile, level.volume_profile)
+
+        insort(means, (cluster.mean_price, seq))
+
+    def _prune(self, min_position: int) -> None:
+        """Drop clusters whose newest swing is older than min_position."""
+        for liquidity_type, clusters in self._clusters.items():
+            stale = [seq for seq, c in clusters.items() if c.last_position < min_position]
+            if not stale:
+                continue
+            for seq in stale:
+                del clusters[seq]
+            self._means[liquidity_type] = [
+                key for key in self._means[liquidity_type] if key[1] in clusters
+            ]
+
+    def __len__(self) -> int:
+        return sum(len(clusters) for clusters in self._clusters.values())
+
+    def reset(self) -> None:
+        """Forget all clusters."""
+        self.last_position = -1
+        for liquidity_type in LiquidityType:
+            self._clusters[liquidity_type].clear()
+            self._means[liquidity_type].clear()
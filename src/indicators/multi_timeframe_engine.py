@@ -13,15 +13,18 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from threading import Lock
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 from src.core.constants import EventType, TimeFrame
 from src.core.events import Event, EventBus
+from src.indicators.aggregator import CandleAggregator
 from src.indicators.breaker_block import BreakerBlock, BreakerBlockDetector
 from src.indicators.expiration_manager import ExpirationRules, IndicatorExpirationManager
 from src.indicators.fair_value_gap import FairValueGap, FVGDetector, FVGState, FVGType
+from src.indicators.incremental import IncrementalIndicatorState
 from src.indicators.liquidity_strength import (
     LiquidityStrengthCalculator,
+    LiquidityStrengthLevel,
     LiquidityStrengthMetrics,
     MarketStateData,
     MarketStateTracker,
@@ -38,16 +41,54 @@ from src.indicators.order_block import (
     OrderBlockState,
     OrderBlockType,
 )
+from src.indicators.primitives import StreamingPrimitives
+from src.indicators.scheduler import RecomputeScheduler
+from src.indicators.snapshot import (
+    IndicatorSnapshot,
+    SnapshotBuilder,
+    SnapshotDelta,
+    diff_snapshots,
+)
 from src.indicators.trend_recognition import (
     TrendDirection,
     TrendRecognitionEngine,
     TrendState,
     TrendStructure,
 )
+from src.indicators.zone_index import ZoneIndex
 from src.models.candle import Candle
 
 logger = logging.getLogger(__name__)
 
+# Zone list attribute -> (index attribute, index factory) on TimeframeIndicators
+_ZONE_INDEXES: Dict[str, Tuple[str, Callable[[], ZoneIndex]]] = {
+    "order_blocks": (
+        "_order_block_index",
+        lambda: ZoneIndex(
+            live=lambda ob: ob.state in (OrderBlockState.ACTIVE, OrderBlockState.TESTED)
+        ),
+    ),
+    "fair_value_gaps": (
+        "_fvg_index",
+        lambda: ZoneIndex(live=lambda fvg: fvg.state in (FVGState.ACTIVE, FVGState.PARTIAL)),
+    ),
+    "breaker_blocks": (
+        "_breaker_block_index",
+        lambda: ZoneIndex(
+            live=lambda bb: bb.state != "EXPIRED",
+            time_attr="transition_timestamp",
+            index_attr="transition_candle_index",
+        ),
+    ),
+}
+
+# Zone list attribute -> states of zones kept only as history
+_SPENT_STATES: Dict[str, Tuple[Any, ...]] = {
+    "order_blocks": (OrderBlockState.BROKEN, OrderBlockState.EXPIRED),
+    "fair_value_gaps": (FVGState.FILLED, FVGState.EXPIRED),
+    "breaker_blocks": ("EXPIRED",),
+}
+
 
 class IndicatorType(str, Enum):
     """Types of ICT indicators supported."""
@@ -79,6 +120,11 @@ class TimeframeIndicators:
         market_state: Current market structure state (Bullish/Bearish/Ranging)
         last_update_timestamp: Last time indicators were calculated
         candle_count: Number of candles processed
+
+    Order Blocks, FVGs and Breaker Blocks are additionally kept in price
+    indexes (see order_block_index, fvg_index, breaker_block_index). Use
+    add_zone() and set_zones() to keep the indexes in sync incrementally;
+    lists assigned or mutated directly are re-indexed on the next access.
     """
 
     timeframe: TimeFrame
@@ -93,6 +139,130 @@ class TimeframeIndicators:
     market_state: Optional[MarketStateData] = None
     last_update_timestamp: Optional[int] = None
     candle_count: int = 0
+    _order_block_index: ZoneIndex = field(
+        default_factory=_ZONE_INDEXES["order_blocks"][1], init=False, repr=False, compare=False
+    )
+    _fvg_index: ZoneIndex = field(
+        default_factory=_ZONE_INDEXES["fair_value_gaps"][1], init=False, repr=False, compare=False
+    )
+    _breaker_block_index: ZoneIndex = field(
+        default_factory=_ZONE_INDEXES["breaker_blocks"][1], init=False, repr=False, compare=False
+    )
+    # Zone list attribute -> (id, length) of the list the index was built from
+    _indexed_lists: Dict[str, Tuple[int, int]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def _zone_index(self, zones_attr: str) -> ZoneIndex:
+        """Price index of a zone list, rebuilt if the list changed behind its back."""
+        zones = getattr(self, zones_attr)
+        index = getattr(self, _ZONE_INDEXES[zones_attr][0])
+        source = (id(zones), len(zones))
+        if self._indexed_lists.get(zones_attr) != source:
+            index.rebuild(zones)
+            self._indexed_lists[zones_attr] = source
+        return index
+
+    @property
+    def order_block_index(self) -> ZoneIndex:
+        """Price index of active and tested Order Blocks."""
+        return self._zone_index("order_blocks")
+
+    @property
+    def fvg_index(self) -> ZoneIndex:
+        """Price index of active and partially filled Fair Value Gaps."""
+        return self._zone_index("fair_value_gaps")
+
+    @property
+    def breaker_block_index(self) -> ZoneIndex:
+        """Price index of non-expired Breaker Blocks."""
+        return self._zone_index("breaker_blocks")
+
+    def add_zone(self, zone: Any) -> None:
+        """
+        Append an Order Block, FVG or Breaker Block and index it.
+
+        Args:
+            zone: Zone to add
+
+        Raises:
+            ValueError: If zone is not an Order Block, FVG or Breaker Block
+        """
+        if isinstance(zone, OrderBlock):
+            zones_attr = "order_blocks"
+        elif isinstance(zone, FairValueGap):
+            zones_attr = "fair_value_gaps"
+        elif isinstance(zone, BreakerBlock):
+            zones_attr = "breaker_blocks"
+        else:
+            raise ValueError(f"Unsupported zone type: {type(zone).__name__}")
+
+        index = self._zone_index(zones_attr)
+        zones = getattr(self, zones_attr)
+        zones.append(zone)
+        index.add(zone)
+        self._indexed_lists[zones_attr] = (id(zones), len(zones))
+
+    def set_zones(self, zones_attr: str, zones: List[Any]) -> None:
+        """
+        Replace a zone list with a subset of itself without re-indexing.
+
+        Zones dropped from the list must already have left their live state
+        (expired, broken or filled) so the index no longer returns them.
+
+        Args:
+            zones_attr: "order_blocks", "fair_value_gaps" or "breaker_blocks"
+            zones: New zone list
+        """
+        self._zone_index(zones_attr)
+        setattr(self, zones_attr, zones)
+        self._indexed_lists[zones_attr] = (id(zones), len(zones))
+
+    def prune_before(self, timestamp: int) -> None:
+        """
+        Forget spent zones and sweeps formed before a timestamp.
+
+        Broken or expired Order Blocks, filled or expired FVGs, expired Breaker
+        Blocks and sweeps stay in their lists as history. Once they predate the
+        candle window nothing can refer to them again, so dropping them keeps
+        the lists bounded on long runs.
+
+        Args:
+            timestamp: Formation timestamp cutoff (exclusive), normally the
+                first retained candle's timestamp
+        """
+        for zones_attr, spent_states in _SPENT_STATES.items():
+            time_attr = self._zone_index(zones_attr).time_attr
+            zones = getattr(self, zones_attr)
+            # Zones are appended as they form, so only a leading run can be old
+            # enough; anything out of order is dropped on a later call
+            old = 0
+            while old < len(zones) and getattr(zones[old], time_attr) < timestamp:
+                old += 1
+            if any(zone.state in spent_states for zone in zones[:old]):
+                kept = [zone for zone in zones[:old] if zone.state not in spent_states]
+                self.set_zones(zones_attr, kept + zones[old:])
+
+        if self.liquidity_sweeps and self.liquidity_sweeps[0].breach_timestamp < timestamp:
+            self.liquidity_sweeps = [
+                sweep for sweep in self.liquidity_sweeps if sweep.breach_timestamp >= timestamp
+            ]
+
+    def get_zones_containing(self, price: float) -> Dict[str, List[Any]]:
+        """
+        Get indexed zones whose range contains a price.
+
+        Args:
+            price: Price to look up
+
+        Returns:
+            Dictionary with matching Order Blocks, FVGs and Breaker Blocks
+        """
+        return {
+            "order_blocks": self.order_block_index.containing(price),
+            "fair_value_gaps": self.fvg_index.containing(price),
+            "breaker_blocks": self.breaker_block_index.containing(price),
+        }
 
     def get_active_order_blocks(self) -> List[OrderBlock]:
         """Get all active (non-broken) Order Blocks."""
@@ -119,6 +289,9 @@ class TimeframeIndicators:
         self.market_state = None
         self.last_update_timestamp = None
         self.candle_count = 0
+        for zones_attr, (index_attr, _) in _ZONE_INDEXES.items():
+            getattr(self, index_attr).clear()
+            self._indexed_lists[zones_attr] = (id(getattr(self, zones_attr)), 0)
 
 
 @dataclass
@@ -128,9 +301,18 @@ class TimeframeData:
 
     Attributes:
         timeframe: The timeframe
-        candles: Historical candle data (limited to max_candles)
+        candles: Historical candle data (limited to max_candles, oldest trimmed
+            in place so the list is never copied)
         indicators: Detected indicators for this timeframe
         max_candles: Maximum number of candles to retain
+        total_candles: Number of candles ever added (including trimmed ones)
+        breaker_scan_total: total_candles when Breaker Block detection last
+            scanned the candles for breaches
+        primitives: Streaming ATR, rolling high/low and mean volume, updated
+            on every added candle (volume averaged over the retained candles)
+        forming_candle: Latest in-progress candle when the engine only appends
+            closed candles (scheduler close_only)
+        live_zones: Zones containing the forming candle's close (live tier)
     """
 
     timeframe: TimeFrame
@@ -139,10 +321,17 @@ class TimeframeData:
         default_factory=lambda: TimeframeIndicators(TimeFrame.M1)
     )
     max_candles: int = 1000
+    total_candles: int = 0
+    breaker_scan_total: int = 0
+    primitives: Optional[StreamingPrimitives] = field(default=None, repr=False)
+    forming_candle: Optional[Candle] = field(default=None, repr=False)
+    live_zones: Dict[str, List[Any]] = field(default_factory=dict, repr=False)
 
     def __post_init__(self):
-        """Initialize indicators with correct timeframe."""
+        """Initialize indicators and primitives for this timeframe."""
         self.indicators = TimeframeIndicators(timeframe=self.timeframe)
+        if self.primitives is None:
+            self.primitives = StreamingPrimitives(volume_period=self.max_candles)
 
     def add_candle(self, candle: Candle) -> None:
         """
@@ -158,18 +347,21 @@ class TimeframeData:
                 f"TimeframeData timeframe {self.timeframe}"
             )
 
-        # Add candle
+        # Add candle and trim the oldest ones in place
         self.candles.append(candle)
-
-        # Trim to max_candles
         if len(self.candles) > self.max_candles:
-            # Remove oldest candles
-            excess = len(self.candles) - self.max_candles
-            self.candles = self.candles[excess:]
-            logger.debug(
-                f"Trimmed {excess} candles from {self.timeframe.value}, "
-                f"now have {len(self.candles)} candles"
-            )
+            del self.candles[: len(self.candles) - self.max_candles]
+        self.total_candles += 1
+        self.primitives.update(candle)
+
+    def clear_candles(self) -> None:
+        """Remove all candles and reset the candle counter."""
+        self.candles.clear()
+        self.total_candles = 0
+        self.breaker_scan_total = 0
+        self.primitives.reset()
+        self.forming_candle = None
+        self.live_zones = {}
 
     def get_latest_candle(self) -> Optional[Candle]:
         """Get the most recent candle."""
@@ -189,7 +381,7 @@ class MultiTimeframeIndicatorEngine:
 
     Key Features:
     - Independent indicator state per timeframe
-    - Automatic candle aggregation (1m → 15m → 1h)
+    - Incremental candle aggregation (1m → 5m → 15m → 1h → 4h → 1d)
     - Event-driven updates on new candle data
     - Thread-safe operations
     - Memory-efficient with configurable retention
@@ -208,6 +400,10 @@ class MultiTimeframeIndicatorEngine:
         expiration_rules: Optional[ExpirationRules] = None,
         auto_remove_expired: bool = True,
         event_bus: Optional[EventBus] = None,
+        incremental: bool = False,
+        symbol: Optional[str] = None,
+        persistent_liquidity: bool = False,
+        scheduler_config: Optional[Dict[str, Any]] = None,
     ):
         """
         Initialize multi-timeframe indicator engine.
@@ -224,19 +420,37 @@ class MultiTimeframeIndicatorEngine:
             expiration_rules: Custom expiration rules, or None for defaults
             auto_remove_expired: If True, automatically remove expired indicators
             event_bus: Optional event bus for publishing indicator events
+            incremental: If True, detectors keep streaming state and only examine
+                newly appended candles instead of re-scanning the whole window.
+                Both modes agree until the window first trims past
+                max_candles_per_timeframe; after that the batch re-scan sees
+                swings at the trimmed window's left edge that were never swings
+                in the full history and adds Order Blocks for them, while
+                incremental mode keeps the Order Blocks of the untrimmed stream
+            symbol: If set, candles of any other symbol are rejected instead of
+                being mixed into the same timeframe state
+            persistent_liquidity: If True (requires incremental), newly confirmed
+                swings are merged into the existing liquidity levels, which keep
+                their touch counts and sweep state instead of being rebuilt on
+                every candle
+            scheduler_config: Configuration for the RecomputeScheduler
+                (close_only, debounce_ms, live_tier); default recomputes on
+                every candle
+
+        Raises:
+            ValueError: If persistent_liquidity is set without incremental, or the
+                scheduler configuration is invalid
         """
+        if persistent_liquidity and not incremental:
+            raise ValueError("persistent_liquidity requires incremental=True")
+
         # Default timeframes: 1m, 15m, 1h
         self.timeframes = timeframes or [TimeFrame.M1, TimeFrame.M15, TimeFrame.H1]
+        self.symbol = symbol
 
         # Validate timeframes are in ascending order
         self._validate_timeframes()
 
-        # Initialize storage for each timeframe
-        self.timeframe_data: Dict[TimeFrame, TimeframeData] = {
-            tf: TimeframeData(timeframe=tf, max_candles=max_candles_per_timeframe)
-            for tf in self.timeframes
-        }
-
         # Initialize detectors
         self.ob_detector = OrderBlockDetector(**(ob_detector_config or {}))
         self.fvg_detector = FVGDetector(**(fvg_detector_config or {}))
@@ -249,6 +463,19 @@ class MultiTimeframeIndicatorEngine:
             **(trend_recognition_config or {}), event_bus=event_bus
         )
 
+        # Initialize storage for each timeframe
+        self.timeframe_data: Dict[TimeFrame, TimeframeData] = {
+            tf: TimeframeData(
+                timeframe=tf,
+                max_candles=max_candles_per_timeframe,
+                primitives=StreamingPrimitives(
+                    atr_period=self.trend_recognition_engine.atr_period,
+                    volume_period=max_candles_per_timeframe,
+                ),
+            )
+            for tf in self.timeframes
+        }
+
         # Initialize liquidity strength calculator
         self.liquidity_strength_calculator = LiquidityStrengthCalculator()
 
@@ -263,6 +490,35 @@ class MultiTimeframeIndicatorEngine:
         # Event bus for publishing indicator events
         self.event_bus = event_bus
 
+        # Decides which timeframe updates recompute indicators
+        self.scheduler = RecomputeScheduler(**(scheduler_config or {}))
+
+        # Streaming higher-timeframe aggregation per base timeframe, created on first use
+        self._aggregators: Dict[TimeFrame, Optional[CandleAggregator]] = {}
+
+        # Streaming detector state per timeframe (incremental mode only)
+        self.incremental = incremental
+        self._incremental_states: Dict[TimeFrame, IncrementalIndicatorState] = {}
+        if incremental:
+            self._incremental_states = {
+                tf: IncrementalIndicatorState.create(
+                    self.ob_detector,
+                    self.fvg_detector,
+                    self.liquidity_zone_detector,
+                    self.trend_recognition_engine,
+                    persistent_liquidity=persistent_liquidity,
+                )
+                for tf in self.timeframes
+            }
+
+        # Immutable indicator snapshots per timeframe, rebuilt lazily after updates
+        self._snapshot_builders: Dict[TimeFrame, SnapshotBuilder] = {}
+        self._stale_snapshots: Set[TimeFrame] = set()
+
+        # Last snapshot published as a delta per timeframe, and delta sequence per symbol
+        self._published_snapshots: Dict[TimeFrame, IndicatorSnapshot] = {}
+        self._sequences: Dict[str, int] = defaultdict(int)
+
         # Thread safety
         self._lock = Lock()
 
@@ -272,7 +528,7 @@ class MultiTimeframeIndicatorEngine:
         logger.info(
             f"Initialized MultiTimeframeIndicatorEngine with timeframes: "
             f"{[tf.value for tf in self.timeframes]}, "
-            f"auto_remove_expired={auto_remove_expired}"
+            f"auto_remove_expired={auto_remove_expired}, incremental={incremental}"
         )
 
     def _validate_timeframes(self) -> None:
@@ -331,6 +587,11 @@ class MultiTimeframeIndicatorEngine:
         with self._lock:
             timeframe = candle.timeframe
 
+            if self.symbol is not None and candle.symbol != self.symbol:
+                raise ValueError(
+                    f"Engine is bound to {self.symbol}, got candle for {candle.symbol}"
+                )
+
             # Validate timeframe is tracked
             if timeframe not in self.timeframe_data:
                 raise ValueError(
@@ -338,8 +599,28 @@ class MultiTimeframeIndicatorEngine:
                     f"Available: {[tf.value for tf in self.timeframes]}"
                 )
 
+            tf_data = self.timeframe_data[timeframe]
+
+            # In-progress candles feed the forming higher-timeframe bars
+            if not candle.is_closed:
+                self._aggregate_to_higher_timeframes(candle)
+
+            # In-progress candles are not appended when only closes are recomputed
+            if self.scheduler.close_only and not candle.is_closed:
+                tf_data.forming_candle = candle
+                self.scheduler.request(timeframe, is_closed=False)
+                if self.scheduler.live_tier:
+                    tf_data.live_zones = tf_data.indicators.get_zones_containing(candle.close)
+                    self.scheduler.live_checked()
+                return
+
             # Add to appropriate timeframe
-            self.timeframe_data[timeframe].add_candle(candle)
+            tf_data.add_candle(candle)
+            if tf_data.forming_candle is not None and (
+                tf_data.forming_candle.timestamp <= candle.timestamp
+            ):
+                tf_data.forming_candle = None
+                tf_data.live_zones = {}
 
             logger.debug(
                 f"Added candle to {timeframe.value}: {candle.symbol} @ "
@@ -347,114 +628,117 @@ class MultiTimeframeIndicatorEngine:
             )
 
             # Update indicators for this timeframe
-            self._update_indicators(timeframe)
+            self._schedule_update(timeframe, candle.is_closed)
 
             # Check if higher timeframes need aggregation
             if candle.is_closed:
                 self._aggregate_to_higher_timeframes(candle)
 
+    def _aggregator(self, base_candle: Candle) -> Optional[CandleAggregator]:
+        """Aggregator from a base timeframe to the higher tracked timeframes, if any."""
+        base_tf = base_candle.timeframe
+        if base_tf in self._aggregators:
+            return self._aggregators[base_tf]
+
+        base_ms = Candle.get_timeframe_milliseconds(base_tf)
+        targets = [
+            tf
+            for tf in self.timeframes[self.timeframes.index(base_tf) + 1 :]
+            if Candle.get_timeframe_milliseconds(tf) % base_ms == 0
+        ]
+        aggregator = CandleAggregator(base_tf, targets, self.symbol) if targets else None
+        if aggregator is not None:
+            # Candles added before the first aggregation still count for the forming bars
+            aggregator.seed(
+                candle
+                for candle in self.timeframe_data[base_tf].candles
+                if candle.timestamp < base_candle.timestamp
+            )
+        self._aggregators[base_tf] = aggregator
+        return aggregator
+
     def _aggregate_to_higher_timeframes(self, base_candle: Candle) -> None:
         """
-        Aggregate base candle to higher timeframes if a new period starts.
+        Feed a base candle to the higher-timeframe aggregator.
+
+        Higher-timeframe candles completed by a closed base candle are added
+        to their timeframes and scheduled for an indicator update; in-progress
+        base candles only update the forming bars.
 
         Args:
-            base_candle: Closed candle from base timeframe
+            base_candle: Candle from base timeframe
         """
-        base_tf = base_candle.timeframe
-
-        # Find position of base timeframe
-        try:
-            base_idx = self.timeframes.index(base_tf)
-        except ValueError:
+        aggregator = self._aggregator(base_candle)
+        if aggregator is None:
             return
 
-        # Check each higher timeframe
-        for higher_tf in self.timeframes[base_idx + 1 :]:
-            # Check if we need to create a new higher timeframe candle
-            if self._should_aggregate_to_timeframe(base_candle, higher_tf):
-                aggregated = self._create_aggregated_candle(base_candle, higher_tf)
-                if aggregated:
-                    self.timeframe_data[higher_tf].add_candle(aggregated)
-                    logger.info(
-                        f"Aggregated {base_tf.value} → {higher_tf.value}: "
-                        f"{aggregated.get_datetime_iso()}"
-                    )
+        for aggregated in aggregator.update(base_candle):
+            higher_tf = aggregated.timeframe
+            self.timeframe_data[higher_tf].add_candle(aggregated)
+            logger.info(
+                f"Aggregated {base_candle.timeframe.value} → {higher_tf.value}: "
+                f"{aggregated.get_datetime_iso()}"
+            )
 
-                    # Update indicators for aggregated timeframe
-                    self._update_indicators(higher_tf)
+            # Update indicators for aggregated timeframe
+            self._schedule_update(higher_tf)
 
-    def _should_aggregate_to_timeframe(self, candle: Candle, target_tf: TimeFrame) -> bool:
+    def get_forming_candle(self, timeframe: TimeFrame) -> Optional[Candle]:
         """
-        Check if candle should trigger aggregation to target timeframe.
+        Get the forming (not yet closed) candle of a timeframe.
 
-        A candle triggers aggregation when the NEXT candle would start
-        a new target timeframe period.
+        For timeframes built by aggregation this is the running bar of the
+        current period, including the in-progress base candle.
 
         Args:
-            candle: Base candle
-            target_tf: Target timeframe to aggregate to
+            timeframe: Timeframe to query
 
         Returns:
-            True if aggregation should occur
+            Candle with is_closed=False, or None if no period is forming
         """
-        # Get target timeframe duration in milliseconds
-        target_ms = Candle.get_timeframe_milliseconds(target_tf)
-
-        # Calculate what the next candle's timestamp would be
-        next_candle_ts = Candle.calculate_next_candle_time(candle.timestamp, candle.timeframe)
-
-        # Check if next candle starts a new target timeframe period
-        # This happens when next_candle_ts is aligned to target boundary
-        return (next_candle_ts % target_ms) == 0
+        with self._lock:
+            if timeframe not in self.timeframe_data:
+                return None
+            for aggregator in self._aggregators.values():
+                if aggregator is not None and timeframe in aggregator.target_timeframes:
+                    forming = aggregator.forming_bar(timeframe)
+                    if forming is not None:
+                        return forming
+
+            tf_data = self.timeframe_data[timeframe]
+            if tf_data.forming_candle is not None:
+                return tf_data.forming_candle
+            latest = tf_data.get_latest_candle()
+            return latest if latest is not None and not latest.is_closed else None
 
-    def _create_aggregated_candle(
-        self, base_candle: Candle, target_tf: TimeFrame
-    ) -> Optional[Candle]:
+    def _schedule_update(self, timeframe: TimeFrame, is_closed: bool = True) -> None:
+        """Mark a timeframe dirty and recompute it if the scheduler allows it now."""
+        if self.scheduler.request(timeframe, is_closed=is_closed):
+            self._update_indicators(timeframe)
+            self.scheduler.completed(timeframe)
+
+    def _flush_pending(self, timeframe: Optional[TimeFrame] = None) -> int:
+        """Recompute dirty timeframes (all of them if timeframe is None)."""
+        pending = self.scheduler.pending()
+        if timeframe is not None:
+            pending = [timeframe] if timeframe in pending else []
+        for dirty in pending:
+            self._update_indicators(dirty)
+            self.scheduler.completed(dirty)
+        return len(pending)
+
+    def flush(self) -> int:
         """
-        Create aggregated candle for higher timeframe.
+        Run recomputations deferred by the scheduler's debounce window.
 
-        Args:
-            base_candle: Base candle that triggered aggregation
-            target_tf: Target timeframe
+        Reads through get_indicators() and get_snapshot() flush the queried
+        timeframe automatically; call this e.g. at the end of a burst.
 
         Returns:
-            Aggregated candle or None if insufficient data
+            Number of timeframes recomputed
         """
-        # Get base timeframe data
-        base_tf = base_candle.timeframe
-        base_data = self.timeframe_data[base_tf]
-
-        # Calculate how many base candles make up one target candle
-        base_ms = Candle.get_timeframe_milliseconds(base_tf)
-        target_ms = Candle.get_timeframe_milliseconds(target_tf)
-        candles_per_period = target_ms // base_ms
-
-        # Get last N base candles for aggregation
-        recent_candles = base_data.candles[-candles_per_period:]
-
-        if len(recent_candles) < candles_per_period:
-            logger.warning(
-                f"Insufficient candles for aggregation: "
-                f"need {candles_per_period}, have {len(recent_candles)}"
-            )
-            return None
-
-        # Calculate aggregated OHLCV
-        normalized_timestamp = Candle.normalize_timestamp(base_candle.timestamp, target_tf)
-
-        aggregated = Candle(
-            symbol=base_candle.symbol,
-            timeframe=target_tf,
-            timestamp=normalized_timestamp,
-            open=recent_candles[0].open,
-            high=max(c.high for c in recent_candles),
-            low=min(c.low for c in recent_candles),
-            close=recent_candles[-1].close,
-            volume=sum(c.volume for c in recent_candles),
-            is_closed=True,
-        )
-
-        return aggregated
+        with self._lock:
+            return self._flush_pending()
 
     def _update_indicators(self, timeframe: TimeFrame) -> None:
         """
@@ -464,139 +748,184 @@ class MultiTimeframeIndicatorEngine:
             timeframe: Timeframe to update
         """
         tf_data = self.timeframe_data[timeframe]
+        self._stale_snapshots.add(timeframe)
+        strength_summary: Optional[Dict[str, Any]] = None
+
+        candles = tf_data.candles
+
+        # Streaming state must see every candle, even before indicators run
+        incremental_state = self._incremental_states.get(timeframe)
+        if incremental_state is not None:
+            incremental_state.advance(candles, tf_data.total_candles)
 
         # Need sufficient candles for analysis
-        if len(tf_data.candles) < 10:
-            logger.debug(
-                f"Insufficient candles for {timeframe.value} indicators: " f"{len(tf_data.candles)}"
-            )
+        if len(candles) < 10:
+            logger.debug(f"Insufficient candles for {timeframe.value} indicators: {len(candles)}")
             return
 
         try:
             # Detect Order Blocks
-            new_obs = self.ob_detector.detect_order_blocks(tf_data.candles)
-
-            # Update existing OBs
-            existing_obs = tf_data.indicators.order_blocks
-            for ob in existing_obs:
-                if ob.state == OrderBlockState.ACTIVE:
-                    # Check if OB is tested by recent price
-                    latest = tf_data.get_latest_candle()
-                    if latest and ob.contains_price(latest.close):
+            if incremental_state is not None:
+                new_obs = incremental_state.take_new_order_blocks()
+            else:
+                new_obs = self.ob_detector.detect_order_blocks(candles)
+
+            # Update existing OBs tested by recent price
+            latest = tf_data.get_latest_candle()
+            if latest:
+                for ob in tf_data.indicators.order_block_index.containing(latest.close):
+                    if ob.state == OrderBlockState.ACTIVE:
                         ob.mark_tested(latest.timestamp)
 
             # Add new OBs (avoid duplicates by timestamp)
-            existing_timestamps = {ob.origin_timestamp for ob in existing_obs}
+            existing_timestamps = (
+                {ob.origin_timestamp for ob in tf_data.indicators.order_blocks}
+                if new_obs
+                else set()
+            )
             newly_detected_obs = []
             for ob in new_obs:
                 if ob.origin_timestamp not in existing_timestamps:
-                    tf_data.indicators.order_blocks.append(ob)
+                    tf_data.indicators.add_zone(ob)
                     newly_detected_obs.append(ob)
                     self._trigger_callbacks(IndicatorType.ORDER_BLOCK, timeframe, [ob])
 
             # Publish ORDER_BLOCK_DETECTED event for new OBs
-            if newly_detected_obs:
+            if newly_detected_obs and self.event_bus:
                 self._publish_event_sync(
                     EventType.ORDER_BLOCK_DETECTED,
                     timeframe,
                     {
                         "count": len(newly_detected_obs),
-                        "order_blocks": [ob.to_dict() for ob in newly_detected_obs],
+                        "order_blocks": self._freeze(timeframe, newly_detected_obs),
                     },
                     priority=7,
                 )
 
             # Detect Fair Value Gaps
-            new_fvgs = self.fvg_detector.detect_fair_value_gaps(tf_data.candles)
+            if incremental_state is not None:
+                new_fvgs = incremental_state.take_new_fvgs()
+            else:
+                new_fvgs = self.fvg_detector.detect_fair_value_gaps(candles)
 
             # Update existing FVGs
             self.fvg_detector.update_fvg_states(
-                tf_data.indicators.fair_value_gaps, tf_data.candles[-10:]  # Check last 10 candles
+                tf_data.indicators.fair_value_gaps,
+                candles[-10:],  # Check last 10 candles
+                fvg_index=tf_data.indicators.fvg_index,
             )
 
             # Add new FVGs
-            existing_fvg_timestamps = {
-                fvg.origin_timestamp for fvg in tf_data.indicators.fair_value_gaps
-            }
+            existing_fvg_timestamps = (
+                {fvg.origin_timestamp for fvg in tf_data.indicators.fair_value_gaps}
+                if new_fvgs
+                else set()
+            )
             newly_detected_fvgs = []
             for fvg in new_fvgs:
                 if fvg.origin_timestamp not in existing_fvg_timestamps:
-                    tf_data.indicators.fair_value_gaps.append(fvg)
+                    tf_data.indicators.add_zone(fvg)
                     newly_detected_fvgs.append(fvg)
                     self._trigger_callbacks(IndicatorType.FAIR_VALUE_GAP, timeframe, [fvg])
 
             # Publish FVG_DETECTED event for new FVGs
-            if newly_detected_fvgs:
+            if newly_detected_fvgs and self.event_bus:
                 self._publish_event_sync(
                     EventType.FVG_DETECTED,
                     timeframe,
                     {
                         "count": len(newly_detected_fvgs),
-                        "fair_value_gaps": [fvg.to_dict() for fvg in newly_detected_fvgs],
+                        "fair_value_gaps": self._freeze(timeframe, newly_detected_fvgs),
                     },
                     priority=7,
                 )
 
-            # Detect Breaker Blocks
-            new_bbs = self.bb_detector.detect_breaker_blocks(
+            # Detect Breaker Blocks. Known blocks were checked against every
+            # candle up to the previous scan, so only newer candles can breach
+            # them; blocks detected in this update are checked over the window.
+            ob_index = tf_data.indicators.order_block_index
+            window_start = max(0, len(candles) - 100)
+            new_bbs = []
+            if newly_detected_obs:
+                new_bbs = self.bb_detector.detect_breaker_blocks(
+                    newly_detected_obs, candles, start_index=window_start
+                )
+                for ob in newly_detected_obs:
+                    if ob.state == OrderBlockState.BROKEN:
+                        ob_index.update(ob)
+
+            unscanned = tf_data.total_candles - tf_data.breaker_scan_total
+            new_bbs += self.bb_detector.detect_breaker_blocks(
                 tf_data.indicators.order_blocks,
-                tf_data.candles,
-                start_index=max(0, len(tf_data.candles) - 100),
+                candles,
+                start_index=max(window_start, len(candles) - unscanned),
+                order_block_index=ob_index,
             )
+            tf_data.breaker_scan_total = tf_data.total_candles
+            new_bbs.sort(key=lambda bb: bb.transition_timestamp)
 
             # Add new BBs
-            existing_bb_timestamps = {
-                bb.transition_timestamp for bb in tf_data.indicators.breaker_blocks
-            }
+            existing_bb_timestamps = (
+                {bb.transition_timestamp for bb in tf_data.indicators.breaker_blocks}
+                if new_bbs
+                else set()
+            )
             newly_detected_bbs = []
             for bb in new_bbs:
                 if bb.transition_timestamp not in existing_bb_timestamps:
-                    tf_data.indicators.breaker_blocks.append(bb)
+                    tf_data.indicators.add_zone(bb)
                     newly_detected_bbs.append(bb)
                     self._trigger_callbacks(IndicatorType.BREAKER_BLOCK, timeframe, [bb])
 
             # Publish BREAKER_BLOCK_DETECTED event for new BBs
-            if newly_detected_bbs:
+            if newly_detected_bbs and self.event_bus:
                 self._publish_event_sync(
                     EventType.BREAKER_BLOCK_DETECTED,
                     timeframe,
                     {
                         "count": len(newly_detected_bbs),
-                        "breaker_blocks": [bb.to_dict() for bb in newly_detected_bbs],
+                        "breaker_blocks": self._freeze(timeframe, newly_detected_bbs),
                     },
                     priority=7,
                 )
 
             # Detect Liquidity Zones (levels)
-            buy_side_levels, sell_side_levels = (
-                self.liquidity_zone_detector.detect_liquidity_levels(tf_data.candles)
-            )
+            if incremental_state is not None:
+                buy_side_levels, sell_side_levels = incremental_state.detect_liquidity_levels(
+                    candles
+                )
+            else:
+                buy_side_levels, sell_side_levels = (
+                    self.liquidity_zone_detector.detect_liquidity_levels(candles)
+                )
 
             # Combine buy and sell side levels for storage
             all_liquidity_levels = buy_side_levels + sell_side_levels
 
-            # Replace existing liquidity levels (full recalculation approach)
+            # Replace the level list (with persistent liquidity the objects are reused)
             tf_data.indicators.liquidity_levels = all_liquidity_levels
 
             # Detect Liquidity Sweeps
             if all_liquidity_levels:
                 # Detect sweeps across all candles
                 # Look back 50 candles max to detect sweeps
-                start_index = max(0, len(tf_data.candles) - 50)
+                start_index = max(0, len(candles) - 50)
 
                 detected_sweeps = self.liquidity_sweep_detector.detect_sweeps(
-                    tf_data.candles, all_liquidity_levels, start_index=start_index
+                    candles, all_liquidity_levels, start_index=start_index
                 )
 
                 # Add new sweeps that weren't detected before
                 if detected_sweeps:
-                    existing_sweep_timestamps = {
-                        s.sweep_timestamp for s in tf_data.indicators.liquidity_sweeps
+                    existing_sweeps = {
+                        (s.breach_timestamp, s.liquidity_level.origin_timestamp)
+                        for s in tf_data.indicators.liquidity_sweeps
                     }
                     new_sweeps = [
                         sweep
                         for sweep in detected_sweeps
-                        if sweep.sweep_timestamp not in existing_sweep_timestamps
+                        if (sweep.breach_timestamp, sweep.liquidity_level.origin_timestamp)
+                        not in existing_sweeps
                     ]
 
                     if new_sweeps:
@@ -605,10 +934,16 @@ class MultiTimeframeIndicatorEngine:
                             IndicatorType.LIQUIDITY_SWEEP, timeframe, new_sweeps
                         )
 
-            # Detect Trend Patterns (HH/HL/LH/LL)
-            trend_structures, trend_direction = (
-                self.trend_recognition_engine.analyze_trend_patterns(tf_data.candles)
-            )
+            # Detect Trend Patterns (HH/HL/LH/LL), noise-filtered by the streaming ATR
+            atr = tf_data.primitives.atr.value
+            if incremental_state is not None:
+                trend_structures, trend_direction = incremental_state.analyze_trend_patterns(
+                    candles, atr=atr
+                )
+            else:
+                trend_structures, trend_direction = (
+                    self.trend_recognition_engine.analyze_trend_patterns(candles, atr=atr)
+                )
 
             # Update trend structures
             tf_data.indicators.trend_structures = trend_structures
@@ -633,10 +968,10 @@ class MultiTimeframeIndicatorEngine:
                             direction=trend_direction,
                             strength=strength_score,
                             strength_level=strength_level,
-                            symbol=tf_data.candles[0].symbol if tf_data.candles else "UNKNOWN",
+                            symbol=candles[0].symbol,
                             timeframe=timeframe,
                             start_timestamp=latest_candle.timestamp,
-                            start_candle_index=len(tf_data.candles) - 1,
+                            start_candle_index=len(candles) - 1,
                             last_update_timestamp=latest_candle.timestamp,
                             pattern_count=len(trend_structures),
                             is_confirmed=len(trend_structures)
@@ -655,49 +990,55 @@ class MultiTimeframeIndicatorEngine:
                             >= self.trend_recognition_engine.min_patterns_for_confirmation
                         )
 
-                    # Detect trend change (will publish event if changed)
-                    if previous_trend:
-                        self.trend_recognition_engine.detect_trend_change(
-                            previous_trend, tf_data.indicators.trend_state, trend_structures
+                    # Publish trend changes (the first detected trend is not a change)
+                    if previous_trend and previous_trend.direction != trend_direction:
+                        self._publish_event_sync(
+                            EventType.MARKET_STRUCTURE_CHANGE,
+                            timeframe,
+                            tf_data.indicators.trend_state.to_dict(),
+                            priority=8,
                         )
 
             # Calculate Liquidity Strength for all detected levels
             if all_liquidity_levels:
                 strength_metrics = self.liquidity_strength_calculator.calculate_all_strengths(
-                    all_liquidity_levels, tf_data.candles, tf_data.indicators.trend_state
+                    all_liquidity_levels,
+                    candles,
+                    len(candles) - 1,
+                    avg_volume=tf_data.primitives.avg_volume,
                 )
 
                 # Store strength metrics
                 tf_data.indicators.liquidity_strength_metrics = strength_metrics
 
-                # Publish event for liquidity strength calculation
-                if strength_metrics:
-                    avg_strength = sum(m.overall_strength for m in strength_metrics) / len(
+                # Summary for the strength event, published with the update delta
+                if strength_metrics and self.event_bus:
+                    avg_strength = sum(m.total_strength for m in strength_metrics) / len(
                         strength_metrics
                     )
-                    self._publish_event_sync(
-                        EventType.LIQUIDITY_STRENGTH_CALCULATED,
-                        timeframe,
-                        {
-                            "total_levels": len(strength_metrics),
-                            "average_strength": round(avg_strength, 2),
-                            "strong_levels": len(
-                                [m for m in strength_metrics if m.overall_strength >= 7.0]
-                            ),
-                            "metrics": [m.to_dict() for m in strength_metrics],
-                        },
-                        priority=7,
-                    )
+                    strength_summary = {
+                        "total_levels": len(strength_metrics),
+                        "average_strength": round(avg_strength, 2),
+                        "strong_levels": len(
+                            [
+                                m
+                                for m in strength_metrics
+                                if m.strength_level
+                                in (
+                                    LiquidityStrengthLevel.STRONG,
+                                    LiquidityStrengthLevel.VERY_STRONG,
+                                )
+                            ]
+                        ),
+                    }
 
-                logger.debug(
-                    f"{timeframe.value}: Calculated liquidity strength for "
-                    f"{len(strength_metrics)} levels, avg={avg_strength:.2f}"
-                )
+                    logger.debug(
+                        f"{timeframe.value}: Calculated liquidity strength for "
+                        f"{len(strength_metrics)} levels, avg={avg_strength:.2f}"
+                    )
 
             # Update Market State (Bullish/Bearish/Ranging)
-            # Separate buy-side and sell-side levels for state tracker
-            buy_side_levels = [lvl for lvl in all_liquidity_levels if lvl.side == "BUY"]
-            sell_side_levels = [lvl for lvl in all_liquidity_levels if lvl.side == "SELL"]
+            # The state tracker takes the buy-side and sell-side levels detected above
 
             # Get recent BMS events (last 10)
             recent_bms = []
@@ -711,19 +1052,19 @@ class MultiTimeframeIndicatorEngine:
                     )
 
                 # Detect BMS using swing points
-                swing_highs = self.liquidity_zone_detector.detect_swing_highs(tf_data.candles)
-                swing_lows = self.liquidity_zone_detector.detect_swing_lows(tf_data.candles)
+                swing_highs = self.liquidity_zone_detector.detect_swing_highs(candles)
+                swing_lows = self.liquidity_zone_detector.detect_swing_lows(candles)
 
                 recent_bms = self._bms_detector_instance.detect_bms(
-                    tf_data.candles,
+                    candles,
                     swing_highs,
                     swing_lows,
-                    start_index=max(0, len(tf_data.candles) - 50),
+                    start_index=max(0, len(candles) - 50),
                 )
 
             # Update market state
             market_state_data = self.market_state_tracker.update_state(
-                candles=tf_data.candles,
+                candles=candles,
                 trend_state=tf_data.indicators.trend_state,
                 bms_list=recent_bms,
                 buy_side_levels=buy_side_levels,
@@ -742,7 +1083,9 @@ class MultiTimeframeIndicatorEngine:
             # Apply expiration logic
             latest = tf_data.get_latest_candle()
             if latest:
-                candle_count = len(tf_data.candles)
+                candle_count = len(candles)
+                # Window indices shift once candles are trimmed, so ages use timestamps
+                timeframe_ms = Candle.get_timeframe_milliseconds(timeframe)
 
                 # Track original counts for expiration events
                 original_ob_count = len(tf_data.indicators.order_blocks)
@@ -750,8 +1093,15 @@ class MultiTimeframeIndicatorEngine:
                 original_bb_count = len(tf_data.indicators.breaker_blocks)
 
                 # Expire Order Blocks
-                tf_data.indicators.order_blocks = self.expiration_manager.expire_order_blocks(
-                    tf_data.indicators.order_blocks, latest, candle_count
+                tf_data.indicators.set_zones(
+                    "order_blocks",
+                    self.expiration_manager.expire_order_blocks(
+                        tf_data.indicators.order_blocks,
+                        latest,
+                        candle_count,
+                        zone_index=tf_data.indicators.order_block_index,
+                        timeframe_ms=timeframe_ms,
+                    ),
                 )
                 expired_ob_count = original_ob_count - len(tf_data.indicators.order_blocks)
                 if expired_ob_count > 0:
@@ -767,8 +1117,15 @@ class MultiTimeframeIndicatorEngine:
                     )
 
                 # Expire Fair Value Gaps
-                tf_data.indicators.fair_value_gaps = self.expiration_manager.expire_fair_value_gaps(
-                    tf_data.indicators.fair_value_gaps, latest, candle_count
+                tf_data.indicators.set_zones(
+                    "fair_value_gaps",
+                    self.expiration_manager.expire_fair_value_gaps(
+                        tf_data.indicators.fair_value_gaps,
+                        latest,
+                        candle_count,
+                        zone_index=tf_data.indicators.fvg_index,
+                        timeframe_ms=timeframe_ms,
+                    ),
                 )
                 expired_fvg_count = original_fvg_count - len(tf_data.indicators.fair_value_gaps)
                 if expired_fvg_count > 0:
@@ -784,8 +1141,15 @@ class MultiTimeframeIndicatorEngine:
                     )
 
                 # Expire Breaker Blocks
-                tf_data.indicators.breaker_blocks = self.expiration_manager.expire_breaker_blocks(
-                    tf_data.indicators.breaker_blocks, latest, candle_count
+                tf_data.indicators.set_zones(
+                    "breaker_blocks",
+                    self.expiration_manager.expire_breaker_blocks(
+                        tf_data.indicators.breaker_blocks,
+                        latest,
+                        candle_count,
+                        zone_index=tf_data.indicators.breaker_block_index,
+                        timeframe_ms=timeframe_ms,
+                    ),
                 )
                 expired_bb_count = original_bb_count - len(tf_data.indicators.breaker_blocks)
                 if expired_bb_count > 0:
@@ -800,16 +1164,53 @@ class MultiTimeframeIndicatorEngine:
                         priority=6,
                     )
 
+                # Forget spent indicators that slid out of the candle window,
+                # unless expired indicators are kept as history
+                if self.expiration_manager.auto_remove_expired:
+                    tf_data.indicators.prune_before(candles[0].timestamp)
+
                 # Update timestamp
                 tf_data.indicators.last_update_timestamp = latest.timestamp
                 tf_data.indicators.candle_count = candle_count
 
+                # Changes since the last published snapshot, shared by the events below
+                delta = self._next_delta(timeframe) if self.event_bus else None
+                delta_info = (
+                    {"sequence": delta.sequence, "version": delta.version, "delta": delta}
+                    if delta
+                    else {}
+                )
+
+                if delta is not None and strength_summary:
+                    self._publish_event_sync(
+                        EventType.LIQUIDITY_STRENGTH_CALCULATED,
+                        timeframe,
+                        {
+                            **strength_summary,
+                            **delta_info,
+                            "metrics_changed": delta.touches("liquidity_strength_metrics"),
+                        },
+                        priority=7,
+                    )
+
+                if delta is not None and delta.market_state is not None:
+                    self._publish_event_sync(
+                        EventType.MARKET_STATE_CHANGED,
+                        timeframe,
+                        {
+                            "market_state": delta.market_state,
+                            "sequence": delta.sequence,
+                            "version": delta.version,
+                        },
+                        priority=7,
+                    )
+
                 # Publish INDICATORS_UPDATED event with summary
                 self._publish_event_sync(
                     EventType.INDICATORS_UPDATED,
                     timeframe,
                     {
-                        "symbol": tf_data.candles[0].symbol if tf_data.candles else "UNKNOWN",
+                        "symbol": candles[0].symbol,
                         "order_blocks_count": len(tf_data.indicators.order_blocks),
                         "fair_value_gaps_count": len(tf_data.indicators.fair_value_gaps),
                         "breaker_blocks_count": len(tf_data.indicators.breaker_blocks),
@@ -848,6 +1249,7 @@ class MultiTimeframeIndicatorEngine:
                             + len(tf_data.indicators.trend_structures)
                         ),
                         "timestamp": latest.timestamp,
+                        **delta_info,
                     },
                     priority=5,
                 )
@@ -906,6 +1308,64 @@ class MultiTimeframeIndicatorEngine:
             except Exception as e:
                 logger.error(f"Error publishing {event_type.value} event: {e}", exc_info=True)
 
+    def _snapshot_builder(self, timeframe: TimeFrame) -> SnapshotBuilder:
+        builder = self._snapshot_builders.get(timeframe)
+        if builder is None:
+            latest = self.timeframe_data[timeframe].get_latest_candle()
+            symbol = self.symbol or (latest.symbol if latest else "UNKNOWN")
+            builder = SnapshotBuilder(symbol, timeframe)
+            self._snapshot_builders[timeframe] = builder
+        return builder
+
+    def _freeze(self, timeframe: TimeFrame, indicators: List[Any]) -> Tuple[Any, ...]:
+        """Frozen copies of indicators for event payloads, shared with the next snapshot."""
+        return self._snapshot_builder(timeframe).freeze_all(indicators)
+
+    def _snapshot(self, timeframe: TimeFrame) -> IndicatorSnapshot:
+        """Latest snapshot of a timeframe, rebuilt if indicators changed since."""
+        builder = self._snapshot_builder(timeframe)
+        if builder.latest is None or timeframe in self._stale_snapshots:
+            builder.build(
+                self.timeframe_data[timeframe].indicators,
+                sequence=self._sequences[builder.symbol],
+            )
+            self._stale_snapshots.discard(timeframe)
+        return builder.latest
+
+    def _next_delta(self, timeframe: TimeFrame) -> SnapshotDelta:
+        """Snapshot the timeframe and number its changes since the last published delta."""
+        builder = self._snapshot_builder(timeframe)
+        self._sequences[builder.symbol] += 1
+        sequence = self._sequences[builder.symbol]
+
+        snapshot = builder.build(self.timeframe_data[timeframe].indicators, sequence=sequence)
+        self._stale_snapshots.discard(timeframe)
+        delta = diff_snapshots(self._published_snapshots.get(timeframe), snapshot, sequence)
+        self._published_snapshots[timeframe] = snapshot
+        return delta
+
+    def get_snapshot(self, timeframe: TimeFrame) -> Optional[IndicatorSnapshot]:
+        """
+        Get an immutable snapshot of a timeframe's indicators.
+
+        Snapshots are shared by reference: the same object is returned until
+        the timeframe is updated again, and unchanged indicators are shared
+        between consecutive snapshots. Consumers of delta events use it to
+        (re)synchronize: deltas with a sequence at or below the snapshot's
+        sequence are already included.
+
+        Args:
+            timeframe: Timeframe to query
+
+        Returns:
+            IndicatorSnapshot or None if timeframe not found
+        """
+        with self._lock:
+            if timeframe not in self.timeframe_data:
+                return None
+            self._flush_pending(timeframe)
+            return self._snapshot(timeframe)
+
     def get_indicators(self, timeframe: TimeFrame) -> Optional[TimeframeIndicators]:
         """
         Get all indicators for a specific timeframe.
@@ -918,7 +1378,39 @@ class MultiTimeframeIndicatorEngine:
         """
         with self._lock:
             tf_data = self.timeframe_data.get(timeframe)
-            return tf_data.indicators if tf_data else None
+            if tf_data is None:
+                return None
+            self._flush_pending(timeframe)
+            return tf_data.indicators
+
+    def get_live_zones(self, timeframe: TimeFrame) -> Dict[str, List[Any]]:
+        """
+        Get the zones containing the close of the forming candle (live tier).
+
+        Args:
+            timeframe: Timeframe to query
+
+        Returns:
+            Zones by type ("order_blocks", "fair_value_gaps", "breaker_blocks"),
+            empty if there is no forming candle or the live tier is disabled
+        """
+        with self._lock:
+            tf_data = self.timeframe_data.get(timeframe)
+            return dict(tf_data.live_zones) if tf_data else {}
+
+    def get_primitives(self, timeframe: TimeFrame) -> Optional[StreamingPrimitives]:
+        """
+        Get the streaming ATR, rolling high/low and mean volume of a timeframe.
+
+        Args:
+            timeframe: Timeframe to query
+
+        Returns:
+            StreamingPrimitives or None if timeframe not found
+        """
+        with self._lock:
+            tf_data = self.timeframe_data.get(timeframe)
+            return tf_data.primitives if tf_data else None
 
     def get_active_indicators(self, timeframe: TimeFrame) -> Dict[str, List[Any]]:
         """
@@ -994,16 +1486,39 @@ class MultiTimeframeIndicatorEngine:
         """
         with self._lock:
             if timeframe in self.timeframe_data:
-                self.timeframe_data[timeframe].candles.clear()
+                self.timeframe_data[timeframe].clear_candles()
                 self.timeframe_data[timeframe].indicators.clear()
+                if timeframe in self._incremental_states:
+                    self._incremental_states[timeframe].reset()
+                builder = self._snapshot_builders.get(timeframe)
+                if builder is not None:
+                    builder.reset()
+                    # The next delta carries the full state under a restarted sequence
+                    self._sequences.pop(builder.symbol, None)
+                self._published_snapshots.pop(timeframe, None)
+                self.scheduler.discard(timeframe)
+                # Aggregators are keyed by base timeframe; drop the forming bar of a target too
+                self._aggregators.pop(timeframe, None)
+                for aggregator in self._aggregators.values():
+                    if aggregator is not None and timeframe in aggregator.target_timeframes:
+                        aggregator.reset_target(timeframe)
                 logger.info(f"Cleared data for {timeframe.value}")
 
     def clear_all(self) -> None:
         """Clear all data and indicators across all timeframes."""
         with self._lock:
             for tf_data in self.timeframe_data.values():
-                tf_data.candles.clear()
+                tf_data.clear_candles()
                 tf_data.indicators.clear()
+            for state in self._incremental_states.values():
+                state.reset()
+            for builder in self._snapshot_builders.values():
+                builder.reset()
+            for timeframe in self.timeframes:
+                self.scheduler.discard(timeframe)
+            self._published_snapshots.clear()
+            self._sequences.clear()
+            self._aggregators.clear()
             logger.info("Cleared all timeframe data")
 
     def get_statistics(self) -> Dict[str, Any]:
@@ -1051,8 +1566,12 @@ class MultiTimeframeIndicatorEngine:
                     ),
                 }
 
-            # Add expiration statistics
+            # Add expiration and recompute scheduling statistics
             stats["expiration"] = self.expiration_manager.get_statistics()
+            stats["scheduler"] = {
+                **self.scheduler.stats.to_dict(),
+                "pending": [tf.value for tf in self.scheduler.pending()],
+            }
 
         return stats
 
@@ -1847,7 +2366,9 @@ class MultiTimeframeMarketStructureAnalyzer:
                 f"✅ Strong alignment - Good trading conditions for {overall_bias.value} bias"
             )
         elif consistency == ConsistencyLevel.MODERATE:
-            recommendations.append("⚠️ Moderate alignment - Use caution, wait for clearer structure")
+            recommendations.append(
+                "⚠️ Moderate alignment - Use caution, wait for clearer structure"
+            )
         elif consistency == ConsistencyLevel.LOW:
             recommendations.append(
                 "⚠️ Low alignment - Consider staying out until structure clarifies"
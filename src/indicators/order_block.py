@@ -13,6 +13,7 @@ from enum import Enum
 from typing import Any, Dict, List, Optional
 
 from src.core.constants import TimeFrame
+from src.indicators.swing_kernel import get_swing_indices
 from src.models.candle import Candle
 
 logger = logging.getLogger(__name__)
@@ -227,34 +228,18 @@ class OrderBlockDetector:
         if len(candles) < (lookback * 2 + 1):
             return []
 
-        swing_highs = []
-
-        for i in range(lookback, len(candles) - lookback):
-            current_high = candles[i].high
-
-            # Check if this is higher than all previous lookback candles
-            is_swing_high = all(current_high > candles[j].high for j in range(i - lookback, i))
-
-            # Check if this is higher than all following lookback candles
-            if is_swing_high:
-                is_swing_high = all(
-                    current_high > candles[j].high for j in range(i + 1, i + lookback + 1)
-                )
-
-            if is_swing_high:
-                swing_highs.append(
-                    SwingPoint(
-                        price=current_high,
-                        timestamp=candles[i].timestamp,
-                        candle_index=i,
-                        is_high=True,
-                        strength=lookback,
-                    )
-                )
-                self.logger.debug(
-                    f"Swing high detected at index {i}: "
-                    f"price={current_high:.2f}, time={candles[i].get_datetime_iso()}"
-                )
+        high_indices, _ = get_swing_indices(candles, lookback)
+        swing_highs = [
+            SwingPoint(
+                price=candles[i].high,
+                timestamp=candles[i].timestamp,
+                candle_index=i,
+                is_high=True,
+                strength=lookback,
+            )
+            for i in high_indices.tolist()
+        ]
+        self.logger.debug(f"Detected {len(swing_highs)} swing highs (lookback={lookback})")
 
         return swing_highs
 
@@ -275,34 +260,18 @@ class OrderBlockDetector:
         if len(candles) < (lookback * 2 + 1):
             return []
 
-        swing_lows = []
-
-        for i in range(lookback, len(candles) - lookback):
-            current_low = candles[i].low
-
-            # Check if this is lower than all previous lookback candles
-            is_swing_low = all(current_low < candles[j].low for j in range(i - lookback, i))
-
-            # Check if this is lower than all following lookback candles
-            if is_swing_low:
-                is_swing_low = all(
-                    current_low < candles[j].low for j in range(i + 1, i + lookback + 1)
-                )
-
-            if is_swing_low:
-                swing_lows.append(
-                    SwingPoint(
-                        price=current_low,
-                        timestamp=candles[i].timestamp,
-                        candle_index=i,
-                        is_high=False,
-                        strength=lookback,
-                    )
-                )
-                self.logger.debug(
-                    f"Swing low detected at index {i}: "
-                    f"price={current_low:.2f}, time={candles[i].get_datetime_iso()}"
-                )
+        _, low_indices = get_swing_indices(candles, lookback)
+        swing_lows = [
+            SwingPoint(
+                price=candles[i].low,
+                timestamp=candles[i].timestamp,
+                candle_index=i,
+                is_high=False,
+                strength=lookback,
+            )
+            for i in low_indices.tolist()
+        ]
+        self.logger.debug(f"Detected {len(swing_lows)} swing lows (lookback={lookback})")
 
         return swing_lows
 
@@ -0,0 +1,331 @@
+"""
+Streaming indicator primitives updated once per candle.
+
+Volatility and volume statistics (true range average, rolling high/low, mean
+volume) are needed by several consumers on every candle: trend noise filtering,
+liquidity volume strength, strategy volatility adjustment and stop buffers.
+Recomputing them from the candle window costs O(n) per read; the accumulators
+in this module are updated in O(1) amortized per candle and read in O(1).
+
+One StreamingPrimitives instance is kept per symbol-timeframe pair (see
+TimeframeData.primitives) and fed every candle appended to that pair.
+"""
+
+from bisect import bisect_left, insort
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from src.models.candle import Candle
+
+
+class RollingATR:
+    """
+    Average True Range over the last `period` true ranges.
+
+    ``value`` is the simple average used by TrendRecognitionEngine.calculate_atr
+    (same result for the same candles), ``wilder`` is Wilder's smoothed ATR
+    seeded with the first simple average.
+    """
+
+    def __init__(self, period: int = 14):
+        """
+        Initialize ATR accumulator.
+
+        Args:
+            period: Number of true ranges averaged
+
+        Raises:
+            ValueError: If period is not positive
+        """
+        if period <= 0:
+            raise ValueError(f"period must be positive, got {period}")
+
+        self.period = period
+        self.count = 0
+        self._ranges: Deque[float] = deque(maxlen=period)
+        self._prev_close: Optional[float] = None
+        self._value: Optional[float] = None
+        self._wilder: Optional[float] = None
+
+    def update(self, high: float, low: float, close: float) -> None:
+        """Add one candle (the first candle only provides the previous close)."""
+        self.count += 1
+        prev_close = self._prev_close
+        self._prev_close = close
+        if prev_close is None:
+            return
+
+        tr = max(high - low, abs(high - prev_close), abs(low - prev_close))
+        self._ranges.append(tr)
+        self._value = None
+
+        if self._wilder is not None:
+            self._wilder = (self._wilder * (self.period - 1) + tr) / self.period
+        elif len(self._ranges) == self.period:
+            self._wilder = sum(self._ranges) / self.period
+
+    @property
+    def ready(self) -> bool:
+        """True once `period` candles have been seen."""
+        return self.count >= self.period
+
+    @property
+    def value(self) -> float:
+        """Simple ATR, 0.0 until ready."""
+        if not self.ready:
+            return 0.0
+        if self._value is None:
+            # Summed in candle order so the result matches the batch calculation exactly
+            self._value = sum(self._ranges) / len(self._ranges) if self._ranges else 0.0
+        return self._value
+
+    @property
+    def wilder(self) -> float:
+        """Wilder-smoothed ATR, 0.0 until `period` true ranges were seen."""
+        return self._wilder if self._wilder is not None else 0.0
+
+    def reset(self) -> None:
+        self.count = 0
+        self._ranges.clear()
+        self._prev_close = None
+        self._value = None
+        self._wilder = None
+
+
+class RollingExtremes:
+    """Highest high and lowest low over the last `period` candles (monotonic deques)."""
+
+    def __init__(self, period: int = 20):
+        """
+        Initialize rolling high/low.
+
+        Args:
+            period: Number of candles covered
+
+        Raises:
+            ValueError: If period is not positive
+        """
+        if period <= 0:
+            raise ValueError(f"period must be positive, got {period}")
+
+        self.period = period
+        self.count = 0
+        # (position, price) pairs with decreasing highs / increasing lows
+        self._highs: Deque[Tuple[int, float]] = deque()
+        self._lows: Deque[Tuple[int, float]] = deque()
+
+    def update(self, high: float, low: float) -> None:
+        """Add one candle."""
+        position = self.count
+        self.count += 1
+
+        while self._highs and self._highs[-1][1] <= high:
+            self._highs.pop()
+        self._highs.append((position, high))
+        while self._lows and self._lows[-1][1] >= low:
+            self._lows.pop()
+        self._lows.append((position, low))
+
+        first = self.count - self.period
+        if self._highs[0][0] < first:
+            self._highs.popleft()
+        if self._lows[0][0] < first:
+            self._lows.popleft()
+
+    @property
+    def high(self) -> Optional[float]:
+        """Highest high in the window, None before the first candle."""
+        return self._highs[0][1] if self._highs else None
+
+    @property
+    def low(self) -> Optional[float]:
+        """Lowest low in the window, None before the first candle."""
+        return self._lows[0][1] if self._lows else None
+
+    def reset(self) -> None:
+        self.count = 0
+        self._highs.clear()
+        self._lows.clear()
+
+
+class RollingMean:
+    """Running mean over the last `period` values, or over all values if period is None."""
+
+    def __init__(self, period: Optional[int] = None):
+        """
+        Initialize running mean.
+
+        Args:
+            period: Number of values averaged, None for no limit
+
+        Raises:
+            ValueError: If period is not positive
+        """
+        if period is not None and period <= 0:
+            raise ValueError(f"period must be positive, got {period}")
+
+        self.period = period
+        self.sum = 0.0
+        self._values: Deque[float] = deque()
+
+    def append(self, value: float) -> None:
+        """Add a value, dropping the oldest one beyond period."""
+        self._values.append(value)
+        self.sum += value
+        if self.period is not None and len(self._values) > self.period:
+            self.sum -= self._values.popleft()
+
+    def trim(self, size: int) -> None:
+        """Keep only the most recent `size` values."""
+        while len(self._values) > max(size, 0):
+            self.sum -= self._values.popleft()
+
+    @property
+    def mean(self) -> float:
+        """Mean of the retained values, 0.0 if empty."""
+        return self.sum / len(self._values) if self._values else 0.0
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def reset(self) -> None:
+        self.sum = 0.0
+        self._values.clear()
+
+
+class StreamingPrimitives:
+    """
+    Per symbol-timeframe bundle of streaming indicator primitives.
+
+    Example:
+        >>> primitives = StreamingPrimitives(atr_period=14)
+        >>> for candle in candles:
+        ...     primitives.update(candle)
+        >>> primitives.atr.value, primitives.avg_volume
+        >>> primitives.volatility()["level"]
+    """
+
+    def __init__(
+        self,
+        atr_period: int = 14,
+        range_period: int = 20,
+        volume_period: Optional[int] = None,
+        volatility_history: int = 100,
+    ):
+        """
+        Initialize streaming primitives.
+
+        Args:
+            atr_period: ATR period
+            range_period: Candles covered by the rolling high/low
+            volume_period: Candles covered by the mean volume, None for all
+            volatility_history: ATR values kept for the volatility percentile
+
+        Raises:
+            ValueError: If a period is not positive
+        """
+        if volatility_history <= 0:
+            raise ValueError(f"volatility_history must be positive, got {volatility_history}")
+
+        self.atr = RollingATR(atr_period)
+        self.range = RollingExtremes(range_period)
+        self.volume = RollingMean(volume_period)
+        self.volatility_history = volatility_history
+        self.last_timestamp: Optional[int] = None
+
+        self._atr_history: Deque[float] = deque()
+        self._atr_sorted: List[float] = []
+        self._percentile = 50.0
+
+    def update(self, candle: Candle) -> None:
+        """
+        Add one candle.
+
+        Args:
+            candle: Next candle of this symbol-timeframe pair
+        """
+        self.atr.update(candle.high, candle.low, candle.close)
+        self.range.update(candle.high, candle.low)
+        self.volume.append(candle.volume)
+        self.last_timestamp = candle.timestamp
+
+        if self.atr.ready:
+            self._record_atr(self.atr.value)
+
+    def _record_atr(self, atr: float) -> None:
+        """Add an ATR value to the history and refresh its percentile."""
+        self._atr_history.append(atr)
+        insort(self._atr_sorted, atr)
+        if len(self._atr_history) > self.volatility_history:
+            old = self._atr_history.popleft()
+            del self._atr_sorted[bisect_left(self._atr_sorted, old)]
+
+        if len(self._atr_sorted) > 1:
+            below = bisect_left(self._atr_sorted, atr)
+            self._percentile = 100.0 * below / (len(self._atr_sorted) - 1)
+        else:
+            self._percentile = 50.0
+
+    @property
+    def avg_volume(self) -> float:
+        """Mean volume over the volume window."""
+        return self.volume.mean
+
+    @property
+    def atr_percentile(self) -> float:
+        """Percentile (0-100) of the current ATR within the recent ATR history."""
+        return self._percentile
+
+    def volatility(self, price: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Volatility metrics in the format expected by strategies.
+
+        Args:
+            price: Reference price for atr_pct, None to use the last rolling high/low midpoint
+
+        Returns:
+            Dictionary with 'atr', 'atr_pct', 'percentile' and 'level'
+            (VERY_LOW, LOW, NORMAL, HIGH or VERY_HIGH)
+        """
+        atr = self.atr.value
+        percentile = self._percentile
+
+        # Same percentile bands as StrategyB._calculate_volatility_multiplier
+        if not self.atr.ready:
+            level = "NORMAL"
+        elif percentile > 85:
+            level = "VERY_HIGH"
+        elif percentile > 70:
+            level = "HIGH"
+        elif percentile < 15:
+            level = "VERY_LOW"
+        elif percentile < 30:
+            level = "LOW"
+        else:
+            level = "NORMAL"
+
+        if price is None and self.range.high is not None:
+            price = (self.range.high + self.range.low) / 2
+
+        return {
+            "atr": atr,
+            "atr_pct": atr / price * 100 if price else 0.0,
+            "percentile": percentile,
+            "level": level,
+        }
+
+    def reset(self) -> None:
+        """Forget all candles."""
+        self.atr.reset()
+        self.range.reset()
+        self.volume.reset()
+        self.last_timestamp = None
+        self._atr_history.clear()
+        self._atr_sorted.clear()
+        self._percentile = 50.0
+
+    def __repr__(self) -> str:
+        return (
+            f"StreamingPrimitives(atr={self.atr.value:.8f}, "
+            f"avg_volume={self.avg_volume:.8f}, candles={self.atr.count})"
+        )
@@ -0,0 +1,161 @@
+"""
+Recompute scheduling for indicator timeframes.
+
+Structural detectors (Order Blocks, FVGs, liquidity, trend) only change when a
+candle closes, yet the engine used to rerun them for every candle it was fed,
+including in-progress ticks, and again for every aggregated higher-timeframe
+candle. RecomputeScheduler decides per timeframe whether a recomputation runs
+now, is skipped, or is deferred:
+
+- close_only: in-progress candles never trigger the structural detectors
+- debounce_ms: closed candles arriving within the window of the previous run
+  only mark the timeframe dirty; the pending work is coalesced into one run
+  (on the next candle after the window, on flush(), or before a read)
+- live_tier: in-progress candles run a cheap zone-containment check instead
+
+Counters of executed and skipped recomputations are kept so the savings can
+be verified (see MultiTimeframeIndicatorEngine.get_statistics()).
+"""
+
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, Hashable, List
+
+
+@dataclass
+class SchedulerStats:
+    """
+    Counters of scheduling decisions.
+
+    Attributes:
+        executed: Structural recomputations that ran
+        skipped_open: In-progress candles that did not trigger a recomputation
+        debounced: Closed candles whose recomputation was coalesced into a later run
+        live_checks: Lightweight live-tier checks run for in-progress candles
+    """
+
+    executed: int = 0
+    skipped_open: int = 0
+    debounced: int = 0
+    live_checks: int = 0
+
+    @property
+    def skipped(self) -> int:
+        """Candles that did not cause a recomputation of their own."""
+        return self.skipped_open + self.debounced
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary format."""
+        return {**asdict(self), "skipped": self.skipped}
+
+
+class RecomputeScheduler:
+    """
+    Dirty tracking and debouncing of indicator recomputations.
+
+    Keys identify a symbol-timeframe pair; an engine bound to one symbol uses
+    its timeframes as keys. The default configuration reproduces eager
+    recomputation on every candle.
+
+    Example:
+        >>> scheduler = RecomputeScheduler(close_only=True, debounce_ms=250)
+        >>> if scheduler.request(TimeFrame.M1, is_closed=candle.is_closed):
+        ...     recompute(TimeFrame.M1)
+        ...     scheduler.completed(TimeFrame.M1)
+    """
+
+    def __init__(
+        self,
+        close_only: bool = False,
+        debounce_ms: float = 0.0,
+        live_tier: bool = False,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize scheduler.
+
+        Args:
+            close_only: Recompute structural detectors only for closed candles
+            debounce_ms: Minimum time between two recomputations of the same key
+            live_tier: Run the lightweight live check for in-progress candles
+                (only meaningful with close_only)
+            clock: Time source in seconds, monotonic by default
+
+        Raises:
+            ValueError: If debounce_ms is negative or live_tier is set without close_only
+        """
+        if debounce_ms < 0:
+            raise ValueError(f"debounce_ms must be non-negative, got {debounce_ms}")
+        if live_tier and not close_only:
+            raise ValueError("live_tier requires close_only=True")
+
+        self.close_only = close_only
+        self.debounce_ms = debounce_ms
+        self.live_tier = live_tier
+        self.stats = SchedulerStats()
+
+        self._clock = clock
+        # Dict keeps dirty keys in the order they became dirty
+        self._dirty: Dict[Hashable, None] = {}
+        self._last_run: Dict[Hashable, float] = {}
+
+    def request(self, key: Hashable, is_closed: bool = True) -> bool:
+        """
+        Register a new candle for a key and decide whether to recompute now.
+
+        Args:
+            key: Symbol-timeframe key
+            is_closed: Whether the candle is closed
+
+        Returns:
+            True if the caller should recompute now (and then call completed())
+        """
+        if self.close_only and not is_closed:
+            self.stats.skipped_open += 1
+            return False
+
+        self._dirty[key] = None
+        last_run = self._last_run.get(key)
+        if (
+            self.debounce_ms
+            and last_run is not None
+            and (self._clock() - last_run) * 1000 < self.debounce_ms
+        ):
+            self.stats.debounced += 1
+            return False
+        return True
+
+    def completed(self, key: Hashable) -> None:
+        """Record that a key was recomputed."""
+        self._dirty.pop(key, None)
+        self._last_run[key] = self._clock()
+        self.stats.executed += 1
+
+    def live_checked(self) -> None:
+        """Record a live-tier check."""
+        self.stats.live_checks += 1
+
+    def is_dirty(self, key: Hashable) -> bool:
+        """True if a key has candles that were not recomputed yet."""
+        return key in self._dirty
+
+    def pending(self) -> List[Hashable]:
+        """Dirty keys in the order they became dirty."""
+        return list(self._dirty)
+
+    def discard(self, key: Hashable) -> None:
+        """Forget a key (e.g. after its data was cleared)."""
+        self._dirty.pop(key, None)
+        self._last_run.pop(key, None)
+
+    def reset(self) -> None:
+        """Forget all keys and counters."""
+        self._dirty.clear()
+        self._last_run.clear()
+        self.stats = SchedulerStats()
+
+    def __repr__(self) -> str:
+        return (
+            f"RecomputeScheduler(close_only={self.close_only}, "
+            f"debounce_ms={self.debounce_ms}, pending={len(self._dirty)})"
+        )
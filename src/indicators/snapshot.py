@@ -0,0 +1,562 @@
+"""
+Immutable, versioned indicator snapshots shared by reference.
+
+The engine mutates its indicator objects in place (states, touch counts), so
+handing them to strategies or the WebSocket layer used to mean converting
+every indicator to a dict on every event. A snapshot instead holds frozen
+shallow copies of the indicators in tuples. Copies are only made for objects
+that changed since the previous snapshot, so a candle that touches one Order
+Block allocates one copy rather than re-serializing the whole timeframe.
+
+Consecutive snapshots are compared into a SnapshotDelta (added, changed and
+removed indicator ids). Thanks to the sharing, unchanged indicators are
+recognized by identity and the comparison only looks at what moved.
+
+Dict/JSON conversion happens lazily at the API boundary (serialize_payload,
+IndicatorSnapshot.to_dict, SnapshotDelta.to_dict) and is cached per object.
+"""
+
+import copy
+from dataclasses import is_dataclass
+from enum import Enum
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from src.core.constants import TimeFrame
+
+# Snapshot attributes holding indicator collections, in serialization order
+_COLLECTIONS = (
+    "order_blocks",
+    "fair_value_gaps",
+    "breaker_blocks",
+    "liquidity_levels",
+    "liquidity_sweeps",
+    "trend_structures",
+    "liquidity_strength_metrics",
+)
+
+
+def _zone_id(zone: Any) -> str:
+    return f"{zone.type.value}:{zone.origin_timestamp}"
+
+
+# Stable indicator ids per collection, derived from the fields that identify
+# an indicator across candles (its type and when it formed)
+_ID_FUNCTIONS: Dict[str, Callable[[Any], str]] = {
+    "order_blocks": _zone_id,
+    "fair_value_gaps": _zone_id,
+    "breaker_blocks": lambda bb: f"{_zone_id(bb)}:{bb.transition_timestamp}",
+    "liquidity_levels": _zone_id,
+    "liquidity_sweeps": lambda sweep: f"{sweep.direction.value}:{sweep.breach_timestamp}",
+    "trend_structures": lambda ts: f"{ts.pattern.value}:{ts.timestamp}",
+    "liquidity_strength_metrics": lambda metric: _zone_id(metric.level),
+}
+
+
+def indicator_id(collection: str, indicator: Any) -> str:
+    """
+    Stable id of an indicator within its collection.
+
+    Args:
+        collection: Collection name (e.g. "order_blocks")
+        indicator: Indicator object
+
+    Returns:
+        Id that stays the same while the indicator changes state
+
+    Raises:
+        ValueError: If the collection is unknown
+    """
+    if collection not in _ID_FUNCTIONS:
+        raise ValueError(f"Unknown indicator collection: {collection}")
+    return _ID_FUNCTIONS[collection](indicator)
+
+
+def _by_id(collection: str, indicators: Tuple[Any, ...]) -> Dict[str, Any]:
+    """Indicators keyed by id; duplicates get a positional suffix."""
+    keyed: Dict[str, Any] = {}
+    for indicator in indicators:
+        key = indicator_id(collection, indicator)
+        if key in keyed:
+            suffix = 1
+            while f"{key}#{suffix}" in keyed:
+                suffix += 1
+            key = f"{key}#{suffix}"
+        keyed[key] = indicator
+    return keyed
+
+
+class IndicatorSnapshot:
+    """
+    Immutable view of one symbol-timeframe's indicators at a point in time.
+
+    Collections are tuples of frozen copies; treat the contained objects as
+    read-only. ``version`` increases by one for every new snapshot of the
+    same symbol-timeframe, so consumers can skip work when it is unchanged.
+    ``sequence`` is the sequence number of the last delta the snapshot
+    includes; consumers resynchronizing from a snapshot drop deltas with a
+    sequence at or below it.
+    """
+
+    __slots__ = (
+        "symbol",
+        "timeframe",
+        "version",
+        "sequence",
+        "timestamp",
+        "candle_count",
+        *_COLLECTIONS,
+        "trend_state",
+        "market_state",
+        "_dict",
+    )
+
+    symbol: str
+    timeframe: TimeFrame
+    version: int
+    sequence: int
+    timestamp: Optional[int]
+    candle_count: int
+    order_blocks: Tuple[Any, ...]
+    fair_value_gaps: Tuple[Any, ...]
+    breaker_blocks: Tuple[Any, ...]
+    liquidity_levels: Tuple[Any, ...]
+    liquidity_sweeps: Tuple[Any, ...]
+    trend_structures: Tuple[Any, ...]
+    liquidity_strength_metrics: Tuple[Any, ...]
+    trend_state: Any
+    market_state: Any
+    _dict: Optional[Dict[str, Any]]
+
+    def __init__(
+        self,
+        symbol: str,
+        timeframe: TimeFrame,
+        version: int,
+        timestamp: Optional[int],
+        candle_count: int,
+        collections: Dict[str, Tuple[Any, ...]],
+        trend_state: Any = None,
+        market_state: Any = None,
+        sequence: int = 0,
+    ):
+        """
+        Initialize snapshot.
+
+        Args:
+            symbol: Trading symbol
+            timeframe: Timeframe of the indicators
+            version: Snapshot version for this symbol-timeframe
+            timestamp: Open time of the last candle included
+            candle_count: Candles in the window when the snapshot was taken
+            collections: Tuples of frozen indicators keyed by collection name
+            trend_state: Frozen trend state, if any
+            market_state: Frozen market state, if any
+            sequence: Sequence number of the last delta included
+        """
+        setattr_ = object.__setattr__
+        setattr_(self, "symbol", symbol)
+        setattr_(self, "timeframe", timeframe)
+        setattr_(self, "version", version)
+        setattr_(self, "sequence", sequence)
+        setattr_(self, "timestamp", timestamp)
+        setattr_(self, "candle_count", candle_count)
+        for name in _COLLECTIONS:
+            setattr_(self, name, collections.get(name, ()))
+        setattr_(self, "trend_state", trend_state)
+        setattr_(self, "market_state", market_state)
+        setattr_(self, "_dict", None)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("IndicatorSnapshot is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError("IndicatorSnapshot is immutable")
+
+    def counts(self) -> Dict[str, int]:
+        """Number of indicators per collection."""
+        return {name: len(getattr(self, name)) for name in _COLLECTIONS}
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert to dictionary format (computed once and cached).
+
+        Returns:
+            Dictionary with the snapshot metadata and serialized indicators;
+            callers must not mutate it
+        """
+        if self._dict is not None:
+            return self._dict
+        data: Dict[str, Any] = {
+            "symbol": self.symbol,
+            "timeframe": self.timeframe.value,
+            "version": self.version,
+            "sequence": self.sequence,
+            "timestamp": self.timestamp,
+            "candle_count": self.candle_count,
+        }
+        for name in _COLLECTIONS:
+            data[name] = [
+                {"id": key, **item.to_dict()}
+                for key, item in _by_id(name, getattr(self, name)).items()
+            ]
+        data["trend_state"] = self.trend_state.to_dict() if self.trend_state else None
+        data["market_state"] = self.market_state.to_dict() if self.market_state else None
+        object.__setattr__(self, "_dict", data)
+        return data
+
+    def __repr__(self) -> str:
+        return (
+            f"IndicatorSnapshot(symbol={self.symbol!r}, timeframe={self.timeframe.value}, "
+            f"version={self.version}, timestamp={self.timestamp})"
+        )
+
+
+class SnapshotBuilder:
+    """
+    Builds successive snapshots of one symbol-timeframe with structural sharing.
+
+    Indicator objects are frozen with a shallow copy (nested dataclasses such
+    as a strength metric's level are frozen too). A frozen copy is reused for
+    as long as the live object compares equal to it field by field, and a
+    collection tuple is reused when all of its members were reused.
+    """
+
+    def __init__(self, symbol: str, timeframe: TimeFrame):
+        """
+        Initialize snapshot builder.
+
+        Args:
+            symbol: Trading symbol
+            timeframe: Timeframe of the indicators
+        """
+        self.symbol = symbol
+        self.timeframe = timeframe
+        self.version = 0
+        self.latest: Optional[IndicatorSnapshot] = None
+        # id(live object) -> (live object, frozen copy); the live reference pins the id
+        self._frozen: Dict[int, Tuple[Any, Any]] = {}
+        self._next_frozen: Dict[int, Tuple[Any, Any]] = {}
+
+    def freeze(self, obj: Any, previous: Any = None) -> Any:
+        """
+        Frozen copy of an indicator object, reused while the object is unchanged.
+
+        Args:
+            obj: Live indicator object (dataclass instance)
+            previous: Frozen object at the same position in the previous
+                snapshot, reused if equal (detectors that rebuild their
+                results every candle return new but equal objects)
+
+        Returns:
+            Shallow copy that the engine will not mutate
+        """
+        key = id(obj)
+        entry = self._next_frozen.get(key) or self._frozen.get(key)
+        if entry is None and type(previous) is type(obj) and previous.__dict__ == obj.__dict__:
+            entry = (obj, previous)
+        elif entry is None or entry[0] is not obj or entry[1].__dict__ != obj.__dict__:
+            frozen = copy.copy(obj)
+            for name, value in vars(obj).items():
+                if is_dataclass(value) and not isinstance(value, type):
+                    object.__setattr__(frozen, name, self.freeze(value))
+            entry = (obj, frozen)
+        self._next_frozen[key] = entry
+        return entry[1]
+
+    def freeze_all(self, objects: Iterable[Any]) -> Tuple[Any, ...]:
+        """Frozen copies of several indicator objects."""
+        return tuple(self.freeze(obj) for obj in objects)
+
+    def build(self, indicators: Any, sequence: int = 0) -> IndicatorSnapshot:
+        """
+        Take a snapshot of a TimeframeIndicators container.
+
+        Args:
+            indicators: TimeframeIndicators of this symbol-timeframe
+            sequence: Sequence number of the last delta the snapshot includes
+
+        Returns:
+            New snapshot with the next version
+        """
+        previous = self.latest
+        collections: Dict[str, Tuple[Any, ...]] = {}
+        for name in _COLLECTIONS:
+            live = getattr(indicators, name)
+            shared = getattr(previous, name) if previous is not None else ()
+            if len(shared) == len(live):
+                frozen = tuple(self.freeze(obj, old) for obj, old in zip(live, shared))
+                if all(a is b for a, b in zip(shared, frozen)):
+                    frozen = shared
+            else:
+                frozen = self.freeze_all(live)
+            collections[name] = frozen
+
+        trend_state = indicators.trend_state
+        market_state = indicators.market_state
+        self.version += 1
+        self.latest = IndicatorSnapshot(
+            symbol=self.symbol,
+            timeframe=self.timeframe,
+            version=self.version,
+            sequence=sequence,
+            timestamp=indicators.last_update_timestamp,
+            candle_count=indicators.candle_count,
+            collections=collections,
+            trend_state=self.freeze(trend_state) if trend_state is not None else None,
+            market_state=self.freeze(market_state) if market_state is not None else None,
+        )
+
+        # Forget frozen copies of objects that are no longer part of the indicators
+        self._frozen = self._next_frozen
+        self._next_frozen = {}
+        return self.latest
+
+    def reset(self) -> None:
+        """Forget frozen copies (the version keeps increasing)."""
+        self.latest = None
+        self._frozen.clear()
+        self._next_frozen.clear()
+
+
+class SnapshotDelta:
+    """
+    Changes between two snapshots of one symbol-timeframe.
+
+    ``added`` and ``changed`` map collection names to frozen indicators keyed
+    by indicator id, ``removed`` maps collection names to removed ids; empty
+    collections are omitted. ``trend_state`` and ``market_state`` are set only
+    when they changed. ``sequence`` increases by one per delta of a symbol
+    across its timeframes, so a consumer that sees a jump has missed deltas
+    and should resynchronize from the engine's get_snapshot(). Clearing a
+    timeframe restarts the symbol's sequence at 1, and the cleared
+    timeframe's next delta holds its full state.
+    """
+
+    __slots__ = (
+        "symbol",
+        "timeframe",
+        "sequence",
+        "version",
+        "timestamp",
+        "added",
+        "changed",
+        "removed",
+        "trend_state",
+        "market_state",
+        "_dict",
+    )
+
+    symbol: str
+    timeframe: TimeFrame
+    sequence: int
+    version: int
+    timestamp: Optional[int]
+    added: Dict[str, Dict[str, Any]]
+    changed: Dict[str, Dict[str, Any]]
+    removed: Dict[str, Tuple[str, ...]]
+    trend_state: Any
+    market_state: Any
+    _dict: Optional[Dict[str, Any]]
+
+    def __init__(
+        self,
+        symbol: str,
+        timeframe: TimeFrame,
+        sequence: int,
+        version: int,
+        timestamp: Optional[int],
+        added: Dict[str, Dict[str, Any]],
+        changed: Dict[str, Dict[str, Any]],
+        removed: Dict[str, Tuple[str, ...]],
+        trend_state: Any = None,
+        market_state: Any = None,
+    ):
+        """
+        Initialize delta.
+
+        Args:
+            symbol: Trading symbol
+            timeframe: Timeframe of the indicators
+            sequence: Per-symbol delta sequence number
+            version: Version of the snapshot the delta leads to
+            timestamp: Open time of the last candle included
+            added: New indicators by collection and id
+            changed: Indicators whose state changed, by collection and id
+            removed: Ids of removed indicators by collection
+            trend_state: New trend state, None if unchanged
+            market_state: New market state, None if unchanged
+        """
+        setattr_ = object.__setattr__
+        setattr_(self, "symbol", symbol)
+        setattr_(self, "timeframe", timeframe)
+        setattr_(self, "sequence", sequence)
+        setattr_(self, "version", version)
+        setattr_(self, "timestamp", timestamp)
+        setattr_(self, "added", added)
+        setattr_(self, "changed", changed)
+        setattr_(self, "removed", removed)
+        setattr_(self, "trend_state", trend_state)
+        setattr_(self, "market_state", market_state)
+        setattr_(self, "_dict", None)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("SnapshotDelta is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError("SnapshotDelta is immutable")
+
+    @property
+    def is_empty(self) -> bool:
+        """True if nothing changed."""
+        return not (
+            self.added or self.changed or self.removed or self.trend_state or self.market_state
+        )
+
+    def touches(self, collection: str) -> bool:
+        """True if the delta adds, changes or removes indicators of a collection."""
+        return collection in self.added or collection in self.changed or collection in self.removed
+
+    def apply(self, collections: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Apply the delta to a consumer-side copy of the indicators.
+
+        Args:
+            collections: Indicators by collection name and id, updated in place
+        """
+        for name, ids in self.removed.items():
+            items = collections.setdefault(name, {})
+            for key in ids:
+                items.pop(key, None)
+        for changes in (self.added, self.changed):
+            for name, indicators in changes.items():
+                collections.setdefault(name, {}).update(indicators)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert to dictionary format (computed once and cached).
+
+        Returns:
+            Dictionary with the delta metadata and serialized changes;
+            callers must not mutate it
+        """
+        if self._dict is not None:
+            return self._dict
+        data: Dict[str, Any] = {
+            "symbol": self.symbol,
+            "timeframe": self.timeframe.value,
+            "sequence": self.sequence,
+            "version": self.version,
+            "timestamp": self.timestamp,
+            "added": {
+                name: [{"id": key, **item.to_dict()} for key, item in items.items()]
+                for name, items in self.added.items()
+            },
+            "changed": {
+                name: [{"id": key, **item.to_dict()} for key, item in items.items()]
+                for name, items in self.changed.items()
+            },
+            "removed": {name: list(ids) for name, ids in self.removed.items()},
+            "trend_state": self.trend_state.to_dict() if self.trend_state else None,
+            "market_state": self.market_state.to_dict() if self.market_state else None,
+        }
+        object.__setattr__(self, "_dict", data)
+        return data
+
+    def __repr__(self) -> str:
+        return (
+            f"SnapshotDelta(symbol={self.symbol!r}, timeframe={self.timeframe.value}, "
+            f"sequence={self.sequence}, added={sum(map(len, self.added.values()))}, "
+            f"changed={sum(map(len, self.changed.values()))}, "
+            f"removed={sum(map(len, self.removed.values()))})"
+        )
+
+
+def diff_snapshots(
+    previous: Optional[IndicatorSnapshot], current: IndicatorSnapshot, sequence: int
+) -> SnapshotDelta:
+    """
+    Compute the delta between two snapshots of the same symbol-timeframe.
+
+    Collections shared by reference are skipped; within a changed collection
+    indicators are matched by id and compared by identity first, so only
+    indicators that were re-frozen are compared field by field.
+
+    Args:
+        previous: Snapshot the consumer already has, None for everything
+        current: New snapshot
+        sequence: Sequence number to give the delta
+
+    Returns:
+        SnapshotDelta leading from previous to current
+    """
+    added: Dict[str, Dict[str, Any]] = {}
+    changed: Dict[str, Dict[str, Any]] = {}
+    removed: Dict[str, Tuple[str, ...]] = {}
+
+    for name in _COLLECTIONS:
+        new_items = getattr(current, name)
+        old_items = getattr(previous, name) if previous is not None else ()
+        if new_items is old_items:
+            continue
+
+        old_by_id = _by_id(name, old_items)
+        new_by_id = _by_id(name, new_items)
+        new_added: Dict[str, Any] = {}
+        new_changed: Dict[str, Any] = {}
+        for key, item in new_by_id.items():
+            old = old_by_id.pop(key, None)
+            if old is None:
+                new_added[key] = item
+            elif old is not item and old != item:
+                new_changed[key] = item
+        if new_added:
+            added[name] = new_added
+        if new_changed:
+            changed[name] = new_changed
+        if old_by_id:
+            removed[name] = tuple(old_by_id)
+
+    def state_change(attr: str) -> Any:
+        new_state = getattr(current, attr)
+        old_state = getattr(previous, attr) if previous is not None else None
+        if new_state is old_state or new_state == old_state:
+            return None
+        return new_state
+
+    return SnapshotDelta(
+        symbol=current.symbol,
+        timeframe=current.timeframe,
+        sequence=sequence,
+        version=current.version,
+        timestamp=current.timestamp,
+        added=added,
+        changed=changed,
+        removed=removed,
+        trend_state=state_change("trend_state"),
+        market_state=state_change("market_state"),
+    )
+
+
+def serialize_payload(value: Any) -> Any:
+    """
+    Convert an event payload to plain JSON-compatible data.
+
+    Objects exposing to_dict() (indicators, snapshots) are converted, tuples
+    become lists and dictionaries are converted recursively. Used at the API
+    boundary so that events can carry indicator objects by reference.
+
+    Args:
+        value: Payload value
+
+    Returns:
+        Plain data structure
+    """
+    if isinstance(value, dict):
+        return {key: serialize_payload(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [serialize_payload(item) for item in value]
+    if hasattr(value, "to_dict"):
+        return value.to_dict()
+    if isinstance(value, Enum):
+        return value.value
+    return value
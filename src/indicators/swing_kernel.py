@@ -0,0 +1,114 @@
+"""
+Vectorized swing point detection shared by the ICT detectors.
+
+Order Block, Liquidity Zone and Trend Recognition detectors all locate swing
+highs/lows with the same rule: a candle whose high (low) is strictly above
+(below) the highs (lows) of ``lookback`` candles on each side. This module
+implements that rule once over NumPy arrays and memoizes the result per
+candle buffer version, so detectors analysing the same candles in one update
+share a single computation.
+"""
+
+import logging
+from threading import Lock
+from typing import Dict, Sequence, Tuple
+from weakref import WeakKeyDictionary
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from src.models.candle import Candle
+from src.models.candle_buffer import CandleBuffer, CandleList
+
+logger = logging.getLogger(__name__)
+
+SwingIndices = Tuple[np.ndarray, np.ndarray]
+
+
+def find_swing_indices(highs: np.ndarray, lows: np.ndarray, lookback: int) -> SwingIndices:
+    """
+    Locate swing highs and lows in price arrays.
+
+    Args:
+        highs: High prices in chronological order
+        lows: Low prices in chronological order
+        lookback: Number of candles to compare on each side
+
+    Returns:
+        Tuple of (swing high indices, swing low indices) as int arrays
+    """
+    if lookback <= 0:
+        raise ValueError(f"lookback must be positive, got {lookback}")
+
+    size = len(highs)
+    if size < lookback * 2 + 1:
+        empty = np.empty(0, dtype=np.intp)
+        return empty, empty
+
+    high_windows = sliding_window_view(highs, lookback * 2 + 1)
+    low_windows = sliding_window_view(lows, lookback * 2 + 1)
+    center_highs = highs[lookback : size - lookback]
+    center_lows = lows[lookback : size - lookback]
+
+    is_high = (center_highs > high_windows[:, :lookback].max(axis=1)) & (
+        center_highs > high_windows[:, lookback + 1 :].max(axis=1)
+    )
+    is_low = (center_lows < low_windows[:, :lookback].min(axis=1)) & (
+        center_lows < low_windows[:, lookback + 1 :].min(axis=1)
+    )
+
+    return np.flatnonzero(is_high) + lookback, np.flatnonzero(is_low) + lookback
+
+
+class _BufferEntry:
+    """Swing results computed for one version of a candle buffer."""
+
+    __slots__ = ("version", "results")
+
+    def __init__(self, version: int):
+        self.version = version
+        self.results: Dict[int, SwingIndices] = {}
+
+
+_cache: "WeakKeyDictionary[CandleBuffer, _BufferEntry]" = WeakKeyDictionary()
+_cache_lock = Lock()
+
+
+def get_swing_indices(candles: Sequence[Candle], lookback: int) -> SwingIndices:
+    """
+    Locate swing highs and lows in a candle sequence.
+
+    When ``candles`` is a CandleList still matching its CandleBuffer, the
+    buffer's columns are used directly and the result is memoized on
+    (buffer version, lookback). Any other sequence is converted to arrays and
+    computed without caching.
+
+    Args:
+        candles: Candles in chronological order
+        lookback: Number of candles to compare on each side
+
+    Returns:
+        Tuple of (swing high indices, swing low indices) as int arrays
+    """
+    if isinstance(candles, CandleList) and candles.is_current():
+        buffer = candles.buffer
+        with _cache_lock:
+            entry = _cache.get(buffer)
+            if entry is None or entry.version != buffer.version:
+                entry = _BufferEntry(buffer.version)
+                _cache[buffer] = entry
+            result = entry.results.get(lookback)
+            if result is None:
+                result = find_swing_indices(buffer.column("high"), buffer.column("low"), lookback)
+                entry.results[lookback] = result
+        return result
+
+    highs = np.fromiter((c.high for c in candles), dtype=np.float64, count=len(candles))
+    lows = np.fromiter((c.low for c in candles), dtype=np.float64, count=len(candles))
+    return find_swing_indices(highs, lows, lookback)
+
+
+def clear_swing_cache() -> None:
+    """Drop all memoized swing results."""
+    with _cache_lock:
+        _cache.clear()
@@ -18,6 +18,7 @@ from typing import Any, Dict, List, Optional, Tuple
 from src.core.constants import EventType, TimeFrame
 from src.core.events import Event, EventBus
 from src.indicators.liquidity_zone import SwingPoint
+from src.indicators.swing_kernel import get_swing_indices
 from src.models.candle import Candle
 
 logger = logging.getLogger(__name__)
@@ -218,8 +219,9 @@ class TrendRecognitionEngine:
             self.logger.warning(f"Insufficient candles for ATR. Need {period}, got {len(candles)}")
             return 0.0
 
+        # Only the last 'period' true ranges are used, so only look at those candles
         true_ranges = []
-        for i in range(1, len(candles)):
+        for i in range(max(1, len(candles) - period), len(candles)):
             high = candles[i].high
             low = candles[i].low
             prev_close = candles[i - 1].close
@@ -227,9 +229,7 @@ class TrendRecognitionEngine:
             tr = max(high - low, abs(high - prev_close), abs(low - prev_close))
             true_ranges.append(tr)
 
-        # Use last 'period' true ranges
-        relevant_trs = true_ranges[-period:]
-        return sum(relevant_trs) / len(relevant_trs) if relevant_trs else 0.0
+        return sum(true_ranges) / len(true_ranges) if true_ranges else 0.0
 
     def detect_swing_highs(
         self, candles: List[Candle], lookback: Optional[int] = None
@@ -255,32 +255,19 @@ class TrendRecognitionEngine:
             )
             return []
 
-        swing_highs = []
-
-        for i in range(lookback, len(candles) - lookback):
-            current_high = candles[i].high
-
-            # Check if higher than all previous lookback candles
-            is_swing_high = all(current_high > candles[j].high for j in range(i - lookback, i))
-
-            # Check if higher than all following lookback candles
-            if is_swing_high:
-                is_swing_high = all(
-                    current_high > candles[j].high
-                    for j in range(i + 1, min(i + lookback + 1, len(candles)))
-                )
-
-            if is_swing_high:
-                swing_highs.append(
-                    SwingPoint(
-                        price=current_high,
-                        timestamp=candles[i].timestamp,
-                        candle_index=i,
-                        is_high=True,
-                        strength=lookback,
-                        volume=candles[i].volume,
-                    )
-                )
+        high_indices, _ = get_swing_indices(candles, lookback)
+        swing_highs = [
+            SwingPoint(
+                price=candles[i].high,
+                timestamp=candles[i].timestamp,
+                candle_index=i,
+                is_high=True,
+                strength=lookback,
+                volume=candles[i].volume,
+            )
+            for i in high_indices.tolist()
+        ]
+        self.logger.debug(f"Detected {len(swing_highs)} swing highs (lookback={lookback})")
 
         return swing_highs
 
@@ -308,47 +295,43 @@ class TrendRecognitionEngine:
             )
             return []
 
-        swing_lows = []
-
-        for i in range(lookback, len(candles) - lookback):
-            current_low = candles[i].low
-
-            # Check if lower than all previous lookback candles
-            is_swing_low = all(current_low < candles[j].low for j in range(i - lookback, i))
-
-            # Check if lower than all following lookback candles
-            if is_swing_low:
-                is_swing_low = all(
-                    current_low < candles[j].low
-                    for j in range(i + 1, min(i + lookback + 1, len(candles)))
-                )
-
-            if is_swing_low:
-                swing_lows.append(
-                    SwingPoint(
-                        price=current_low,
-                        timestamp=candles[i].timestamp,
-                        candle_index=i,
-                        is_high=False,
-                        strength=lookback,
-                        volume=candles[i].volume,
-                    )
-                )
+        _, low_indices = get_swing_indices(candles, lookback)
+        swing_lows = [
+            SwingPoint(
+                price=candles[i].low,
+                timestamp=candles[i].timestamp,
+                candle_index=i,
+                is_high=False,
+                strength=lookback,
+                volume=candles[i].volume,
+            )
+            for i in low_indices.tolist()
+        ]
+        self.logger.debug(f"Detected {len(swing_lows)} swing lows (lookback={lookback})")
 
         return swing_lows
 
-    def is_significant_move(self, price_change: float, candles: List[Candle]) -> bool:
+    def is_significant_move(
+        self, price_change: float, candles: List[Candle], atr: Optional[float] = None
+    ) -> bool:
         """
         Check if price move is significant using ATR filter.
 
         Args:
             price_change: Absolute price change
             candles: Candle data for ATR calculation
+            atr: Precomputed ATR (e.g. StreamingPrimitives.atr.value), None to
+                calculate it from candles
 
         Returns:
             True if move is significant (above noise threshold)
         """
-        atr = self.calculate_atr(candles)
+        if atr is None:
+            atr = self.calculate_atr(candles)
+        return self._exceeds_atr_threshold(price_change, atr)
+
+    def _exceeds_atr_threshold(self, price_change: float, atr: float) -> bool:
+        """Check a price change against the ATR noise threshold."""
         if atr == 0:
             return True  # No ATR available, accept the move
 
@@ -385,13 +368,14 @@ class TrendRecognitionEngine:
         return None
 
     def analyze_trend_patterns(
-        self, candles: List[Candle]
+        self, candles: List[Candle], atr: Optional[float] = None
     ) -> Tuple[List[TrendStructure], TrendDirection]:
         """
         Analyze candles to detect HH/HL/LH/LL patterns.
 
         Args:
             candles: List of candles to analyze
+            atr: Precomputed ATR for noise filtering, None to calculate it from candles
 
         Returns:
             Tuple of (trend structures, overall trend direction)
@@ -414,50 +398,70 @@ class TrendRecognitionEngine:
 
         self.logger.info(f"Found {len(swing_highs)} swing highs and {len(swing_lows)} swing lows")
 
+        if atr is None:
+            atr = self.calculate_atr(candles)
+        return self.analyze_swing_points(swing_highs, swing_lows, atr)
+
+    def analyze_swing_points(
+        self, swing_highs: List[SwingPoint], swing_lows: List[SwingPoint], atr: float
+    ) -> Tuple[List[TrendStructure], TrendDirection]:
+        """
+        Build HH/HL/LH/LL structures from already detected swing points.
+
+        Shared by the batch path (analyze_trend_patterns) and the incremental
+        engine, which maintains swing points as candles stream in.
+
+        Args:
+            swing_highs: Swing highs in chronological order
+            swing_lows: Swing lows in chronological order
+            atr: Current ATR used for noise filtering (0 disables the filter)
+
+        Returns:
+            Tuple of (trend structures, overall trend direction)
+        """
         # Store for later use
         self._swing_highs = swing_highs
         self._swing_lows = swing_lows
 
-        # Analyze high patterns (HH/LH)
-        high_patterns = []
-        for i in range(1, len(swing_highs)):
-            current = swing_highs[i]
-            previous = swing_highs[i - 1]
+        # Analyze high patterns (HH/LH) and low patterns (HL/LL)
+        high_patterns = self._build_structures(swing_highs, atr)
+        low_patterns = self._build_structures(swing_lows, atr)
 
-            price_change = current.price - previous.price
+        # Combine and sort by candle index
+        all_structures = sorted(high_patterns + low_patterns, key=lambda s: s.candle_index)
 
-            # Apply noise filter
-            if not self.is_significant_move(price_change, candles):
-                continue
+        self._trend_structures = all_structures
 
-            pattern = self.identify_pattern(current, previous)
-            if pattern:
-                swing_length = current.candle_index - previous.candle_index
-                price_change_pct = (price_change / previous.price) * 100
+        # Determine overall trend
+        direction = self._determine_trend_direction(all_structures)
 
-                structure = TrendStructure(
-                    pattern=pattern,
-                    price=current.price,
-                    timestamp=current.timestamp,
-                    candle_index=current.candle_index,
-                    previous_swing_price=previous.price,
-                    previous_swing_index=previous.candle_index,
-                    swing_length=swing_length,
-                    price_change=price_change,
-                    price_change_pct=price_change_pct,
-                )
-                high_patterns.append(structure)
+        self.logger.info(
+            f"Detected {len(all_structures)} trend structures. "
+            f"Overall direction: {direction.value}"
+        )
 
-        # Analyze low patterns (HL/LL)
-        low_patterns = []
-        for i in range(1, len(swing_lows)):
-            current = swing_lows[i]
-            previous = swing_lows[i - 1]
+        return all_structures, direction
 
+    def _build_structures(self, swings: List[SwingPoint], atr: float) -> List[TrendStructure]:
+        """
+        Compare consecutive swing points of the same side.
+
+        Args:
+            swings: Swing highs or swing lows in chronological order
+            atr: Current ATR used for noise filtering
+
+        Returns:
+            Trend structures for significant swing-to-swing moves
+        """
+        # Noise threshold of _exceeds_atr_threshold (no ATR accepts every move)
+        min_change = atr * self.min_price_change_atr_multiple if atr != 0 else 0.0
+
+        structures = []
+        for previous, current in zip(swings, swings[1:]):
             price_change = current.price - previous.price
 
             # Apply noise filter
-            if not self.is_significant_move(price_change, candles):
+            if abs(price_change) < min_change:
                 continue
 
             pattern = self.identify_pattern(current, previous)
@@ -465,33 +469,22 @@ class TrendRecognitionEngine:
                 swing_length = current.candle_index - previous.candle_index
                 price_change_pct = (price_change / previous.price) * 100
 
+                # Positional arguments in field order: the incremental engine
+                # rebuilds every structure of the window on each update
                 structure = TrendStructure(
-                    pattern=pattern,
-                    price=current.price,
-                    timestamp=current.timestamp,
-                    candle_index=current.candle_index,
-                    previous_swing_price=previous.price,
-                    previous_swing_index=previous.candle_index,
-                    swing_length=swing_length,
-                    price_change=price_change,
-                    price_change_pct=price_change_pct,
+                    pattern,
+                    current.price,
+                    current.timestamp,
+                    current.candle_index,
+                    previous.price,
+                    previous.candle_index,
+                    swing_length,
+                    price_change,
+                    price_change_pct,
                 )
-                low_patterns.append(structure)
-
-        # Combine and sort by candle index
-        all_structures = sorted(high_patterns + low_patterns, key=lambda s: s.candle_index)
+                structures.append(structure)
 
-        self._trend_structures = all_structures
-
-        # Determine overall trend
-        direction = self._determine_trend_direction(all_structures)
-
-        self.logger.info(
-            f"Detected {len(all_structures)} trend structures. "
-            f"Overall direction: {direction.value}"
-        )
-
-        return all_structures, direction
+        return structures
 
     def _determine_trend_direction(self, structures: List[TrendStructure]) -> TrendDirection:
         """
@@ -507,13 +500,11 @@ class TrendRecognitionEngine:
             return TrendDirection.RANGING
 
         # Count pattern types
-        hh_count = sum(1 for s in structures if s.pattern == TrendPattern.HIGHER_HIGH)
-        hl_count = sum(1 for s in structures if s.pattern == TrendPattern.HIGHER_LOW)
-        lh_count = sum(1 for s in structures if s.pattern == TrendPattern.LOWER_HIGH)
-        ll_count = sum(1 for s in structures if s.pattern == TrendPattern.LOWER_LOW)
-
-        bullish_patterns = hh_count + hl_count
-        lh_count + ll_count
+        bullish_patterns = sum(
+            1
+            for s in structures
+            if s.pattern in (TrendPattern.HIGHER_HIGH, TrendPattern.HIGHER_LOW)
+        )
 
         total_patterns = len(structures)
         bullish_ratio = bullish_patterns / total_patterns if total_patterns > 0 else 0
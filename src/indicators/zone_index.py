@@ -0,0 +1,339 @@
+"""
+Price index over zone indicators (Order Blocks, Fair Value Gaps, Breaker Blocks).
+
+Zones are price intervals [low, high] with a BULLISH or BEARISH type. The index
+keeps the live zones of one collection sorted by low, high and age so that the
+common questions asked on every candle are answered by binary search instead
+of a scan over the whole list:
+
+- which zones contain a price / overlap a candle range (stabbing query)
+- nearest zone below or above a price
+- which zones a candle may have invalidated (price beyond the protective edge)
+- which zones are old enough to expire
+
+Zone states are mutated in place by detectors, so liveness is re-checked on
+every query and zones that left the live states are pruned lazily. Callers that
+know about a state transition call update() to drop the zone immediately.
+"""
+
+from bisect import bisect_left, bisect_right, insort
+from itertools import count
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+_SIDES = ("BULLISH", "BEARISH")
+_INF = float("inf")
+
+
+class _Side:
+    """Sorted (key, seq) lists of the zones of one type."""
+
+    __slots__ = ("lows", "highs")
+
+    def __init__(self):
+        self.lows: List[Tuple[float, int]] = []
+        self.highs: List[Tuple[float, int]] = []
+
+
+def _remove(keys: List[Tuple[Any, int]], key: Tuple[Any, int]) -> None:
+    pos = bisect_left(keys, key)
+    if pos < len(keys) and keys[pos] == key:
+        del keys[pos]
+
+
+class ZoneIndex:
+    """
+    Incrementally maintained price index over live zones.
+
+    Containment uses interval-tree semantics on top of sorted lows: only zones
+    with low in [price - widest zone, price] can contain the price, so a query
+    costs O(log n + k) for k candidates. Insertions and removals are O(log n)
+    searches plus a list shift.
+
+    Example:
+        >>> index = ZoneIndex(live=lambda ob: ob.state != OrderBlockState.BROKEN)
+        >>> index.add(order_block)
+        >>> index.containing(latest.close)
+        >>> index.nearest_below(entry_price, side="BULLISH")
+    """
+
+    def __init__(
+        self,
+        live: Optional[Callable[[Any], bool]] = None,
+        time_attr: str = "origin_timestamp",
+        index_attr: str = "origin_candle_index",
+    ):
+        """
+        Initialize zone index.
+
+        Args:
+            live: Predicate deciding whether a zone belongs in the index,
+                None to index every zone
+            time_attr: Zone attribute holding its formation timestamp
+            index_attr: Zone attribute holding its formation candle index
+        """
+        self._live = live or (lambda zone: True)
+        self.time_attr = time_attr
+        self.index_attr = index_attr
+
+        self._seq = count()
+        self._zones: Dict[int, Any] = {}  # seq -> zone
+        self._seq_of: Dict[int, int] = {}  # id(zone) -> seq
+        self._keys: Dict[int, Tuple[str, float, float, int, int]] = {}
+        self._sides = {side: _Side() for side in _SIDES}
+        self._widths: List[Tuple[float, int]] = []
+        self._times: List[Tuple[int, int]] = []
+        self._indices: List[Tuple[int, int]] = []
+
+    # ------------------------------------------------------------------ #
+    # Maintenance
+    # ------------------------------------------------------------------ #
+
+    def add(self, zone: Any) -> bool:
+        """
+        Index a zone if it is live and not already indexed.
+
+        Returns:
+            True if the zone was added
+        """
+        if id(zone) in self._seq_of or not self._live(zone):
+            return False
+
+        seq = next(self._seq)
+        side = zone.type.value
+        low, high = float(zone.low), float(zone.high)
+        timestamp = int(getattr(zone, self.time_attr))
+        candle_index = int(getattr(zone, self.index_attr))
+
+        self._zones[seq] = zone
+        self._seq_of[id(zone)] = seq
+        self._keys[seq] = (side, low, high, timestamp, candle_index)
+
+        insort(self._sides[side].lows, (low, seq))
+        insort(self._sides[side].highs, (high, seq))
+        insort(self._widths, (high - low, seq))
+        insort(self._times, (timestamp, seq))
+        insort(self._indices, (candle_index, seq))
+        return True
+
+    def discard(self, zone: Any) -> bool:
+        """
+        Remove a zone from the index.
+
+        Returns:
+            True if the zone was indexed
+        """
+        seq = self._seq_of.pop(id(zone), None)
+        if seq is None:
+            return False
+
+        del self._zones[seq]
+        side, low, high, timestamp, candle_index = self._keys.pop(seq)
+        _remove(self._sides[side].lows, (low, seq))
+        _remove(self._sides[side].highs, (high, seq))
+        _remove(self._widths, (high - low, seq))
+        _remove(self._times, (timestamp, seq))
+        _remove(self._indices, (candle_index, seq))
+        return True
+
+    def update(self, zone: Any) -> None:
+        """Re-check a zone after a state transition, dropping it if no longer live."""
+        if self._live(zone):
+            self.add(zone)
+        else:
+            self.discard(zone)
+
+    def rebuild(self, zones: List[Any]) -> None:
+        """Replace the index contents with the live zones of a list."""
+        self.clear()
+        for zone in zones:
+            self.add(zone)
+
+    def clear(self) -> None:
+        """Remove all zones."""
+        self._zones.clear()
+        self._seq_of.clear()
+        self._keys.clear()
+        for side in self._sides.values():
+            side.lows.clear()
+            side.highs.clear()
+        self._widths.clear()
+        self._times.clear()
+        self._indices.clear()
+
+    def __len__(self) -> int:
+        return len(self._zones)
+
+    def __contains__(self, zone: Any) -> bool:
+        return id(zone) in self._seq_of
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate indexed zones in insertion order."""
+        return iter(list(self._zones.values()))
+
+    # ------------------------------------------------------------------ #
+    # Queries
+    # ------------------------------------------------------------------ #
+
+    def _sides_for(self, side: Optional[str]) -> List[_Side]:
+        if side is None:
+            return list(self._sides.values())
+        return [self._sides[getattr(side, "value", side)]]
+
+    def _resolve(self, seqs: List[int]) -> List[Any]:
+        """Live zones for seqs in insertion order, pruning dead ones."""
+        zones = []
+        for seq in sorted(set(seqs)):
+            zone = self._zones.get(seq)
+            if zone is None:
+                continue
+            if self._live(zone):
+                zones.append(zone)
+            else:
+                self.discard(zone)
+        return zones
+
+    def overlapping(self, low: float, high: float, side: Optional[str] = None) -> List[Any]:
+        """
+        Zones intersecting [low, high] (boundaries inclusive).
+
+        Args:
+            low: Lower bound of the range
+            high: Upper bound of the range
+            side: Restrict to BULLISH or BEARISH zones, None for both
+
+        Returns:
+            Matching zones in insertion order
+        """
+        widest = self._widths[-1][0] if self._widths else 0.0
+        # Slack keeps rounding in high - low from excluding a zone at the window edge
+        start = low - widest - 1e-9 * max(1.0, abs(low))
+        seqs = []
+        for zones in self._sides_for(side):
+            lo = bisect_left(zones.lows, (start, -1))
+            hi = bisect_right(zones.lows, (high, _INF))
+            for _, seq in zones.lows[lo:hi]:
+                if self._keys[seq][2] >= low:
+                    seqs.append(seq)
+        return self._resolve(seqs)
+
+    def containing(self, price: float, side: Optional[str] = None) -> List[Any]:
+        """Zones with low <= price <= high, in insertion order."""
+        return self.overlapping(price, price, side)
+
+    def reached_by(self, low: float, high: float) -> List[Any]:
+        """
+        Zones a candle spanning [low, high] touched or traded through.
+
+        These are the zones overlapping the range plus bullish zones lying
+        above it and bearish zones lying below it, i.e. every zone whose
+        state a detector or expiration rule may change for this candle.
+
+        Returns:
+            Matching zones in insertion order
+        """
+        bullish = self._sides["BULLISH"]
+        bearish = self._sides["BEARISH"]
+        seqs = [seq for _, seq in bullish.lows[bisect_right(bullish.lows, (low, _INF)) :]]
+        seqs.extend(seq for _, seq in bearish.highs[: bisect_left(bearish.highs, (high, -1))])
+        seqs.extend(self._seq_of[id(zone)] for zone in self.overlapping(low, high))
+        return self._resolve(seqs)
+
+    def aged(
+        self, timestamp: Optional[int] = None, candle_index: Optional[int] = None
+    ) -> List[Any]:
+        """
+        Zones formed at or before a timestamp or candle index.
+
+        Args:
+            timestamp: Inclusive formation timestamp cutoff, None to skip
+            candle_index: Inclusive formation candle index cutoff, None to skip
+
+        Returns:
+            Matching zones in insertion order
+        """
+        seqs = []
+        if timestamp is not None:
+            seqs.extend(
+                seq for _, seq in self._times[: bisect_right(self._times, (timestamp, _INF))]
+            )
+        if candle_index is not None:
+            seqs.extend(
+                seq for _, seq in self._indices[: bisect_right(self._indices, (candle_index, _INF))]
+            )
+        return self._resolve(seqs)
+
+    def nearest_below(
+        self,
+        price: float,
+        side: Optional[str] = None,
+        predicate: Optional[Callable[[Any], bool]] = None,
+    ) -> Optional[Any]:
+        """
+        Zone with the highest high strictly below a price.
+
+        Args:
+            price: Reference price
+            side: Restrict to BULLISH or BEARISH zones, None for both
+            predicate: Additional filter applied while walking down
+
+        Returns:
+            Nearest matching zone, or None
+        """
+        best = None
+        best_high = -_INF
+        for zones in self._sides_for(side):
+            found, found_high = None, -_INF
+            pos = bisect_left(zones.highs, (price, -1))
+            while pos > 0:
+                pos -= 1
+                high, seq = zones.highs[pos]
+                if high < found_high or high < best_high:
+                    break
+                zone = self._zones[seq]
+                if not self._live(zone):
+                    self.discard(zone)
+                    continue
+                if predicate is None or predicate(zone):
+                    # Keep walking through equal highs so ties resolve to the oldest zone
+                    found, found_high = zone, high
+            if found is not None and found_high > best_high:
+                best, best_high = found, found_high
+        return best
+
+    def nearest_above(
+        self,
+        price: float,
+        side: Optional[str] = None,
+        predicate: Optional[Callable[[Any], bool]] = None,
+    ) -> Optional[Any]:
+        """
+        Zone with the lowest low strictly above a price.
+
+        Args:
+            price: Reference price
+            side: Restrict to BULLISH or BEARISH zones, None for both
+            predicate: Additional filter applied while walking up
+
+        Returns:
+            Nearest matching zone, or None
+        """
+        best = None
+        best_low = _INF
+        for zones in self._sides_for(side):
+            pos = bisect_right(zones.lows, (price, _INF))
+            while pos < len(zones.lows):
+                low, seq = zones.lows[pos]
+                if low >= best_low:
+                    break
+                zone = self._zones[seq]
+                if not self._live(zone):
+                    self.discard(zone)
+                    continue
+                if predicate is None or predicate(zone):
+                    best, best_low = zone, low
+                    break
+                pos += 1
+        return best
+
+    def __repr__(self) -> str:
+        return f"ZoneIndex(zones={len(self)})"
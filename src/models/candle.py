@@ -14,6 +14,17 @@ from src.core.constants import TimeFrame
 
 logger = logging.getLogger(__name__)
 
+# Mapping of timeframes to milliseconds
+_TIMEFRAME_MS: Dict[TimeFrame, int] = {
+    TimeFrame.M1: 60 * 1000,  # 1 minute
+    TimeFrame.M5: 5 * 60 * 1000,  # 5 minutes
+    TimeFrame.M15: 15 * 60 * 1000,  # 15 minutes
+    TimeFrame.M30: 30 * 60 * 1000,  # 30 minutes
+    TimeFrame.H1: 60 * 60 * 1000,  # 1 hour
+    TimeFrame.H4: 4 * 60 * 60 * 1000,  # 4 hours
+    TimeFrame.D1: 24 * 60 * 60 * 1000,  # 1 day
+}
+
 
 @dataclass
 class Candle:
@@ -140,21 +151,10 @@ class Candle:
         Raises:
             ValueError: If timeframe is not recognized
         """
-        # Mapping of timeframes to milliseconds
-        timeframe_ms = {
-            TimeFrame.M1: 60 * 1000,  # 1 minute
-            TimeFrame.M5: 5 * 60 * 1000,  # 5 minutes
-            TimeFrame.M15: 15 * 60 * 1000,  # 15 minutes
-            TimeFrame.M30: 30 * 60 * 1000,  # 30 minutes
-            TimeFrame.H1: 60 * 60 * 1000,  # 1 hour
-            TimeFrame.H4: 4 * 60 * 60 * 1000,  # 4 hours
-            TimeFrame.D1: 24 * 60 * 60 * 1000,  # 1 day
-        }
-
-        if timeframe not in timeframe_ms:
-            raise ValueError(f"Unknown timeframe: {timeframe}")
-
-        return timeframe_ms[timeframe]
+        try:
+            return _TIMEFRAME_MS[timeframe]
+        except (KeyError, TypeError):
+            raise ValueError(f"Unknown timeframe: {timeframe}") from None
 
     @staticmethod
     def calculate_next_candle_time(timestamp: int, timeframe: TimeFrame) -> int:
@@ -0,0 +1,233 @@
+"""
+Vectorized construction of many candles at once.
+
+Creating a Candle runs validate_ohlcv() and normalize_timestamp() in
+__post_init__, which dominates bulk loads of exchange OHLCV rows. CandleBatch
+validates and normalizes whole OHLCV arrays in a single NumPy pass, keeps a
+boolean mask of rejected rows with the reason for each, and hands the valid
+rows to columnar storage (CandleBuffer.extend, CandleStorage.add_batch)
+without creating Candle objects. Candle remains the API for single candles.
+"""
+
+import logging
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+import numpy as np
+
+from src.core.constants import TimeFrame
+from src.models.candle import Candle
+from src.models.candle_buffer import CandleArrays
+
+logger = logging.getLogger(__name__)
+
+# Validation rules in the order Candle.validate_ohlcv checks them, so a row is
+# reported with the same reason a single Candle would raise
+_REJECT_REASONS = (
+    "non_positive_price",
+    "negative_volume",
+    "open_outside_range",
+    "close_outside_range",
+)
+
+
+class CandleBatch:
+    """
+    Validated, normalized OHLCV rows of one symbol-timeframe pair.
+
+    ``arrays`` holds only the accepted rows (timestamps normalized to the
+    start of their period); ``valid`` is the accept mask aligned with the
+    input rows and ``errors()`` describes every rejected row.
+
+    Example:
+        >>> batch = CandleBatch.from_ohlcv("BTCUSDT", TimeFrame.M1, ohlcv, is_closed=True)
+        >>> batch.rejected, batch.errors()[:1]
+        >>> storage.add_batch(batch)
+    """
+
+    def __init__(
+        self,
+        symbol: str,
+        timeframe: TimeFrame,
+        arrays: CandleArrays,
+        valid: np.ndarray,
+        reasons: np.ndarray,
+    ):
+        """
+        Initialize candle batch.
+
+        Use from_ohlcv() or from_arrays() instead of calling this directly.
+
+        Args:
+            symbol: Trading pair symbol
+            timeframe: Candle timeframe
+            arrays: Columns of the accepted rows
+            valid: Accept mask aligned with the input rows
+            reasons: Index into _REJECT_REASONS per input row, -1 if accepted
+        """
+        self.symbol = symbol
+        self.timeframe = timeframe
+        self.arrays = arrays
+        self.valid = valid
+        self._reasons = reasons
+
+    @classmethod
+    def from_ohlcv(
+        cls,
+        symbol: str,
+        timeframe: TimeFrame,
+        ohlcv: Union[Sequence[Sequence[float]], np.ndarray],
+        is_closed: Union[bool, Sequence[bool], np.ndarray] = False,
+    ) -> "CandleBatch":
+        """
+        Build a batch from CCXT-style OHLCV rows.
+
+        Args:
+            symbol: Trading pair symbol
+            timeframe: Candle timeframe
+            ohlcv: Rows of [timestamp, open, high, low, close, volume]
+                (extra columns are ignored)
+            is_closed: Whether the candles are finalized, for all rows or per row
+
+        Returns:
+            CandleBatch of the rows
+
+        Raises:
+            ValueError: If the rows do not have at least 6 columns
+        """
+        if len(ohlcv) == 0:
+            data = np.empty((0, 6), dtype=np.float64)
+        else:
+            try:
+                data = np.asarray(ohlcv, dtype=np.float64)
+            except ValueError as e:
+                raise ValueError(f"Invalid OHLCV rows: {e}") from e
+        if data.ndim != 2 or data.shape[1] < 6:
+            raise ValueError(f"Invalid OHLCV rows. Expected 6 columns, got shape {data.shape}")
+
+        # Timestamps above 2**53 do not survive float64; reparse them exactly
+        timestamps = data[:, 0].astype(np.int64)
+        if len(timestamps) and np.abs(data[:, 0]).max() >= 2**53:
+            timestamps = np.array([int(row[0]) for row in ohlcv], dtype=np.int64)
+
+        return cls.from_arrays(
+            symbol,
+            timeframe,
+            timestamp=timestamps,
+            open=data[:, 1],
+            high=data[:, 2],
+            low=data[:, 3],
+            close=data[:, 4],
+            volume=data[:, 5],
+            is_closed=is_closed,
+        )
+
+    @classmethod
+    def from_arrays(
+        cls,
+        symbol: str,
+        timeframe: TimeFrame,
+        timestamp: np.ndarray,
+        open: np.ndarray,
+        high: np.ndarray,
+        low: np.ndarray,
+        close: np.ndarray,
+        volume: np.ndarray,
+        is_closed: Union[bool, Sequence[bool], np.ndarray] = False,
+    ) -> "CandleBatch":
+        """
+        Build a batch from equally long column arrays.
+
+        Applies the rules of Candle.validate_ohlcv to every row (prices
+        positive, volume non-negative, open and close within [low, high]) and
+        normalizes timestamps like Candle.normalize_timestamp.
+
+        Args:
+            symbol: Trading pair symbol
+            timeframe: Candle timeframe
+            timestamp: Open times in milliseconds
+            open: Opening prices
+            high: Highest prices
+            low: Lowest prices
+            close: Closing prices
+            volume: Volumes
+            is_closed: Whether the candles are finalized, for all rows or per row
+
+        Returns:
+            CandleBatch of the rows
+
+        Raises:
+            ValueError: If the arrays differ in length or the timeframe is unknown
+        """
+        interval_ms = Candle.get_timeframe_milliseconds(timeframe)
+
+        timestamp = np.asarray(timestamp, dtype=np.int64)
+        open_, high, low, close, volume = (
+            np.asarray(column, dtype=np.float64) for column in (open, high, low, close, volume)
+        )
+        size = len(timestamp)
+        if any(len(column) != size for column in (open_, high, low, close, volume)):
+            raise ValueError("OHLCV columns must have the same length")
+        closed = np.broadcast_to(np.asarray(is_closed, dtype=np.bool_), (size,))
+
+        # One mask per rule; NaN fails every comparison and is rejected as a price
+        checks = (
+            (open_ > 0) & (high > 0) & (low > 0) & (close > 0),
+            volume >= 0,
+            (low <= open_) & (open_ <= high),
+            (low <= close) & (close <= high),
+        )
+        reasons = np.full(size, -1, dtype=np.int8)
+        for code in range(len(checks) - 1, -1, -1):
+            reasons[~checks[code]] = code
+        valid = reasons < 0
+
+        rows = slice(None) if valid.all() else valid
+        arrays = CandleArrays(
+            timestamp=(timestamp[rows] // interval_ms) * interval_ms,
+            open=open_[rows],
+            high=high[rows],
+            low=low[rows],
+            close=close[rows],
+            volume=volume[rows],
+            is_closed=np.array(closed[rows], dtype=np.bool_),
+        )
+        return cls(symbol, timeframe, arrays, valid, reasons)
+
+    def __len__(self) -> int:
+        """Number of accepted rows."""
+        return len(self.arrays)
+
+    @property
+    def rejected(self) -> int:
+        """Number of rejected input rows."""
+        return int(len(self.valid) - np.count_nonzero(self.valid))
+
+    def errors(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Describe rejected rows.
+
+        Args:
+            limit: Maximum number of rows to describe, None for all
+
+        Returns:
+            List of dictionaries with the input row 'index' and the 'reason'
+            (non_positive_price, negative_volume, open_outside_range or
+            close_outside_range)
+        """
+        rows = np.flatnonzero(~self.valid)
+        if limit is not None:
+            rows = rows[:limit]
+        return [
+            {"index": int(row), "reason": _REJECT_REASONS[self._reasons[row]]}
+            for row in rows.tolist()
+        ]
+
+    def to_candles(self) -> List[Candle]:
+        """Build Candle objects for the accepted rows (without re-validating)."""
+        return self.arrays.to_candles(self.symbol, self.timeframe)
+
+    def __repr__(self) -> str:
+        return (
+            f"CandleBatch(symbol={self.symbol}, timeframe={self.timeframe.value}, "
+            f"accepted={len(self)}, rejected={self.rejected})"
+        )
@@ -0,0 +1,453 @@
+"""
+Columnar fixed-capacity candle buffer.
+
+This module provides CandleBuffer, a preallocated ring buffer that stores candle
+fields in NumPy columns so consumers can read OHLCV arrays directly instead of
+materialising Candle objects for every row.
+"""
+
+import logging
+from typing import Dict, List, NamedTuple, Optional
+
+import numpy as np
+
+from src.core.constants import TimeFrame
+from src.models.candle import Candle
+
+logger = logging.getLogger(__name__)
+
+
+class CandleArrays(NamedTuple):
+    """Column views over a contiguous range of buffered candles."""
+
+    timestamp: np.ndarray
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+    is_closed: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.timestamp)
+
+    def to_candles(self, symbol: str, timeframe: TimeFrame) -> List[Candle]:
+        """
+        Build Candle objects from the columns.
+
+        Rows are assumed to have been validated when they were first stored,
+        so Candle.__post_init__ is skipped.
+
+        Args:
+            symbol: Symbol of the rows
+            timeframe: Timeframe of the rows
+
+        Returns:
+            List of candles in row order
+        """
+        rows = zip(
+            self.timestamp.tolist(),
+            self.open.tolist(),
+            self.high.tolist(),
+            self.low.tolist(),
+            self.close.tolist(),
+            self.volume.tolist(),
+            self.is_closed.tolist(),
+        )
+
+        candles = []
+        for timestamp, open_, high, low, close, volume, is_closed in rows:
+            candle = Candle.__new__(Candle)
+            candle.__dict__.update(
+                symbol=symbol,
+                timeframe=timeframe,
+                timestamp=timestamp,
+                open=open_,
+                high=high,
+                low=low,
+                close=close,
+                volume=volume,
+                is_closed=is_closed,
+            )
+            candles.append(candle)
+        return candles
+
+
+class CandleList(list):
+    """
+    Snapshot of all rows of a CandleBuffer as a list of Candle objects.
+
+    Remembers the buffer and its version so consumers can tell whether the
+    buffer columns still describe exactly these candles and read them instead
+    of iterating the objects. Treat it as read-only.
+    """
+
+    def __init__(self, candles: List[Candle], buffer: "CandleBuffer"):
+        super().__init__(candles)
+        self.buffer = buffer
+        self.version = buffer.version
+
+    def is_current(self) -> bool:
+        """Check that the buffer has not changed since this snapshot."""
+        return self.version == self.buffer.version and len(self) == len(self.buffer)
+
+
+_COLUMN_DTYPES: Dict[str, type] = {
+    "timestamp": np.int64,
+    "open": np.float64,
+    "high": np.float64,
+    "low": np.float64,
+    "close": np.float64,
+    "volume": np.float64,
+    "is_closed": np.bool_,
+}
+
+
+class CandleBuffer:
+    """
+    Fixed-capacity columnar buffer for a single symbol-timeframe pair.
+
+    Rows live in backing arrays with a quarter of the capacity as slack. New rows
+    are written after the newest row and the window slides forward on eviction;
+    when the slack is exhausted the live rows are compacted back to the front.
+    Appends are amortised O(1) and every "last N rows" range is contiguous, so
+    column views are returned without copying.
+
+    Column views are read-only and only valid until the next mutation of the
+    buffer. Callers that keep arrays across appends must copy them.
+
+    Example:
+        >>> buffer = CandleBuffer(capacity=500)
+        >>> buffer.append(candle)
+        >>> closes = buffer.arrays(last=100).close
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        symbol: Optional[str] = None,
+        timeframe: Optional[TimeFrame] = None,
+        keep_objects: bool = False,
+    ):
+        """
+        Initialize candle buffer.
+
+        Args:
+            capacity: Maximum number of candles retained
+            symbol: Symbol of buffered candles (taken from first candle if None)
+            timeframe: Timeframe of buffered candles (taken from first candle if None)
+            keep_objects: Also retain the appended Candle instances so reads return
+                the original objects instead of rebuilding them from columns
+        """
+        if capacity <= 0:
+            raise ValueError(f"capacity must be positive, got {capacity}")
+
+        self._capacity = capacity
+        self._slots = capacity + max(16, capacity // 4)
+        self.symbol = symbol
+        self.timeframe = timeframe
+        self._columns: Dict[str, np.ndarray] = {
+            name: np.zeros(self._slots, dtype=dtype) for name, dtype in _COLUMN_DTYPES.items()
+        }
+        self._objects: Optional[np.ndarray] = (
+            np.empty(self._slots, dtype=object) if keep_objects else None
+        )
+        self._start = 0
+        self._end = 0
+        self._version = 0
+        self._sorted = True
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of candles retained."""
+        return self._capacity
+
+    @property
+    def version(self) -> int:
+        """Counter incremented on every mutation, usable as a cache key."""
+        return self._version
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the preallocated column arrays."""
+        total = sum(column.nbytes for column in self._columns.values())
+        if self._objects is not None:
+            total += self._objects.nbytes
+        return total
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    def append(self, candle: Candle) -> bool:
+        """
+        Append a candle, evicting the oldest row when at capacity.
+
+        Args:
+            candle: Candle to append
+
+        Returns:
+            True if the oldest row was evicted
+        """
+        if self.symbol is None:
+            self.symbol = candle.symbol
+        if self.timeframe is None:
+            self.timeframe = candle.timeframe
+
+        if self._end == self._slots:
+            self._compact()
+
+        end = self._end
+        columns = self._columns
+        if end > self._start and candle.timestamp < columns["timestamp"][end - 1]:
+            self._sorted = False
+        columns["timestamp"][end] = candle.timestamp
+        columns["open"][end] = candle.open
+        columns["high"][end] = candle.high
+        columns["low"][end] = candle.low
+        columns["close"][end] = candle.close
+        columns["volume"][end] = candle.volume
+        columns["is_closed"][end] = candle.is_closed
+        if self._objects is not None:
+            self._objects[end] = candle
+
+        self._end = end + 1
+        self._version += 1
+
+        if self._end - self._start > self._capacity:
+            if self._objects is not None:
+                self._objects[self._start] = None
+            self._start += 1
+            return True
+        return False
+
+    def extend(self, arrays: CandleArrays) -> int:
+        """
+        Append many validated rows at once, evicting the oldest rows beyond capacity.
+
+        Equivalent to calling append() for every row, but the rows are copied
+        column by column. With keep_objects the Candle objects are built from
+        the columns, which requires symbol and timeframe to be known.
+
+        Args:
+            arrays: Columns of the rows to append, oldest first
+
+        Returns:
+            Number of rows evicted (including input rows beyond capacity)
+
+        Raises:
+            RuntimeError: If objects are kept and symbol or timeframe is unknown
+        """
+        count = len(arrays)
+        if count == 0:
+            return 0
+        if self._objects is not None and (self.symbol is None or self.timeframe is None):
+            raise RuntimeError("CandleBuffer needs symbol and timeframe to keep batch objects")
+
+        evicted = max(0, len(self) + count - self._capacity)
+        if count > self._capacity:
+            arrays = CandleArrays(*(column[-self._capacity :] for column in arrays))
+            count = self._capacity
+
+        if self._end + count > self._slots:
+            # Only rows that survive this batch are moved to the front
+            keep = min(len(self), self._capacity - count)
+            self._start = self._end - keep
+            self._compact()
+
+        end = self._end
+        columns = self._columns
+        timestamps = arrays.timestamp
+        if (end > self._start and timestamps[0] < columns["timestamp"][end - 1]) or (
+            count > 1 and bool(np.any(timestamps[1:] < timestamps[:-1]))
+        ):
+            self._sorted = False
+        for name in CandleArrays._fields:
+            columns[name][end : end + count] = getattr(arrays, name)
+        if self._objects is not None:
+            objects = np.empty(count, dtype=object)
+            objects[:] = arrays.to_candles(self.symbol, self.timeframe)
+            self._objects[end : end + count] = objects
+
+        self._end = end + count
+        self._version += 1
+
+        if self._end - self._start > self._capacity:
+            start = self._end - self._capacity
+            if self._objects is not None:
+                self._objects[self._start : start] = None
+            self._start = start
+        return evicted
+
+    def _compact(self) -> None:
+        """Move live rows to the front of the backing arrays."""
+        size = len(self)
+        for column in self._columns.values():
+            column[:size] = column[self._start : self._end]
+        if self._objects is not None:
+            self._objects[:size] = self._objects[self._start : self._end]
+            self._objects[size:] = None
+        self._start = 0
+        self._end = size
+
+    def _bounds(self, last: Optional[int]) -> slice:
+        if last is None:
+            return slice(self._start, self._end)
+        if last <= 0:
+            return slice(self._end, self._end)
+        return slice(max(self._start, self._end - last), self._end)
+
+    def column(self, name: str, last: Optional[int] = None) -> np.ndarray:
+        """
+        Get a read-only view of one column.
+
+        Args:
+            name: Column name (timestamp, open, high, low, close, volume, is_closed)
+            last: Restrict to the most recent N rows
+
+        Returns:
+            Contiguous view over the requested rows, oldest first
+        """
+        view = self._columns[name][self._bounds(last)]
+        view.flags.writeable = False
+        return view
+
+    def arrays(self, last: Optional[int] = None) -> CandleArrays:
+        """
+        Get read-only views of all columns.
+
+        Args:
+            last: Restrict to the most recent N rows
+
+        Returns:
+            CandleArrays of contiguous views, oldest first
+        """
+        bounds = self._bounds(last)
+        views = []
+        for name in CandleArrays._fields:
+            view = self._columns[name][bounds]
+            view.flags.writeable = False
+            views.append(view)
+        return CandleArrays(*views)
+
+    def search(self, start_time: Optional[int] = None, end_time: Optional[int] = None) -> slice:
+        """
+        Get the rows whose timestamp falls in [start_time, end_time].
+
+        Uses binary search, so the result is only exact while is_sorted is
+        True; callers must fall back to a timestamp mask otherwise.
+
+        Args:
+            start_time: Inclusive lower bound (milliseconds), unbounded if None
+            end_time: Inclusive upper bound (milliseconds), unbounded if None
+
+        Returns:
+            Slice of row indices relative to the oldest retained row
+        """
+        timestamps = self._columns["timestamp"][self._start : self._end]
+        lo = 0 if start_time is None else int(np.searchsorted(timestamps, start_time, "left"))
+        hi = (
+            len(timestamps)
+            if end_time is None
+            else int(np.searchsorted(timestamps, end_time, "right"))
+        )
+        return slice(lo, max(lo, hi))
+
+    @property
+    def is_sorted(self) -> bool:
+        """Whether rows were appended in non-decreasing timestamp order."""
+        return self._sorted
+
+    def to_candles(self, start: int = 0, stop: Optional[int] = None) -> List[Candle]:
+        """
+        Get buffered rows as Candle objects.
+
+        Args:
+            start: First row index (relative to the oldest retained row)
+            stop: Row index to stop before (defaults to the number of rows)
+
+        Returns:
+            List of candles in chronological order
+        """
+        size = len(self)
+        stop = size if stop is None else min(stop, size)
+        if start >= stop:
+            return []
+
+        lo = self._start + start
+        hi = self._start + stop
+        if self._objects is not None:
+            return self._objects[lo:hi].tolist()
+        return self._materialize(np.arange(lo, hi))
+
+    def snapshot(self) -> CandleList:
+        """Get all rows as a CandleList tied to the current buffer version."""
+        return CandleList(self.to_candles(), self)
+
+    def select(self, mask: np.ndarray) -> List[Candle]:
+        """
+        Get rows selected by a boolean mask as Candle objects.
+
+        Args:
+            mask: Boolean array aligned with arrays()
+
+        Returns:
+            List of selected candles in chronological order
+        """
+        positions = np.flatnonzero(mask) + self._start
+        if self._objects is not None:
+            return self._objects[positions].tolist()
+        return self._materialize(positions)
+
+    def latest(self) -> Optional[Candle]:
+        """Get the most recent candle, or None if empty."""
+        if self._end == self._start:
+            return None
+        return self.to_candles(len(self) - 1)[0]
+
+    def _materialize(self, positions: np.ndarray) -> List[Candle]:
+        columns = self._columns
+        rows = CandleArrays(*(columns[name][positions] for name in CandleArrays._fields))
+        return rows.to_candles(self.symbol, self.timeframe)
+
+    def remove_before(self, timestamp: int) -> int:
+        """
+        Remove rows with a timestamp older than the given one.
+
+        Args:
+            timestamp: Rows with timestamp < this value are removed (milliseconds)
+
+        Returns:
+            Number of rows removed
+        """
+        live = slice(self._start, self._end)
+        keep = self._columns["timestamp"][live] >= timestamp
+        removed = int(len(keep) - np.count_nonzero(keep))
+        if removed == 0:
+            return 0
+
+        size = len(keep) - removed
+        for column in self._columns.values():
+            column[:size] = column[live][keep]
+        if self._objects is not None:
+            self._objects[:size] = self._objects[live][keep]
+            self._objects[size:] = None
+        self._start = 0
+        self._end = size
+        self._version += 1
+        return removed
+
+    def clear(self) -> None:
+        """Remove all rows."""
+        if self._objects is not None:
+            self._objects[:] = None
+        self._start = 0
+        self._end = 0
+        self._version += 1
+        self._sorted = True
+
+    def __repr__(self) -> str:
+        return (
+            f"CandleBuffer(symbol={self.symbol}, "
+            f"timeframe={self.timeframe.value if self.timeframe else None}, "
+            f"size={len(self)}, capacity={self._capacity})"
+        )
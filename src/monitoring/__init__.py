@@ -6,6 +6,7 @@ Provides custom metrics for trading system observability including:
 - Order execution latency monitoring
 - Risk violation tracking
 - Position P&L metrics
+- Write-behind persistence queue depth and flush latency
 
 And distributed tracing with OpenTelemetry:
 - End-to-end workflow tracing (signal → order execution)
@@ -16,9 +17,11 @@ And distributed tracing with OpenTelemetry:
 
 from src.monitoring.metrics import (
     record_order_execution,
+    record_persistence_flush,
     record_risk_violation,
     record_signal_generated,
     trading_metrics,
+    update_persistence_queue_depth,
     update_position_pnl,
 )
 from src.monitoring.tracing import (
@@ -27,6 +30,7 @@ from src.monitoring.tracing import (
     get_tracer,
     init_tracing,
     shutdown_tracing,
+    suppress_tracing,
 )
 
 __all__ = [
@@ -36,10 +40,13 @@ __all__ = [
     "record_order_execution",
     "record_risk_violation",
     "update_position_pnl",
+    "update_persistence_queue_depth",
+    "record_persistence_flush",
     # Tracing
     "TradingTracer",
     "TracingConfig",
     "get_tracer",
     "init_tracing",
     "shutdown_tracing",
+    "suppress_tracing",
 ]
@@ -95,6 +95,22 @@ class TradingMetrics:
             registry=self.registry,
         )
 
+        # Write-behind persistence metrics
+        self.persistence_queue_depth = Gauge(
+            name="persistence_queue_depth",
+            documentation="Rows with pending updates in a write-behind queue",
+            labelnames=["queue"],
+            registry=self.registry,
+        )
+
+        self.persistence_flush_latency = Histogram(
+            name="persistence_flush_seconds",
+            documentation="Time taken to flush a write-behind queue in one transaction",
+            labelnames=["queue"],
+            buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0),
+            registry=self.registry,
+        )
+
         logger.info("Trading metrics initialized successfully")
 
     def get_registry(self) -> CollectorRegistry:
@@ -225,6 +241,34 @@ def record_api_error(exchange: str, endpoint: str, error_type: str) -> None:
         logger.error(f"Failed to record API error metric: {e}")
 
 
+def update_persistence_queue_depth(queue: str, depth: int) -> None:
+    """
+    Update the pending row count of a write-behind queue.
+
+    Args:
+        queue: Queue name
+        depth: Rows with pending updates
+    """
+    try:
+        trading_metrics.persistence_queue_depth.labels(queue=queue).set(depth)
+    except Exception as e:
+        logger.error(f"Failed to update persistence queue depth metric: {e}")
+
+
+def record_persistence_flush(queue: str, duration: float) -> None:
+    """
+    Record the latency of a write-behind queue flush.
+
+    Args:
+        queue: Queue name
+        duration: Flush duration in seconds
+    """
+    try:
+        trading_metrics.persistence_flush_latency.labels(queue=queue).observe(duration)
+    except Exception as e:
+        logger.error(f"Failed to record persistence flush metric: {e}")
+
+
 class ExecutionTimer:
     """
     Context manager for timing strategy execution.
@@ -12,8 +12,9 @@ Provides comprehensive tracing for the trading system including:
 import logging
 import os
 from contextlib import contextmanager
+from contextvars import ContextVar
 from functools import wraps
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, Iterator, Optional
 
 from opentelemetry import trace
 from opentelemetry.exporter.jaeger.thrift import JaegerExporter
@@ -31,6 +32,9 @@ from opentelemetry.trace import Status, StatusCode
 
 logger = logging.getLogger(__name__)
 
+# True while spans are suppressed in the current context (see suppress_tracing)
+_suppressed: ContextVar[bool] = ContextVar("tracing_suppressed", default=False)
+
 
 class TracingConfig:
     """Configuration for OpenTelemetry tracing."""
@@ -204,7 +208,7 @@ class TradingTracer:
                 # Your code here
                 pass
         """
-        if not self.config.enabled or not self._tracer:
+        if not self.config.enabled or not self._tracer or _suppressed.get():
             yield None
             return
 
@@ -337,6 +341,26 @@ class TradingTracer:
                 logger.error(f"Error during tracing shutdown: {e}", exc_info=True)
 
 
+@contextmanager
+def suppress_tracing() -> Iterator[None]:
+    """
+    Create no spans in the current context until the block exits.
+
+    Used by replays (e.g. backtests) that run the live pipeline thousands of
+    times per second, where a span per call would dominate the run time and
+    flood the exporter with spans of simulated activity.
+
+    Example:
+        with suppress_tracing():
+            await engine.run(candles)
+    """
+    token = _suppressed.set(True)
+    try:
+        yield
+    finally:
+        _suppressed.reset(token)
+
+
 # Global tracer instance
 _tracer: Optional[TradingTracer] = None
 
@@ -0,0 +1,44 @@
+"""Historical backtesting: event replay through the trading pipeline."""
+
+from src.services.backtest.clock import VirtualClock
+from src.services.backtest.engine import (
+    BacktestConfig,
+    BacktestEngine,
+    BacktestError,
+    BacktestReport,
+    BacktestTrade,
+)
+from src.services.backtest.metrics import calculate_performance_metrics
+from src.services.backtest.optimizer import (
+    ParameterSweep,
+    ParameterSweepRunner,
+    SearchMode,
+    SharedCandleData,
+    SweepResult,
+)
+from src.services.backtest.simulated_exchange import SimulatedExchange, SimulatedPosition
+from src.services.backtest.strategy_adapter import (
+    STRATEGY_CLASSES,
+    StrategySignalGenerator,
+    build_indicator_snapshot,
+)
+
+__all__ = [
+    "BacktestConfig",
+    "BacktestEngine",
+    "BacktestError",
+    "BacktestReport",
+    "BacktestTrade",
+    "ParameterSweep",
+    "ParameterSweepRunner",
+    "STRATEGY_CLASSES",
+    "SearchMode",
+    "SharedCandleData",
+    "SimulatedExchange",
+    "SimulatedPosition",
+    "StrategySignalGenerator",
+    "SweepResult",
+    "VirtualClock",
+    "build_indicator_snapshot",
+    "calculate_performance_metrics",
+]
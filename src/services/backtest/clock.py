@@ -0,0 +1,64 @@
+"""
+Virtual clock for historical replay.
+
+Components that read the current time accept a clock callable; during a
+backtest they are given a VirtualClock so time advances with the replayed
+candles instead of the wall clock.
+"""
+
+from datetime import datetime, timezone
+
+
+class VirtualClock:
+    """
+    Clock driven by replayed market data.
+
+    Attributes:
+        timestamp_ms: Current virtual time as Unix timestamp in milliseconds
+    """
+
+    def __init__(self, start_ms: int = 0):
+        """
+        Initialize the clock.
+
+        Args:
+            start_ms: Initial virtual time in milliseconds
+        """
+        self.timestamp_ms = start_ms
+
+    def advance_to(self, timestamp_ms: int) -> None:
+        """
+        Move the clock forward.
+
+        Args:
+            timestamp_ms: New virtual time in milliseconds
+
+        Raises:
+            ValueError: If the new time is earlier than the current time
+        """
+        if timestamp_ms < self.timestamp_ms:
+            raise ValueError(
+                f"Virtual clock cannot move backwards: {timestamp_ms} < {self.timestamp_ms}"
+            )
+        self.timestamp_ms = timestamp_ms
+
+    def now(self) -> datetime:
+        """
+        Get the virtual time as a timezone-aware UTC datetime.
+
+        Returns:
+            Current virtual time (UTC)
+        """
+        return datetime.fromtimestamp(self.timestamp_ms / 1000, tz=timezone.utc)
+
+    def utcnow(self) -> datetime:
+        """
+        Get the virtual time as a naive UTC datetime (datetime.utcnow replacement).
+
+        Returns:
+            Current virtual time without tzinfo
+        """
+        return self.now().replace(tzinfo=None)
+
+    def __repr__(self) -> str:
+        return f"VirtualClock({self.now().isoformat()})"
@@ -0,0 +1,811 @@
+"""
+Historical event-replay backtest engine.
+
+Replays closed candles through the same components the live system uses -
+MultiTimeframeIndicatorEngine, StrategyIntegrationLayer, PositionSizer,
+RiskValidator and OrderExecutor - with a SimulatedExchange in place of
+Binance and a VirtualClock in place of wall time.
+
+The replay is a fast path: stages are called directly in pipeline order
+instead of through the EventBus, so there are no queue hops or asyncio
+sleeps. Tracing spans are suppressed for the whole replay. With quiet
+enabled, the replay's pipeline logging is dropped and its errors are counted
+and summarized once at the end instead of logged per candle.
+"""
+
+import json
+import logging
+import threading
+import time
+from array import array
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional
+
+import numpy as np
+import pandas as pd
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.config import BinanceConfig
+from src.core.constants import OrderSide, PositionSide, TimeFrame
+from src.core.events import DEFAULT_EVENT_POLICIES, EventBus
+from src.database.dao.backtest_dao import BacktestResultDAO
+from src.database.models import BacktestResult
+from src.indicators.multi_timeframe_engine import MultiTimeframeIndicatorEngine
+from src.models.candle import Candle
+from src.monitoring.tracing import suppress_tracing
+from src.services.backtest.clock import VirtualClock
+from src.services.backtest.metrics import MS_PER_DAY, calculate_performance_metrics
+from src.services.backtest.simulated_exchange import SimulatedExchange
+from src.services.backtest.strategy_adapter import StrategySignalGenerator, build_indicator_snapshot
+from src.services.candle_storage import CandleStorage
+from src.services.exchange.binance_manager import BinanceManager
+from src.services.exchange.order_executor import OrderExecutor
+from src.services.risk.daily_loss_monitor import DailyLossMonitor
+from src.services.risk.position_sizer import PositionSizer, PositionSizingError
+from src.services.risk.risk_validator import RiskValidator
+from src.services.risk.stop_loss_calculator import StopLossCalculator
+from src.services.risk.take_profit_calculator import TakeProfitCalculator
+from src.services.strategy.integration_layer import StrategyIntegrationLayer
+from src.services.strategy.signal import Signal
+from src.services.strategy.signal_filter import FilterConfig
+
+logger = logging.getLogger(__name__)
+
+
+class BacktestError(Exception):
+    """Raised when a backtest cannot be run."""
+
+
+class _ErrorTally:
+    """Counts error records by logger name and message."""
+
+    def __init__(self):
+        self.counts: Counter = Counter()
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts.values())
+
+    def add(self, record: logging.LogRecord) -> None:
+        self.counts[(record.name, record.getMessage())] += 1
+
+
+# Error tally of the quiet replay running in the current context, if any
+_replay_tally: ContextVar[Optional[_ErrorTally]] = ContextVar("replay_tally", default=None)
+
+
+class _ReplayLogFilter(logging.Filter):
+    """Drops records emitted inside a quiet replay, counting the errors."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        tally = _replay_tally.get()
+        if tally is None:
+            return True
+        if record.levelno >= logging.ERROR:
+            tally.add(record)
+        return False
+
+
+_replay_filter = _ReplayLogFilter()
+_replay_filter_lock = threading.Lock()
+_replay_filter_users = 0
+
+
+def _install_replay_filter() -> None:
+    """Attach the replay filter to the existing src loggers (reference counted)."""
+    global _replay_filter_users
+    with _replay_filter_lock:
+        _replay_filter_users += 1
+        if _replay_filter_users > 1:
+            return
+        for name, candidate in list(logging.Logger.manager.loggerDict.items()):
+            if isinstance(candidate, logging.Logger) and name.startswith("src."):
+                candidate.addFilter(_replay_filter)
+        logging.getLogger("src").addFilter(_replay_filter)
+
+
+def _remove_replay_filter() -> None:
+    """Detach the replay filter once no quiet replay is running."""
+    global _replay_filter_users
+    with _replay_filter_lock:
+        _replay_filter_users -= 1
+        if _replay_filter_users > 0:
+            return
+        for candidate in list(logging.Logger.manager.loggerDict.values()):
+            if isinstance(candidate, logging.Logger):
+                candidate.removeFilter(_replay_filter)
+
+
+@contextmanager
+def _quiet_logging(enabled: bool) -> Iterator[Optional[_ErrorTally]]:
+    """
+    Mute pipeline logging emitted by a replay.
+
+    Records the replay's own components emit while it runs (in its task and
+    the tasks it creates) are dropped, and errors are counted rather than
+    emitted, because a failing stage would otherwise log a traceback for
+    every candle. A single summary is logged when the replay ends. Logger
+    levels and handlers are left unchanged, so other tasks and threads in
+    the process keep logging normally.
+
+    Args:
+        enabled: If False, logging is left unchanged
+
+    Yields:
+        The error tally, or None if not enabled
+    """
+    if not enabled:
+        yield None
+        return
+
+    tally = _ErrorTally()
+    _install_replay_filter()
+    token = _replay_tally.set(tally)
+    try:
+        yield tally
+    finally:
+        _replay_tally.reset(token)
+        _remove_replay_filter()
+        if tally.counts:
+            (name, message), count = tally.counts.most_common(1)[0]
+            logger.error(
+                f"{tally.total} pipeline errors during the replay "
+                f"({len(tally.counts)} distinct), most frequent ({count}x) "
+                f"from {name}: {message}"
+            )
+
+
+@dataclass
+class BacktestConfig:
+    """
+    Backtest run configuration.
+
+    Attributes:
+        symbol: Trading symbol to replay
+        timeframes: Indicator timeframes; the first is the replayed base timeframe
+        initial_capital: Starting balance in quote currency
+        fee_rate: Fee rate on filled notional
+        slippage_pct: Adverse slippage for market orders in percent
+        risk_percentage: PositionSizer risk per trade in percent
+        leverage: PositionSizer leverage
+        daily_loss_limit_pct: DailyLossMonitor limit in percent
+        max_candles_per_timeframe: Candles retained by the indicator engine
+        strategy_lookback: Base-timeframe candles passed to strategies
+        quantity_precision: Decimal places of order quantities
+        filter_config: Signal duplicate filter settings (default FilterConfig)
+        strategies: Strategy name -> constructor parameters for src.strategies
+            classes (see STRATEGY_CLASSES); if empty, the integration layer's
+            built-in generators are used
+        indicator_config: Detector configuration passed to
+            MultiTimeframeIndicatorEngine (e.g. {'fvg_detector_config': {...}});
+            persistent_liquidity defaults to True
+        name: Name stored with the result (generated if None)
+        notes: Free-form notes stored with the result
+        quiet: Drop the replay's pipeline logging and summarize its errors once
+    """
+
+    symbol: str = "BTCUSDT"
+    timeframes: List[TimeFrame] = field(
+        default_factory=lambda: [TimeFrame.M1, TimeFrame.M15, TimeFrame.H1]
+    )
+    initial_capital: float = 10_000.0
+    fee_rate: float = 0.0004
+    slippage_pct: float = 0.0
+    risk_percentage: float = 2.0
+    leverage: int = 5
+    daily_loss_limit_pct: float = 5.0
+    max_candles_per_timeframe: int = 500
+    strategy_lookback: int = 100
+    quantity_precision: int = 3
+    filter_config: Optional[FilterConfig] = None
+    strategies: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    indicator_config: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    name: Optional[str] = None
+    notes: Optional[str] = None
+    quiet: bool = False
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert config to a JSON-serialisable dictionary."""
+        data = asdict(self)
+        data["timeframes"] = [tf.value for tf in self.timeframes]
+        data["filter_config"] = self.filter_config.to_dict() if self.filter_config else None
+        return data
+
+
+@dataclass
+class BacktestTrade:
+    """
+    A round-trip trade executed during a backtest.
+
+    Attributes:
+        symbol: Trading symbol
+        strategy: Strategy that generated the entry signal
+        side: Position side
+        quantity: Position quantity
+        entry_time: Entry fill time (ms)
+        entry_price: Entry fill price
+        stop_loss: Stop loss level
+        take_profit: Take profit level
+        fees: Fees paid on entry and exit
+        exit_time: Exit fill time (ms), None while open
+        exit_price: Exit fill price, None while open
+        exit_reason: 'stop_loss', 'take_profit' or 'end_of_data'
+        gross_pnl: Realized PnL before fees
+    """
+
+    symbol: str
+    strategy: str
+    side: PositionSide
+    quantity: float
+    entry_time: int
+    entry_price: float
+    stop_loss: float
+    take_profit: float
+    fees: float = 0.0
+    exit_time: Optional[int] = None
+    exit_price: Optional[float] = None
+    exit_reason: Optional[str] = None
+    gross_pnl: float = 0.0
+
+    @property
+    def net_pnl(self) -> float:
+        """Realized PnL after fees."""
+        return self.gross_pnl - self.fees
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert trade to dictionary."""
+        return {
+            "symbol": self.symbol,
+            "strategy": self.strategy,
+            "side": self.side.value,
+            "quantity": self.quantity,
+            "entry_time": self.entry_time,
+            "entry_price": self.entry_price,
+            "stop_loss": self.stop_loss,
+            "take_profit": self.take_profit,
+            "exit_time": self.exit_time,
+            "exit_price": self.exit_price,
+            "exit_reason": self.exit_reason,
+            "gross_pnl": self.gross_pnl,
+            "fees": self.fees,
+            "net_pnl": self.net_pnl,
+        }
+
+
+@dataclass
+class BacktestReport:
+    """
+    Outcome of a backtest run.
+
+    Attributes:
+        name: Run name
+        strategy: Strategy name(s) evaluated
+        symbol: Trading symbol
+        timeframe: Replayed base timeframe
+        start_time: First candle open time (ms)
+        end_time: Last candle close time (ms)
+        metrics: Performance metrics keyed by BacktestResult column
+        trades: Closed trades
+        equity_timestamps: Equity sample times (ms), one per candle
+        equity: Equity after each candle
+        configuration: Run configuration
+        execution_time: Wall-clock run time in seconds
+        data_points: Number of candles replayed
+        signals_rejected: Signals rejected by risk validation or sizing
+        pipeline_errors: Errors logged by pipeline components during a quiet replay
+        notes: Free-form notes
+    """
+
+    name: str
+    strategy: str
+    symbol: str
+    timeframe: TimeFrame
+    start_time: int
+    end_time: int
+    metrics: Dict[str, Any]
+    trades: List[BacktestTrade]
+    equity_timestamps: np.ndarray
+    equity: np.ndarray
+    configuration: Dict[str, Any]
+    execution_time: float
+    data_points: int
+    signals_rejected: int = 0
+    pipeline_errors: int = 0
+    notes: Optional[str] = None
+
+    @property
+    def candles_per_second(self) -> float:
+        """Replay throughput."""
+        return self.data_points / self.execution_time if self.execution_time > 0 else 0.0
+
+    def to_record(self) -> Dict[str, Any]:
+        """
+        Build BacktestResult column values.
+
+        Returns:
+            Keyword arguments for BacktestResult / BacktestResultDAO.create()
+        """
+        record = dict(self.metrics)
+        for column in (
+            "initial_capital",
+            "final_capital",
+            "total_pnl",
+            "avg_trade_pnl",
+            "avg_win",
+            "avg_loss",
+            "largest_win",
+            "largest_loss",
+        ):
+            if record[column] is not None:
+                record[column] = Decimal(str(round(record[column], 8)))
+
+        record.update(
+            name=self.name,
+            strategy=self.strategy,
+            symbol=self.symbol,
+            timeframe=self.timeframe,
+            start_date=datetime.fromtimestamp(self.start_time / 1000, tz=timezone.utc),
+            end_date=datetime.fromtimestamp(self.end_time / 1000, tz=timezone.utc),
+            configuration=json.dumps(self.configuration),
+            notes=self.notes,
+            execution_time=self.execution_time,
+            data_points=self.data_points,
+        )
+        return record
+
+
+class BacktestEngine:
+    """
+    Replays historical candles through the trading pipeline.
+
+    One engine instance runs one backtest. Components are exposed as
+    attributes so callers can adjust them before run(), e.g. replace the
+    generators in ``strategy_layer.strategies``.
+
+    Pipeline per closed base candle:
+    1. Advance the virtual clock to the candle close and roll the daily session
+    2. Exit the open position if the candle range hit its stop loss or take profit
+    3. Store the candle and update multi-timeframe indicators
+    4. Without an open position, generate signals, size and validate the order,
+       and execute it through OrderExecutor on the SimulatedExchange
+    5. Record equity
+
+    Example:
+        >>> engine = BacktestEngine(BacktestConfig(symbol="BTCUSDT"))
+        >>> report = await engine.run(candles)
+        >>> async with get_session() as session:
+        ...     await engine.save_result(report, session)
+    """
+
+    def __init__(self, config: Optional[BacktestConfig] = None):
+        """
+        Initialize the engine and the pipeline components.
+
+        Args:
+            config: Backtest configuration (defaults if None)
+
+        Raises:
+            BacktestError: If the configuration is invalid
+        """
+        self.config = config or BacktestConfig()
+        if not self.config.timeframes:
+            raise BacktestError("At least one timeframe is required")
+        if self.config.strategy_lookback < 1:
+            raise BacktestError("strategy_lookback must be at least 1")
+
+        self.base_timeframe = self.config.timeframes[0]
+        self._base_ms = Candle.get_timeframe_milliseconds(self.base_timeframe)
+
+        self.clock = VirtualClock()
+        self.exchange = SimulatedExchange(
+            clock=self.clock,
+            initial_balance=self.config.initial_capital,
+            fee_rate=self.config.fee_rate,
+            slippage_pct=self.config.slippage_pct,
+        )
+
+        # Events raised by risk components are collected here, never dispatched
+        self.event_bus = EventBus(policies=DEFAULT_EVENT_POLICIES)
+
+        # BinanceManager wraps the simulated exchange so balance queries go
+        # through the same code path as live trading
+        self.binance_manager = BinanceManager(config=BinanceConfig(testnet=True))
+        self.binance_manager.exchange = self.exchange
+
+        self.candle_storage = CandleStorage(
+            max_candles=max(self.config.strategy_lookback, self.config.max_candles_per_timeframe)
+        )
+        try:
+            self.indicator_engine = MultiTimeframeIndicatorEngine(
+                timeframes=self.config.timeframes,
+                max_candles_per_timeframe=self.config.max_candles_per_timeframe,
+                incremental=True,
+                **{"persistent_liquidity": True, **self.config.indicator_config},
+            )
+        except TypeError as e:
+            raise BacktestError(f"Invalid indicator_config: {e}") from e
+        # Last snapshot handed to the strategies; unchanged timeframes are reused
+        self._indicator_snapshot: Optional[Dict[str, Mapping]] = None
+
+        self.strategy_layer = StrategyIntegrationLayer(
+            filter_config=self.config.filter_config,
+            candle_storage=self.candle_storage,
+            clock=self.clock.utcnow,
+        )
+        if self.config.strategies:
+            self._register_strategies(self.config.strategies)
+
+        self.position_sizer = PositionSizer(
+            binance_manager=self.binance_manager,
+            risk_percentage=self.config.risk_percentage,
+            leverage=self.config.leverage,
+        )
+        self.daily_loss_monitor = DailyLossMonitor(
+            event_bus=self.event_bus,
+            daily_loss_limit_pct=self.config.daily_loss_limit_pct,
+            clock=self.clock.now,
+        )
+        self.risk_validator = RiskValidator(
+            position_sizer=self.position_sizer,
+            stop_loss_calculator=StopLossCalculator(position_sizer=self.position_sizer),
+            take_profit_calculator=TakeProfitCalculator(),
+            daily_loss_monitor=self.daily_loss_monitor,
+        )
+        self.order_executor = OrderExecutor(exchange=self.exchange)
+
+        self.trades: List[BacktestTrade] = []
+        self._open_trade: Optional[BacktestTrade] = None
+        self._session_day: Optional[int] = None
+        self._day_realized_pnl = 0.0
+        self._signals_rejected = 0
+        self._equity_timestamps = array("q")
+        self._equity = array("d")
+        self._last_close = 0.0
+        self._has_run = False
+
+    def _register_strategies(self, strategies: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Replace the integration layer's generators with src.strategies adapters.
+
+        Args:
+            strategies: Strategy name -> constructor parameters
+
+        Raises:
+            BacktestError: If a strategy name or parameter is invalid
+        """
+        generators = {}
+        for name, params in strategies.items():
+            try:
+                generators[name] = StrategySignalGenerator.create(name, params)
+            except (TypeError, ValueError) as e:
+                raise BacktestError(f"Invalid strategy configuration for {name}: {e}") from e
+
+        self.strategy_layer.strategies = generators
+        self.strategy_layer.strategy_enabled = {name: True for name in generators}
+        self.strategy_layer.metrics["strategy_signals"] = {name: 0 for name in generators}
+
+    async def run(self, candles: Iterable[Candle]) -> BacktestReport:
+        """
+        Replay candles and build the report.
+
+        Candles must be closed, belong to the configured symbol and base
+        timeframe, and be in ascending time order; open (forming) candles
+        are skipped. A position still open at the end is closed at the last
+        close price.
+
+        Args:
+            candles: Historical candles
+
+        Returns:
+            BacktestReport with metrics, trades and equity curve
+
+        Raises:
+            BacktestError: If the engine already ran, a candle does not match
+                the configuration, or no closed candles were replayed
+        """
+        if self._has_run:
+            raise BacktestError("BacktestEngine instances run a single backtest")
+        self._has_run = True
+
+        started = time.perf_counter()
+        first_open: Optional[int] = None
+        data_points = 0
+
+        with _quiet_logging(self.config.quiet) as error_tally, suppress_tracing():
+            for candle in candles:
+                if not candle.is_closed:
+                    continue
+                if candle.symbol != self.config.symbol or candle.timeframe != self.base_timeframe:
+                    raise BacktestError(
+                        f"Unexpected candle {candle.symbol} {candle.timeframe.value}; "
+                        f"expected {self.config.symbol} {self.base_timeframe.value}"
+                    )
+                if first_open is None:
+                    first_open = candle.timestamp
+                await self._process_candle(candle)
+                data_points += 1
+
+            if first_open is None:
+                raise BacktestError("No closed candles to replay")
+
+            if self._open_trade is not None:
+                await self._close_position(self._open_trade, self._last_close, "end_of_data")
+                self._equity[-1] = self.exchange.equity()
+
+        execution_time = time.perf_counter() - started
+        report = self._build_report(first_open, data_points, execution_time)
+        report.pipeline_errors = error_tally.total if error_tally is not None else 0
+
+        logger.info(
+            f"Backtest '{report.name}' finished: {data_points} candles in "
+            f"{execution_time:.1f}s ({report.candles_per_second:.0f} candles/s), "
+            f"{len(self.trades)} trades, return={report.metrics['total_return']:.2f}%"
+        )
+        return report
+
+    async def _process_candle(self, candle: Candle) -> None:
+        """
+        Run one closed base candle through the pipeline.
+
+        Args:
+            candle: Closed base-timeframe candle
+        """
+        close_time = candle.timestamp + self._base_ms
+        self.clock.advance_to(close_time)
+        self._roll_daily_session()
+
+        if self._open_trade is not None:
+            await self._check_exit(self._open_trade, candle)
+
+        self._last_close = candle.close
+        self.exchange.set_market_price(candle.symbol, candle.close)
+        self.candle_storage.add_candle(candle)
+        self.indicator_engine.add_candle(candle)
+
+        if self._open_trade is None:
+            await self._evaluate_entry(candle)
+
+        self._equity_timestamps.append(close_time)
+        self._equity.append(self.exchange.equity())
+
+    def _roll_daily_session(self) -> None:
+        """Start a new DailyLossMonitor session when the virtual UTC day changes."""
+        day = self.clock.timestamp_ms // MS_PER_DAY
+        if day == self._session_day:
+            return
+
+        self._session_day = day
+        self._day_realized_pnl = 0.0
+        self.daily_loss_monitor.reset_session()
+        self.daily_loss_monitor.start_session(Decimal(str(self.exchange.equity())))
+        self.risk_validator.reset_entry_blocking()
+
+    async def _check_exit(self, trade: BacktestTrade, candle: Candle) -> None:
+        """
+        Close the open position if the candle reached its stop loss or take profit.
+
+        When both levels lie inside the candle range the stop loss is assumed
+        to fill first. Gaps through a level fill at the candle open.
+
+        Args:
+            trade: Open trade
+            candle: Candle being replayed
+        """
+        if trade.side == PositionSide.LONG:
+            if candle.low <= trade.stop_loss:
+                await self._close_position(trade, min(trade.stop_loss, candle.open), "stop_loss")
+            elif candle.high >= trade.take_profit:
+                await self._close_position(
+                    trade, max(trade.take_profit, candle.open), "take_profit"
+                )
+        else:
+            if candle.high >= trade.stop_loss:
+                await self._close_position(trade, max(trade.stop_loss, candle.open), "stop_loss")
+            elif candle.low <= trade.take_profit:
+                await self._close_position(
+                    trade, min(trade.take_profit, candle.open), "take_profit"
+                )
+
+    async def _close_position(self, trade: BacktestTrade, price: float, reason: str) -> None:
+        """
+        Close a trade with a reduce-only market order at the given price.
+
+        Args:
+            trade: Open trade
+            price: Price the exit fills at (before slippage)
+            reason: Exit reason recorded on the trade
+        """
+        self.exchange.set_market_price(trade.symbol, price)
+        response = await self.order_executor.execute_market_order(
+            symbol=trade.symbol,
+            side=OrderSide.SELL if trade.side == PositionSide.LONG else OrderSide.BUY,
+            quantity=Decimal(str(trade.quantity)),
+            position_side=trade.side,
+            reduce_only=True,
+        )
+
+        trade.exit_time = self.clock.timestamp_ms
+        trade.exit_price = float(response.average_price)
+        trade.exit_reason = reason
+        trade.gross_pnl = float(response.raw_response["info"]["realizedPnl"])
+        trade.fees += float(response.fee.get("cost", 0.0))
+        self.trades.append(trade)
+        self._open_trade = None
+
+        self._day_realized_pnl += trade.net_pnl
+        self.daily_loss_monitor.update_balance(
+            current_balance=Decimal(str(self.exchange.balance)),
+            realized_pnl=Decimal(str(self._day_realized_pnl)),
+            unrealized_pnl=Decimal("0"),
+        )
+
+    async def _evaluate_entry(self, candle: Candle) -> None:
+        """
+        Generate signals for the candle and open a position for the first approved one.
+
+        Args:
+            candle: Candle just added to the indicator engine
+        """
+        enabled = [
+            generator
+            for name, generator in self.strategy_layer.strategies.items()
+            if self.strategy_layer.strategy_enabled.get(name, False)
+        ]
+        if not enabled:
+            return
+
+        # Only build the candle DataFrame if an enabled generator reads it
+        candles = None
+        if any(getattr(generator, "uses_candles", True) for generator in enabled):
+            arrays = self.candle_storage.get_arrays(
+                candle.symbol, self.base_timeframe, limit=self.config.strategy_lookback
+            )
+            candles = pd.DataFrame(arrays._asdict())
+
+        signals = self.strategy_layer.generate_signals(
+            symbol=candle.symbol,
+            current_price=Decimal(str(candle.close)),
+            candles=candles,
+            indicators=self._build_indicator_snapshot(),
+        )
+
+        for signal in signals:
+            if await self._open_position(signal, candle):
+                return
+
+    def _build_indicator_snapshot(self) -> Dict[str, Mapping]:
+        """Build the strategies' indicator snapshot, reusing unchanged timeframes."""
+        self._indicator_snapshot = build_indicator_snapshot(
+            self.indicator_engine, previous=self._indicator_snapshot
+        )
+        return self._indicator_snapshot
+
+    async def _open_position(self, signal: Signal, candle: Candle) -> bool:
+        """
+        Size, risk-check and execute an entry for a signal.
+
+        Args:
+            signal: Validated signal from the strategy layer
+            candle: Current candle
+
+        Returns:
+            True if a position was opened
+        """
+        side = PositionSide(signal.direction.value)
+
+        try:
+            sizing = await self.position_sizer.calculate_position_size()
+            position_size = Decimal(str(sizing["position_size"]))
+            quantity = self.position_sizer.calculate_quantity_for_symbol(
+                float(position_size), candle.close, self.config.quantity_precision
+            )
+        except (PositionSizingError, ValueError):
+            self._signals_rejected += 1
+            return False
+
+        validation = await self.risk_validator.validate_order(
+            symbol=signal.symbol,
+            side=side,
+            entry_price=signal.entry_price,
+            stop_loss=signal.stop_loss,
+            take_profit=signal.take_profit,
+            position_size=position_size,
+            metadata={"strategy": signal.strategy_name},
+        )
+        if not validation.approved or quantity <= 0:
+            self._signals_rejected += 1
+            return False
+
+        response = await self.order_executor.execute_market_order(
+            symbol=signal.symbol,
+            side=OrderSide.BUY if side == PositionSide.LONG else OrderSide.SELL,
+            quantity=Decimal(str(quantity)),
+            position_side=side,
+        )
+
+        self._open_trade = BacktestTrade(
+            symbol=signal.symbol,
+            strategy=signal.strategy_name,
+            side=side,
+            quantity=float(response.filled_quantity),
+            entry_time=self.clock.timestamp_ms,
+            entry_price=float(response.average_price),
+            stop_loss=float(signal.stop_loss),
+            take_profit=float(signal.take_profit),
+            fees=float(response.fee.get("cost", 0.0)),
+        )
+        return True
+
+    def _build_report(
+        self, first_open: int, data_points: int, execution_time: float
+    ) -> BacktestReport:
+        """
+        Compute metrics and assemble the report.
+
+        Args:
+            first_open: Open time of the first replayed candle (ms)
+            data_points: Number of candles replayed
+            execution_time: Wall-clock run time in seconds
+
+        Returns:
+            BacktestReport
+        """
+        timestamps = np.frombuffer(self._equity_timestamps, dtype=np.int64).copy()
+        equity = np.frombuffer(self._equity, dtype=np.float64).copy()
+        metrics = calculate_performance_metrics(
+            timestamps,
+            equity,
+            [trade.net_pnl for trade in self.trades],
+            self.config.initial_capital,
+        )
+
+        strategy = ",".join(
+            name for name, enabled in self.strategy_layer.strategy_enabled.items() if enabled
+        )[:50]
+        end_time = int(timestamps[-1])
+        name = (
+            self.config.name
+            or (
+                f"{strategy or 'no_strategy'} {self.config.symbol} "
+                f"{datetime.fromtimestamp(first_open / 1000, tz=timezone.utc):%Y-%m-%d}"
+                f"..{datetime.fromtimestamp(end_time / 1000, tz=timezone.utc):%Y-%m-%d}"
+            )[:100]
+        )
+
+        return BacktestReport(
+            name=name,
+            strategy=strategy,
+            symbol=self.config.symbol,
+            timeframe=self.base_timeframe,
+            start_time=first_open,
+            end_time=end_time,
+            metrics=metrics,
+            trades=list(self.trades),
+            equity_timestamps=timestamps,
+            equity=equity,
+            configuration=self.config.to_dict(),
+            execution_time=execution_time,
+            data_points=data_points,
+            signals_rejected=self._signals_rejected,
+            notes=self.config.notes,
+        )
+
+    async def save_result(self, report: BacktestReport, session: AsyncSession) -> BacktestResult:
+        """
+        Persist a report to the backtest_results table.
+
+        Args:
+            report: Report returned by run()
+            session: Async database session (committed by the caller)
+
+        Returns:
+            Created BacktestResult
+        """
+        result = await BacktestResultDAO(session).create(**report.to_record())
+        logger.info(f"Saved backtest result {result.id} ('{report.name}')")
+        return result
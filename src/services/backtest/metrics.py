@@ -0,0 +1,168 @@
+"""
+Performance metrics for backtest runs.
+
+Computes return, risk (Sharpe, Sortino, drawdown, Calmar) and trade
+statistics (win rate, profit factor) from an equity curve and closed trades.
+Ratios are annualised from daily returns using 365 periods, since crypto
+markets trade every day.
+"""
+
+import math
+from typing import Any, Dict, Optional, Sequence
+
+import numpy as np
+
+MS_PER_DAY = 86_400_000
+MS_PER_HOUR = 3_600_000
+PERIODS_PER_YEAR = 365
+
+
+def daily_equity(timestamps: np.ndarray, equity: np.ndarray) -> np.ndarray:
+    """
+    Sample an equity curve at the last point of each UTC day.
+
+    Args:
+        timestamps: Sample times in milliseconds (ascending)
+        equity: Equity at each sample
+
+    Returns:
+        End-of-day equity values
+    """
+    if len(equity) == 0:
+        return equity
+    days = timestamps // MS_PER_DAY
+    # Index of the last sample of each day
+    last_of_day = np.flatnonzero(np.diff(days, append=days[-1] + 1))
+    return equity[last_of_day]
+
+
+def sharpe_ratio(returns: np.ndarray, periods_per_year: int = PERIODS_PER_YEAR) -> Optional[float]:
+    """
+    Annualised Sharpe ratio (risk-free rate 0).
+
+    Args:
+        returns: Periodic returns
+        periods_per_year: Periods per year for annualisation
+
+    Returns:
+        Sharpe ratio, or None with fewer than two returns or zero volatility
+    """
+    if len(returns) < 2:
+        return None
+    std = returns.std(ddof=1)
+    if std == 0:
+        return None
+    return float(returns.mean() / std * math.sqrt(periods_per_year))
+
+
+def sortino_ratio(returns: np.ndarray, periods_per_year: int = PERIODS_PER_YEAR) -> Optional[float]:
+    """
+    Annualised Sortino ratio (target return 0).
+
+    Args:
+        returns: Periodic returns
+        periods_per_year: Periods per year for annualisation
+
+    Returns:
+        Sortino ratio, or None with fewer than two returns or no downside
+    """
+    if len(returns) < 2:
+        return None
+    downside = np.minimum(returns, 0.0)
+    downside_dev = math.sqrt(float(np.mean(downside**2)))
+    if downside_dev == 0:
+        return None
+    return float(returns.mean() / downside_dev * math.sqrt(periods_per_year))
+
+
+def max_drawdown(timestamps: np.ndarray, equity: np.ndarray) -> Dict[str, float]:
+    """
+    Maximum peak-to-trough drawdown and the longest time spent below a peak.
+
+    Args:
+        timestamps: Sample times in milliseconds
+        equity: Equity at each sample
+
+    Returns:
+        Dictionary with 'max_drawdown' (percent) and 'max_drawdown_duration' (hours)
+    """
+    if len(equity) == 0:
+        return {"max_drawdown": 0.0, "max_drawdown_duration": 0}
+
+    peaks = np.maximum.accumulate(equity)
+    drawdowns = (peaks - equity) / peaks * 100
+
+    # Duration: time since the running peak was last set, maximised
+    at_peak = equity >= peaks
+    peak_times = np.where(at_peak, timestamps, 0)
+    last_peak_time = np.maximum.accumulate(peak_times)
+    longest_ms = int((timestamps - last_peak_time).max())
+
+    return {
+        "max_drawdown": float(drawdowns.max()),
+        "max_drawdown_duration": longest_ms // MS_PER_HOUR,
+    }
+
+
+def calculate_performance_metrics(
+    timestamps: np.ndarray,
+    equity: np.ndarray,
+    trade_pnls: Sequence[float],
+    initial_capital: float,
+) -> Dict[str, Any]:
+    """
+    Calculate all metrics stored in a BacktestResult.
+
+    Args:
+        timestamps: Equity sample times in milliseconds (ascending)
+        equity: Equity curve
+        trade_pnls: Net PnL of each closed trade
+        initial_capital: Starting capital
+
+    Returns:
+        Dictionary keyed by BacktestResult column names
+    """
+    final_capital = float(equity[-1]) if len(equity) else float(initial_capital)
+    total_pnl = final_capital - initial_capital
+    total_return = total_pnl / initial_capital * 100
+
+    # Daily returns, with the starting capital as the opening value
+    closes = np.concatenate(([float(initial_capital)], daily_equity(timestamps, equity)))
+    daily_returns = np.diff(closes) / closes[:-1]
+
+    drawdown = max_drawdown(timestamps, equity)
+
+    calmar = None
+    if len(timestamps) > 1 and drawdown["max_drawdown"] > 0 and final_capital > 0:
+        years = (timestamps[-1] - timestamps[0]) / (MS_PER_DAY * PERIODS_PER_YEAR)
+        if years > 0:
+            annual_return = ((final_capital / initial_capital) ** (1 / years) - 1) * 100
+            calmar = annual_return / drawdown["max_drawdown"]
+
+    pnls = np.asarray(trade_pnls, dtype=float)
+    wins = pnls[pnls > 0]
+    losses = pnls[pnls < 0]
+    gross_profit = float(wins.sum())
+    gross_loss = float(-losses.sum())
+
+    return {
+        "total_trades": len(pnls),
+        "winning_trades": len(wins),
+        "losing_trades": len(losses),
+        "win_rate": len(wins) / len(pnls) * 100 if len(pnls) else None,
+        "initial_capital": float(initial_capital),
+        "final_capital": final_capital,
+        "total_return": total_return,
+        "total_pnl": total_pnl,
+        "sharpe_ratio": sharpe_ratio(daily_returns),
+        "sortino_ratio": sortino_ratio(daily_returns),
+        "max_drawdown": drawdown["max_drawdown"],
+        "max_drawdown_duration": drawdown["max_drawdown_duration"],
+        "calmar_ratio": calmar,
+        "avg_trade_pnl": float(pnls.mean()) if len(pnls) else None,
+        "avg_win": float(wins.mean()) if len(wins) else None,
+        "avg_loss": float(losses.mean()) if len(losses) else None,
+        "profit_factor": gross_profit / gross_loss if gross_loss > 0 else None,
+        "largest_win": float(wins.max()) if len(wins) else None,
+        "largest_loss": float(losses.min()) if len(losses) else None,
+    }
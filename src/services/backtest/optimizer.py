@@ -0,0 +1,456 @@
+"""
+Parallel parameter sweeps over backtest configurations.
+
+A ParameterSweep expands a grid or random search space into BacktestConfig
+instances. ParameterSweepRunner runs them across a ProcessPoolExecutor and
+bulk-inserts the results as BacktestResult rows.
+
+Candle data is written once to a memory-mapped .npy file
+(SharedCandleData). Each worker maps it read-only when it starts, so
+candles are neither pickled per task nor re-downloaded per worker, and the
+OS page cache holds a single copy for all processes.
+"""
+
+import asyncio
+import copy
+import itertools
+import json
+import logging
+import os
+import random
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from enum import Enum
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.constants import TimeFrame
+from src.database.dao.backtest_dao import BacktestResultDAO
+from src.database.models import BacktestResult
+from src.models.candle import Candle
+from src.services.backtest.engine import BacktestConfig, BacktestEngine
+
+logger = logging.getLogger(__name__)
+
+CANDLE_DTYPE = np.dtype(
+    [
+        ("timestamp", np.int64),
+        ("open", np.float64),
+        ("high", np.float64),
+        ("low", np.float64),
+        ("close", np.float64),
+        ("volume", np.float64),
+    ]
+)
+
+
+class SearchMode(str, Enum):
+    """How a search space is sampled."""
+
+    GRID = "grid"  # Every combination
+    RANDOM = "random"  # Independent uniform draws per parameter
+
+
+class SharedCandleData:
+    """
+    Closed candles stored in a memory-mapped file shared by worker processes.
+
+    Instances only carry the file path, symbol and timeframe, so they are
+    cheap to pass to worker initializers.
+
+    Attributes:
+        path: Path of the .npy file
+        symbol: Trading symbol of the candles
+        timeframe: Timeframe of the candles
+        owner: Whether close() deletes the file
+    """
+
+    def __init__(self, path: str, symbol: str, timeframe: TimeFrame, owner: bool = False):
+        """
+        Initialize a handle to an existing candle file.
+
+        Args:
+            path: Path of the .npy file
+            symbol: Trading symbol
+            timeframe: Candle timeframe
+            owner: Delete the file on close()
+        """
+        self.path = path
+        self.symbol = symbol
+        self.timeframe = timeframe
+        self.owner = owner
+        self._data: Optional[np.ndarray] = None
+
+    @classmethod
+    def create(
+        cls, candles: Sequence[Candle], directory: Optional[str] = None
+    ) -> "SharedCandleData":
+        """
+        Write candles to a new memory-mapped file.
+
+        Args:
+            candles: Closed candles of a single symbol and timeframe, in time order
+            directory: Directory for the file (system temp directory if None)
+
+        Returns:
+            SharedCandleData owning the file
+
+        Raises:
+            ValueError: If candles are empty or mix symbols/timeframes
+        """
+        if not candles:
+            raise ValueError("No candles to share")
+
+        symbol = candles[0].symbol
+        timeframe = candles[0].timeframe
+        if any(c.symbol != symbol or c.timeframe != timeframe for c in candles):
+            raise ValueError("Shared candle data must contain a single symbol and timeframe")
+
+        records = np.fromiter(
+            ((c.timestamp, c.open, c.high, c.low, c.close, c.volume) for c in candles),
+            dtype=CANDLE_DTYPE,
+            count=len(candles),
+        )
+
+        fd, path = tempfile.mkstemp(
+            prefix=f"candles_{symbol}_{timeframe.value}_", suffix=".npy", dir=directory
+        )
+        with os.fdopen(fd, "wb") as f:
+            np.save(f, records)
+
+        return cls(path, symbol, timeframe, owner=True)
+
+    @property
+    def data(self) -> np.ndarray:
+        """Read-only memory-mapped candle records."""
+        if self._data is None:
+            self._data = np.load(self.path, mmap_mode="r")
+        return self._data
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def iter_candles(self) -> Iterator[Candle]:
+        """
+        Yield candles from the mapped records.
+
+        Yields:
+            Closed Candle objects in time order
+        """
+        data = self.data
+        for timestamp, open_, high, low, close, volume in zip(
+            data["timestamp"].tolist(),
+            data["open"].tolist(),
+            data["high"].tolist(),
+            data["low"].tolist(),
+            data["close"].tolist(),
+            data["volume"].tolist(),
+        ):
+            yield Candle(
+                symbol=self.symbol,
+                timeframe=self.timeframe,
+                timestamp=timestamp,
+                open=open_,
+                high=high,
+                low=low,
+                close=close,
+                volume=volume,
+                is_closed=True,
+            )
+
+    def close(self) -> None:
+        """Release the mapping and delete the file if owned."""
+        self._data = None
+        if self.owner and os.path.exists(self.path):
+            os.remove(self.path)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Workers map the file themselves and never delete it
+        return {"path": self.path, "symbol": self.symbol, "timeframe": self.timeframe}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.path = state["path"]
+        self.symbol = state["symbol"]
+        self.timeframe = state["timeframe"]
+        self.owner = False
+        self._data = None
+
+    def __enter__(self) -> "SharedCandleData":
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"SharedCandleData({self.symbol} {self.timeframe.value}, path={self.path})"
+
+
+def _apply_parameter(config: BacktestConfig, path: str, value: Any) -> None:
+    """
+    Set a parameter on a config by dotted path.
+
+    'risk_percentage' sets a BacktestConfig field; longer paths walk into
+    dictionary fields, e.g. 'strategies.Strategy_A.min_confidence' or
+    'indicator_config.fvg_detector_config.min_gap_percentage'.
+
+    Args:
+        config: Config to modify in place
+        path: Dotted parameter path
+        value: Value to set
+
+    Raises:
+        ValueError: If the path does not name a config field
+    """
+    field_name, *keys = path.split(".")
+    if not hasattr(config, field_name):
+        raise ValueError(f"Unknown backtest parameter '{path}'")
+
+    if not keys:
+        setattr(config, field_name, value)
+        return
+
+    target = getattr(config, field_name)
+    if not isinstance(target, dict):
+        raise ValueError(f"Parameter '{path}' does not refer to a dictionary field")
+    for key in keys[:-1]:
+        target = target.setdefault(key, {})
+    target[keys[-1]] = value
+
+
+@dataclass
+class ParameterSweep:
+    """
+    Search space over backtest configurations.
+
+    Attributes:
+        base_config: Configuration every sampled point starts from
+        space: Dotted parameter path -> candidate values
+        mode: GRID for the full product, RANDOM for sampled points
+        samples: Number of points in RANDOM mode
+        seed: Random seed for RANDOM mode
+
+    Example:
+        >>> sweep = ParameterSweep(
+        ...     base_config=BacktestConfig(strategies={"Strategy_A": {}}),
+        ...     space={
+        ...         "strategies.Strategy_A.min_confidence": [0.6, 0.7, 0.8],
+        ...         "strategies.Strategy_A.risk_reward_ratio": [1.5, 2.0, 3.0],
+        ...     },
+        ... )
+        >>> len(sweep)
+        9
+    """
+
+    base_config: BacktestConfig
+    space: Dict[str, Sequence[Any]]
+    mode: SearchMode = SearchMode.GRID
+    samples: Optional[int] = None
+    seed: Optional[int] = None
+
+    def __post_init__(self) -> None:
+        if not self.space:
+            raise ValueError("Search space must contain at least one parameter")
+        for path, values in self.space.items():
+            if len(values) == 0:
+                raise ValueError(f"Parameter '{path}' has no candidate values")
+        if self.mode == SearchMode.RANDOM and (self.samples is None or self.samples < 1):
+            raise ValueError("Random search requires samples >= 1")
+
+    def __len__(self) -> int:
+        if self.mode == SearchMode.RANDOM:
+            # samples is validated in __post_init__
+            return self.samples or 0
+        count = 1
+        for values in self.space.values():
+            count *= len(values)
+        return count
+
+    def points(self) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over sampled parameter combinations.
+
+        Yields:
+            Dotted parameter path -> value
+        """
+        paths = list(self.space)
+        if self.mode == SearchMode.GRID:
+            for values in itertools.product(*(self.space[p] for p in paths)):
+                yield dict(zip(paths, values))
+        else:
+            rng = random.Random(self.seed)
+            for _ in range(self.samples or 0):
+                yield {path: rng.choice(list(self.space[path])) for path in paths}
+
+    def configurations(self) -> Iterator[Tuple[Dict[str, Any], BacktestConfig]]:
+        """
+        Iterate over configurations for each sampled point.
+
+        Yields:
+            Tuple of (parameters, BacktestConfig)
+        """
+        base_name = self.base_config.name or "sweep"
+        for index, parameters in enumerate(self.points()):
+            config = copy.deepcopy(self.base_config)
+            for path, value in parameters.items():
+                _apply_parameter(config, path, value)
+            config.name = f"{base_name} #{index}"
+            yield parameters, config
+
+
+@dataclass
+class SweepResult:
+    """
+    Outcome of one configuration in a sweep.
+
+    Attributes:
+        index: Position of the configuration in the sweep
+        parameters: Sampled parameter values
+        record: BacktestResult column values (None if the run failed)
+        error: Error message if the run failed
+    """
+
+    index: int
+    parameters: Dict[str, Any]
+    record: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+
+    @property
+    def succeeded(self) -> bool:
+        """Whether the backtest completed."""
+        return self.record is not None
+
+
+# Candle data mapped by each worker process (set by _init_worker)
+_worker_candles: Optional[SharedCandleData] = None
+
+
+def _init_worker(candles: SharedCandleData) -> None:
+    """Map the shared candle file once per worker process."""
+    global _worker_candles
+    logging.getLogger("src").setLevel(logging.ERROR)
+    _worker_candles = candles
+    len(candles)  # Map the file before the first task arrives
+
+
+def _run_configuration(
+    index: int, parameters: Dict[str, Any], config: BacktestConfig
+) -> SweepResult:
+    """
+    Run one backtest in a worker process.
+
+    Args:
+        index: Position of the configuration in the sweep
+        parameters: Sampled parameter values
+        config: Backtest configuration
+
+    Returns:
+        SweepResult with the BacktestResult record or the error
+    """
+    try:
+        if _worker_candles is None:
+            raise RuntimeError("Worker process was not initialized with candle data")
+        # Workers log nothing else, so per-candle errors are summarized once per run
+        engine = BacktestEngine(replace(config, quiet=True))
+        report = asyncio.run(engine.run(_worker_candles.iter_candles()))
+    except Exception as e:
+        return SweepResult(index=index, parameters=parameters, error=f"{type(e).__name__}: {e}")
+
+    record = report.to_record()
+    configuration = json.loads(record["configuration"])
+    configuration["sweep_parameters"] = parameters
+    record["configuration"] = json.dumps(configuration, default=str)
+    return SweepResult(index=index, parameters=parameters, record=record)
+
+
+class ParameterSweepRunner:
+    """
+    Runs parameter sweeps across worker processes.
+
+    Each configuration is one task; with many more configurations than
+    workers every core stays busy until the queue drains. Results are
+    returned in sweep order.
+
+    Example:
+        >>> runner = ParameterSweepRunner(max_workers=8)
+        >>> results = await runner.run(sweep, candles)
+        >>> async with get_session() as session:
+        ...     await runner.save_results(results, session)
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, mp_context: Any = None):
+        """
+        Initialize the runner.
+
+        Args:
+            max_workers: Worker processes (default: CPU count)
+            mp_context: multiprocessing context for the pool (default platform start method)
+
+        Raises:
+            ValueError: If max_workers is not positive
+        """
+        if max_workers is not None and max_workers < 1:
+            raise ValueError(f"max_workers must be positive, got {max_workers}")
+
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.mp_context = mp_context
+
+    async def run(self, sweep: ParameterSweep, candles: Sequence[Candle]) -> List[SweepResult]:
+        """
+        Run every configuration of a sweep.
+
+        Args:
+            sweep: Search space to evaluate
+            candles: Closed base-timeframe candles of the sweep symbol
+
+        Returns:
+            SweepResult per configuration, in sweep order
+        """
+        configurations = list(sweep.configurations())
+        workers = min(self.max_workers, len(configurations))
+        logger.info(
+            f"Running parameter sweep: {len(configurations)} configurations on {workers} workers"
+        )
+
+        loop = asyncio.get_running_loop()
+        with SharedCandleData.create(candles) as shared:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=self.mp_context,
+                initializer=_init_worker,
+                initargs=(shared,),
+            ) as executor:
+                futures = [
+                    loop.run_in_executor(executor, _run_configuration, index, parameters, config)
+                    for index, (parameters, config) in enumerate(configurations)
+                ]
+                results = await asyncio.gather(*futures)
+
+        failed = [r for r in results if not r.succeeded]
+        for result in failed:
+            logger.warning(f"Sweep configuration #{result.index} failed: {result.error}")
+        logger.info(
+            f"Parameter sweep finished: {len(results) - len(failed)} succeeded, "
+            f"{len(failed)} failed"
+        )
+        return list(results)
+
+    async def save_results(
+        self, results: Sequence[SweepResult], session: AsyncSession
+    ) -> List[BacktestResult]:
+        """
+        Bulk-insert successful sweep results.
+
+        Args:
+            results: Results returned by run()
+            session: Async database session (committed by the caller)
+
+        Returns:
+            Created BacktestResult rows
+        """
+        records = [result.record for result in results if result.record is not None]
+        if not records:
+            return []
+        return await BacktestResultDAO(session).bulk_insert(records)
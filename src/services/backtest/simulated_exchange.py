@@ -0,0 +1,286 @@
+"""
+Simulated exchange for backtesting.
+
+Implements the subset of the CCXT exchange interface used by OrderExecutor
+and BinanceManager (create_order, fetch_balance, load_time_difference) and
+fills orders against replayed prices, so the real order path runs unchanged.
+"""
+
+import itertools
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from ccxt.base.errors import InsufficientFunds, InvalidOrder
+
+from src.services.backtest.clock import VirtualClock
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SimulatedPosition:
+    """
+    Net position held on the simulated exchange.
+
+    Attributes:
+        quantity: Signed position size (positive = long, negative = short)
+        entry_price: Average entry price
+    """
+
+    quantity: float = 0.0
+    entry_price: float = 0.0
+
+
+class SimulatedExchange:
+    """
+    CCXT-compatible exchange stub that fills orders at replayed prices.
+
+    Market orders fill immediately at the current market price adjusted for
+    slippage; limit orders fill at their limit price. Margin is not modelled:
+    the quote balance changes only by realized PnL and fees.
+
+    Attributes:
+        clock: Virtual clock used for order timestamps
+        fee_rate: Fee charged on filled notional (e.g. 0.0004 = 0.04%)
+        slippage_pct: Adverse price slippage for market orders, in percent
+        quote_currency: Currency of the account balance
+        balance: Current quote balance
+        positions: Net positions per symbol
+        fills: Raw order responses, in fill order
+    """
+
+    def __init__(
+        self,
+        clock: VirtualClock,
+        initial_balance: float,
+        fee_rate: float = 0.0004,
+        slippage_pct: float = 0.0,
+        quote_currency: str = "USDT",
+    ):
+        """
+        Initialize the simulated exchange.
+
+        Args:
+            clock: Virtual clock for order timestamps
+            initial_balance: Starting quote balance
+            fee_rate: Fee rate applied to filled notional
+            slippage_pct: Adverse slippage for market orders in percent
+            quote_currency: Quote currency of the account
+
+        Raises:
+            ValueError: If parameters are invalid
+        """
+        if initial_balance <= 0:
+            raise ValueError(f"initial_balance must be positive, got {initial_balance}")
+        if fee_rate < 0:
+            raise ValueError(f"fee_rate must be non-negative, got {fee_rate}")
+        if slippage_pct < 0:
+            raise ValueError(f"slippage_pct must be non-negative, got {slippage_pct}")
+
+        self.clock = clock
+        self.fee_rate = fee_rate
+        self.slippage_pct = slippage_pct
+        self.quote_currency = quote_currency
+        self.balance = float(initial_balance)
+        self.positions: Dict[str, SimulatedPosition] = {}
+        self.fills: List[Dict[str, Any]] = []
+
+        self._prices: Dict[str, float] = {}
+        self._order_ids = itertools.count(1)
+
+    def set_market_price(self, symbol: str, price: float) -> None:
+        """
+        Set the price at which market orders for a symbol fill.
+
+        Args:
+            symbol: Trading symbol
+            price: Current market price
+        """
+        self._prices[symbol] = price
+
+    def get_position(self, symbol: str) -> SimulatedPosition:
+        """
+        Get the net position for a symbol.
+
+        Args:
+            symbol: Trading symbol
+
+        Returns:
+            Position (flat if none is held)
+        """
+        return self.positions.get(symbol) or SimulatedPosition()
+
+    def unrealized_pnl(self) -> float:
+        """
+        Calculate unrealized PnL of all positions at current market prices.
+
+        Returns:
+            Total unrealized PnL in quote currency
+        """
+        return sum(
+            (self._prices.get(symbol, position.entry_price) - position.entry_price)
+            * position.quantity
+            for symbol, position in self.positions.items()
+        )
+
+    def equity(self) -> float:
+        """
+        Get account equity (balance plus unrealized PnL).
+
+        Returns:
+            Equity in quote currency
+        """
+        return self.balance + self.unrealized_pnl()
+
+    async def create_order(
+        self,
+        symbol: str,
+        type: str,
+        side: str,
+        amount: float,
+        price: Optional[float] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Fill an order immediately.
+
+        Args:
+            symbol: Trading symbol
+            type: Order type ('market', 'limit', 'STOP_MARKET')
+            side: 'buy' or 'sell'
+            amount: Order quantity
+            price: Limit price (limit orders)
+            params: Extra order parameters (stopPrice, reduceOnly, clientOrderId, ...)
+
+        Returns:
+            CCXT-style order response with realizedPnl in 'info'
+
+        Raises:
+            InvalidOrder: If the order cannot be filled
+            InsufficientFunds: If the account balance is exhausted
+        """
+        params = params or {}
+        order_type = type.lower()
+        side = side.lower()
+        amount = float(amount)
+
+        if amount <= 0:
+            raise InvalidOrder(f"Order amount must be positive, got {amount}")
+        if self.balance <= 0 and not params.get("reduceOnly"):
+            raise InsufficientFunds(f"No {self.quote_currency} balance left: {self.balance}")
+
+        if order_type == "limit":
+            if price is None:
+                raise InvalidOrder("Limit order requires a price")
+            fill_price = float(price)
+        elif order_type == "stop_market":
+            fill_price = float(params["stopPrice"])
+        else:
+            market_price = self._prices.get(symbol)
+            if market_price is None:
+                raise InvalidOrder(f"No market price for {symbol}")
+            slippage = market_price * self.slippage_pct / 100
+            fill_price = market_price + slippage if side == "buy" else market_price - slippage
+
+        signed_amount = amount if side == "buy" else -amount
+        position = self.positions.setdefault(symbol, SimulatedPosition())
+
+        if params.get("reduceOnly"):
+            if position.quantity == 0 or (position.quantity > 0) == (signed_amount > 0):
+                raise InvalidOrder(f"Reduce-only order would increase position for {symbol}")
+            signed_amount = max(-abs(position.quantity), min(abs(position.quantity), signed_amount))
+            amount = abs(signed_amount)
+
+        realized_pnl = self._apply_fill(position, signed_amount, fill_price)
+        fee = amount * fill_price * self.fee_rate
+        self.balance += realized_pnl - fee
+        if position.quantity == 0:
+            del self.positions[symbol]
+
+        order_id = str(next(self._order_ids))
+        response = {
+            "id": order_id,
+            "clientOrderId": params.get("clientOrderId"),
+            "timestamp": self.clock.timestamp_ms,
+            "status": "closed",
+            "symbol": symbol,
+            "type": order_type,
+            "side": side,
+            "price": fill_price,
+            "amount": amount,
+            "filled": amount,
+            "remaining": 0.0,
+            "average": fill_price,
+            "fee": {"cost": fee, "currency": self.quote_currency},
+            "info": {"orderId": order_id, "realizedPnl": realized_pnl},
+        }
+        self.fills.append(response)
+        return response
+
+    def _apply_fill(self, position: SimulatedPosition, signed_amount: float, price: float) -> float:
+        """
+        Update a net position with a fill.
+
+        Args:
+            position: Position to update in place
+            signed_amount: Filled quantity (positive = buy)
+            price: Fill price
+
+        Returns:
+            Realized PnL from the part of the fill that reduced the position
+        """
+        realized = 0.0
+        quantity = position.quantity
+
+        if quantity == 0 or (quantity > 0) == (signed_amount > 0):
+            # Opening or adding: weighted average entry
+            new_quantity = quantity + signed_amount
+            position.entry_price = (
+                position.entry_price * quantity + price * signed_amount
+            ) / new_quantity
+            position.quantity = new_quantity
+            return realized
+
+        closed = min(abs(quantity), abs(signed_amount))
+        direction = 1.0 if quantity > 0 else -1.0
+        realized = (price - position.entry_price) * closed * direction
+        new_quantity = quantity + signed_amount
+
+        if new_quantity == 0 or abs(new_quantity) < 1e-12:
+            position.quantity = 0.0
+            position.entry_price = 0.0
+        elif (new_quantity > 0) == (quantity > 0):
+            position.quantity = new_quantity
+        else:
+            # Flipped through zero: the remainder opens at the fill price
+            position.quantity = new_quantity
+            position.entry_price = price
+
+        return realized
+
+    async def fetch_balance(self) -> Dict[str, Any]:
+        """
+        Get the account balance in CCXT format.
+
+        Returns:
+            Dictionary with free/used/total balances per currency
+        """
+        currency = self.quote_currency
+        return {
+            "free": {currency: self.balance},
+            "used": {currency: 0.0},
+            "total": {currency: self.balance},
+            currency: {"free": self.balance, "used": 0.0, "total": self.balance},
+            "info": {},
+        }
+
+    async def load_time_difference(self) -> int:
+        """Virtual time never drifts from the exchange."""
+        return 0
+
+    def __repr__(self) -> str:
+        return (
+            f"SimulatedExchange(balance={self.balance:.2f} {self.quote_currency}, "
+            f"positions={len(self.positions)}, fills={len(self.fills)})"
+        )
@@ -0,0 +1,303 @@
+"""
+Adapters that run the multi-timeframe strategies (src.strategies) inside
+the StrategyIntegrationLayer during a backtest.
+
+BaseStrategy.analyze() expects a nested dictionary of indicator data per
+timeframe, while the indicator engine holds typed indicator objects.
+build_indicator_snapshot() converts between the two, and
+StrategySignalGenerator wraps a BaseStrategy as a SignalGenerator.
+"""
+
+import logging
+from collections.abc import Mapping
+from decimal import Decimal
+from typing import Any, Callable, Dict, Iterator, Optional, Type
+
+import pandas as pd
+
+from src.core.constants import PositionSide, TimeFrame
+from src.indicators.multi_timeframe_engine import (
+    MultiTimeframeIndicatorEngine,
+    TimeframeIndicators,
+)
+from src.models.candle import Candle
+from src.services.strategy.generator import SignalGenerator
+from src.services.strategy.signal import Signal, SignalDirection
+from src.strategies.base_strategy import BaseStrategy
+from src.strategies.strategy_a import StrategyA
+from src.strategies.strategy_b import StrategyB
+from src.strategies.strategy_c import StrategyC
+
+logger = logging.getLogger(__name__)
+
+# Strategy name -> class, as used in BacktestConfig.strategies
+STRATEGY_CLASSES: Dict[str, Type[BaseStrategy]] = {
+    "Strategy_A": StrategyA,
+    "Strategy_B": StrategyB,
+    "Strategy_C": StrategyC,
+}
+
+# TrendDirection values mapped to the structure labels strategies compare against
+_TREND_LABELS = {"UPTREND": "BULLISH", "DOWNTREND": "BEARISH"}
+
+# LiquidityType values mapped to the side labels strategies compare against
+_SIDE_LABELS = {"BUY_SIDE": "BUY", "SELL_SIDE": "SELL"}
+
+
+def _zone_dicts(zones) -> list:
+    """Convert zone indicators to dictionaries with lowercase 'type' values."""
+    result = []
+    for zone in zones:
+        data = zone.to_dict()
+        data["type"] = str(data.get("type", "")).lower()
+        result.append(data)
+    return result
+
+
+def _candles_ago(indicators: TimeframeIndicators, timestamp: int, timeframe: TimeFrame) -> int:
+    """Candles between a timestamp and the timeframe's latest indicator update."""
+    latest = indicators.last_update_timestamp
+    if latest is None:
+        return 0
+    return max(0, (latest - timestamp) // Candle.get_timeframe_milliseconds(timeframe))
+
+
+def _fvg_dicts(indicators: TimeframeIndicators) -> list:
+    """
+    Convert active FVGs, adding their age in candles and a 0-1 strength.
+
+    The strength is the unfilled share of the gap, so a fresh gap scores 1.0.
+    """
+    fvgs = indicators.get_active_fvgs()
+    result = _zone_dicts(fvgs)
+    for data, fvg in zip(result, fvgs):
+        data["candles_ago"] = _candles_ago(indicators, fvg.origin_timestamp, fvg.timeframe)
+        data["strength"] = 1.0 - fvg.filled_percentage / 100
+    return result
+
+
+def _level_dicts(indicators: TimeframeIndicators) -> list:
+    """Convert liquidity levels, adding the 'BUY'/'SELL' side label."""
+    result = []
+    for level in indicators.liquidity_levels:
+        data = level.to_dict()
+        data["side"] = _SIDE_LABELS.get(level.type.value, "")
+        result.append(data)
+    return result
+
+
+def _sweep_dicts(indicators: TimeframeIndicators) -> list:
+    """
+    Convert liquidity sweeps, adding the swept side, the level price, a 0-1
+    strength (the reversal strength) and the age in candles of the sweep's
+    confirmation.
+    """
+    result = []
+    for sweep in indicators.liquidity_sweeps:
+        level = sweep.liquidity_level
+        data = sweep.to_dict()
+        data["liquidity_side"] = _SIDE_LABELS.get(level.type.value, "")
+        data["price"] = level.price
+        data["strength"] = sweep.reversal_strength / 100
+        data["candles_ago"] = _candles_ago(
+            indicators, sweep.reversal_timestamp or sweep.breach_timestamp, sweep.timeframe
+        )
+        result.append(data)
+    return result
+
+
+def _current_trend(indicators: TimeframeIndicators) -> Dict[str, str]:
+    trend_state = indicators.trend_state
+    label = _TREND_LABELS.get(trend_state.direction.value, "UNCERTAIN") if trend_state else None
+    return {"current_trend": label or "UNCERTAIN"}
+
+
+# Strategy-facing key -> conversion from the engine's indicators
+_CONVERSIONS: Dict[str, Callable[[TimeframeIndicators], Any]] = {
+    "order_blocks": lambda ind: _zone_dicts(ind.get_active_order_blocks()),
+    "fvg": _fvg_dicts,
+    "breaker_blocks": lambda ind: _zone_dicts(ind.get_active_breaker_blocks()),
+    "liquidity_levels": _level_dicts,
+    "liquidity_sweeps": _sweep_dicts,
+    "trend_state": lambda ind: ind.trend_state.to_dict() if ind.trend_state else None,
+    "trend": _current_trend,
+}
+
+# Keys holding the same converted value
+_ALIASES = {"fair_value_gaps": "fvg"}
+
+
+class _TimeframeIndicatorData(Mapping):
+    """
+    Indicator data of one timeframe, converted key by key on first access.
+
+    Strategies read a few keys of some timeframes, so converting every
+    indicator of every timeframe for each candle is mostly wasted work.
+    """
+
+    def __init__(self, indicators: TimeframeIndicators):
+        self._indicators = indicators
+        self._update_timestamp = indicators.last_update_timestamp
+        self._values: Dict[str, Any] = {}
+
+    def is_current(self, indicators: TimeframeIndicators) -> bool:
+        """Whether these values still match the given indicators."""
+        return (
+            indicators is self._indicators
+            and indicators.last_update_timestamp == self._update_timestamp
+        )
+
+    def __getitem__(self, key: str) -> Any:
+        key = _ALIASES.get(key, key)
+        if key not in self._values:
+            if key not in _CONVERSIONS:
+                raise KeyError(key)
+            self._values[key] = _CONVERSIONS[key](self._indicators)
+        return self._values[key]
+
+    def __iter__(self) -> Iterator[str]:
+        yield from _CONVERSIONS
+        yield from _ALIASES
+
+    def __len__(self) -> int:
+        return len(_CONVERSIONS) + len(_ALIASES)
+
+
+def build_indicator_snapshot(
+    engine: MultiTimeframeIndicatorEngine,
+    previous: Optional[Dict[str, Mapping]] = None,
+) -> Dict[str, Mapping]:
+    """
+    Build the per-timeframe indicator dictionary consumed by BaseStrategy.analyze().
+
+    Each timeframe's data is a read-only mapping that converts a key when it
+    is first read, from the engine's indicators at that moment. Read it
+    before the engine processes the next candle.
+
+    Higher timeframes only change when one of their candles closes, so the
+    mappings of ``previous`` are reused for timeframes whose indicators have
+    not been updated since, keeping their already converted keys.
+
+    Args:
+        engine: Indicator engine to read from
+        previous: Snapshot built for an earlier candle of the same engine
+
+    Returns:
+        Dictionary keyed by timeframe value ('1m', '15m', '1h')
+    """
+    snapshot: Dict[str, Mapping] = {}
+
+    for timeframe in engine.timeframes:
+        indicators = engine.get_indicators(timeframe)
+        if indicators is None:
+            snapshot[timeframe.value] = {}
+            continue
+
+        data = previous.get(timeframe.value) if previous is not None else None
+        if not (isinstance(data, _TimeframeIndicatorData) and data.is_current(indicators)):
+            data = _TimeframeIndicatorData(indicators)
+        snapshot[timeframe.value] = data
+
+    return snapshot
+
+
+class StrategySignalGenerator(SignalGenerator):
+    """
+    SignalGenerator backed by a BaseStrategy.
+
+    Expects the integration layer to pass the output of
+    build_indicator_snapshot() as the ``indicators`` keyword argument.
+    Strategies only read indicators, so the candles argument is unused.
+    """
+
+    uses_candles = False
+
+    def __init__(self, strategy_name: str, strategy: BaseStrategy):
+        """
+        Initialize the adapter.
+
+        Args:
+            strategy_name: Name used by the integration layer (e.g., 'Strategy_A')
+            strategy: Strategy instance to delegate analysis to
+        """
+        super().__init__(strategy_name)
+        self.strategy = strategy
+
+    @classmethod
+    def create(
+        cls, strategy_name: str, params: Optional[Dict[str, Any]] = None
+    ) -> "StrategySignalGenerator":
+        """
+        Build an adapter for a named strategy.
+
+        Args:
+            strategy_name: Key of STRATEGY_CLASSES
+            params: Keyword arguments for the strategy constructor
+
+        Returns:
+            StrategySignalGenerator
+
+        Raises:
+            ValueError: If the strategy name is unknown
+        """
+        strategy_class = STRATEGY_CLASSES.get(strategy_name)
+        if strategy_class is None:
+            raise ValueError(
+                f"Unknown strategy '{strategy_name}', expected one of {list(STRATEGY_CLASSES)}"
+            )
+        return cls(strategy_name, strategy_class(**(params or {})))
+
+    def _generate_signal_impl(
+        self, symbol: str, current_price: Decimal, candles: pd.DataFrame, **kwargs
+    ) -> Optional[Signal]:
+        market_data = {
+            "symbol": symbol,
+            "current_price": float(current_price),
+            "indicators": kwargs.get("indicators", {}),
+            "volatility": kwargs.get("volatility", {}),
+        }
+
+        trading_signal = self.strategy.analyze(market_data)
+        if trading_signal is None or not self.strategy.validate_signal(trading_signal):
+            return None
+
+        try:
+            signal = Signal(
+                entry_price=Decimal(str(trading_signal.entry_price)),
+                direction=SignalDirection(trading_signal.direction.value),
+                confidence=trading_signal.confidence,
+                stop_loss=Decimal(str(trading_signal.stop_loss)),
+                take_profit=Decimal(str(trading_signal.take_profit)),
+                symbol=symbol,
+                strategy_name=self.strategy_name,
+                metadata=trading_signal.metadata,
+            )
+        except ValueError as e:
+            logger.debug(f"{self.strategy_name} signal rejected: {e}")
+            return None
+
+        self._last_signal = signal
+        return signal
+
+    def calculate_stop_loss(
+        self, entry_price: Decimal, direction: str, candles: pd.DataFrame, **kwargs
+    ) -> Decimal:
+        reference_level = kwargs.get("reference_level", float(entry_price))
+        return Decimal(
+            str(
+                self.strategy.calculate_stop_loss(
+                    float(entry_price), PositionSide(direction), reference_level
+                )
+            )
+        )
+
+    def calculate_take_profit(
+        self, entry_price: Decimal, stop_loss: Decimal, direction: str, **kwargs
+    ) -> Decimal:
+        ratio = getattr(self.strategy, "risk_reward_ratio", 2.0)
+        return Decimal(
+            str(self.strategy.calculate_take_profit(float(entry_price), float(stop_loss), ratio))
+        )
+
+    def calculate_confidence(self, candles: pd.DataFrame, **kwargs) -> float:
+        return self.last_signal.confidence if self.last_signal else 0.0
@@ -0,0 +1,333 @@
+"""
+Append-only, memory-mapped candle archive.
+
+Closed candles are appended as fixed-width binary records, one file per
+symbol-timeframe pair:
+
+    <root>/<SYMBOL>/<timeframe>.bin    48-byte records (timestamp, OHLCV)
+    <root>/<SYMBOL>/<timeframe>.idx    timestamp of every INDEX_STRIDE-th record
+
+Records are kept in strictly increasing timestamp order, so a time range is
+located by binary search on the sparse index followed by a search inside a
+single block of the memory-mapped data file. Only the pages of the requested
+range are read, so deep history stays on disk instead of in RAM.
+"""
+
+import logging
+import threading
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterable, List, Literal, Optional, Tuple, Union
+
+import numpy as np
+
+from src.core.constants import TimeFrame
+from src.models.candle import Candle
+from src.models.candle_buffer import CandleArrays
+
+logger = logging.getLogger(__name__)
+
+_RECORD_FIELDS = ("timestamp", "open", "high", "low", "close", "volume")
+_RECORD_DTYPE = np.dtype(
+    [(name, "<i8" if name == "timestamp" else "<f8") for name in _RECORD_FIELDS]
+)
+
+
+class _ArchiveFile:
+    """Data file, sparse index and memory map of one symbol-timeframe pair."""
+
+    def __init__(self, data_path: Path, index_stride: int):
+        self.data_path = data_path
+        self.index_path = data_path.with_suffix(".idx")
+        self.index_stride = index_stride
+
+        self._data_file: Optional[BinaryIO] = None
+        self._index_file: Optional[BinaryIO] = None
+        self._mmap: Optional[np.memmap] = None
+
+        self.count = 0
+        self.last_timestamp: Optional[int] = None
+        self.index = np.empty(0, dtype=np.int64)
+        self._open()
+
+    def _open(self) -> None:
+        """Recover record count and sparse index from disk."""
+        size = self.data_path.stat().st_size if self.data_path.exists() else 0
+
+        # Drop a record torn by a crash mid-write
+        torn = size % _RECORD_DTYPE.itemsize
+        if torn:
+            logger.warning(f"Truncating {torn} trailing bytes of {self.data_path}")
+            with open(self.data_path, "r+b") as f:
+                f.truncate(size - torn)
+            size -= torn
+
+        self.count = size // _RECORD_DTYPE.itemsize
+        if self.count:
+            timestamps = self._records()["timestamp"]
+            self.last_timestamp = int(timestamps[-1])
+            expected = -(-self.count // self.index_stride)
+            index = (
+                np.fromfile(self.index_path, dtype="<i8")
+                if self.index_path.exists()
+                else np.empty(0, dtype=np.int64)
+            )
+            if len(index) != expected:
+                index = np.ascontiguousarray(timestamps[:: self.index_stride], dtype="<i8")
+                index.tofile(self.index_path)
+            self.index = index.astype(np.int64)
+        elif self.index_path.exists():
+            self.index_path.unlink()
+
+    def _records(self) -> np.ndarray:
+        """Memory map covering all records, remapped when the file has grown."""
+        if self.count == 0:
+            return np.empty(0, dtype=_RECORD_DTYPE)
+        if self._mmap is None or len(self._mmap) != self.count:
+            self._mmap = np.memmap(
+                self.data_path, dtype=_RECORD_DTYPE, mode="r", shape=(self.count,)
+            )
+        return self._mmap
+
+    def append(self, records: np.ndarray) -> None:
+        """Append records already sorted and newer than last_timestamp."""
+        if self._data_file is None or self._index_file is None:
+            self.data_path.parent.mkdir(parents=True, exist_ok=True)
+            self._data_file = open(self.data_path, "ab")
+            self._index_file = open(self.index_path, "ab")
+        data_file, index_file = self._data_file, self._index_file
+
+        first = self.count
+        data_file.write(records.tobytes())
+        data_file.flush()
+
+        positions = np.arange(first, first + len(records))
+        indexed = records["timestamp"][positions % self.index_stride == 0]
+        if len(indexed):
+            index_file.write(indexed.astype("<i8").tobytes())
+            index_file.flush()
+            self.index = np.concatenate((self.index, indexed.astype(np.int64)))
+
+        self.count += len(records)
+        self.last_timestamp = int(records["timestamp"][-1])
+
+    def position(self, timestamp: int, side: Literal["left", "right"]) -> int:
+        """Record position of a timestamp, as np.searchsorted over the whole file."""
+        if self.count == 0:
+            return 0
+        block = int(np.searchsorted(self.index, timestamp, side))
+        lo = max(block - 1, 0) * self.index_stride
+        hi = min(block * self.index_stride, self.count)
+        if hi <= lo:
+            return lo
+        return lo + int(np.searchsorted(self._records()["timestamp"][lo:hi], timestamp, side))
+
+    def slice(self, lo: int, hi: int) -> np.ndarray:
+        """Copy of records [lo, hi)."""
+        return np.array(self._records()[lo:hi])
+
+    def close(self) -> None:
+        for f in (self._data_file, self._index_file):
+            if f is not None:
+                f.close()
+        self._data_file = None
+        self._index_file = None
+        self._mmap = None
+
+
+class CandleArchive:
+    """
+    Persistent append-only archive of closed candles.
+
+    Appends are O(1) and range reads are O(log n) in the number of archived
+    candles. Candles that are not newer than the last archived candle of their
+    symbol-timeframe pair are ignored, so replaying overlapping history is safe.
+
+    Example:
+        >>> archive = CandleArchive("data/archive")
+        >>> archive.append(candles)
+        >>> arrays = archive.read('BTCUSDT', TimeFrame.M1, start_time=start_ms, end_time=end_ms)
+        >>> recent = archive.get_candles('BTCUSDT', TimeFrame.M1, limit=500)
+    """
+
+    # Records between two sparse index entries (4096 * 48 bytes = 192 KiB block)
+    INDEX_STRIDE = 4096
+
+    def __init__(self, root_dir: Union[str, Path], index_stride: int = INDEX_STRIDE):
+        """
+        Initialize candle archive.
+
+        Args:
+            root_dir: Directory holding archive files (created if missing)
+            index_stride: Records per sparse index entry
+
+        Raises:
+            ValueError: If index_stride is not positive
+        """
+        if index_stride <= 0:
+            raise ValueError(f"index_stride must be positive, got {index_stride}")
+
+        self.root_dir = Path(root_dir)
+        self.root_dir.mkdir(parents=True, exist_ok=True)
+        self.index_stride = index_stride
+        self._files: Dict[Tuple[str, TimeFrame], _ArchiveFile] = {}
+        self._lock = threading.Lock()
+
+    def _file(self, symbol: str, timeframe: TimeFrame) -> _ArchiveFile:
+        key = (symbol.upper(), timeframe)
+        archive_file = self._files.get(key)
+        if archive_file is None:
+            path = self.root_dir / key[0] / f"{timeframe.value}.bin"
+            archive_file = _ArchiveFile(path, self.index_stride)
+            self._files[key] = archive_file
+        return archive_file
+
+    def append(self, candles: Iterable[Candle]) -> int:
+        """
+        Append closed candles.
+
+        Open candles and candles not newer than the last archived candle of
+        their pair are skipped.
+
+        Args:
+            candles: Candles of any symbol-timeframe pairs
+
+        Returns:
+            Number of candles written
+        """
+        groups: Dict[Tuple[str, TimeFrame], List[Candle]] = {}
+        for candle in candles:
+            if candle.is_closed:
+                groups.setdefault((candle.symbol, candle.timeframe), []).append(candle)
+
+        written = 0
+        with self._lock:
+            for (symbol, timeframe), group in groups.items():
+                records = np.array(
+                    [(c.timestamp, c.open, c.high, c.low, c.close, c.volume) for c in group],
+                    dtype=_RECORD_DTYPE,
+                )
+                written += self._write(symbol, timeframe, records)
+
+        return written
+
+    def append_arrays(self, symbol: str, timeframe: TimeFrame, arrays: CandleArrays) -> int:
+        """
+        Append the closed rows of candle columns of one symbol-timeframe pair.
+
+        Same rules as append(), without building Candle objects.
+
+        Args:
+            symbol: Trading pair symbol
+            timeframe: Candle timeframe
+            arrays: Candle columns (e.g. CandleBatch.arrays)
+
+        Returns:
+            Number of candles written
+        """
+        closed = np.asarray(arrays.is_closed, dtype=bool)
+        records = np.empty(int(np.count_nonzero(closed)), dtype=_RECORD_DTYPE)
+        for name in _RECORD_FIELDS:
+            records[name] = getattr(arrays, name)[closed]
+
+        with self._lock:
+            return self._write(symbol, timeframe, records)
+
+    def _write(self, symbol: str, timeframe: TimeFrame, records: np.ndarray) -> int:
+        """Sort records, drop duplicates and already archived ones, and append the rest."""
+        records = records[np.argsort(records["timestamp"], kind="stable")]
+
+        archive_file = self._file(symbol, timeframe)
+        keep = np.ones(len(records), dtype=bool)
+        keep[1:] = np.diff(records["timestamp"]) > 0
+        if archive_file.last_timestamp is not None:
+            keep &= records["timestamp"] > archive_file.last_timestamp
+        records = records[keep]
+
+        if len(records):
+            archive_file.append(records)
+        return len(records)
+
+    def read(
+        self,
+        symbol: str,
+        timeframe: TimeFrame,
+        start_time: Optional[int] = None,
+        end_time: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> CandleArrays:
+        """
+        Read archived candles in [start_time, end_time].
+
+        Args:
+            symbol: Trading pair symbol
+            timeframe: Candle timeframe
+            start_time: Inclusive lower bound (milliseconds), unbounded if None
+            end_time: Inclusive upper bound (milliseconds), unbounded if None
+            limit: Maximum number of most recent rows in the range
+
+        Returns:
+            CandleArrays in chronological order (empty if nothing matches)
+        """
+        with self._lock:
+            archive_file = self._file(symbol, timeframe)
+            lo = 0 if start_time is None else archive_file.position(start_time, "left")
+            hi = (
+                archive_file.count if end_time is None else archive_file.position(end_time, "right")
+            )
+            if limit is not None:
+                lo = max(lo, hi - max(limit, 0))
+            records = archive_file.slice(lo, hi) if hi > lo else np.empty(0, _RECORD_DTYPE)
+
+        return CandleArrays(
+            timestamp=records["timestamp"].astype(np.int64),
+            open=records["open"].astype(np.float64),
+            high=records["high"].astype(np.float64),
+            low=records["low"].astype(np.float64),
+            close=records["close"].astype(np.float64),
+            volume=records["volume"].astype(np.float64),
+            is_closed=np.ones(len(records), dtype=bool),
+        )
+
+    def get_candles(
+        self,
+        symbol: str,
+        timeframe: TimeFrame,
+        start_time: Optional[int] = None,
+        end_time: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> List[Candle]:
+        """
+        Read archived candles in [start_time, end_time] as Candle objects.
+
+        Args:
+            symbol: Trading pair symbol
+            timeframe: Candle timeframe
+            start_time: Inclusive lower bound (milliseconds), unbounded if None
+            end_time: Inclusive upper bound (milliseconds), unbounded if None
+            limit: Maximum number of most recent rows in the range
+
+        Returns:
+            List of closed candles in chronological order
+        """
+        arrays = self.read(symbol, timeframe, start_time, end_time, limit)
+        return arrays.to_candles(symbol.upper(), timeframe)
+
+    def count(self, symbol: str, timeframe: TimeFrame) -> int:
+        """Number of archived candles for a symbol-timeframe pair."""
+        with self._lock:
+            return self._file(symbol, timeframe).count
+
+    def last_timestamp(self, symbol: str, timeframe: TimeFrame) -> Optional[int]:
+        """Open time of the newest archived candle, or None if nothing is archived."""
+        with self._lock:
+            return self._file(symbol, timeframe).last_timestamp
+
+    def close(self) -> None:
+        """Close open file handles and memory maps."""
+        with self._lock:
+            for archive_file in self._files.values():
+                archive_file.close()
+            self._files.clear()
+
+    def __repr__(self) -> str:
+        return f"CandleArchive(root_dir={str(self.root_dir)!r})"
@@ -1,19 +1,24 @@
 """
-Thread-safe in-memory candle storage system using deque.
+Thread-safe in-memory candle storage system using columnar ring buffers.
 
 This module provides high-performance candle storage with automatic LRU eviction
-and memory monitoring capabilities.
+and memory monitoring capabilities. An optional CandleArchive keeps closed
+candles on disk so time-range reads can reach beyond the in-memory window.
 """
 
 import logging
 import sys
-from collections import deque
 from dataclasses import dataclass
 from threading import RLock
-from typing import Deque, Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
 
 from src.core.constants import TimeFrame
 from src.models.candle import Candle
+from src.models.candle_batch import CandleBatch
+from src.models.candle_buffer import CandleArrays, CandleBuffer
+from src.services.candle_archive import CandleArchive
 
 logger = logging.getLogger(__name__)
 
@@ -52,29 +57,38 @@ class CandleStorage:
     - Maximum 500 candles per storage (LRU eviction)
     - Thread-safe operations using RLock
     - Memory usage monitoring
-    - O(1) append and eviction operations via deque
+    - O(1) append and eviction into preallocated columnar buffers
+    - Array access to OHLCV columns without building Candle objects
+    - Optional write-through CandleArchive for warm start and deep lookback
 
     Example:
         >>> storage = CandleStorage(max_candles=500)
         >>> candle = Candle(symbol='BTCUSDT', timeframe=TimeFrame.M1, ...)
         >>> storage.add_candle(candle)
         >>> candles = storage.get_candles('BTCUSDT', TimeFrame.M1, limit=100)
+        >>>
+        >>> # Persist closed candles and restore them after a restart
+        >>> storage = CandleStorage(max_candles=500, archive=CandleArchive("data/archive"))
+        >>> storage.load_from_archive('BTCUSDT', TimeFrame.M1)
     """
 
-    def __init__(self, max_candles: int = 500):
+    def __init__(self, max_candles: int = 500, archive: Optional[CandleArchive] = None):
         """
         Initialize candle storage.
 
         Args:
             max_candles: Maximum candles to store per symbol-timeframe pair
+            archive: On-disk archive that closed candles are written through to
+                and that reads fall through to beyond the in-memory window
         """
         if max_candles <= 0:
             raise ValueError(f"max_candles must be positive, got {max_candles}")
 
         self._max_candles = max_candles
-        self._storage: Dict[Tuple[str, TimeFrame], Deque[Candle]] = {}
+        self._storage: Dict[Tuple[str, TimeFrame], CandleBuffer] = {}
         self._lock = RLock()
         self._eviction_count = 0
+        self._archive = archive
 
         logger.info(f"CandleStorage initialized with max_candles={max_candles}")
 
@@ -109,29 +123,69 @@ class CandleStorage:
         with self._lock:
             # Create storage if doesn't exist
             if key not in self._storage:
-                self._storage[key] = deque(maxlen=self._max_candles)
+                self._storage[key] = CandleBuffer(
+                    self._max_candles, symbol=candle.symbol, timeframe=candle.timeframe
+                )
                 logger.debug(f"Created new storage for {key}")
 
             storage = self._storage[key]
 
-            # Check if we'll evict (storage is at max capacity)
-            will_evict = len(storage) >= self._max_candles
-
-            # Add candle (deque automatically evicts oldest if at maxlen)
-            storage.append(candle)
+            # Add candle (buffer evicts oldest row when at capacity)
+            evicted = storage.append(candle)
 
-            if will_evict:
+            if evicted:
                 self._eviction_count += 1
                 logger.debug(
                     f"Evicted oldest candle for {candle.symbol} {candle.timeframe.value} "
                     f"(total evictions: {self._eviction_count})"
                 )
 
+            if self._archive is not None and candle.is_closed:
+                self._archive.append([candle])
+
             logger.debug(
                 f"Added candle for {candle.symbol} {candle.timeframe.value} "
                 f"@ {candle.get_datetime_iso()} (storage size: {len(storage)})"
             )
 
+    def add_batch(self, batch: CandleBatch) -> int:
+        """
+        Add the accepted rows of a CandleBatch without creating Candle objects.
+
+        Same as calling add_candle() for every row, but rows are copied into
+        the columnar buffer (and the archive) in bulk.
+
+        Args:
+            batch: Validated candle batch
+
+        Returns:
+            Number of candles added
+        """
+        if len(batch) == 0:
+            return 0
+
+        key = self._get_storage_key(batch.symbol, batch.timeframe)
+
+        with self._lock:
+            if key not in self._storage:
+                self._storage[key] = CandleBuffer(
+                    self._max_candles, symbol=batch.symbol, timeframe=batch.timeframe
+                )
+                logger.debug(f"Created new storage for {key}")
+
+            storage = self._storage[key]
+            evicted = storage.extend(batch.arrays)
+            self._eviction_count += evicted
+
+            if self._archive is not None:
+                self._archive.append_arrays(batch.symbol, batch.timeframe, batch.arrays)
+
+        logger.debug(
+            f"Added {len(batch)} candles for {batch.symbol} {batch.timeframe.value} "
+            f"(evicted: {evicted}, storage size: {len(storage)})"
+        )
+        return len(batch)
+
     def get_candles(
         self,
         symbol: str,
@@ -144,6 +198,8 @@ class CandleStorage:
         Get candles from storage with optional filtering.
 
         Thread-safe operation that retrieves candles in chronological order.
+        With an archive, candles older than the in-memory window are read from
+        disk when the time range or limit reaches past it.
 
         Args:
             symbol: Trading pair symbol
@@ -169,26 +225,20 @@ class CandleStorage:
         key = self._get_storage_key(symbol, timeframe)
 
         with self._lock:
-            if key not in self._storage:
+            storage = self._storage.get(key)
+            if storage is None and self._archive is None:
                 logger.debug(f"No storage found for {symbol} {timeframe.value}")
                 return []
 
-            storage = self._storage[key]
-            candles = list(storage)  # Convert deque to list
-
-            # Apply time filters
-            if start_time is not None:
-                candles = [c for c in candles if c.timestamp >= start_time]
-
-            if end_time is not None:
-                candles = [c for c in candles if c.timestamp <= end_time]
+            candles = (
+                [] if storage is None else self._get_buffered(storage, limit, start_time, end_time)
+            )
 
-            # Apply limit (get most recent)
-            if limit is not None:
-                if limit <= 0:
-                    candles = []
-                else:
-                    candles = candles[-limit:]
+            if self._archive is not None:
+                candles = (
+                    self._get_archived(key, storage, limit, start_time, end_time, len(candles))
+                    + candles
+                )
 
             logger.debug(
                 f"Retrieved {len(candles)} candles for {symbol} {timeframe.value} "
@@ -197,6 +247,86 @@ class CandleStorage:
 
             return candles
 
+    def _get_buffered(
+        self,
+        storage: CandleBuffer,
+        limit: Optional[int],
+        start_time: Optional[int],
+        end_time: Optional[int],
+    ) -> List[Candle]:
+        """Filter one in-memory buffer (caller holds the lock)."""
+        if start_time is None and end_time is None:
+            # Only the requested tail is materialised into Candle objects
+            if limit is None:
+                return storage.to_candles()
+            if limit <= 0:
+                return []
+            return storage.to_candles(max(0, len(storage) - limit))
+
+        if storage.is_sorted:
+            # Binary search on the timestamp column
+            rows = storage.search(start_time, end_time)
+            start, stop = rows.start, rows.stop
+            if limit is not None:
+                start = max(start, stop - max(limit, 0))
+            return storage.to_candles(start, stop)
+
+        # Out-of-order appends: apply time filters with a mask
+        timestamps = storage.column("timestamp")
+        mask = np.ones(len(timestamps), dtype=bool)
+        if start_time is not None:
+            mask &= timestamps >= start_time
+        if end_time is not None:
+            mask &= timestamps <= end_time
+
+        # Apply limit (get most recent)
+        if limit is not None:
+            selected = np.flatnonzero(mask)
+            mask[:] = False
+            if limit > 0:
+                mask[selected[-limit:]] = True
+
+        return storage.select(mask)
+
+    def _get_archived(
+        self,
+        key: Tuple[str, TimeFrame],
+        storage: Optional[CandleBuffer],
+        limit: Optional[int],
+        start_time: Optional[int],
+        end_time: Optional[int],
+        buffered: int,
+    ) -> List[Candle]:
+        """
+        Read archived candles older than the in-memory window (caller holds the lock).
+
+        Falls through only when the request reaches past the oldest buffered
+        candle: a time range starting before it, or a limit larger than what
+        the buffer returned.
+        """
+        if limit is not None and buffered >= limit:
+            return []
+
+        if storage is not None and len(storage) > 0:
+            timestamps = storage.column("timestamp")
+            oldest = int(timestamps[0] if storage.is_sorted else timestamps.min())
+            if start_time is None and end_time is None and limit is None:
+                return []
+            if start_time is not None and start_time >= oldest:
+                return []
+            archive_end = oldest - 1 if end_time is None else min(end_time, oldest - 1)
+        else:
+            archive_end = end_time
+
+        symbol, timeframe = key
+        return self._archive.get_candles(
+            symbol,
+            timeframe,
+            start_time=start_time,
+            end_time=archive_end,
+            limit=None if limit is None else limit - buffered,
+        )
+
     def get_latest_candle(self, symbol: str, timeframe: TimeFrame) -> Optional[Candle]:
         """
         Get the most recent candle for symbol-timeframe pair.
@@ -217,7 +347,85 @@ class CandleStorage:
             if key not in self._storage or len(self._storage[key]) == 0:
                 return None
 
-            return self._storage[key][-1]  # Most recent candle
+            return self._storage[key].latest()
+
+    def get_arrays(
+        self, symbol: str, timeframe: TimeFrame, limit: Optional[int] = None
+    ) -> Optional[CandleArrays]:
+        """
+        Get OHLCV columns for a symbol-timeframe pair without building Candle objects.
+
+        The arrays are copied while the lock is held, so they remain valid when
+        other threads keep appending candles.
+
+        Args:
+            symbol: Trading pair symbol
+            timeframe: Candle timeframe
+            limit: Maximum number of most recent rows to return
+
+        Returns:
+            CandleArrays in chronological order, or None if nothing is stored
+
+        Example:
+            >>> arrays = storage.get_arrays('BTCUSDT', TimeFrame.M1, limit=200)
+            >>> sma = arrays.close[-20:].mean()
+        """
+        key = self._get_storage_key(symbol, timeframe)
+
+        with self._lock:
+            if key not in self._storage:
+                return None
+
+            views = self._storage[key].arrays(last=limit)
+            return CandleArrays(*(view.copy() for view in views))
+
+    def load_from_archive(
+        self, symbol: str, timeframe: TimeFrame, limit: Optional[int] = None
+    ) -> int:
+        """
+        Warm-start the in-memory window from the archive.
+
+        Loads the most recent archived candles that are newer than anything
+        already in memory, up to max_candles.
+
+        Args:
+            symbol: Trading pair symbol
+            timeframe: Candle timeframe
+            limit: Maximum candles to load (default: max_candles)
+
+        Returns:
+            Number of candles loaded
+
+        Raises:
+            RuntimeError: If the storage has no archive
+        """
+        if self._archive is None:
+            raise RuntimeError("CandleStorage was created without an archive")
+
+        key = self._get_storage_key(symbol, timeframe)
+        limit = self._max_candles if limit is None else min(limit, self._max_candles)
+
+        with self._lock:
+            storage = self._storage.get(key)
+            start_time = None
+            if storage is not None and len(storage) > 0:
+                start_time = int(storage.column("timestamp")[-1]) + 1
+
+            candles = self._archive.get_candles(
+                key[0], timeframe, start_time=start_time, limit=limit
+            )
+            if not candles:
+                return 0
+
+            if storage is None:
+                storage = CandleBuffer(self._max_candles, symbol=key[0], timeframe=timeframe)
+                self._storage[key] = storage
+            for candle in candles:
+                if storage.append(candle):
+                    self._eviction_count += 1
+
+        logger.info(f"Loaded {len(candles)} archived candles for {symbol} {timeframe.value}")
+        return len(candles)
 
     def remove_candles(
         self, symbol: str, timeframe: TimeFrame, before_timestamp: Optional[int] = None
@@ -257,13 +465,7 @@ class CandleStorage:
                 return count
 
             # Remove candles before timestamp
-            original_count = len(storage)
-
-            # Convert to list, filter, and create new deque
-            remaining = [c for c in storage if c.timestamp >= before_timestamp]
-            self._storage[key] = deque(remaining, maxlen=self._max_candles)
-
-            removed_count = original_count - len(remaining)
+            removed_count = storage.remove_before(before_timestamp)
 
             if removed_count > 0:
                 logger.info(
@@ -383,13 +585,11 @@ class CandleStorage:
             # Storage dictionary overhead
             total_bytes += sys.getsizeof(self._storage)
 
-            # Each storage deque and its candles
+            # Each storage buffer and its preallocated columns
             for key, storage in self._storage.items():
                 total_bytes += sys.getsizeof(key)
                 total_bytes += sys.getsizeof(storage)
-
-                for candle in storage:
-                    total_bytes += sys.getsizeof(candle)
+                total_bytes += storage.nbytes
 
             return total_bytes
 
@@ -444,6 +644,11 @@ class CandleStorage:
         """Maximum candles per storage."""
         return self._max_candles
 
+    @property
+    def archive(self) -> Optional[CandleArchive]:
+        """On-disk archive backing this storage, if any."""
+        return self._archive
+
     def __repr__(self) -> str:
         """String representation of storage."""
         stats = self.get_stats()
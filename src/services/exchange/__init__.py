@@ -1,6 +1,8 @@
 """Exchange integration services for connecting to cryptocurrency exchanges."""
 
+from .account_state import AccountSnapshot, AccountStateService
 from .binance_manager import BinanceManager
+from .candle_cache import CandleCache
 from .historical_loader import HistoricalDataLoader
 from .order_executor import (
     OrderExecutor,
@@ -16,7 +18,10 @@ from .order_tracker import (
 from .realtime_processor import RealtimeCandleProcessor
 
 __all__ = [
+    "AccountSnapshot",
+    "AccountStateService",
     "BinanceManager",
+    "CandleCache",
     "HistoricalDataLoader",
     "RealtimeCandleProcessor",
     "OrderExecutor",
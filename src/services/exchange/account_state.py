@@ -0,0 +1,430 @@
+"""
+Cached account state for in-memory risk checks.
+
+Position sizing needs the free balance on every signal. Fetching it over REST
+adds a round trip and request weight to the signal → order path, so
+AccountStateService keeps the last known balances in memory:
+
+- The user data stream (ccxt watch_balance) pushes balance changes as they happen
+- A periodic REST refresh keeps the snapshot fresh while the stream is quiet or down
+- Our own fills are applied locally (margin and fees are debited from the free
+  balance) until the next exchange snapshot replaces them
+- invalidate() drops the snapshot when it is known to be wrong, e.g. after a
+  position closed with unknown realized P&L
+
+Reads within the staleness bound are pure in-memory lookups; only a stale or
+invalidated snapshot is refreshed over REST on the read path.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Any, Callable, Dict, List, Optional
+
+from src.core.constants import EventType
+from src.core.events import Event, EventHandler
+from src.services.exchange.binance_manager import BinanceManager
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class AccountSnapshot:
+    """
+    Balances per currency as last reported by the exchange.
+
+    Attributes:
+        free: Available balances
+        used: Balances locked in orders and positions
+        total: Total balances
+        updated_at: Clock time of the exchange report
+        source: Where the balances came from ('rest' or 'stream')
+        local_adjustments: Fills applied locally since the exchange report
+    """
+
+    free: Dict[str, Decimal] = field(default_factory=dict)
+    used: Dict[str, Decimal] = field(default_factory=dict)
+    total: Dict[str, Decimal] = field(default_factory=dict)
+    updated_at: float = 0.0
+    source: str = "rest"
+    local_adjustments: int = 0
+
+    @classmethod
+    def from_balance(
+        cls, balance: Dict[str, Any], updated_at: float, source: str
+    ) -> "AccountSnapshot":
+        """
+        Create a snapshot from a ccxt unified balance structure.
+
+        Args:
+            balance: Balance with 'free', 'used' and 'total' dictionaries
+            updated_at: Clock time of the report
+            source: Where the balance came from
+
+        Returns:
+            AccountSnapshot instance
+        """
+
+        def amounts(key: str) -> Dict[str, Decimal]:
+            return {
+                currency: Decimal(str(amount))
+                for currency, amount in (balance.get(key) or {}).items()
+                if amount is not None
+            }
+
+        return cls(
+            free=amounts("free"),
+            used=amounts("used"),
+            total=amounts("total"),
+            updated_at=updated_at,
+            source=source,
+        )
+
+
+class AccountStateService(EventHandler):
+    """
+    In-memory account balances with a staleness bound.
+
+    Subscribe the service to ORDER_FILLED and POSITION_CLOSED to apply our own
+    fills locally and to invalidate the snapshot when positions close.
+
+    Example:
+        >>> account_state = AccountStateService(binance_manager, max_staleness=30.0, leverage=5)
+        >>> await account_state.start()
+        >>> event_bus.subscribe(EventType.ORDER_FILLED, account_state)
+        >>> balance = await account_state.get_free_balance("USDT")
+    """
+
+    def __init__(
+        self,
+        binance_manager: BinanceManager,
+        max_staleness: float = 30.0,
+        refresh_interval: float = 10.0,
+        use_stream: bool = True,
+        currency: str = "USDT",
+        leverage: int = 1,
+        fee_rate: float = 0.0004,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize account state service.
+
+        Args:
+            binance_manager: Binance manager for balance fetches and the user data stream
+            max_staleness: Seconds a snapshot may be served without refreshing
+            refresh_interval: Seconds without updates after which the background
+                task refreshes over REST (should be below max_staleness)
+            use_stream: Consume balance updates from the user data stream
+            currency: Margin currency adjusted by fills
+            leverage: Leverage used to estimate the margin of a fill
+            fee_rate: Fee rate used to estimate the fee of a fill
+            clock: Time source in seconds, monotonic by default
+
+        Raises:
+            ValueError: If parameters are invalid
+        """
+        if max_staleness <= 0:
+            raise ValueError("max_staleness must be positive")
+        if refresh_interval <= 0:
+            raise ValueError("refresh_interval must be positive")
+        if leverage <= 0:
+            raise ValueError("leverage must be positive")
+        if fee_rate < 0:
+            raise ValueError("fee_rate must be non-negative")
+
+        super().__init__(name="AccountStateService")
+        self.binance_manager = binance_manager
+        self.max_staleness = max_staleness
+        self.refresh_interval = refresh_interval
+        self.use_stream = use_stream
+        self.currency = currency
+        self.leverage = leverage
+        self.fee_rate = Decimal(str(fee_rate))
+
+        self._clock = clock
+        self._snapshot: Optional[AccountSnapshot] = None
+        self._received_at = float("-inf")
+        self._refresh_lock = asyncio.Lock()
+        self._tasks: List[asyncio.Task] = []
+        self._stats = {
+            "cache_hits": 0,
+            "refreshes": 0,
+            "failed_refreshes": 0,
+            "stream_updates": 0,
+            "local_adjustments": 0,
+            "invalidations": 0,
+        }
+
+        logger.info(
+            f"AccountStateService initialized: max_staleness={max_staleness}s, "
+            f"refresh_interval={refresh_interval}s, "
+            f"stream={'enabled' if use_stream else 'disabled'}"
+        )
+
+    @property
+    def age(self) -> Optional[float]:
+        """Seconds since the exchange reported the current snapshot (None if invalid)."""
+        if self._snapshot is None:
+            return None
+        return self._clock() - self._snapshot.updated_at
+
+    @property
+    def is_fresh(self) -> bool:
+        """Whether the snapshot can be served without refreshing."""
+        age = self.age
+        return age is not None and age <= self.max_staleness
+
+    async def get_free_balance(self, currency: Optional[str] = None) -> Decimal:
+        """
+        Get the available balance of a currency.
+
+        Served from memory while the snapshot is fresh; refreshed over REST
+        otherwise.
+
+        Args:
+            currency: Currency symbol (defaults to the margin currency)
+
+        Returns:
+            Available balance (0 if the account holds none)
+
+        Raises:
+            BinanceConnectionError: If a required refresh fails
+        """
+        if self.is_fresh:
+            self._stats["cache_hits"] += 1
+            snapshot = self._snapshot
+        else:
+            snapshot = await self.refresh()
+        return snapshot.free.get(currency or self.currency, Decimal("0"))
+
+    def get_cached_free_balance(self, currency: Optional[str] = None) -> Optional[Decimal]:
+        """
+        Get the available balance without ever calling the exchange.
+
+        Args:
+            currency: Currency symbol (defaults to the margin currency)
+
+        Returns:
+            Available balance, or None if the snapshot is stale or invalidated
+        """
+        if not self.is_fresh:
+            return None
+        self._stats["cache_hits"] += 1
+        return self._snapshot.free.get(currency or self.currency, Decimal("0"))
+
+    async def refresh(self) -> AccountSnapshot:
+        """
+        Fetch balances over REST and replace the snapshot.
+
+        Concurrent callers share one request: callers that waited for an
+        in-flight refresh use its result.
+
+        Returns:
+            New snapshot
+
+        Raises:
+            BinanceConnectionError: If the balance fetch fails
+        """
+        requested_at = self._clock()
+        async with self._refresh_lock:
+            if self._snapshot is not None and self._received_at >= requested_at:
+                return self._snapshot  # Updated while waiting for the lock
+
+            try:
+                balance = await self.binance_manager.fetch_balance()
+            except Exception:
+                self._stats["failed_refreshes"] += 1
+                raise
+
+            self._stats["refreshes"] += 1
+            return self.apply_balance(balance, source="rest", updated_at=requested_at)
+
+    def apply_balance(
+        self,
+        balance: Dict[str, Any],
+        source: str = "stream",
+        updated_at: Optional[float] = None,
+    ) -> AccountSnapshot:
+        """
+        Replace the snapshot with balances reported by the exchange.
+
+        Local fill adjustments are dropped since the report includes them.
+
+        Args:
+            balance: ccxt unified balance structure
+            source: Where the balance came from ('rest' or 'stream')
+            updated_at: Clock time of the report (now if None)
+
+        Returns:
+            New snapshot
+        """
+        self._received_at = self._clock()
+        if updated_at is None:
+            updated_at = self._received_at
+        self._snapshot = AccountSnapshot.from_balance(balance, updated_at, source)
+        logger.debug(
+            f"Account state updated from {source}: "
+            f"free {self.currency}={self._snapshot.free.get(self.currency)}"
+        )
+        return self._snapshot
+
+    def apply_fill(
+        self,
+        symbol: str,
+        quantity: float,
+        price: float,
+        reduce_only: bool = False,
+    ) -> None:
+        """
+        Apply one of our own fills to the snapshot.
+
+        Opening fills move the estimated initial margin and fee from free to
+        used balance. A reducing fill releases margin and realizes P&L that is
+        not known locally, so it invalidates the snapshot instead.
+
+        Args:
+            symbol: Traded symbol
+            quantity: Filled quantity
+            price: Average fill price
+            reduce_only: Whether the fill reduced an open position
+        """
+        snapshot = self._snapshot
+        if snapshot is None or not self._is_margin_symbol(symbol):
+            return
+        if reduce_only:
+            self.invalidate(f"reducing fill on {symbol}")
+            return
+
+        notional = Decimal(str(quantity)) * Decimal(str(price))
+        margin = notional / Decimal(self.leverage)
+        fee = notional * self.fee_rate
+        currency = self.currency
+
+        snapshot.free[currency] = snapshot.free.get(currency, Decimal("0")) - margin - fee
+        snapshot.used[currency] = snapshot.used.get(currency, Decimal("0")) + margin
+        snapshot.total[currency] = snapshot.total.get(currency, Decimal("0")) - fee
+        snapshot.local_adjustments += 1
+        self._stats["local_adjustments"] += 1
+
+        logger.debug(
+            f"Applied {symbol} fill locally: margin={margin:.8f}, fee={fee:.8f}, "
+            f"free {currency}={snapshot.free[currency]:.8f}"
+        )
+
+    def _is_margin_symbol(self, symbol: str) -> bool:
+        market = symbol.split(":")[0].replace("/", "")
+        return market.endswith(self.currency)
+
+    def invalidate(self, reason: str = "") -> None:
+        """
+        Drop the snapshot so the next read refreshes it.
+
+        Args:
+            reason: Reason for logging
+        """
+        if self._snapshot is not None:
+            self._snapshot = None
+            self._stats["invalidations"] += 1
+            logger.debug(f"Account state invalidated{': ' + reason if reason else ''}")
+
+    async def handle(self, event: Event) -> None:
+        """
+        Apply ORDER_FILLED events and invalidate on POSITION_CLOSED.
+
+        Args:
+            event: Order or position event
+        """
+        data = event.data or {}
+        if event.event_type == EventType.ORDER_FILLED:
+            quantity = data.get("filled_quantity") or data.get("quantity")
+            price = data.get("average_price") or data.get("price")
+            if data.get("symbol") and quantity and price:
+                self.apply_fill(
+                    data["symbol"],
+                    quantity,
+                    price,
+                    reduce_only=bool(data.get("reduce_only", False)),
+                )
+            else:
+                self.invalidate("fill without quantity or price")
+        elif event.event_type == EventType.POSITION_CLOSED:
+            self.invalidate("position closed")
+
+    async def start(self) -> None:
+        """Load the initial snapshot and start the background updates."""
+        if self._tasks:
+            return
+        try:
+            await self.refresh()
+        except Exception as e:
+            logger.warning(f"Initial account state refresh failed: {e}")
+
+        self._tasks.append(asyncio.create_task(self._refresh_loop()))
+        if self.use_stream:
+            self._tasks.append(asyncio.create_task(self._stream_loop()))
+        logger.info("AccountStateService started")
+
+    async def stop(self) -> None:
+        """Stop the background updates."""
+        for task in self._tasks:
+            task.cancel()
+        for task in self._tasks:
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._tasks.clear()
+        logger.info("AccountStateService stopped")
+
+    async def _refresh_loop(self) -> None:
+        """Refresh over REST whenever no update arrived for refresh_interval."""
+        while True:
+            age = self.age
+            delay = self.refresh_interval if age is None else self.refresh_interval - age
+            await asyncio.sleep(max(delay, 0.0))
+            if self.age is None or self.age >= self.refresh_interval:
+                try:
+                    await self.refresh()
+                except Exception as e:
+                    logger.warning(f"Account state refresh failed: {e}")
+                    await asyncio.sleep(self.refresh_interval)
+
+    async def _stream_loop(self) -> None:
+        """Apply balance updates pushed by the user data stream."""
+        while True:
+            try:
+                balance = await self.binance_manager.watch_balance()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # The REST refresh keeps the snapshot fresh until the stream recovers
+                logger.warning(f"Balance stream error, retrying: {e}")
+                await asyncio.sleep(self.refresh_interval)
+                continue
+
+            self.apply_balance(balance, source="stream")
+            self._stats["stream_updates"] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get service statistics.
+
+        Returns:
+            Dictionary with counters, snapshot 'age', 'source' and 'fresh' flag
+        """
+        snapshot = self._snapshot
+        return {
+            **self._stats,
+            "age": self.age,
+            "fresh": self.is_fresh,
+            "source": snapshot.source if snapshot else None,
+            "pending_local_adjustments": snapshot.local_adjustments if snapshot else 0,
+        }
+
+    def __repr__(self) -> str:
+        return (
+            f"AccountStateService(currency={self.currency}, fresh={self.is_fresh}, "
+            f"max_staleness={self.max_staleness})"
+        )
@@ -359,6 +359,26 @@ class BinanceManager:
             logger.error(error_msg, exc_info=True)
             raise BinanceConnectionError(error_msg) from e
 
+    async def watch_balance(self) -> Dict[str, Any]:
+        """
+        Wait for the next account balance update from the user data stream.
+
+        Returns:
+            Balance dictionary in the same format as fetch_balance()
+
+        Raises:
+            BinanceConnectionError: If exchange not initialized or the stream fails
+        """
+        if not self.exchange:
+            raise BinanceConnectionError("Exchange not initialized. Call initialize() first.")
+
+        try:
+            return await self.exchange.watch_balance()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            raise BinanceConnectionError(f"Balance stream failed: {e}") from e
+
     async def fetch_positions(self, symbols: Optional[List[str]] = None) -> List[Dict[str, Any]]:
         """
         Fetch open positions information.
@@ -0,0 +1,300 @@
+"""
+On-disk columnar cache for historical candles.
+
+Closed candles are stored per symbol, timeframe and UTC month as compressed
+NumPy archives:
+
+    <root>/<SYMBOL>/<timeframe>/<YYYY-MM>.npz
+
+Each archive holds one array per OHLCV column, sorted by timestamp without
+duplicates. Loading a cached range only decompresses the month files it
+overlaps, so warm restarts do not touch the exchange.
+
+Ranges the exchange has no candles for (before a listing, during outages)
+are recorded in <root>/<SYMBOL>/<timeframe>/empty_ranges.npy so they are
+not requested again.
+"""
+
+import logging
+import os
+import tempfile
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import BinaryIO, Callable, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from src.core.constants import TimeFrame
+from src.models.candle import Candle
+from src.models.candle_buffer import CandleArrays
+
+logger = logging.getLogger(__name__)
+
+_COLUMNS = ("timestamp", "open", "high", "low", "close", "volume")
+_EMPTY_RANGES_FILE = "empty_ranges.npy"
+
+
+def _month_start(timestamp_ms: int) -> datetime:
+    """UTC start of the month containing a timestamp."""
+    dt = datetime.fromtimestamp(timestamp_ms / 1000, tz=timezone.utc)
+    return dt.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def _next_month(month: datetime) -> datetime:
+    """UTC start of the following month."""
+    if month.month == 12:
+        return month.replace(year=month.year + 1, month=1)
+    return month.replace(month=month.month + 1)
+
+
+def _empty_columns() -> Dict[str, np.ndarray]:
+    return {
+        name: np.empty(0, dtype=np.int64 if name == "timestamp" else np.float64)
+        for name in _COLUMNS
+    }
+
+
+class CandleCache:
+    """
+    Month-partitioned compressed candle cache.
+
+    Only closed candles belong in the cache; callers are responsible for
+    not writing the still-forming candle.
+
+    Example:
+        >>> cache = CandleCache("data/candles")
+        >>> cache.write("BTCUSDT", TimeFrame.M1, candles)
+        >>> arrays = cache.read("BTCUSDT", TimeFrame.M1, start_ms, end_ms)
+        >>> missing = cache.missing_ranges("BTCUSDT", TimeFrame.M1, start_ms, end_ms)
+        >>> cache.mark_empty("BTCUSDT", TimeFrame.M1, [(listing_gap_start, listing_ms)])
+    """
+
+    def __init__(self, root_dir: Union[str, Path]):
+        """
+        Initialize the cache.
+
+        Args:
+            root_dir: Directory holding the cache files (created if missing)
+        """
+        self.root_dir = Path(root_dir)
+        self.root_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+    def _month_path(self, symbol: str, timeframe: TimeFrame, month: datetime) -> Path:
+        return self.root_dir / symbol / timeframe.value / f"{month:%Y-%m}.npz"
+
+    def _months(self, start_ms: int, end_ms: int) -> List[datetime]:
+        """Months overlapping [start_ms, end_ms)."""
+        months = []
+        month = _month_start(start_ms)
+        end = datetime.fromtimestamp(end_ms / 1000, tz=timezone.utc)
+        while month < end:
+            months.append(month)
+            month = _next_month(month)
+        return months
+
+    def _load_month(self, path: Path) -> Dict[str, np.ndarray]:
+        if not path.exists():
+            return _empty_columns()
+        with np.load(path) as archive:
+            return {name: archive[name] for name in _COLUMNS}
+
+    def _save_month(self, path: Path, columns: Dict[str, np.ndarray]) -> None:
+        """Write a month file atomically."""
+        self._save_atomic(path, lambda f: np.savez_compressed(f, **columns))
+
+    @staticmethod
+    def _save_atomic(path: Path, write: Callable[[BinaryIO], None]) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                write(f)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def _empty_ranges_path(self, symbol: str, timeframe: TimeFrame) -> Path:
+        return self.root_dir / symbol / timeframe.value / _EMPTY_RANGES_FILE
+
+    def empty_ranges(self, symbol: str, timeframe: TimeFrame) -> List[Tuple[int, int]]:
+        """
+        Get ranges recorded as having no candles on the exchange.
+
+        Args:
+            symbol: Trading pair symbol
+            timeframe: Candle timeframe
+
+        Returns:
+            List of (start_ms, end_ms) ranges, end exclusive, in time order
+        """
+        path = self._empty_ranges_path(symbol, timeframe)
+        if not path.exists():
+            return []
+        return [(int(start), int(end)) for start, end in np.load(path)]
+
+    def mark_empty(self, symbol: str, timeframe: TimeFrame, ranges: List[Tuple[int, int]]) -> None:
+        """
+        Record ranges the exchange returned no candles for.
+
+        missing_ranges() no longer reports them. Overlapping and adjacent
+        ranges are merged with the recorded ones.
+
+        Args:
+            symbol: Trading pair symbol
+            timeframe: Candle timeframe
+            ranges: (start_ms, end_ms) ranges, end exclusive
+        """
+        if not ranges:
+            return
+
+        with self._lock:
+            merged: List[List[int]] = []
+            for start, end in sorted(self.empty_ranges(symbol, timeframe) + list(ranges)):
+                if merged and start <= merged[-1][1]:
+                    merged[-1][1] = max(merged[-1][1], end)
+                else:
+                    merged.append([start, end])
+
+            spans = np.array(merged, dtype=np.int64)
+            self._save_atomic(
+                self._empty_ranges_path(symbol, timeframe), lambda f: np.save(f, spans)
+            )
+
+        logger.debug(f"Recorded {len(ranges)} empty range(s) for {symbol} {timeframe.value}")
+
+    def write(self, symbol: str, timeframe: TimeFrame, candles: List[Candle]) -> int:
+        """
+        Merge candles into the cache.
+
+        Candles already cached at the same timestamp are replaced.
+
+        Args:
+            symbol: Trading pair symbol
+            timeframe: Candle timeframe
+            candles: Closed candles (any order)
+
+        Returns:
+            Number of candles written
+        """
+        if not candles:
+            return 0
+
+        new = {
+            "timestamp": np.fromiter((c.timestamp for c in candles), np.int64, len(candles)),
+            "open": np.fromiter((c.open for c in candles), np.float64, len(candles)),
+            "high": np.fromiter((c.high for c in candles), np.float64, len(candles)),
+            "low": np.fromiter((c.low for c in candles), np.float64, len(candles)),
+            "close": np.fromiter((c.close for c in candles), np.float64, len(candles)),
+            "volume": np.fromiter((c.volume for c in candles), np.float64, len(candles)),
+        }
+
+        with self._lock:
+            for month in self._months(int(new["timestamp"].min()), int(new["timestamp"].max()) + 1):
+                month_start = int(month.timestamp() * 1000)
+                month_end = int(_next_month(month).timestamp() * 1000)
+                in_month = (new["timestamp"] >= month_start) & (new["timestamp"] < month_end)
+                if not in_month.any():
+                    continue
+
+                path = self._month_path(symbol, timeframe, month)
+                existing = self._load_month(path)
+                merged = {
+                    name: np.concatenate((existing[name], new[name][in_month])) for name in _COLUMNS
+                }
+
+                # Keep the last occurrence of each timestamp (new data wins)
+                reversed_ts = merged["timestamp"][::-1]
+                _, first_in_reversed = np.unique(reversed_ts, return_index=True)
+                keep = len(reversed_ts) - 1 - first_in_reversed
+                self._save_month(path, {name: merged[name][keep] for name in _COLUMNS})
+
+        logger.debug(f"Cached {len(candles)} candles for {symbol} {timeframe.value}")
+        return len(candles)
+
+    def read(self, symbol: str, timeframe: TimeFrame, start_ms: int, end_ms: int) -> CandleArrays:
+        """
+        Read cached candles in [start_ms, end_ms).
+
+        Args:
+            symbol: Trading pair symbol
+            timeframe: Candle timeframe
+            start_ms: Range start (inclusive)
+            end_ms: Range end (exclusive)
+
+        Returns:
+            CandleArrays in chronological order (empty if nothing is cached)
+        """
+        parts = []
+        for month in self._months(start_ms, end_ms):
+            columns = self._load_month(self._month_path(symbol, timeframe, month))
+            ts = columns["timestamp"]
+            lo, hi = np.searchsorted(ts, [start_ms, end_ms])
+            if hi > lo:
+                parts.append({name: columns[name][lo:hi] for name in _COLUMNS})
+
+        if parts:
+            columns = {name: np.concatenate([p[name] for p in parts]) for name in _COLUMNS}
+        else:
+            columns = _empty_columns()
+
+        return CandleArrays(**columns, is_closed=np.ones(len(columns["timestamp"]), dtype=bool))
+
+    def last_timestamp(self, symbol: str, timeframe: TimeFrame) -> Optional[int]:
+        """
+        Get the open time of the newest cached candle.
+
+        Args:
+            symbol: Trading pair symbol
+            timeframe: Candle timeframe
+
+        Returns:
+            Timestamp in milliseconds, or None if nothing is cached
+        """
+        directory = self.root_dir / symbol / timeframe.value
+        if not directory.exists():
+            return None
+        for path in sorted(directory.glob("*.npz"), reverse=True):
+            timestamps = self._load_month(path)["timestamp"]
+            if len(timestamps):
+                return int(timestamps[-1])
+        return None
+
+    def missing_ranges(
+        self, symbol: str, timeframe: TimeFrame, start_ms: int, end_ms: int
+    ) -> List[Tuple[int, int]]:
+        """
+        Find candle open times in [start_ms, end_ms) that are not cached.
+
+        Covers both the uncached tail (resume point) and interior gaps.
+        Ranges recorded with mark_empty() are not missing.
+
+        Args:
+            symbol: Trading pair symbol
+            timeframe: Candle timeframe
+            start_ms: Range start (aligned to the timeframe)
+            end_ms: Range end (exclusive)
+
+        Returns:
+            List of (start_ms, end_ms) ranges, end exclusive, in time order
+        """
+        interval_ms = Candle.get_timeframe_milliseconds(timeframe)
+        expected = np.arange(start_ms, end_ms, interval_ms, dtype=np.int64)
+        if len(expected) == 0:
+            return []
+
+        cached = self.read(symbol, timeframe, start_ms, end_ms).timestamp
+        missing = expected[~np.isin(expected, cached, assume_unique=True)]
+        for empty_start, empty_end in self.empty_ranges(symbol, timeframe):
+            missing = missing[(missing < empty_start) | (missing >= empty_end)]
+        if len(missing) == 0:
+            return []
+
+        # Split missing timestamps into runs of consecutive candles
+        breaks = np.flatnonzero(np.diff(missing) != interval_ms) + 1
+        return [(int(run[0]), int(run[-1]) + interval_ms) for run in np.split(missing, breaks)]
+
+    def __repr__(self) -> str:
+        return f"CandleCache(root_dir={str(self.root_dir)!r})"
@@ -2,7 +2,9 @@
 Historical candle data loader for Binance exchange.
 
 Handles batch loading of historical OHLCV data with rate limiting,
-data validation, and integration with CandleStorage.
+data validation, and integration with CandleStorage. Long ranges are
+downloaded page by page with bounded concurrency and can be persisted to
+an on-disk CandleCache so later loads resume instead of re-fetching.
 """
 
 import asyncio
@@ -12,8 +14,11 @@ from typing import Any, Dict, List, Optional
 
 from src.core.constants import TimeFrame
 from src.models.candle import Candle
+from src.models.candle_batch import CandleBatch
+from src.models.candle_buffer import CandleArrays
 from src.services.candle_storage import CandleStorage
 from src.services.exchange.binance_manager import BinanceConnectionError, BinanceManager
+from src.services.exchange.candle_cache import CandleCache
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +33,8 @@ class HistoricalDataLoader:
     - Data integrity validation (time ordering, gap detection)
     - Integration with CandleStorage for persistence
     - Efficient loading of multiple symbols/timeframes in parallel
+    - Paginated since/until downloads with bounded request concurrency
+    - Optional on-disk cache with resume and gap refill
 
     Example:
         >>> loader = HistoricalDataLoader(binance_manager, candle_storage)
@@ -38,6 +45,11 @@ class HistoricalDataLoader:
         ...     timeframes=[TimeFrame.M15, TimeFrame.H1],
         ...     limit=500
         ... )
+        >>> # Download months of data, cached on disk
+        >>> loader = HistoricalDataLoader(
+        ...     binance_manager, candle_storage, candle_cache=CandleCache("data/candles")
+        ... )
+        >>> candles = await loader.download_range('BTCUSDT', TimeFrame.M1, since=start_ms)
     """
 
     # Binance API limits
@@ -55,11 +67,16 @@ class HistoricalDataLoader:
     BACKOFF_MULTIPLIER = 2.0
     MAX_RETRIES = 5
 
+    # Concurrent klines requests in flight
+    DEFAULT_MAX_CONCURRENT_REQUESTS = 5
+
     def __init__(
         self,
         binance_manager: BinanceManager,
         candle_storage: CandleStorage,
         enable_rate_limiting: bool = True,
+        candle_cache: Optional[CandleCache] = None,
+        max_concurrent_requests: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
     ):
         """
         Initialize historical data loader.
@@ -68,19 +85,33 @@ class HistoricalDataLoader:
             binance_manager: Initialized BinanceManager instance
             candle_storage: CandleStorage instance for persistence
             enable_rate_limiting: Enable automatic rate limiting (default: True)
+            candle_cache: On-disk cache used by download_range (optional)
+            max_concurrent_requests: Maximum klines requests in flight (default: 5)
+
+        Raises:
+            ValueError: If max_concurrent_requests is not positive
         """
+        if max_concurrent_requests < 1:
+            raise ValueError(
+                f"max_concurrent_requests must be positive, got {max_concurrent_requests}"
+            )
+
         self.binance_manager = binance_manager
         self.candle_storage = candle_storage
         self.enable_rate_limiting = enable_rate_limiting
+        self.candle_cache = candle_cache
+        self.max_concurrent_requests = max_concurrent_requests
 
         # Rate limiting tracking
         self._request_times: List[float] = []
         self._rate_limit_lock = asyncio.Lock()
+        self._request_semaphore = asyncio.Semaphore(max_concurrent_requests)
 
         # Statistics
         self._total_candles_loaded = 0
         self._total_requests = 0
         self._rate_limit_delays = 0
+        self._cached_candles_served = 0
 
         logger.info(
             f"HistoricalDataLoader initialized (rate_limiting={'enabled' if enable_rate_limiting else 'disabled'})"
@@ -162,9 +193,10 @@ class HistoricalDataLoader:
                     f"(since={since}, limit={limit}, attempt={attempt + 1})"
                 )
 
-                ohlcv = await self.binance_manager.fetch_ohlcv(
-                    symbol=symbol, timeframe=timeframe.value, since=since, limit=limit
-                )
+                async with self._request_semaphore:
+                    ohlcv = await self.binance_manager.fetch_ohlcv(
+                        symbol=symbol, timeframe=timeframe.value, since=since, limit=limit
+                    )
 
                 self._total_requests += 1
                 return ohlcv
@@ -190,6 +222,63 @@ class HistoricalDataLoader:
         logger.error(error_msg)
         raise BinanceConnectionError(error_msg) from last_error
 
+    def _parse_batch(
+        self, symbol: str, timeframe: TimeFrame, ohlcv_data: List[List]
+    ) -> CandleBatch:
+        """
+        Validate CCXT OHLCV rows as closed candles in one vectorized pass.
+
+        Rows that are malformed or fail candle validation are skipped and logged.
+
+        Args:
+            symbol: Trading pair symbol
+            timeframe: Candle timeframe
+            ohlcv_data: OHLCV rows from the exchange
+
+        Returns:
+            CandleBatch of the valid rows
+        """
+        try:
+            # Historical candles are always closed
+            batch = CandleBatch.from_ohlcv(symbol, timeframe, ohlcv_data, is_closed=True)
+        except (TypeError, ValueError):
+            # Short or non-numeric rows: keep the well-formed ones
+            rows = []
+            for ohlcv in ohlcv_data:
+                try:
+                    rows.append([float(value) for value in ohlcv[:6]])
+                except (TypeError, ValueError):
+                    continue
+            rows = [row for row in rows if len(row) == 6]
+            logger.error(
+                f"Failed to parse {len(ohlcv_data) - len(rows)} malformed OHLCV rows "
+                f"for {symbol} {timeframe.value}"
+            )
+            batch = CandleBatch.from_ohlcv(symbol, timeframe, rows, is_closed=True)
+
+        if batch.rejected:
+            logger.error(
+                f"Skipped {batch.rejected} invalid candles for {symbol} {timeframe.value}: "
+                f"{batch.errors(limit=5)}"
+            )
+        return batch
+
+    def _parse_ohlcv(
+        self, symbol: str, timeframe: TimeFrame, ohlcv_data: List[List]
+    ) -> List[Candle]:
+        """
+        Convert CCXT OHLCV rows to closed candles, skipping rows that fail to parse.
+
+        Args:
+            symbol: Trading pair symbol
+            timeframe: Candle timeframe
+            ohlcv_data: OHLCV rows from the exchange
+
+        Returns:
+            List of Candle objects
+        """
+        return self._parse_batch(symbol, timeframe, ohlcv_data).to_candles()
+
     def _validate_candles(self, candles: List[Candle]) -> Dict[str, Any]:
         """
         Validate loaded candles for data integrity.
@@ -311,20 +400,9 @@ class HistoricalDataLoader:
                 logger.warning(f"No data returned for {symbol} {timeframe.value}")
                 return []
 
-            # Convert to Candle objects
-            candles = []
-            for ohlcv in ohlcv_data:
-                try:
-                    candle = Candle.from_ccxt_ohlcv(
-                        symbol=symbol,
-                        timeframe=timeframe,
-                        ohlcv=ohlcv,
-                        is_closed=True,  # Historical candles are always closed
-                    )
-                    candles.append(candle)
-                except Exception as e:
-                    logger.error(f"Failed to parse candle data: {e}", exc_info=True)
-                    continue
+            # Validate in bulk, then convert to Candle objects
+            batch = self._parse_batch(symbol, timeframe, ohlcv_data)
+            candles = batch.to_candles()
 
             logger.info(
                 f"Loaded {len(candles)} candles for {symbol} {timeframe.value} "
@@ -345,8 +423,7 @@ class HistoricalDataLoader:
 
             # Store in CandleStorage
             if store and candles:
-                for candle in candles:
-                    self.candle_storage.add_candle(candle)
+                self.candle_storage.add_batch(batch)
 
                 logger.info(
                     f"Stored {len(candles)} candles in storage for {symbol} {timeframe.value}"
@@ -458,6 +535,221 @@ class HistoricalDataLoader:
 
         return results
 
+    async def _fetch_page(
+        self, symbol: str, timeframe: TimeFrame, start_ms: int, end_ms: int
+    ) -> List[Candle]:
+        """
+        Fetch candles with open time in [start_ms, end_ms) using a single request.
+
+        Args:
+            symbol: Trading pair symbol
+            timeframe: Candle timeframe
+            start_ms: Page start (aligned to the timeframe)
+            end_ms: Page end (exclusive, at most MAX_CANDLES_PER_REQUEST intervals later)
+
+        Returns:
+            Candles inside the page range
+        """
+        interval_ms = Candle.get_timeframe_milliseconds(timeframe)
+        limit = min(self.MAX_CANDLES_PER_REQUEST, -(-(end_ms - start_ms) // interval_ms))
+        ohlcv_data = await self._fetch_ohlcv_with_retry(
+            symbol=symbol, timeframe=timeframe, since=start_ms, limit=limit
+        )
+        return [
+            candle
+            for candle in self._parse_ohlcv(symbol, timeframe, ohlcv_data)
+            if start_ms <= candle.timestamp < end_ms
+        ]
+
+    @staticmethod
+    def _arrays_to_candles(symbol: str, timeframe: TimeFrame, arrays: CandleArrays) -> List[Candle]:
+        """Build closed Candle objects from cached columns, validating them in bulk."""
+        return CandleBatch.from_arrays(
+            symbol,
+            timeframe,
+            timestamp=arrays.timestamp,
+            open=arrays.open,
+            high=arrays.high,
+            low=arrays.low,
+            close=arrays.close,
+            volume=arrays.volume,
+            is_closed=True,
+        ).to_candles()
+
+    async def download_range(
+        self,
+        symbol: str,
+        timeframe: TimeFrame,
+        since: int,
+        until: Optional[int] = None,
+        validate: bool = True,
+        store: bool = False,
+    ) -> List[Candle]:
+        """
+        Download all closed candles with open time in [since, until).
+
+        The range is split into pages of MAX_CANDLES_PER_REQUEST candles that
+        are fetched concurrently (bounded by max_concurrent_requests and the
+        rate limiter). With a candle_cache, only ranges missing from the
+        cache are requested - the uncached tail after the last stored candle
+        and any interior gaps - and the result is read back from the cache.
+        Requested candles the exchange did not return although it has later
+        candles (before the listing, outages) are recorded as empty in the
+        cache and not requested again. The still-forming candle is never
+        returned or cached.
+
+        Args:
+            symbol: Trading pair symbol (e.g., 'BTCUSDT')
+            timeframe: Candle timeframe
+            since: Range start in milliseconds (rounded down to the timeframe)
+            until: Range end in milliseconds, exclusive (default: now)
+            validate: Validate data integrity (default: True)
+            store: Store candles in CandleStorage (default: False)
+
+        Returns:
+            List of Candle objects in chronological order
+
+        Raises:
+            ValueError: If the range is invalid
+            BinanceConnectionError: If a page cannot be fetched
+        """
+        interval_ms = Candle.get_timeframe_milliseconds(timeframe)
+        start_ms = since - since % interval_ms
+
+        # Open time of the forming candle bounds the closed range
+        forming_ms = int(time.time() * 1000) // interval_ms * interval_ms
+        end_ms = forming_ms if until is None else min(until, forming_ms)
+        if until is not None and until <= since:
+            raise ValueError(f"until ({until}) must be after since ({since})")
+        if end_ms <= start_ms:
+            return []
+
+        started = time.time()
+        if self.candle_cache is not None:
+            missing = await asyncio.to_thread(
+                self.candle_cache.missing_ranges, symbol, timeframe, start_ms, end_ms
+            )
+        else:
+            missing = [(start_ms, end_ms)]
+
+        page_span = self.MAX_CANDLES_PER_REQUEST * interval_ms
+        pages = [
+            (page_start, min(page_start + page_span, range_end))
+            for range_start, range_end in missing
+            for page_start in range(range_start, range_end, page_span)
+        ]
+
+        logger.info(
+            f"Downloading {symbol} {timeframe.value}: {len(missing)} missing range(s), "
+            f"{len(pages)} page(s)"
+        )
+        page_results = await asyncio.gather(
+            *(
+                self._fetch_page(symbol, timeframe, page_start, page_end)
+                for page_start, page_end in pages
+            )
+        )
+        fetched = [candle for page in page_results for candle in page]
+        self._total_candles_loaded += len(fetched)
+
+        if self.candle_cache is not None:
+            await asyncio.to_thread(self.candle_cache.write, symbol, timeframe, fetched)
+            await self._record_empty_ranges(symbol, timeframe, start_ms, end_ms)
+            arrays = await asyncio.to_thread(
+                self.candle_cache.read, symbol, timeframe, start_ms, end_ms
+            )
+            candles = self._arrays_to_candles(symbol, timeframe, arrays)
+            self._cached_candles_served += len(candles) - len(fetched)
+        else:
+            unique = {candle.timestamp: candle for candle in fetched}
+            candles = [unique[ts] for ts in sorted(unique)]
+
+        if validate and candles:
+            validation_result = self._validate_candles(candles)
+            if not validation_result["valid"]:
+                logger.warning(
+                    f"Data validation issues for {symbol} {timeframe.value}:\n"
+                    + "\n".join(validation_result["issues"][:5])
+                )
+
+        if store:
+            for candle in candles:
+                self.candle_storage.add_candle(candle)
+
+        logger.info(
+            f"✓ Download complete: {symbol} {timeframe.value} "
+            f"({len(candles)} candles, {len(fetched)} fetched, {time.time() - started:.2f}s)"
+        )
+        return candles
+
+    async def _record_empty_ranges(
+        self, symbol: str, timeframe: TimeFrame, start_ms: int, end_ms: int
+    ) -> None:
+        """
+        Mark ranges still missing after a download as empty in the cache.
+
+        Every missing range in [start_ms, end_ms) was just requested. Only
+        candles older than the newest cached one are marked, so a tail the
+        exchange has not published yet is requested again next time.
+        """
+        latest = await asyncio.to_thread(self.candle_cache.last_timestamp, symbol, timeframe)
+        if latest is None or latest <= start_ms:
+            return
+
+        empty = await asyncio.to_thread(
+            self.candle_cache.missing_ranges, symbol, timeframe, start_ms, min(end_ms, latest)
+        )
+        if empty:
+            await asyncio.to_thread(self.candle_cache.mark_empty, symbol, timeframe, empty)
+            logger.info(
+                f"{symbol} {timeframe.value}: {len(empty)} range(s) without candles "
+                f"on the exchange, skipped in future downloads"
+            )
+
+    async def download_multiple_symbols(
+        self,
+        symbols: List[str],
+        timeframes: List[TimeFrame],
+        since: int,
+        until: Optional[int] = None,
+        validate: bool = True,
+        store: bool = False,
+    ) -> Dict[str, Dict[TimeFrame, List[Candle]]]:
+        """
+        Download a time range for multiple symbol-timeframe combinations.
+
+        All combinations run concurrently; the request semaphore and rate
+        limiter keep the exchange load bounded.
+
+        Args:
+            symbols: List of trading pair symbols
+            timeframes: List of timeframes to download
+            since: Range start in milliseconds
+            until: Range end in milliseconds, exclusive (default: now)
+            validate: Validate data integrity
+            store: Store candles in CandleStorage
+
+        Returns:
+            Nested dictionary: {symbol: {timeframe: [candles]}}; failed pairs map to []
+        """
+        pairs = [(symbol, timeframe) for symbol in symbols for timeframe in timeframes]
+        candle_lists = await asyncio.gather(
+            *(
+                self.download_range(symbol, timeframe, since, until, validate, store)
+                for symbol, timeframe in pairs
+            ),
+            return_exceptions=True,
+        )
+
+        results: Dict[str, Dict[TimeFrame, List[Candle]]] = {symbol: {} for symbol in symbols}
+        for (symbol, timeframe), candles in zip(pairs, candle_lists):
+            if isinstance(candles, Exception):
+                logger.error(f"Failed to download {symbol} {timeframe.value}: {candles}")
+                results[symbol][timeframe] = []
+            else:
+                results[symbol][timeframe] = candles
+        return results
+
     def get_stats(self) -> Dict[str, Any]:
         """
         Get loader statistics.
@@ -470,6 +762,7 @@ class HistoricalDataLoader:
             "total_requests": self._total_requests,
             "rate_limit_delays": self._rate_limit_delays,
             "rate_limiting_enabled": self.enable_rate_limiting,
+            "cached_candles_served": self._cached_candles_served,
         }
 
     def reset_stats(self) -> None:
@@ -477,4 +770,5 @@ class HistoricalDataLoader:
         self._total_candles_loaded = 0
         self._total_requests = 0
         self._rate_limit_delays = 0
+        self._cached_candles_served = 0
         logger.debug("Loader statistics reset")
@@ -23,7 +23,7 @@ from ccxt.base.errors import (
 )
 
 from src.core.constants import OrderSide, OrderType, PositionSide
-from src.core.events import EventBus, EventType
+from src.core.events import Event, EventBus, EventType
 from src.core.retry_manager import RetryConfig, RetryManager, RetryStrategy
 from src.monitoring.metrics import record_order_execution
 from src.monitoring.tracing import get_tracer
@@ -242,6 +242,15 @@ class OrderExecutor:
     - 이벤트 발행 및 로깅
     """
 
+    # OrderTracker와 동일한 이벤트 우선순위
+    _EVENT_PRIORITIES = {
+        EventType.ORDER_PLACED: 7,
+        EventType.ORDER_FILLED: 8,
+        EventType.ORDER_CANCELLED: 6,
+        EventType.EXCHANGE_ERROR: 8,
+        EventType.ERROR_OCCURRED: 9,
+    }
+
     def __init__(
         self,
         exchange,
@@ -767,6 +776,7 @@ class OrderExecutor:
             "order_type": request.order_type.value,
             "side": request.side.value,
             "quantity": float(request.quantity),
+            "reduce_only": request.reduce_only,
             "timestamp": request.timestamp.isoformat(),
         }
 
@@ -786,7 +796,14 @@ class OrderExecutor:
             event_data["error"] = error
 
         try:
-            await self.event_bus.emit(event_type, event_data)
+            await self.event_bus.publish(
+                Event(
+                    event_type=event_type,
+                    priority=self._EVENT_PRIORITIES.get(event_type, 7),
+                    data=event_data,
+                    source="OrderExecutor",
+                )
+            )
         except Exception as e:
             logger.error(f"Failed to emit event {event_type}: {e}")
 
@@ -811,13 +828,17 @@ class OrderExecutor:
 
             # 이벤트 발행
             if self.event_bus:
-                await self.event_bus.emit(
-                    EventType.ORDER_CANCELLED,
-                    {
-                        "order_id": order_id,
-                        "symbol": symbol,
-                        "timestamp": datetime.now(timezone.utc).isoformat(),
-                    },
+                await self.event_bus.publish(
+                    Event(
+                        event_type=EventType.ORDER_CANCELLED,
+                        priority=self._EVENT_PRIORITIES[EventType.ORDER_CANCELLED],
+                        data={
+                            "order_id": order_id,
+                            "symbol": symbol,
+                            "timestamp": datetime.now(timezone.utc).isoformat(),
+                        },
+                        source="OrderExecutor",
+                    )
                 )
 
             logger.info(f"Order cancelled successfully: {order_id}")
@@ -13,13 +13,16 @@ from dataclasses import dataclass
 from datetime import datetime, timezone
 from decimal import Decimal
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from src.core.constants import EventType, PositionSide
+from src.core.constants import EventType, OrderSide, PositionSide
 from src.core.events import Event, EventBus
 from src.database.models import Position as PositionModel
+from src.database.write_behind import WriteBehindQueue
 from src.monitoring.metrics import update_position_pnl
 
 logger = logging.getLogger(__name__)
@@ -130,17 +133,27 @@ class PositionManager:
     실시간 PnL 계산 및 데이터베이스 동기화를 수행합니다.
     """
 
-    def __init__(self, db_session: Session, event_bus: Optional[EventBus] = None):
+    def __init__(
+        self,
+        db_session: Union[Session, AsyncSession],
+        event_bus: Optional[EventBus] = None,
+        write_queue: Optional[WriteBehindQueue] = None,
+    ):
         """
         PositionManager 초기화.
 
         Args:
-            db_session: 데이터베이스 세션
+            db_session: 데이터베이스 세션 (동기 Session 또는 AsyncSession)
             event_bus: 이벤트 버스 (선택)
+            write_queue: 포지션 업데이트를 모아서 기록하는 write-behind 큐 (선택,
+                기본값은 업데이트마다 즉시 커밋하는 write-through 큐)
         """
         self.db_session = db_session
         self.event_bus = event_bus
 
+        # 가격 틱 업데이트는 병합되어 일괄 커밋됨; 포지션 종료는 즉시 커밋
+        self.write_queue = write_queue or WriteBehindQueue(db_session, name="positions")
+
         # 메모리 포지션 맵: symbol -> PositionInfo
         self._positions: Dict[str, PositionInfo] = {}
 
@@ -153,6 +166,14 @@ class PositionManager:
 
         logger.info("PositionManager initialized")
 
+    async def start(self) -> None:
+        """쓰기 큐의 주기적 flush 시작."""
+        self.write_queue.start()
+
+    async def stop(self) -> None:
+        """주기적 flush를 멈추고 대기 중인 업데이트를 기록."""
+        await self.write_queue.stop()
+
     async def open_position(
         self,
         symbol: str,
@@ -191,7 +212,7 @@ class PositionManager:
             if existing.status == PositionStatus.OPENED:
                 raise ValueError(f"Position already exists for {symbol}")
 
-        # 데이터베이스에 저장
+        # 데이터베이스에 저장 (대기 중인 업데이트를 먼저 기록하여 쓰기 순서 보장)
         db_position = PositionModel(
             symbol=symbol,
             strategy=strategy,
@@ -207,9 +228,7 @@ class PositionManager:
             timeframe=timeframe if timeframe else "1h",
         )
 
-        self.db_session.add(db_position)
-        self.db_session.commit()
-        self.db_session.refresh(db_position)
+        await self.write_queue.execute(self._insert_position, db_position)
 
         # 메모리 포지션 생성
         position = PositionInfo(
@@ -282,16 +301,18 @@ class PositionManager:
         # Update P&L metrics
         update_position_pnl(symbol=symbol, side=position.side.value, pnl=float(pnl))
 
-        # 데이터베이스 동기화
-        db_position = self.db_session.query(PositionModel).filter_by(id=position.id).first()
-
-        if db_position:
-            db_position.current_price = current_price
-            db_position.size = position.size
-            db_position.unrealized_pnl = pnl
-            db_position.unrealized_pnl_percent = pnl_percent
-            db_position.updated_at = datetime.now(timezone.utc)
-            self.db_session.commit()
+        # 데이터베이스 동기화 (write-behind 큐에서 같은 포지션의 업데이트는 병합됨)
+        await self.write_queue.stage(
+            PositionModel,
+            position.id,
+            {
+                "current_price": current_price,
+                "size": position.size,
+                "unrealized_pnl": pnl,
+                "unrealized_pnl_percent": pnl_percent,
+                "updated_at": datetime.now(timezone.utc),
+            },
+        )
 
         self._stats["total_updated"] += 1
 
@@ -348,19 +369,22 @@ class PositionManager:
         # Reset P&L metrics to 0 when position is closed
         update_position_pnl(symbol=symbol, side=position.side.value, pnl=0.0)
 
-        # 데이터베이스 동기화
-        db_position = self.db_session.query(PositionModel).filter_by(id=position.id).first()
-
-        if db_position:
-            db_position.status = "CLOSED"
-            db_position.current_price = exit_price
-            db_position.unrealized_pnl = Decimal("0")
-            db_position.unrealized_pnl_percent = 0.0
-            db_position.realized_pnl = realized_pnl
-            db_position.total_fees = fees
-            db_position.closed_at = position.closed_at
-            db_position.updated_at = datetime.now(timezone.utc)
-            self.db_session.commit()
+        # 데이터베이스 동기화 (종료는 대기 중인 업데이트와 함께 즉시 커밋)
+        await self.write_queue.stage(
+            PositionModel,
+            position.id,
+            {
+                "status": "CLOSED",
+                "current_price": exit_price,
+                "unrealized_pnl": Decimal("0"),
+                "unrealized_pnl_percent": 0.0,
+                "realized_pnl": realized_pnl,
+                "total_fees": fees,
+                "closed_at": position.closed_at,
+                "updated_at": datetime.now(timezone.utc),
+            },
+            durable=True,
+        )
 
         self._stats["total_closed"] += 1
 
@@ -387,6 +411,77 @@ class PositionManager:
 
         return position
 
+    async def apply_fill(
+        self,
+        symbol: str,
+        side: OrderSide,
+        quantity: Decimal,
+        price: Decimal,
+        reduce_only: bool = False,
+        strategy: str = "order_fill",
+    ) -> Optional[PositionInfo]:
+        """
+        체결된 주문을 포지션에 반영.
+
+        포지션이 없으면 체결 방향으로 새 포지션을 열고, 같은 방향 체결은 크기를
+        늘리며 진입가를 가중 평균합니다. 반대 방향 체결은 포지션을 줄이거나
+        종료하고, 남은 수량으로 반대 포지션을 엽니다 (reduce_only 제외).
+
+        Args:
+            symbol: 거래 심볼
+            side: 주문 방향 (BUY/SELL)
+            quantity: 체결 수량
+            price: 평균 체결 가격
+            reduce_only: 포지션 축소 전용 주문 여부
+            strategy: 새 포지션의 전략 이름 (기본값: "order_fill")
+
+        Returns:
+            PositionInfo: 반영된 포지션 정보 (반영할 포지션이 없으면 None)
+        """
+        fill_side = PositionSide.LONG if OrderSide(side) == OrderSide.BUY else PositionSide.SHORT
+        position = self._positions.get(symbol)
+        if position is not None and position.status != PositionStatus.OPENED:
+            position = None
+
+        if position is None:
+            if reduce_only:
+                logger.warning(f"Reduce-only fill without open position for {symbol}")
+                return None
+            return await self.open_position(symbol, strategy, fill_side, quantity, price)
+
+        if position.side == fill_side:
+            if reduce_only:
+                logger.warning(f"Reduce-only fill would increase position for {symbol}")
+                return position
+            # 진입가 가중 평균
+            position.entry_price = (position.entry_price * position.size + price * quantity) / (
+                position.size + quantity
+            )
+            await self.write_queue.stage(
+                PositionModel, position.id, {"entry_price": position.entry_price}
+            )
+            return await self.update_position(symbol, price, size_change=quantity)
+
+        if quantity < position.size:
+            return await self.update_position(symbol, price, size_change=-quantity)
+
+        closed = await self.close_position(symbol, exit_price=price, exit_reason="order_fill")
+        remainder = quantity - closed.size
+        if remainder > 0 and not reduce_only:
+            return await self.open_position(symbol, strategy, fill_side, remainder, price)
+        return closed
+
+    @staticmethod
+    def _insert_position(session: Session, db_position: PositionModel) -> None:
+        """포지션 행 삽입 및 커밋 (쓰기 큐의 세션에서 실행)."""
+        session.add(db_position)
+        try:
+            session.commit()
+        except SQLAlchemyError:
+            session.rollback()
+            raise
+        session.refresh(db_position)
+
     def get_position(self, symbol: str) -> Optional[PositionInfo]:
         """
         심볼별 포지션 조회.
@@ -427,6 +522,8 @@ class PositionManager:
         """
         여러 포지션 일괄 업데이트.
 
+        모든 포지션의 데이터베이스 업데이트는 하나의 트랜잭션으로 기록됩니다.
+
         Args:
             price_updates: {symbol: current_price} 맵
 
@@ -435,10 +532,11 @@ class PositionManager:
         """
         updated_count = 0
 
-        for symbol, current_price in price_updates.items():
-            result = await self.update_position(symbol, current_price)
-            if result:
-                updated_count += 1
+        async with self.write_queue.batch():
+            for symbol, current_price in price_updates.items():
+                result = await self.update_position(symbol, current_price)
+                if result:
+                    updated_count += 1
 
         return updated_count
 
@@ -453,6 +551,7 @@ class PositionManager:
             **self._stats,
             "current_open_positions": len(self.get_open_positions()),
             "total_positions_in_memory": len(self._positions),
+            "persistence": self.write_queue.get_stats(),
         }
 
     async def _publish_event(
@@ -14,7 +14,7 @@ from dataclasses import dataclass
 from datetime import datetime, time, timezone
 from decimal import Decimal
 from threading import Lock
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional
 
 from src.core.constants import EventType
 from src.core.events import Event
@@ -88,6 +88,7 @@ class DailyLossMonitor:
         daily_loss_limit_pct: float = 6.0,
         reset_time_utc: time = time(0, 0),
         precision: int = 8,
+        clock: Optional[Callable[[], datetime]] = None,
     ):
         """
         Initialize daily loss monitor.
@@ -97,6 +98,8 @@ class DailyLossMonitor:
             daily_loss_limit_pct: Maximum daily loss percentage (default: 6.0%)
             reset_time_utc: UTC time for daily session reset (default: 00:00)
             precision: Decimal places for balance calculations
+            clock: Returns the current UTC time (default: wall clock); backtests
+                pass a virtual clock so day boundaries follow replayed candles
 
         Raises:
             ValueError: If daily_loss_limit_pct is not positive
@@ -108,6 +111,7 @@ class DailyLossMonitor:
         self.daily_loss_limit_pct = Decimal(str(daily_loss_limit_pct))
         self.reset_time_utc = reset_time_utc
         self.precision = precision
+        self.clock = clock or (lambda: datetime.now(timezone.utc))
 
         self.current_session: Optional[DailySession] = None
         self._lock = Lock()
@@ -135,7 +139,7 @@ class DailyLossMonitor:
             raise ValueError(f"starting_balance must be positive, got {starting_balance}")
 
         with self._lock:
-            current_date = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+            current_date = self.clock().strftime("%Y-%m-%d")
 
             self.current_session = DailySession(
                 date=current_date,
@@ -251,7 +255,7 @@ class DailyLossMonitor:
         if not self.current_session:
             return True
 
-        now_utc = datetime.now(timezone.utc)
+        now_utc = self.clock()
         current_date = now_utc.strftime("%Y-%m-%d")
 
         # Reset if we're on a different date
@@ -296,7 +300,7 @@ class DailyLossMonitor:
             "unrealized_pnl": float(self.current_session.unrealized_pnl),
             "loss_percentage": float(self.current_session.loss_percentage),
             "loss_limit": float(self.daily_loss_limit_pct),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": self.clock().isoformat(),
         }
 
         event = Event(
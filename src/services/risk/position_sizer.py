@@ -11,6 +11,7 @@ import logging
 from decimal import ROUND_DOWN, Decimal
 from typing import Any, Dict, Optional
 
+from src.services.exchange.account_state import AccountStateService
 from src.services.exchange.binance_manager import BinanceConnectionError, BinanceManager
 
 logger = logging.getLogger(__name__)
@@ -32,6 +33,7 @@ class PositionSizer:
 
     Attributes:
         binance_manager: Binance exchange manager for balance queries
+        account_state: Optional cached account state used instead of balance queries
         risk_percentage: Risk percentage per trade (default: 2%)
         leverage: Leverage multiplier (default: 5x)
         min_position_size: Minimum position size in USDT
@@ -47,6 +49,7 @@ class PositionSizer:
         min_position_size: float = 10.0,
         max_position_size: Optional[float] = None,
         precision: int = 8,
+        account_state: Optional[AccountStateService] = None,
     ):
         """
         Initialize position sizer.
@@ -58,6 +61,8 @@ class PositionSizer:
             min_position_size: Minimum position size in USDT (default: 10.0)
             max_position_size: Maximum position size in USDT (None = no limit)
             precision: Decimal places for position size (default: 8)
+            account_state: Cached account state; balances are read from memory
+                instead of fetched over REST for every calculation (None = fetch)
 
         Raises:
             ValueError: If parameters are invalid
@@ -87,6 +92,7 @@ class PositionSizer:
         self.min_position_size = Decimal(str(min_position_size))
         self.max_position_size = Decimal(str(max_position_size)) if max_position_size else None
         self.precision = precision
+        self.account_state = account_state
 
         logger.info(
             f"PositionSizer initialized: "
@@ -98,6 +104,9 @@ class PositionSizer:
         """
         Get available account balance for specified currency.
 
+        Uses the cached account state if configured, which only calls the
+        exchange when its snapshot is stale.
+
         Args:
             currency: Currency symbol (default: 'USDT')
 
@@ -108,10 +117,13 @@ class PositionSizer:
             PositionSizingError: If balance fetch fails
         """
         try:
-            balance_data = await self.binance_manager.fetch_balance()
+            if self.account_state is not None:
+                free_balance = await self.account_state.get_free_balance(currency)
+            else:
+                balance_data = await self.binance_manager.fetch_balance()
 
-            # Get free balance for the currency
-            free_balance = balance_data.get("free", {}).get(currency, 0)
+                # Get free balance for the currency
+                free_balance = balance_data.get("free", {}).get(currency, 0)
 
             if free_balance is None or free_balance == 0:
                 logger.warning(f"No available {currency} balance found")
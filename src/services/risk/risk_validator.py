@@ -191,8 +191,9 @@ class RiskValidator:
 
             # Allow some tolerance (±5%)
             tolerance = Decimal("0.05")
-            min_size = calculated_size["position_size"] * (Decimal("1") - tolerance)
-            max_size = calculated_size["position_size"] * (Decimal("1") + tolerance)
+            expected_size = Decimal(str(calculated_size["position_size"]))
+            min_size = expected_size * (Decimal("1") - tolerance)
+            max_size = expected_size * (Decimal("1") + tolerance)
 
             if position_size < min_size:
                 return False, f"Position size {position_size} below minimum {min_size:.8f}"
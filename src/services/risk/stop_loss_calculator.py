@@ -11,12 +11,13 @@ Calculates stop loss levels using:
 import logging
 from decimal import ROUND_DOWN, Decimal
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
 from src.core.constants import PositionSide
 from src.indicators.fair_value_gap import FairValueGap, FVGState, FVGType
 from src.indicators.liquidity_zone import LiquidityLevel, LiquidityState, LiquidityType
 from src.indicators.order_block import OrderBlock, OrderBlockState, OrderBlockType
+from src.indicators.zone_index import ZoneIndex
 from src.services.risk.position_sizer import PositionSizer
 
 logger = logging.getLogger(__name__)
@@ -56,6 +57,9 @@ class StopLossCalculator:
         precision: Decimal places for stop loss price
     """
 
+    # Tolerance as a fraction of ATR when an ATR is supplied (clamped to the tolerance range)
+    ATR_TOLERANCE_MULTIPLE = Decimal("0.25")
+
     def __init__(
         self,
         position_sizer: PositionSizer,
@@ -111,13 +115,16 @@ class StopLossCalculator:
         )
 
     def _find_nearest_order_block(
-        self, order_blocks: List[OrderBlock], entry_price: float, position_side: PositionSide
+        self,
+        order_blocks: Union[List[OrderBlock], ZoneIndex],
+        entry_price: float,
+        position_side: PositionSide,
     ) -> Optional[OrderBlock]:
         """
         Find the nearest relevant order block for stop loss placement.
 
         Args:
-            order_blocks: List of detected order blocks
+            order_blocks: List of detected order blocks, or a price index over them
             entry_price: Entry price for the trade
             position_side: LONG or SHORT position
 
@@ -127,6 +134,20 @@ class StopLossCalculator:
         if not order_blocks:
             return None
 
+        if isinstance(order_blocks, ZoneIndex):
+            # Closest active OB below entry for longs, above entry for shorts
+            if position_side == PositionSide.LONG:
+                return order_blocks.nearest_below(
+                    entry_price,
+                    side=OrderBlockType.BULLISH,
+                    predicate=lambda ob: ob.state == OrderBlockState.ACTIVE,
+                )
+            return order_blocks.nearest_above(
+                entry_price,
+                side=OrderBlockType.BEARISH,
+                predicate=lambda ob: ob.state == OrderBlockState.ACTIVE,
+            )
+
         # Filter active order blocks
         active_obs = [ob for ob in order_blocks if ob.state == OrderBlockState.ACTIVE]
 
@@ -164,13 +185,16 @@ class StopLossCalculator:
             return min(relevant_obs, key=lambda ob: ob.low)
 
     def _find_nearest_fvg(
-        self, fvgs: List[FairValueGap], entry_price: float, position_side: PositionSide
+        self,
+        fvgs: Union[List[FairValueGap], ZoneIndex],
+        entry_price: float,
+        position_side: PositionSide,
     ) -> Optional[FairValueGap]:
         """
         Find the nearest relevant FVG for stop loss placement.
 
         Args:
-            fvgs: List of detected FVGs
+            fvgs: List of detected FVGs, or a price index over them
             entry_price: Entry price for the trade
             position_side: LONG or SHORT position
 
@@ -180,6 +204,20 @@ class StopLossCalculator:
         if not fvgs:
             return None
 
+        if isinstance(fvgs, ZoneIndex):
+            # Closest unfilled FVG below entry for longs, above entry for shorts
+            if position_side == PositionSide.LONG:
+                return fvgs.nearest_below(
+                    entry_price,
+                    side=FVGType.BULLISH,
+                    predicate=lambda fvg: fvg.state in (FVGState.ACTIVE, FVGState.PARTIAL),
+                )
+            return fvgs.nearest_above(
+                entry_price,
+                side=FVGType.BEARISH,
+                predicate=lambda fvg: fvg.state in (FVGState.ACTIVE, FVGState.PARTIAL),
+            )
+
         # Filter active FVGs (not filled)
         active_fvgs = [fvg for fvg in fvgs if fvg.state in (FVGState.ACTIVE, FVGState.PARTIAL)]
 
@@ -343,6 +381,26 @@ class StopLossCalculator:
 
         return float(stop_price)
 
+    def tolerance_from_atr(self, atr: float, entry_price: float) -> float:
+        """
+        Derive a tolerance percentage from the current ATR.
+
+        Args:
+            atr: Average True Range (e.g. StreamingPrimitives.atr.value)
+            entry_price: Entry price for the trade
+
+        Returns:
+            ATR_TOLERANCE_MULTIPLE * ATR as a percentage of entry, clamped to
+            [min_tolerance_pct, max_tolerance_pct]; the default tolerance if
+            ATR or entry price is not positive
+        """
+        if atr <= 0 or entry_price <= 0:
+            return float(self.default_tolerance_pct)
+
+        atr_pct = Decimal(str(atr)) / Decimal(str(entry_price)) * Decimal("100")
+        tolerance = atr_pct * self.ATR_TOLERANCE_MULTIPLE
+        return float(min(max(tolerance, self.min_tolerance_pct), self.max_tolerance_pct))
+
     def _validate_stop_distance(
         self, entry_price: float, stop_loss_price: float, position_side: PositionSide
     ) -> bool:
@@ -453,11 +511,12 @@ class StopLossCalculator:
         self,
         entry_price: float,
         position_side: PositionSide,
-        order_blocks: Optional[List[OrderBlock]] = None,
-        fvgs: Optional[List[FairValueGap]] = None,
+        order_blocks: Optional[Union[List[OrderBlock], ZoneIndex]] = None,
+        fvgs: Optional[Union[List[FairValueGap], ZoneIndex]] = None,
         liquidity_levels: Optional[List[LiquidityLevel]] = None,
         strategy: StopLossStrategy = StopLossStrategy.AUTO,
         tolerance_pct: Optional[float] = None,
+        atr: Optional[float] = None,
     ) -> Dict[str, Any]:
         """
         Calculate stop loss level based on structural analysis and tolerance.
@@ -472,11 +531,13 @@ class StopLossCalculator:
         Args:
             entry_price: Entry price for the trade
             position_side: LONG or SHORT position
-            order_blocks: List of detected order blocks (optional)
-            fvgs: List of detected Fair Value Gaps (optional)
+            order_blocks: List of detected order blocks, or their ZoneIndex (optional)
+            fvgs: List of detected Fair Value Gaps, or their ZoneIndex (optional)
             liquidity_levels: List of detected liquidity levels (optional)
             strategy: Stop loss placement strategy (default: AUTO)
             tolerance_pct: Custom tolerance percentage (None = use default)
+            atr: Current ATR; when set and tolerance_pct is None the tolerance
+                scales with volatility (see tolerance_from_atr)
 
         Returns:
             Dictionary containing:
@@ -499,6 +560,9 @@ class StopLossCalculator:
                 f"side={position_side.value}, strategy={strategy.value}"
             )
 
+            if tolerance_pct is None and atr is not None:
+                tolerance_pct = self.tolerance_from_atr(atr, entry_price)
+
             # Find structural level based on strategy
             structural_level = None
             structural_type = None
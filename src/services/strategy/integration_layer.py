@@ -6,8 +6,9 @@ applies filtering, and publishes validated signals through the event system.
 """
 
 import logging
+from datetime import datetime
 from decimal import Decimal
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 import pandas as pd
 
@@ -51,6 +52,7 @@ class StrategyIntegrationLayer:
         enable_strategy_c: bool = True,
         event_bus: Optional[EventBus] = None,
         candle_storage: Optional[CandleStorage] = None,
+        clock: Optional[Callable[[], datetime]] = None,
     ):
         """
         Initialize strategy integration layer.
@@ -62,13 +64,16 @@ class StrategyIntegrationLayer:
             enable_strategy_c: Enable Strategy C (Hybrid)
             event_bus: Main event bus for publishing SIGNAL_GENERATED events
             candle_storage: Candle storage for retrieving historical candles
+            clock: Returns the current naive UTC time; when set, generated signals
+                are stamped with it so duplicate filtering follows replayed time
         """
         # Store dependencies
         self.event_bus = event_bus
         self.candle_storage = candle_storage
+        self.clock = clock
 
         # Initialize signal filter
-        self.signal_filter = SignalFilter(config=filter_config)
+        self.signal_filter = SignalFilter(config=filter_config, clock=clock)
 
         # Initialize strategy generators
         self.strategies: Dict[str, SignalGenerator] = {}
@@ -134,6 +139,9 @@ class StrategyIntegrationLayer:
                     logger.debug(f"No signal from {strategy_name}")
                     continue
 
+                if self.clock is not None:
+                    signal.timestamp = self.clock()
+
                 # Signal generated
                 self.metrics["signals_generated"] += 1
                 self.metrics["strategy_signals"][strategy_name] += 1
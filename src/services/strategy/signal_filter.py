@@ -8,7 +8,7 @@ and cross-strategy similarity to prevent redundant trade entries.
 import logging
 from datetime import datetime, timedelta
 from decimal import Decimal
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from src.services.strategy.signal import Signal
 
@@ -88,6 +88,7 @@ class SignalFilter:
         self,
         config: Optional[FilterConfig] = None,
         active_positions: Optional[List[Dict[str, Any]]] = None,
+        clock: Optional[Callable[[], datetime]] = None,
     ):
         """
         Initialize signal filter.
@@ -95,8 +96,11 @@ class SignalFilter:
         Args:
             config: Filter configuration (creates default if None)
             active_positions: List of active trading positions for conflict detection
+            clock: Returns the current naive UTC time (default: datetime.utcnow);
+                backtests pass a virtual clock
         """
         self.config = config or FilterConfig()
+        self.clock = clock or datetime.utcnow
         self.recent_signals: List[Signal] = []
         self.active_positions = active_positions or []
         self.filtered_count = 0
@@ -266,7 +270,7 @@ class SignalFilter:
         if not self.recent_signals:
             return
 
-        cutoff_time = datetime.utcnow() - self.config.time_window
+        cutoff_time = self.clock() - self.config.time_window
         original_count = len(self.recent_signals)
 
         self.recent_signals = [s for s in self.recent_signals if s.timestamp > cutoff_time]
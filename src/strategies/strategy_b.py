@@ -13,6 +13,7 @@ from datetime import datetime
 from typing import List, Optional
 
 from src.core.constants import PositionSide, TimeFrame
+from src.indicators.primitives import StreamingPrimitives
 from src.strategies.base_strategy import BaseStrategy, TradingSignal
 
 logger = logging.getLogger(__name__)
@@ -79,7 +80,8 @@ class StrategyB(BaseStrategy):
                 - indicators: Multi-timeframe indicator data
                 - current_price: Current market price
                 - symbol: Trading symbol
-                - volatility: Optional volatility metrics
+                - volatility: Optional volatility metrics, as a dict or as the
+                  StreamingPrimitives of the 15m timeframe
 
         Returns:
             TradingSignal if conditions met (LS + FVG alignment), None otherwise
@@ -92,6 +94,8 @@ class StrategyB(BaseStrategy):
             current_price = market_data.get("current_price")
             symbol = market_data.get("symbol", "UNKNOWN")
             volatility_data = market_data.get("volatility", {})
+            if isinstance(volatility_data, StreamingPrimitives):
+                volatility_data = volatility_data.volatility(current_price)
 
             if not current_price or not indicators:
                 logger.debug("Insufficient market data for analysis")
@@ -108,7 +108,7 @@ class TestReadyEndpoint:
         with (
             patch("src.api.server.orchestrator") as mock_orch,
             patch("src.api.server.monitoring_system") as mock_mon,
-            patch("src.database.engine.get_session") as mock_db,
+            patch("src.database.engine.get_read_session") as mock_db,
         ):
             # Mock healthy state
             mock_orch.get_status.return_value = {"state": "running"}
@@ -133,7 +133,7 @@ class TestReadyEndpoint:
         with (
             patch("src.api.server.orchestrator") as mock_orch,
             patch("src.api.server.monitoring_system") as mock_mon,
-            patch("src.database.engine.get_session") as mock_db,
+            patch("src.database.engine.get_read_session") as mock_db,
         ):
             # Mock healthy orchestrator
             mock_orch.get_status.return_value = {"state": "running"}
@@ -166,7 +166,7 @@ class TestReadyEndpoint:
         with (
             patch("src.api.server.orchestrator") as mock_orch,
             patch("src.api.server.monitoring_system") as mock_mon,
-            patch("src.database.engine.get_session") as mock_db,
+            patch("src.database.engine.get_read_session") as mock_db,
         ):
             # Mock degraded state
             mock_orch.get_status.return_value = {"state": "initializing"}
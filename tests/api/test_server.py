@@ -11,7 +11,8 @@ Tests cover:
 """
 
 from datetime import datetime
-from unittest.mock import Mock
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
 from fastapi.testclient import TestClient
@@ -424,6 +425,64 @@ class TestMetricsEndpoints:
         assert response.status_code == 404
 
 
+# ============================================================================
+# Performance Endpoint Tests
+# ============================================================================
+
+
+class TestPerformanceEndpoints:
+    """Test dashboard endpoints backed by read sessions."""
+
+    def test_strategy_pnl_uses_read_session(self, client):
+        """Test strategy P&L is queried on a read session."""
+        session = MagicMock()
+        with (
+            patch("src.database.engine.get_read_session") as mock_read_session,
+            patch("src.database.engine.get_session") as mock_session,
+            patch("src.api.server.TradeDAO") as mock_dao,
+        ):
+            mock_read_session.return_value.__aenter__.return_value = session
+            mock_dao.return_value.calculate_strategy_pnl = AsyncMock(
+                return_value={"total_trades": 3, "total_pnl": Decimal("12.5")}
+            )
+
+            response = client.get("/api/strategies/ICT/pnl")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["strategy"] == "ICT"
+        assert data["stats"]["total_trades"] == 3
+        mock_dao.assert_called_once_with(session)
+        mock_session.assert_not_called()
+
+    def test_pnl_summary_uses_read_session(self, client):
+        """Test the daily P&L summary is queried on a read session."""
+        session = MagicMock()
+        with (
+            patch("src.database.engine.get_read_session") as mock_read_session,
+            patch("src.api.server.DailyPnLDAO") as mock_dao,
+        ):
+            mock_read_session.return_value.__aenter__.return_value = session
+            mock_dao.return_value.get_performance_summary = AsyncMock(
+                return_value={"total_sessions": 7}
+            )
+
+            response = client.get("/api/pnl/summary?days=7")
+
+        assert response.status_code == 200
+        assert response.json()["summary"] == {"total_sessions": 7}
+        mock_dao.return_value.get_performance_summary.assert_awaited_once_with(7)
+
+    def test_performance_endpoints_without_database(self, client):
+        """Test dashboard endpoints report 503 before the database is initialized."""
+        with (
+            patch("src.database.engine._session_factory", None),
+            patch("src.database.engine._read_session_factory", None),
+        ):
+            assert client.get("/api/strategies/ICT/pnl").status_code == 503
+            assert client.get("/api/pnl/summary").status_code == 503
+
+
 # ============================================================================
 # Security & CORS Tests
 # ============================================================================
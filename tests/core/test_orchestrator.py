@@ -78,6 +78,7 @@ class TestOrchestratorInitialization:
             "candle_storage",
             "multi_timeframe_engine",
             "strategy_layer",
+            "account_state",
             "risk_validator",
             "order_executor",
             "position_manager",
@@ -538,3 +539,119 @@ class TestConcurrency:
 
             await orchestrator.stop()
             assert orchestrator.get_system_state() == SystemState.OFFLINE
+
+
+class TestPositionPersistence:
+    """Test position writes through the orchestrator's database session."""
+
+    @pytest.mark.asyncio
+    async def test_position_updates_reach_database(self, mock_config, tmp_path):
+        """Test write-behind position updates are committed on the AsyncSession."""
+        from decimal import Decimal
+
+        from sqlalchemy import select
+
+        from src.core.constants import PositionSide
+        from src.database import engine as db_engine
+        from src.database.models import Position
+
+        await db_engine.init_db(f"sqlite+aiosqlite:///{tmp_path / 'positions.db'}")
+        try:
+            orch = TradingSystemOrchestrator(config=mock_config)
+            await orch._initialize_position_manager()
+            manager = orch.position_manager
+            await manager.start()
+
+            position = await manager.open_position(
+                symbol="BTCUSDT",
+                strategy="test",
+                side=PositionSide.LONG,
+                size=Decimal("0.1"),
+                entry_price=Decimal("100"),
+            )
+            await manager.update_position("BTCUSDT", Decimal("105"))
+            await manager.update_position("ETHUSDT", Decimal("1"))  # no position, ignored
+            await orch._stop_position_manager()
+
+            async with db_engine.get_session() as session:
+                row = await session.get(Position, position.id)
+                assert row.current_price == Decimal("105")
+                assert row.unrealized_pnl == Decimal("0.5")
+
+            await orch._initialize_position_manager()
+            manager = orch.position_manager
+            manager._positions["BTCUSDT"] = position
+            await manager.close_position("BTCUSDT", exit_price=Decimal("110"))
+
+            async with db_engine.get_session() as session:
+                row = (
+                    await session.execute(select(Position).where(Position.id == position.id))
+                ).scalar_one()
+                assert row.status == "CLOSED"
+                assert row.realized_pnl == Decimal("1.0")
+            assert manager.get_stats()["persistence"]["failed_flushes"] == 0
+            await orch._stop_position_manager()
+        finally:
+            await db_engine.close_db()
+
+
+class TestOrderToPositionHandler:
+    """Test fills reach the position manager through the event bus."""
+
+    @pytest.mark.asyncio
+    async def test_executor_fill_updates_position(self):
+        """Test an OrderExecutor fill opens and a reduce-only fill closes the position."""
+        from decimal import Decimal
+
+        from sqlalchemy import create_engine
+        from sqlalchemy.orm import sessionmaker
+
+        from src.core.constants import EventType, OrderSide, PositionSide
+        from src.core.events import EventBus
+        from src.core.orchestrator import OrderToPositionHandler, PipelineMetrics
+        from src.database.models import Base
+        from src.services.exchange.order_executor import OrderExecutor
+        from src.services.position.position_manager import PositionManager
+
+        engine = create_engine("sqlite:///:memory:")
+        Base.metadata.create_all(engine)
+        session = sessionmaker(bind=engine)()
+
+        event_bus = EventBus()
+        manager = PositionManager(db_session=session, event_bus=event_bus)
+        metrics = PipelineMetrics()
+        event_bus.subscribe(EventType.ORDER_FILLED, OrderToPositionHandler(manager, metrics))
+
+        exchange = AsyncMock()
+        exchange.create_order.return_value = {
+            "id": "order-1",
+            "status": "closed",
+            "symbol": "BTCUSDT",
+            "type": "market",
+            "filled": 0.01,
+            "remaining": 0.0,
+            "average": 50000.0,
+            "timestamp": 1234567890000,
+        }
+        executor = OrderExecutor(exchange=exchange, event_bus=event_bus, retry_delay=0.01)
+
+        await event_bus.start()
+        try:
+            await executor.execute_market_order("BTCUSDT", OrderSide.BUY, 0.01)
+            assert await event_bus.wait_empty(timeout=1.0)
+
+            position = manager.get_position("BTCUSDT")
+            assert position.side == PositionSide.LONG
+            assert position.size == Decimal("0.01")
+            assert position.entry_price == Decimal("50000.0")
+
+            exchange.create_order.return_value["average"] = 51000.0
+            await executor.execute_market_order("BTCUSDT", OrderSide.SELL, 0.01, reduce_only=True)
+            assert await event_bus.wait_empty(timeout=1.0)
+
+            assert manager.get_position("BTCUSDT") is None
+            assert manager.get_stats()["total_closed"] == 1
+            assert metrics.errors == 0
+        finally:
+            await event_bus.stop()
+            session.close()
@@ -10,6 +10,7 @@ from decimal import Decimal
 import pytest
 
 from src.core.constants import TimeFrame
+from src.database.dao import DailyPnLDAO
 
 
 @pytest.mark.asyncio
@@ -256,3 +257,73 @@ class TestBaseDAO:
         trades = await trade_dao.bulk_create(items)
         assert len(trades) == 5
         assert all(t.id is not None for t in trades)
+
+    async def test_bulk_insert_chunks_and_returns_rows(self, session, trade_dao):
+        """Test bulk insert spans several chunks and returns rows with generated ids."""
+        items = [
+            {
+                "symbol": "BTCUSDT",
+                "strategy": "MACD",
+                "timeframe": TimeFrame.H1,
+                "entry_time": datetime(2024, 1, 1, i),
+                "entry_price": Decimal("50000.00") + i,
+                "quantity": Decimal("0.1"),
+                "side": "LONG",
+            }
+            for i in range(7)
+        ]
+
+        trades = await trade_dao.bulk_insert(items, chunk_size=3)
+
+        assert [t.entry_price for t in trades] == [item["entry_price"] for item in items]
+        assert len({t.id for t in trades}) == 7
+        assert all(t.status == "OPEN" and t.leverage == 1 for t in trades)
+
+        count = await trade_dao.bulk_insert(items, chunk_size=3, returning=False)
+        assert count == 7
+        assert await trade_dao.count() == 14
+
+        with pytest.raises(ValueError):
+            await trade_dao.bulk_insert(items, chunk_size=0)
+
+    async def test_bulk_upsert_updates_on_conflict(self, session):
+        """Test bulk upsert inserts new records and updates existing ones by key."""
+        dao = DailyPnLDAO(session)
+        start = datetime(2024, 1, 1)
+        await dao.create_session("2024-01-01", Decimal("1000"), start)
+
+        sessions = await dao.upsert_sessions(
+            [
+                {
+                    "date": f"2024-01-0{day}",
+                    "starting_balance": Decimal("1000"),
+                    "session_start": start,
+                    "total_pnl": Decimal(day * 10),
+                }
+                for day in (1, 2)
+            ]
+        )
+
+        assert [s.total_pnl for s in sessions] == [Decimal("10"), Decimal("20")]
+        assert await dao.count() == 2
+        existing = await dao.get_session_by_date("2024-01-01")
+        assert existing.total_pnl == Decimal("10")
+        assert existing.id == sessions[0].id
+
+    async def test_bulk_upsert_rejects_rows_with_different_columns(self, session):
+        """Test inferred update columns require every row to give the same columns."""
+        dao = DailyPnLDAO(session)
+        start = datetime(2024, 1, 1)
+        rows = [
+            {"date": "2024-01-01", "starting_balance": Decimal("1000"), "session_start": start},
+            {
+                "date": "2024-01-02",
+                "starting_balance": Decimal("1000"),
+                "session_start": start,
+                "total_pnl": Decimal("20"),
+            },
+        ]
+
+        with pytest.raises(ValueError):
+            await dao.bulk_upsert(rows, conflict_columns=["date"])
+        assert await dao.count() == 0
@@ -0,0 +1,169 @@
+"""
+Tests for database engine setup and the SQLite performance profile.
+"""
+
+import asyncio
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from src.core.constants import TimeFrame
+from src.database import engine as db_engine
+from src.database.dao import TradeDAO
+from src.database.engine import SQLiteProfile, resolve_sqlite_profile
+
+
+@pytest.fixture
+def db_file_url(tmp_path) -> str:
+    """Get URL of a temporary SQLite database file."""
+    return f"sqlite+aiosqlite:///{tmp_path / 'test.db'}"
+
+
+async def pragma(session, name: str):
+    return (await session.execute(text(f"PRAGMA {name}"))).scalar()
+
+
+def closed_trade(pnl: str) -> dict:
+    now = datetime.now(timezone.utc)
+    return {
+        "symbol": "BTCUSDT",
+        "strategy": "ICT",
+        "timeframe": TimeFrame.M15,
+        "entry_time": now,
+        "entry_price": Decimal("100"),
+        "exit_time": now,
+        "exit_price": Decimal("100") + Decimal(pnl),
+        "quantity": Decimal("1"),
+        "leverage": 1,
+        "side": "LONG",
+        "pnl": Decimal(pnl),
+        "fees": Decimal("0"),
+        "status": "CLOSED",
+    }
+
+
+class TestResolveSQLiteProfile:
+    """Test profile selection."""
+
+    def test_named_profiles(self):
+        """Test profile names resolve and custom profiles pass through."""
+        custom = SQLiteProfile(read_pool_size=2)
+
+        assert resolve_sqlite_profile("default") is None
+        assert resolve_sqlite_profile("performance") == SQLiteProfile()
+        assert resolve_sqlite_profile(custom) is custom
+
+    def test_unknown_profile(self):
+        """Test unknown profile names are rejected."""
+        with pytest.raises(ValueError, match="Unknown SQLite profile"):
+            resolve_sqlite_profile("turbo")
+
+    def test_reader_pragmas_are_query_only(self):
+        """Test readers are query-only and leave the journal mode to the writer."""
+        reader = SQLiteProfile().pragmas(read_only=True)
+        writer = SQLiteProfile().pragmas()
+
+        assert "PRAGMA query_only=ON" in reader
+        assert writer[0] == "PRAGMA journal_mode=WAL"
+        assert not any("journal_mode" in pragma for pragma in reader)
+
+
+class TestPerformanceProfile:
+    """Test the single-writer / read-pool setup."""
+
+    @pytest.mark.asyncio
+    async def test_writer_pragmas_and_single_connection(self, db_file_url):
+        """Test the writer runs in WAL mode on one pooled connection."""
+        await db_engine.init_db(db_file_url, sqlite_profile="performance")
+        try:
+            async with db_engine.get_session() as session:
+                assert await pragma(session, "journal_mode") == "wal"
+                assert await pragma(session, "synchronous") == 1  # NORMAL
+                assert await pragma(session, "cache_size") == -64 * 1024
+                assert await pragma(session, "query_only") == 0
+
+            pool = db_engine.get_engine().pool
+            assert pool.size() == 1
+            assert pool._max_overflow == 0
+        finally:
+            await db_engine.close_db()
+
+    @pytest.mark.asyncio
+    async def test_read_session_is_read_only(self, db_file_url):
+        """Test read sessions see committed writes but cannot write."""
+        await db_engine.init_db(db_file_url, sqlite_profile=SQLiteProfile(read_pool_size=2))
+        try:
+            async with db_engine.get_session() as session:
+                await session.execute(text("CREATE TABLE t (x INTEGER)"))
+                await session.execute(text("INSERT INTO t VALUES (1)"))
+
+            async with db_engine.get_read_session() as session:
+                assert (await session.execute(text("SELECT x FROM t"))).scalar() == 1
+                assert await pragma(session, "query_only") == 1
+                with pytest.raises(OperationalError, match="readonly"):
+                    await session.execute(text("INSERT INTO t VALUES (2)"))
+
+            assert db_engine._read_engine.pool.size() == 2
+        finally:
+            await db_engine.close_db()
+
+        assert db_engine._read_engine is None
+
+    @pytest.mark.asyncio
+    async def test_reads_do_not_wait_for_writer(self, db_file_url):
+        """Test dashboard reads run while the single writer connection is held."""
+        await db_engine.init_db(db_file_url, sqlite_profile="performance")
+
+        async def strategy_trades(session_factory) -> int:
+            async with session_factory() as session:
+                stats = await TradeDAO(session).calculate_strategy_pnl("ICT")
+                return stats["total_trades"]
+
+        try:
+            async with db_engine.get_session() as session:
+                await TradeDAO(session).import_trades([closed_trade("10")])
+
+            # Hold the writer connection inside an uncommitted write transaction
+            async with db_engine.get_session() as writer:
+                await TradeDAO(writer).import_trades([closed_trade("-5")])
+
+                reads = await asyncio.wait_for(
+                    asyncio.gather(
+                        *(strategy_trades(db_engine.get_read_session) for _ in range(4))
+                    ),
+                    timeout=5,
+                )
+                assert reads == [1, 1, 1, 1]
+
+                # A read on the writer engine queues behind the open transaction
+                with pytest.raises(asyncio.TimeoutError):
+                    await asyncio.wait_for(strategy_trades(db_engine.get_session), timeout=0.5)
+
+            assert await strategy_trades(db_engine.get_read_session) == 2
+        finally:
+            await db_engine.close_db()
+
+    @pytest.mark.asyncio
+    async def test_default_profile_reads_on_writer(self, db_file_url):
+        """Test without the profile read sessions use the regular engine."""
+        await db_engine.init_db(db_file_url, sqlite_profile="default")
+        try:
+            assert db_engine._read_engine is None
+            async with db_engine.get_read_session() as session:
+                assert session.bind is db_engine.get_engine()
+                assert await pragma(session, "journal_mode") == "delete"
+        finally:
+            await db_engine.close_db()
+
+    @pytest.mark.asyncio
+    async def test_in_memory_database_ignores_profile(self):
+        """Test in-memory SQLite keeps the default setup."""
+        await db_engine.init_db("sqlite+aiosqlite:///:memory:", sqlite_profile="performance")
+        try:
+            assert db_engine._read_engine is None
+            assert await db_engine.health_check()
+        finally:
+            await db_engine.close_db()
@@ -127,6 +127,16 @@ class TestPositionDAO:
         assert updated.unrealized_pnl == Decimal("200.00")
         assert updated.unrealized_pnl_percent == 4.0
 
+    async def test_update_unrealized_pnl_not_open(self, session, position_dao, sample_position):
+        """Test closed or missing positions are not updated."""
+        await position_dao.close_position(sample_position.id, datetime.utcnow(), Decimal("5"))
+
+        unchanged = await position_dao.update_unrealized_pnl(sample_position.id, Decimal("1"))
+
+        assert unchanged.status == "CLOSED"
+        assert unchanged.current_price is None
+        assert await position_dao.update_unrealized_pnl(999, Decimal("1")) is None
+
     async def test_close_position(self, session, position_dao, sample_position):
         """Test closing a position."""
         closed_at = datetime.utcnow()
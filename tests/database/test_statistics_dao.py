@@ -9,6 +9,8 @@ from decimal import Decimal
 
 import pytest
 
+from src.core.constants import TimeFrame
+
 
 @pytest.mark.asyncio
 class TestStatisticsDAO:
@@ -163,3 +165,113 @@ class TestStatisticsDAO:
         assert trend["pnl_trend"] in ["improving", "declining", "stable"]
         assert trend["win_rate_trend"] in ["improving", "declining", "stable"]
         assert trend["total_pnl"] > 0
+        assert trend["pnl_trend"] == "improving"
+        assert trend["win_rate_trend"] == "improving"
+        assert trend["total_pnl"] == Decimal("10000")
+        assert trend["periods"][0]["pnl"] == Decimal("500")
+
+    async def test_get_strategy_comparison_aggregates(self, session, statistics_dao):
+        """Test comparison totals are aggregated per strategy and missing ones are None."""
+        start = datetime(2024, 1, 10)
+        for i, (pnl, sharpe) in enumerate([(Decimal("100"), 1.5), (Decimal("300"), 0.0)]):
+            await statistics_dao.create(
+                strategy="MACD",
+                period_type="DAILY",
+                period_start=start - timedelta(days=i),
+                period_end=start - timedelta(days=i) + timedelta(hours=23),
+                total_trades=4,
+                winning_trades=3,
+                losing_trades=1,
+                total_pnl=pnl,
+                sharpe_ratio=sharpe,
+            )
+
+        comparison = await statistics_dao.get_strategy_comparison(["MACD", "RSI"])
+
+        assert comparison["RSI"] is None
+        assert comparison["MACD"]["total_trades"] == 8
+        assert comparison["MACD"]["win_rate"] == 75.0
+        assert comparison["MACD"]["total_pnl"] == Decimal("400")
+        assert comparison["MACD"]["avg_pnl_per_period"] == Decimal("200")
+        assert comparison["MACD"]["best_sharpe"] == 1.5
+
+    async def test_calculate_daily_stats(self, session, statistics_dao, trade_dao):
+        """Test closed trades of the day are rolled up into an upserted statistics row."""
+        day = datetime(2024, 3, 5)
+        pnls = ["100", "50", "-30", "-20", "-10", "80"]
+        for i, pnl in enumerate(pnls):
+            await trade_dao.create(
+                symbol="BTCUSDT",
+                strategy="MACD",
+                timeframe=TimeFrame.H1,
+                entry_time=day + timedelta(hours=i),
+                entry_price=Decimal("100"),
+                exit_time=day + timedelta(hours=i, minutes=30),
+                exit_price=Decimal("110"),
+                quantity=Decimal("2"),
+                side="LONG",
+                status="CLOSED",
+                pnl=Decimal(pnl),
+                fees=Decimal("1"),
+            )
+        # Other days, strategies and open trades are excluded
+        for strategy, exit_time, status in [
+            ("MACD", day - timedelta(minutes=1), "CLOSED"),
+            ("RSI", day + timedelta(hours=1), "CLOSED"),
+            ("MACD", None, "OPEN"),
+        ]:
+            await trade_dao.create(
+                symbol="BTCUSDT",
+                strategy=strategy,
+                timeframe=TimeFrame.H1,
+                entry_time=day,
+                entry_price=Decimal("100"),
+                exit_time=exit_time,
+                quantity=Decimal("1"),
+                side="LONG",
+                status=status,
+                pnl=Decimal("999") if exit_time else None,
+            )
+
+        stats = await statistics_dao.calculate_daily_stats("MACD", day + timedelta(hours=12))
+
+        assert stats["period_start"] == day
+        assert stats["total_trades"] == 6
+        assert (stats["winning_trades"], stats["losing_trades"]) == (3, 3)
+        assert stats["win_rate"] == 50.0
+        assert stats["total_pnl"] == Decimal("170")
+        assert (stats["gross_profit"], stats["gross_loss"]) == (Decimal("230"), Decimal("-60"))
+        assert stats["profit_factor"] == pytest.approx(230 / 60)
+        assert (stats["largest_win"], stats["largest_loss"]) == (Decimal("100"), Decimal("-30"))
+        assert (stats["max_consecutive_wins"], stats["max_consecutive_losses"]) == (2, 3)
+        assert stats["total_fees"] == Decimal("6")
+        assert stats["total_volume"] == Decimal("1320")
+
+        # Recalculating updates the existing row
+        await trade_dao.create(
+            symbol="BTCUSDT",
+            strategy="MACD",
+            timeframe=TimeFrame.H1,
+            entry_time=day + timedelta(hours=20),
+            entry_price=Decimal("100"),
+            exit_time=day + timedelta(hours=21),
+            exit_price=Decimal("90"),
+            quantity=Decimal("1"),
+            side="LONG",
+            status="CLOSED",
+            pnl=Decimal("-10"),
+        )
+        updated = await statistics_dao.calculate_daily_stats("MACD", day)
+
+        assert updated["id"] == stats["id"]
+        assert updated["total_trades"] == 7
+        assert updated["total_pnl"] == Decimal("160")
+        assert len(await statistics_dao.get_daily_stats("MACD", day, day)) == 1
+
+    async def test_calculate_daily_stats_without_trades(self, session, statistics_dao):
+        """Test a day without trades records zero totals."""
+        stats = await statistics_dao.calculate_daily_stats("MACD", datetime(2024, 3, 5))
+
+        assert stats["total_trades"] == 0
+        assert stats["total_pnl"] == Decimal("0")
+        assert stats["win_rate"] is None
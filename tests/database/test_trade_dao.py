@@ -167,6 +167,9 @@ class TestTradeDAO:
         assert stats["win_rate"] == 60.0
         assert stats["total_pnl"] == Decimal("1100.00")  # 3*500 + 2*(-200)
         assert stats["total_fees"] == Decimal("50.00")  # 5*10
+        assert stats["avg_win"] == Decimal("500.00")
+        assert stats["avg_loss"] == Decimal("-200.00")
+        assert stats["avg_pnl"] == Decimal("220.00")
 
     async def test_calculate_strategy_pnl_empty(self, session, trade_dao):
         """Test calculating P&L for strategy with no trades."""
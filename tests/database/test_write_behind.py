@@ -0,0 +1,239 @@
+"""
+Unit tests for the write-behind persistence queue.
+"""
+
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.core.constants import TimeFrame
+from src.database.models import Base, Position
+from src.database.write_behind import WriteBehindQueue
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def sync_session():
+    """In-memory SQLite session counting UPDATE statements."""
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    session.updates = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def count_updates(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("UPDATE"):
+            session.updates.append(statement)
+
+    for i in range(3):
+        session.add(
+            Position(
+                symbol=f"SYM{i}",
+                strategy="test",
+                timeframe=TimeFrame.H1,
+                side="LONG",
+                size=Decimal("1"),
+                entry_price=Decimal("100"),
+                opened_at=datetime(2024, 1, 1, i),
+            )
+        )
+    session.commit()
+    yield session
+    session.close()
+
+
+def price_of(session, position_id: int) -> Decimal:
+    session.expire_all()
+    return session.get(Position, position_id).current_price
+
+
+class TestWriteBehindQueue:
+    """Test coalescing, thresholds and durability."""
+
+    @pytest.mark.asyncio
+    async def test_write_through_by_default(self, sync_session):
+        """Test every update is committed immediately without an interval."""
+        queue = WriteBehindQueue(sync_session)
+        await queue.stage(Position, 1, {"current_price": Decimal("101")})
+
+        assert queue.depth == 0
+        assert price_of(sync_session, 1) == Decimal("101")
+
+    @pytest.mark.asyncio
+    async def test_updates_are_coalesced_until_interval(self, sync_session):
+        """Test repeated updates of a row are merged and written in one flush."""
+        clock = FakeClock()
+        queue = WriteBehindQueue(sync_session, flush_interval=1.0, clock=clock)
+
+        for tick in range(5):
+            for row_id in (1, 2):
+                await queue.stage(Position, row_id, {"current_price": Decimal(100 + tick)})
+        await queue.stage(Position, 1, {"unrealized_pnl": Decimal("4")})
+
+        assert queue.depth == 2
+        assert sync_session.updates == []
+        assert price_of(sync_session, 1) is None
+
+        clock.now = 1.0
+        await queue.stage(Position, 3, {"current_price": Decimal("99")})
+
+        assert queue.depth == 0
+        assert price_of(sync_session, 1) == Decimal("104")
+        assert price_of(sync_session, 3) == Decimal("99")
+        assert sync_session.get(Position, 1).unrealized_pnl == Decimal("4")
+
+        stats = queue.get_stats()
+        assert (stats["staged"], stats["coalesced"], stats["rows_written"]) == (12, 9, 3)
+        assert stats["flushes"] == 1
+        assert stats["last_flush_ms"] > 0
+
+    @pytest.mark.asyncio
+    async def test_size_threshold_and_durable_flush(self, sync_session):
+        """Test max_pending and durable updates flush without waiting for the interval."""
+        queue = WriteBehindQueue(
+            sync_session, flush_interval=60.0, max_pending=2, clock=FakeClock()
+        )
+        await queue.stage(Position, 1, {"current_price": Decimal("101")})
+        await queue.stage(Position, 2, {"current_price": Decimal("102")})
+        assert queue.depth == 0
+
+        await queue.stage(Position, 1, {"current_price": Decimal("103")})
+        await queue.stage(Position, 3, {"status": "CLOSED"}, durable=True)
+
+        assert queue.depth == 0
+        assert price_of(sync_session, 1) == Decimal("103")
+        assert sync_session.get(Position, 3).status == "CLOSED"
+
+    @pytest.mark.asyncio
+    async def test_batch_defers_flush(self, sync_session):
+        """Test updates inside a batch are written together when it ends."""
+        queue = WriteBehindQueue(sync_session)
+        async with queue.batch():
+            for row_id in (1, 2, 3):
+                await queue.stage(Position, row_id, {"current_price": Decimal("110")})
+            assert queue.depth == 3
+
+        assert queue.depth == 0
+        assert queue.stats.flushes == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_keeps_updates(self, sync_session):
+        """Test a failing flush rolls back and keeps the updates pending."""
+        queue = WriteBehindQueue(sync_session, flush_interval=60.0, clock=FakeClock())
+        await queue.stage(Position, 1, {"size": Decimal("-1")})  # violates check constraint
+
+        with pytest.raises(Exception):
+            await queue.flush()
+
+        assert queue.depth == 1
+        assert queue.stats.failed_flushes == 1
+
+    @pytest.mark.asyncio
+    async def test_deleted_row_is_dropped(self, sync_session):
+        """Test an update of a deleted row doesn't block the other updates."""
+        queue = WriteBehindQueue(sync_session, flush_interval=60.0, clock=FakeClock())
+        await queue.stage(Position, 1, {"current_price": Decimal("101")})
+        await queue.stage(Position, 2, {"current_price": Decimal("102")})
+        sync_session.delete(sync_session.get(Position, 2))
+        sync_session.commit()
+
+        assert await queue.flush() == 1
+        assert queue.depth == 0
+        assert queue.stats.dropped == 1
+        assert price_of(sync_session, 1) == Decimal("101")
+
+        await queue.stage(Position, 1, {"current_price": Decimal("103")})
+        assert await queue.flush() == 1
+        assert queue.stats.failed_flushes == 0
+
+    def test_invalid_configuration(self, sync_session):
+        """Test invalid thresholds are rejected."""
+        with pytest.raises(ValueError):
+            WriteBehindQueue(sync_session, flush_interval=-1)
+        with pytest.raises(ValueError):
+            WriteBehindQueue(sync_session, max_pending=0)
+
+
+class TestWriteBehindQueueAsyncSession:
+    """Test the queue on an AsyncSession."""
+
+    @pytest.fixture
+    async def session_factory(self, tmp_path):
+        """Async session factory of a temporary database with one position."""
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'positions.db'}")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        factory = async_sessionmaker(engine, expire_on_commit=False)
+        async with factory() as session:
+            session.add(
+                Position(
+                    symbol="SYM0",
+                    strategy="test",
+                    timeframe=TimeFrame.H1,
+                    side="LONG",
+                    size=Decimal("1"),
+                    entry_price=Decimal("100"),
+                    opened_at=datetime(2024, 1, 1),
+                )
+            )
+            await session.commit()
+        yield factory
+        await engine.dispose()
+
+    async def read_position(self, factory, position_id: int) -> Position:
+        async with factory() as session:
+            return await session.get(Position, position_id)
+
+    @pytest.mark.asyncio
+    async def test_updates_are_committed(self, session_factory):
+        """Test staged and durable updates are written, as read by another session."""
+        async with session_factory() as session:
+            queue = WriteBehindQueue(session, flush_interval=60.0, clock=FakeClock())
+            await queue.stage(Position, 1, {"current_price": Decimal("101")})
+            assert (await self.read_position(session_factory, 1)).current_price is None
+
+            await queue.stage(Position, 1, {"status": "CLOSED"}, durable=True)
+
+        row = await self.read_position(session_factory, 1)
+        assert (row.current_price, row.status) == (Decimal("101"), "CLOSED")
+        assert queue.stats.rows_written == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_rolls_back(self, session_factory):
+        """Test a failing flush keeps the updates and leaves the session usable."""
+        async with session_factory() as session:
+            queue = WriteBehindQueue(session, flush_interval=60.0, clock=FakeClock())
+            await queue.stage(Position, 1, {"size": Decimal("-1")})
+
+            with pytest.raises(SQLAlchemyError):
+                await queue.flush()
+            assert (queue.depth, queue.stats.rows_written) == (1, 0)
+
+            await queue.stage(Position, 1, {"size": Decimal("2")}, durable=True)
+
+        assert (await self.read_position(session_factory, 1)).size == Decimal("2")
+
+    @pytest.mark.asyncio
+    async def test_deleted_row_is_dropped(self, session_factory):
+        """Test updates of deleted rows are dropped on an AsyncSession too."""
+        async with session_factory() as session:
+            queue = WriteBehindQueue(session, flush_interval=60.0, clock=FakeClock())
+            await queue.stage(Position, 1, {"current_price": Decimal("101")})
+            await queue.stage(Position, 2, {"current_price": Decimal("102")})
+
+            assert await queue.flush() == 1
+            assert queue.stats.dropped == 1
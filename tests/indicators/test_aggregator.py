@@ -0,0 +1,143 @@
+"""
+Tests for streaming higher-timeframe candle aggregation.
+"""
+
+import pytest
+
+from src.core.constants import TimeFrame
+from src.indicators.aggregator import CandleAggregator
+from src.indicators.multi_timeframe_engine import MultiTimeframeIndicatorEngine
+from src.models.candle import Candle
+
+BASE_TS = 1704067200000  # 2024-01-01 00:00 UTC
+MINUTE = 60000
+
+
+def make_candle(i: int, is_closed: bool = True, timeframe: TimeFrame = TimeFrame.M1) -> Candle:
+    """Create a ramp 1m candle at minute i."""
+    close = 100.0 + i
+    return Candle(
+        symbol="BTCUSDT",
+        timeframe=timeframe,
+        timestamp=BASE_TS + i * MINUTE,
+        open=close - 0.5,
+        high=close + 1.0,
+        low=close - 1.0,
+        close=close,
+        volume=10.0,
+        is_closed=is_closed,
+    )
+
+
+class TestCandleAggregator:
+    """Test running OHLCV accumulators."""
+
+    def test_chain_from_single_stream(self):
+        """Test one 1m stream closes 5m, 15m and 1h bars at their boundaries."""
+        aggregator = CandleAggregator(TimeFrame.M1, [TimeFrame.H1, TimeFrame.M5, TimeFrame.M15])
+        completed = []
+        for i in range(60):
+            completed.extend(aggregator.update(make_candle(i)))
+
+        counts = {
+            tf: sum(c.timeframe == tf for c in completed) for tf in aggregator.target_timeframes
+        }
+        assert counts == {TimeFrame.M5: 12, TimeFrame.M15: 4, TimeFrame.H1: 1}
+
+        hour = completed[-1]
+        assert hour.timeframe == TimeFrame.H1 and hour.is_closed
+        assert (hour.timestamp, hour.open, hour.close) == (BASE_TS, 99.5, 159.0)
+        assert (hour.high, hour.low, hour.volume) == (160.0, 99.0, 600.0)
+
+    def test_gap_closes_period_late(self):
+        """Test a period missing its last candles is closed by the next period's first candle."""
+        aggregator = CandleAggregator(TimeFrame.M1, [TimeFrame.M5])
+        for i in range(3):
+            assert aggregator.update(make_candle(i)) == []
+
+        (bar,) = aggregator.update(make_candle(7))
+        assert (bar.timestamp, bar.close, bar.volume) == (BASE_TS, 102.0, 30.0)
+        assert aggregator.forming_bar(TimeFrame.M5).timestamp == BASE_TS + 5 * MINUTE
+
+    def test_duplicates_and_late_candles_are_ignored(self):
+        """Test repeated or late base candles do not change or reopen bars."""
+        aggregator = CandleAggregator(TimeFrame.M1, [TimeFrame.M5])
+        for i in range(5):
+            aggregator.update(make_candle(i))
+        aggregator.update(make_candle(5))
+        aggregator.update(make_candle(5))
+
+        assert aggregator.update(make_candle(2)) == []
+        assert aggregator.forming_bar(TimeFrame.M5).volume == 10.0
+
+    def test_forming_bar_includes_live_candle(self):
+        """Test the forming bar covers closed candles plus the in-progress one."""
+        aggregator = CandleAggregator(TimeFrame.M1, [TimeFrame.M15])
+        assert aggregator.forming_bar(TimeFrame.M15) is None
+
+        aggregator.update(make_candle(0))
+        aggregator.update(make_candle(1, is_closed=False))
+        forming = aggregator.forming_bar(TimeFrame.M15)
+
+        assert not forming.is_closed
+        assert (forming.open, forming.close, forming.volume) == (99.5, 101.0, 20.0)
+
+        aggregator.update(make_candle(1))
+        assert aggregator.forming_bar(TimeFrame.M15).volume == 20.0
+
+    def test_reset_target_drops_only_its_forming_bar(self):
+        """Test resetting one target leaves the other targets' bars intact."""
+        aggregator = CandleAggregator(TimeFrame.M1, [TimeFrame.M5, TimeFrame.M15])
+        for i in range(7):
+            aggregator.update(make_candle(i))
+
+        aggregator.reset_target(TimeFrame.M15)
+
+        assert aggregator.forming_bar(TimeFrame.M15) is None
+        assert aggregator.forming_bar(TimeFrame.M5).volume == 20.0
+        aggregator.update(make_candle(7))
+        forming = aggregator.forming_bar(TimeFrame.M15)
+        assert (forming.timestamp, forming.open, forming.volume) == (BASE_TS, 106.5, 10.0)
+
+    def test_invalid_configuration(self):
+        """Test targets must be larger multiples of the base and inputs match the base."""
+        with pytest.raises(ValueError):
+            CandleAggregator(TimeFrame.M15, [TimeFrame.M5])
+        aggregator = CandleAggregator(TimeFrame.M1, [TimeFrame.M5])
+        with pytest.raises(ValueError):
+            aggregator.update(make_candle(0, timeframe=TimeFrame.M5))
+
+
+class TestEngineAggregation:
+    """Test engine integration."""
+
+    def test_engine_builds_all_timeframes_from_1m(self):
+        """Test an engine fed only 1m candles fills every higher timeframe."""
+        timeframes = [TimeFrame.M1, TimeFrame.M5, TimeFrame.M15, TimeFrame.H1]
+        engine = MultiTimeframeIndicatorEngine(timeframes=timeframes)
+        for i in range(61):
+            engine.add_candle(make_candle(i))
+
+        counts = [len(engine.timeframe_data[tf].candles) for tf in timeframes]
+        assert counts == [61, 12, 4, 1]
+
+        forming = engine.get_forming_candle(TimeFrame.H1)
+        assert (forming.timestamp, forming.volume, forming.is_closed) == (
+            BASE_TS + 60 * MINUTE,
+            10.0,
+            False,
+        )
+
+    def test_clear_higher_timeframe_drops_forming_bar(self):
+        """Test clearing an aggregated timeframe resets its forming bar in the base aggregator."""
+        engine = MultiTimeframeIndicatorEngine(timeframes=[TimeFrame.M1, TimeFrame.H1])
+        for i in range(70):
+            engine.add_candle(make_candle(i))
+        assert engine.get_forming_candle(TimeFrame.H1).volume == 100.0
+
+        engine.clear_timeframe(TimeFrame.H1)
+
+        assert engine.get_forming_candle(TimeFrame.H1) is None
+        engine.add_candle(make_candle(70))
+        forming = engine.get_forming_candle(TimeFrame.H1)
+        assert (forming.timestamp, forming.volume) == (BASE_TS + 60 * MINUTE, 10.0)
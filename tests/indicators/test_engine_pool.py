@@ -0,0 +1,205 @@
+"""
+Tests for the symbol-sharded IndicatorEnginePool.
+"""
+
+import multiprocessing
+import random
+from typing import List
+
+import pytest
+
+from src.core.constants import TimeFrame
+from src.indicators.engine_pool import IndicatorDelta, IndicatorEnginePool
+from src.indicators.multi_timeframe_engine import IndicatorType, MultiTimeframeIndicatorEngine
+from src.models.candle import Candle
+
+ENGINE_CONFIG = {"timeframes": [TimeFrame.M1], "incremental": True}
+
+
+def generate_candles(symbol: str, count: int, seed: int) -> List[Candle]:
+    """Generate a reproducible random walk with occasional large moves."""
+    rnd = random.Random(seed)
+    price = 100.0
+    candles = []
+    for i in range(count):
+        open_price = price
+        step = rnd.gauss(0, 1.0) * (4 if rnd.random() < 0.1 else 1)
+        close = max(1.0, open_price + step)
+        candles.append(
+            Candle(
+                symbol=symbol,
+                timeframe=TimeFrame.M1,
+                timestamp=1704067200000 + i * 60000,
+                open=open_price,
+                high=max(open_price, close) + abs(rnd.gauss(0, 0.4)),
+                low=max(0.5, min(open_price, close) - abs(rnd.gauss(0, 0.4))),
+                close=close,
+                volume=rnd.uniform(50, 150),
+                is_closed=True,
+            )
+        )
+        price = close
+    return candles
+
+
+def reference_deltas(candles: List[Candle]) -> List[tuple]:
+    """Detections of a standalone engine fed the same candles."""
+    engine = MultiTimeframeIndicatorEngine(**ENGINE_CONFIG)
+    found = []
+    for indicator_type in (IndicatorType.ORDER_BLOCK, IndicatorType.FAIR_VALUE_GAP):
+        engine.register_callback(
+            indicator_type,
+            lambda tf, ind, t=indicator_type: found.append((t, ind.to_dict())),
+        )
+    for candle in candles:
+        engine.add_candle(candle)
+    return found
+
+
+def interleave(*series: List[Candle]) -> List[Candle]:
+    return [candle for group in zip(*series) for candle in group]
+
+
+class TestEngineSymbolBinding:
+    """Test engines bound to a symbol."""
+
+    def test_rejects_other_symbols(self):
+        """Test a bound engine refuses candles of another symbol."""
+        engine = MultiTimeframeIndicatorEngine(symbol="BTCUSDT", **ENGINE_CONFIG)
+        engine.add_candle(generate_candles("BTCUSDT", 1, seed=1)[0])
+
+        with pytest.raises(ValueError, match="bound to BTCUSDT"):
+            engine.add_candle(generate_candles("ETHUSDT", 1, seed=1)[0])
+
+
+class TestInProcessPool:
+    """Test pools running engines in the calling process."""
+
+    def test_invalid_workers(self):
+        """Test negative worker counts are rejected."""
+        with pytest.raises(ValueError, match="workers must be non-negative"):
+            IndicatorEnginePool(workers=-1)
+
+    def test_symbols_get_separate_engines(self):
+        """Test each symbol's candles go to its own engine."""
+        pool = IndicatorEnginePool(engine_config=ENGINE_CONFIG)
+        btc = generate_candles("BTCUSDT", 40, seed=1)
+        eth = generate_candles("ETHUSDT", 25, seed=2)
+
+        pool.add_candles(interleave(btc, eth) + btc[25:])
+
+        assert pool.symbols == ["BTCUSDT", "ETHUSDT"]
+        btc_engine = pool.get_engine("BTCUSDT")
+        eth_engine = pool.get_engine("ETHUSDT")
+        assert btc_engine is not eth_engine
+        assert len(btc_engine.timeframe_data[TimeFrame.M1].candles) == 40
+        assert len(eth_engine.timeframe_data[TimeFrame.M1].candles) == 25
+        assert pool.get_engine("XRPUSDT") is None
+
+    def test_deltas_match_standalone_engine(self):
+        """Test collected deltas equal a standalone engine's detections."""
+        pool = IndicatorEnginePool(engine_config=ENGINE_CONFIG)
+        received: List[IndicatorDelta] = []
+        pool.register_callback(IndicatorType.ORDER_BLOCK, received.append)
+        candles = generate_candles("BTCUSDT", 150, seed=3)
+
+        pool.add_candles(candles)
+        deltas = pool.collect()
+
+        expected = reference_deltas(candles)
+        assert expected
+        assert [
+            (d.indicator_type, d.payload)
+            for d in deltas
+            if d.indicator_type in (IndicatorType.ORDER_BLOCK, IndicatorType.FAIR_VALUE_GAP)
+        ] == expected
+        assert all(d.symbol == "BTCUSDT" and d.timeframe == TimeFrame.M1 for d in deltas)
+        assert received == [d for d in deltas if d.indicator_type == IndicatorType.ORDER_BLOCK]
+        assert pool.collect() == []
+
+    def test_shard_stats(self):
+        """Test in-process pools report a single shard."""
+        pool = IndicatorEnginePool(engine_config=ENGINE_CONFIG)
+        pool.add_candles(generate_candles("BTCUSDT", 20, seed=4))
+
+        (stats,) = pool.get_shard_stats()
+        assert stats["symbols"] == ["BTCUSDT"]
+        assert stats["candles_processed"] == 20
+        assert stats["backlog"] == 0
+        assert stats["busy_seconds"] > 0
+
+
+class TestShardedPool:
+    """Test pools sharding symbols across worker processes."""
+
+    @pytest.fixture
+    def pool(self):
+        pool = IndicatorEnginePool(
+            workers=2,
+            engine_config=ENGINE_CONFIG,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+        pool.start()
+        yield pool
+        pool.stop()
+
+    def test_requires_start(self):
+        """Test candles cannot be queued before workers start."""
+        pool = IndicatorEnginePool(workers=1, engine_config=ENGINE_CONFIG)
+
+        with pytest.raises(RuntimeError, match="call start"):
+            pool.add_candle(generate_candles("BTCUSDT", 1, seed=1)[0])
+
+    def test_symbols_balanced_across_shards(self, pool):
+        """Test new symbols go to the least-loaded shard."""
+        shards = [pool.assign(s) for s in ("BTCUSDT", "ETHUSDT", "SOLUSDT", "XRPUSDT")]
+
+        assert shards == [0, 1, 0, 1]
+        assert pool.assign("ETHUSDT") == 1
+
+    def test_deltas_match_standalone_engine(self, pool):
+        """Test worker deltas equal per-symbol standalone engine detections."""
+        btc = generate_candles("BTCUSDT", 150, seed=3)
+        eth = generate_candles("ETHUSDT", 150, seed=5)
+
+        pool.add_candles(interleave(btc, eth))
+        deltas = pool.flush(timeout=60)
+
+        for symbol, candles in (("BTCUSDT", btc), ("ETHUSDT", eth)):
+            got = [
+                (d.indicator_type, d.payload)
+                for d in deltas
+                if d.symbol == symbol
+                and d.indicator_type in (IndicatorType.ORDER_BLOCK, IndicatorType.FAIR_VALUE_GAP)
+            ]
+            assert got == reference_deltas(candles)
+
+        stats = pool.get_shard_stats()
+        assert [s["symbols"] for s in stats] == [["BTCUSDT"], ["ETHUSDT"]]
+        assert all(s["candles_processed"] == 150 and s["backlog"] == 0 for s in stats)
+        assert sum(s["deltas"] for s in stats) == len(deltas)
+        assert all(s["alive"] for s in stats)
+
+    def test_worker_errors_are_counted(self, pool):
+        """Test candles the engine rejects are reported per shard."""
+        candle = generate_candles("BTCUSDT", 1, seed=1)[0]
+        wrong_timeframe = Candle(
+            symbol="BTCUSDT",
+            timeframe=TimeFrame.H1,
+            timestamp=1704067200000,
+            open=candle.open,
+            high=candle.high,
+            low=candle.low,
+            close=candle.close,
+            volume=candle.volume,
+        )
+
+        pool.add_candles([candle, wrong_timeframe])
+        pool.flush(timeout=60)
+
+        assert pool.get_shard_stats()[0]["errors"] == 1
+
+    def test_engines_not_accessible(self, pool):
+        """Test engine objects are not exposed from worker processes."""
+        with pytest.raises(RuntimeError):
+            pool.get_engine("BTCUSDT")
@@ -309,6 +309,40 @@ class TestOrderBlockExpiration:
         assert result[1].origin_candle_index == 25
         assert manager.expiration_stats["order_blocks_expired"] == 1
 
+    def test_expire_order_blocks_by_timestamp_in_sliding_window(self):
+        """With timeframe_ms, ages come from timestamps, not shifted window indices."""
+        manager = IndicatorExpirationManager(
+            expiration_rules=ExpirationRules(
+                order_block=ExpirationConfig(
+                    max_age_candles=50, expiration_type=ExpirationType.TIME_BASED
+                )
+            ),
+        )
+        minute = 60000
+        now = 1704067200000
+
+        # Window indices are stale after trimming: both claim index 0
+        obs = [
+            self.create_order_block(OrderBlockType.BULLISH, 50000.0, 49500.0, now - 60 * minute),
+            self.create_order_block(OrderBlockType.BULLISH, 51000.0, 50500.0, now - 10 * minute),
+        ]
+        current_candle = Candle(
+            timestamp=now,
+            open=51000.0,
+            high=51500.0,
+            low=50500.0,
+            close=51000.0,
+            volume=500000.0,
+            symbol="BTCUSDT",
+            timeframe=TimeFrame.M1,
+        )
+
+        result = manager.expire_order_blocks(obs, current_candle, 60, timeframe_ms=minute)
+
+        assert result == [obs[1]]
+        assert obs[0].state == OrderBlockState.EXPIRED
+        assert obs[1].state == OrderBlockState.ACTIVE
+
 
 class TestFairValueGapExpiration:
     """Test Fair Value Gap expiration logic."""
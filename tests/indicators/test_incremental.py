@@ -0,0 +1,378 @@
+"""
+Differential tests for incremental indicator detection.
+
+Every streaming detector is fed candles one at a time and compared against the
+batch detector run over the same window, so the incremental engine mode is
+verified to produce identical results to the full re-scan path.
+"""
+
+import random
+from typing import List, Optional
+
+import pytest
+
+from src.core.constants import TimeFrame
+from src.indicators.fair_value_gap import FVGDetector
+from src.indicators.incremental import IncrementalIndicatorState, SwingTracker
+from src.indicators.liquidity_zone import LiquidityState, LiquidityZoneDetector, SwingPoint
+from src.indicators.multi_timeframe_engine import MultiTimeframeIndicatorEngine
+from src.indicators.order_block import OrderBlockDetector
+from src.indicators.trend_recognition import TrendRecognitionEngine
+from src.models.candle import Candle
+
+
+def generate_candles(count: int, seed: int) -> List[Candle]:
+    """Generate a reproducible random walk with occasional large moves."""
+    rnd = random.Random(seed)
+    base_timestamp = 1704067200000
+    price = 100.0
+    candles = []
+
+    for i in range(count):
+        open_price = price
+        step = rnd.gauss(0, 1.0) * (4 if rnd.random() < 0.1 else 1)
+        close = max(1.0, open_price + step)
+        high = max(open_price, close) + abs(rnd.gauss(0, 0.4))
+        low = max(0.5, min(open_price, close) - abs(rnd.gauss(0, 0.4)))
+
+        candles.append(
+            Candle(
+                symbol="BTCUSDT",
+                timeframe=TimeFrame.M1,
+                timestamp=base_timestamp + i * 60000,
+                open=open_price,
+                high=high,
+                low=low,
+                close=close,
+                volume=rnd.uniform(50, 150),
+                is_closed=True,
+            )
+        )
+        price = close
+
+    return candles
+
+
+class StreamingHarness:
+    """Feeds candles into incremental state through a trimmed window."""
+
+    def __init__(self, max_candles: Optional[int] = None, persistent_liquidity: bool = False):
+        self.ob_detector = OrderBlockDetector()
+        self.fvg_detector = FVGDetector()
+        self.lz_detector = LiquidityZoneDetector()
+        self.trend_engine = TrendRecognitionEngine()
+        self.state = IncrementalIndicatorState.create(
+            self.ob_detector,
+            self.fvg_detector,
+            self.lz_detector,
+            self.trend_engine,
+            persistent_liquidity=persistent_liquidity,
+        )
+        self.max_candles = max_candles
+        self.window: List[Candle] = []
+        self.total = 0
+        self.order_blocks = {}
+        self.fvgs = {}
+
+    def add(self, candle: Candle) -> None:
+        self.window.append(candle)
+        self.total += 1
+        if self.max_candles and len(self.window) > self.max_candles:
+            self.window = self.window[-self.max_candles :]
+
+        self.state.advance(self.window, self.total)
+        for ob in self.state.take_new_order_blocks():
+            self.order_blocks.setdefault(ob.origin_timestamp, ob)
+        for fvg in self.state.take_new_fvgs():
+            self.fvgs.setdefault(fvg.origin_timestamp, fvg)
+
+
+class TestSwingTracker:
+    """Test streaming swing detection."""
+
+    @pytest.mark.parametrize("lookback", [1, 2, 3, 5])
+    def test_matches_batch_swing_detection(self, lookback):
+        """Test tracked swings equal batch swing detection for any lookback."""
+        candles = generate_candles(400, seed=11)
+        tracker = SwingTracker(lookback)
+
+        for i in range(1, len(candles) + 1):
+            tracker.on_candle(candles[:i], 0)
+
+        detector = LiquidityZoneDetector(min_swing_strength=lookback)
+        assert tracker.get_swing_highs(0) == detector.detect_swing_highs(candles)
+        assert tracker.get_swing_lows(0) == detector.detect_swing_lows(candles)
+
+    def test_invalid_lookback_raises_error(self):
+        """Test non-positive lookback is rejected."""
+        with pytest.raises(ValueError, match="lookback must be positive"):
+            SwingTracker(0)
+
+
+class TestIncrementalDetectorsDifferential:
+    """Compare streaming detectors with their batch counterparts."""
+
+    @pytest.mark.parametrize("seed", [1, 2, 3])
+    def test_order_blocks_identical(self, seed):
+        """Test accumulated streaming Order Blocks equal a batch scan."""
+        candles = generate_candles(500, seed)
+        harness = StreamingHarness()
+        for candle in candles:
+            harness.add(candle)
+
+        batch = {}
+        for ob in harness.ob_detector.detect_order_blocks(candles):
+            batch.setdefault(ob.origin_timestamp, ob)
+
+        assert batch
+        assert {ts: ob.to_dict() for ts, ob in harness.order_blocks.items()} == {
+            ts: ob.to_dict() for ts, ob in batch.items()
+        }
+
+    @pytest.mark.parametrize("seed", [1, 2, 3])
+    def test_fair_value_gaps_identical(self, seed):
+        """Test accumulated streaming FVGs equal a batch scan."""
+        candles = generate_candles(500, seed)
+        harness = StreamingHarness()
+        for candle in candles:
+            harness.add(candle)
+
+        batch = harness.fvg_detector.detect_fair_value_gaps(candles)
+
+        assert batch
+        assert [fvg.to_dict() for fvg in sorted(harness.fvgs.values(), key=_fvg_key)] == [
+            fvg.to_dict() for fvg in sorted(batch, key=_fvg_key)
+        ]
+
+    @pytest.mark.parametrize("max_candles", [None, 150])
+    def test_liquidity_levels_identical(self, max_candles):
+        """Test streaming liquidity levels equal batch detection on the window."""
+        harness = StreamingHarness(max_candles=max_candles)
+
+        for i, candle in enumerate(generate_candles(600, seed=4)):
+            harness.add(candle)
+            if i < 20 or i % 25:
+                continue
+
+            expected = harness.lz_detector.detect_liquidity_levels(harness.window)
+            actual = harness.state.detect_liquidity_levels(harness.window)
+
+            for expected_side, actual_side in zip(expected, actual):
+                assert [_level_key(lvl) for lvl in actual_side] == [
+                    _level_key(lvl) for lvl in expected_side
+                ]
+                for expected_level, actual_level in zip(expected_side, actual_side):
+                    # Running volume sum may differ from a fresh sum in the last bits
+                    assert actual_level.price == pytest.approx(expected_level.price)
+                    assert actual_level.strength == pytest.approx(expected_level.strength)
+
+    @pytest.mark.parametrize("max_candles", [None, 150])
+    def test_trend_patterns_identical(self, max_candles):
+        """Test streaming trend structures equal batch analysis on the window."""
+        harness = StreamingHarness(max_candles=max_candles)
+
+        for i, candle in enumerate(generate_candles(600, seed=5)):
+            harness.add(candle)
+            if i < 20 or i % 25:
+                continue
+
+            expected = harness.trend_engine.analyze_trend_patterns(harness.window)
+            actual = harness.state.analyze_trend_patterns(harness.window)
+
+            assert actual == expected
+
+
+class TestPersistentLiquidity:
+    """Test liquidity levels merged incrementally into persistent clusters."""
+
+    def test_levels_keep_identity_and_state(self):
+        """Test levels survive updates with their touch counts and state."""
+        harness = StreamingHarness(persistent_liquidity=True)
+        candles = generate_candles(300, seed=4)
+
+        for candle in candles[:150]:
+            harness.add(candle)
+        buy_side, sell_side = harness.state.detect_liquidity_levels(harness.window)
+        assert buy_side and sell_side
+
+        level = buy_side[0]
+        level.mark_touched(candles[149].timestamp)
+        level.mark_swept(candles[149].timestamp)
+
+        for candle in candles[150:160]:
+            harness.add(candle)
+        buy_side, _ = harness.state.detect_liquidity_levels(harness.window)
+
+        assert any(lvl is level for lvl in buy_side)
+        assert level.state == LiquidityState.SWEPT
+        assert level.touch_count == 1
+
+    @pytest.mark.parametrize("max_candles", [None, 150])
+    def test_same_swings_as_batch(self, max_candles):
+        """Test every swing in the window belongs to exactly one level per side."""
+        harness = StreamingHarness(max_candles=max_candles, persistent_liquidity=True)
+        tolerance = harness.lz_detector.proximity_tolerance_pips * harness.lz_detector.pip_size
+
+        for i, candle in enumerate(generate_candles(600, seed=8)):
+            harness.add(candle)
+            if i < 20 or i % 25:
+                continue
+
+            actual = harness.state.detect_liquidity_levels(harness.window)
+            swing_highs = harness.lz_detector.detect_swing_highs(harness.window)
+            swing_lows = harness.lz_detector.detect_swing_lows(harness.window)
+
+            for levels, swings in zip(actual, (swing_highs, swing_lows)):
+                assert [lvl.price for lvl in levels] == sorted(lvl.price for lvl in levels)
+                # Each window swing is represented by a level within tolerance
+                for swing in swings:
+                    assert any(abs(lvl.price - swing.price) <= tolerance for lvl in levels)
+                # Levels originate from swings still in (or just before) the window
+                assert all(lvl.origin_candle_index < len(harness.window) for lvl in levels)
+
+            # Window-start levels are dropped once their swings slide out
+            if max_candles:
+                first_kept = harness.window[harness.lz_detector.min_swing_strength].timestamp
+                assert all(
+                    lvl.origin_timestamp >= first_kept or lvl.origin_candle_index < 0
+                    for lvl in actual[0] + actual[1]
+                )
+
+    def test_nearby_swings_merge_into_one_level(self):
+        """Test a swing within tolerance folds into the existing level object."""
+        detector = LiquidityZoneDetector(proximity_tolerance_pips=1.0, pip_size=1.0)
+        harness = StreamingHarness(persistent_liquidity=True)
+        harness.lz_detector = detector
+        clusters = harness.state.liquidity_clusters
+        clusters.detector = detector
+
+        candles = generate_candles(30, seed=1)
+        first = SwingPoint(
+            price=100.0, timestamp=candles[5].timestamp, candle_index=5, is_high=True
+        )
+        second = SwingPoint(
+            price=100.5, timestamp=candles[9].timestamp, candle_index=9, is_high=True
+        )
+        far = SwingPoint(
+            price=110.0, timestamp=candles[12].timestamp, candle_index=12, is_high=True
+        )
+
+        buy_side, _ = clusters.update(candles, [first], [], offset=0)
+        level = buy_side[0]
+        level.mark_touched(candles[8].timestamp)
+
+        buy_side, _ = clusters.update(candles, [second, far], [], offset=0)
+
+        assert len(buy_side) == 2
+        assert buy_side[0] is level
+        assert 100.0 < level.price < 100.5
+        assert level.touch_count == 1
+        assert level.origin_timestamp == candles[5].timestamp
+        assert clusters.last_position == 12
+
+        # Sliding the window re-derives the origin index
+        buy_side, _ = clusters.update(candles[2:], [], [], offset=2)
+        assert level.origin_candle_index == 3
+
+    def test_engine_requires_incremental(self):
+        """Test persistent liquidity is rejected in batch mode."""
+        with pytest.raises(ValueError, match="requires incremental"):
+            MultiTimeframeIndicatorEngine(timeframes=[TimeFrame.M1], persistent_liquidity=True)
+
+    def test_engine_reuses_level_objects(self):
+        """Test the engine keeps the same level objects across candles."""
+        engine = MultiTimeframeIndicatorEngine(
+            timeframes=[TimeFrame.M1], incremental=True, persistent_liquidity=True
+        )
+        candles = generate_candles(200, seed=6)
+        for candle in candles[:150]:
+            engine.add_candle(candle)
+        before = {id(lvl) for lvl in engine.get_indicators(TimeFrame.M1).liquidity_levels}
+
+        engine.add_candle(candles[150])
+        after = {id(lvl) for lvl in engine.get_indicators(TimeFrame.M1).liquidity_levels}
+
+        assert before
+        assert before & after
+
+
+class TestIncrementalEngine:
+    """Compare incremental and batch MultiTimeframeIndicatorEngine modes."""
+
+    def test_engine_state_identical_after_every_candle(self):
+        """Test both engine modes hold the same indicators after each candle."""
+        # Expired indicators are kept so the batch path cannot re-detect removed ones
+        batch = MultiTimeframeIndicatorEngine(timeframes=[TimeFrame.M1], auto_remove_expired=False)
+        incremental = MultiTimeframeIndicatorEngine(
+            timeframes=[TimeFrame.M1], auto_remove_expired=False, incremental=True
+        )
+
+        for candle in generate_candles(200, seed=6):
+            batch.add_candle(candle)
+            incremental.add_candle(candle)
+
+            assert _engine_snapshot(incremental) == _engine_snapshot(batch)
+
+        assert batch.get_indicators(TimeFrame.M1).order_blocks
+
+    def test_engine_past_window_trim(self):
+        """Test the modes after trimming: only batch Order Blocks pick up edge swings."""
+        options = {"timeframes": [TimeFrame.M1], "auto_remove_expired": False}
+        batch = MultiTimeframeIndicatorEngine(max_candles_per_timeframe=150, **options)
+        incremental = MultiTimeframeIndicatorEngine(
+            max_candles_per_timeframe=150, incremental=True, **options
+        )
+        untrimmed = MultiTimeframeIndicatorEngine(max_candles_per_timeframe=1000, **options)
+
+        for candle in generate_candles(600, seed=6):
+            batch.add_candle(candle)
+            incremental.add_candle(candle)
+            untrimmed.add_candle(candle)
+
+            assert _engine_snapshot(incremental)[1:] == _engine_snapshot(batch)[1:]
+
+        def origins(engine):
+            return {ob.origin_timestamp for ob in engine.get_indicators(TimeFrame.M1).order_blocks}
+
+        assert origins(incremental) == origins(untrimmed)
+        assert origins(batch) > origins(incremental)
+        assert incremental.get_indicators(TimeFrame.M1).liquidity_sweeps
+
+    def test_clear_all_resets_streaming_state(self):
+        """Test clearing the engine restarts streaming detection from scratch."""
+        engine = MultiTimeframeIndicatorEngine(timeframes=[TimeFrame.M1], incremental=True)
+        candles = generate_candles(120, seed=7)
+
+        for candle in candles:
+            engine.add_candle(candle)
+        engine.clear_all()
+
+        assert engine.timeframe_data[TimeFrame.M1].total_candles == 0
+
+        for candle in candles:
+            engine.add_candle(candle)
+
+        reference = MultiTimeframeIndicatorEngine(timeframes=[TimeFrame.M1], incremental=True)
+        for candle in candles:
+            reference.add_candle(candle)
+
+        assert _engine_snapshot(engine) == _engine_snapshot(reference)
+
+
+def _fvg_key(fvg):
+    return (fvg.origin_timestamp, fvg.type.value)
+
+
+def _level_key(level):
+    return (level.type, level.origin_timestamp, level.origin_candle_index)
+
+
+def _engine_snapshot(engine: MultiTimeframeIndicatorEngine):
+    indicators = engine.get_indicators(TimeFrame.M1)
+    return (
+        [ob.to_dict() for ob in indicators.order_blocks],
+        [fvg.to_dict() for fvg in indicators.fair_value_gaps],
+        [(lvl.origin_timestamp, round(lvl.price, 9)) for lvl in indicators.liquidity_levels],
+        indicators.trend_structures,
+        [sweep.breach_timestamp for sweep in indicators.liquidity_sweeps],
+    )
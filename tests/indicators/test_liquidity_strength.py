@@ -186,6 +186,34 @@ class TestLiquidityStrengthCalculator:
             assert isinstance(metrics, LiquidityStrengthMetrics)
             assert 0 <= metrics.total_strength <= 100
 
+    def test_calculate_all_strengths_matches_single_level(self, sample_candles):
+        """Test batch scoring gives the same metrics as scoring levels one by one."""
+        calculator = LiquidityStrengthCalculator()
+
+        levels = [
+            LiquidityLevel(
+                type=LiquidityType.BUY_SIDE,
+                price=50000.0 + i * 50,
+                origin_timestamp=sample_candles[i * 12].timestamp,
+                origin_candle_index=i * 12,
+                symbol="BTCUSDT",
+                timeframe=TimeFrame.M15,
+                touch_count=i,
+                strength=20.0 * i,
+                volume_profile=1500.0 * i,
+                state=LiquidityState.PARTIAL if i % 2 else LiquidityState.ACTIVE,
+            )
+            for i in range(5)
+        ]
+
+        for avg_volume in (None, 0.0, 2500.0):
+            batch = calculator.calculate_all_strengths(levels, sample_candles, 50, avg_volume)
+            single = [
+                calculator.calculate_strength(level, sample_candles, 50, avg_volume)
+                for level in levels
+            ]
+            assert batch == single
+
     def test_calculate_all_strengths_skips_filled_levels(self, sample_candles):
         """Test that filled/swept levels are skipped in batch calculation."""
         calculator = LiquidityStrengthCalculator()
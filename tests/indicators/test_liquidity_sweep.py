@@ -2,7 +2,9 @@
 Unit tests for Liquidity Sweep detection.
 """
 
+import random
 from datetime import datetime
+from typing import List
 
 import pytest
 
@@ -479,5 +481,129 @@ class TestLiquiditySweepDetector:
         assert level.swept_timestamp is not None
 
 
+class ScanSweepDetector(LiquiditySweepDetector):
+    """Reference detector testing every level against every candle."""
+
+    def detect_sweeps(self, candles, liquidity_levels, start_index=0):
+        sweeps = []
+        active_levels = [
+            level
+            for level in liquidity_levels
+            if level.state in (LiquidityState.ACTIVE, LiquidityState.PARTIAL)
+        ]
+        for i in range(start_index, len(candles)):
+            for level in active_levels:
+                if level.origin_candle_index >= i or level.level_id in self._candidate_ids:
+                    continue
+                candidate = self._check_breach(candles[i], level, i)
+                if candidate:
+                    self._candidates.append(candidate)
+                    self._candidate_ids[level.level_id] = candidate
+            self._update_candidates(candles[i], i, candles)
+            sweeps.extend(self._check_completions())
+        self._cleanup_candidates(len(candles) - 1)
+        return sweeps
+
+
+class TestPriceIndexedDetection:
+    """Test the price-indexed breach search against a full scan."""
+
+    def generate(self, seed: int, level_count: int):
+        rnd = random.Random(seed)
+        price = 100.0
+        candles = []
+        for i in range(300):
+            open_price = price
+            close = open_price + rnd.gauss(0, 0.08)
+            candles.append(
+                Candle(
+                    symbol="BTCUSDT",
+                    timeframe=TimeFrame.M1,
+                    timestamp=1704067200000 + i * 60000,
+                    open=open_price,
+                    high=max(open_price, close) + abs(rnd.gauss(0, 0.04)),
+                    low=min(open_price, close) - abs(rnd.gauss(0, 0.04)),
+                    close=close,
+                    volume=rnd.uniform(1, 100),
+                )
+            )
+            price = close
+
+        low = min(c.low for c in candles)
+        high = max(c.high for c in candles)
+        level_specs = []
+        for k in range(level_count):
+            origin = rnd.randrange(0, 100)
+            level_specs.append(
+                (
+                    rnd.choice([LiquidityType.BUY_SIDE, LiquidityType.SELL_SIDE]),
+                    rnd.uniform(low, high),
+                    candles[origin].timestamp + k,
+                    origin,
+                )
+            )
+        return candles, level_specs
+
+    def make_levels(self, level_specs) -> List[LiquidityLevel]:
+        return [
+            LiquidityLevel(
+                type=level_type,
+                price=price,
+                origin_timestamp=origin_timestamp,
+                origin_candle_index=origin,
+                symbol="BTCUSDT",
+                timeframe=TimeFrame.M1,
+            )
+            for level_type, price, origin_timestamp, origin in level_specs
+        ]
+
+    @pytest.mark.parametrize("seed,level_count", [(1, 20), (2, 100), (3, 300)])
+    def test_matches_full_scan(self, seed, level_count):
+        """Test indexed detection finds exactly the sweeps of a full scan."""
+        candles, level_specs = self.generate(seed, level_count)
+        config = dict(pip_size=0.01, min_reversal_strength=0.0)
+
+        expected = ScanSweepDetector(**config).detect_sweeps(
+            candles, self.make_levels(level_specs), start_index=5
+        )
+        actual = LiquiditySweepDetector(**config).detect_sweeps(
+            candles, self.make_levels(level_specs), start_index=5
+        )
+
+        assert expected
+        assert [s.to_dict() for s in actual] == [s.to_dict() for s in expected]
+
+    def test_candidate_keyed_by_level_id(self):
+        """Test a recalculated copy of a pending level does not start a second candidate."""
+        base_timestamp = 1704067200000
+        detector = LiquiditySweepDetector(pip_size=0.0001)
+
+        def level(strength: float, origin_index: int) -> LiquidityLevel:
+            return LiquidityLevel(
+                type=LiquidityType.BUY_SIDE,
+                price=1.1000,
+                origin_timestamp=base_timestamp,
+                origin_candle_index=origin_index,
+                symbol="EURUSD",
+                timeframe=TimeFrame.M1,
+                strength=strength,
+            )
+
+        breach = Candle(
+            symbol="EURUSD",
+            timeframe=TimeFrame.M1,
+            timestamp=base_timestamp + 60000,
+            open=1.0995,
+            high=1.1005,
+            low=1.0992,
+            close=1.0998,
+            volume=100.0,
+        )
+        detector.detect_sweeps([breach, breach], [level(10.0, 0)], start_index=1)
+        detector.detect_sweeps([breach, breach], [level(40.0, 0)], start_index=1)
+
+        assert len(detector.get_active_candidates()) == 1
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -10,6 +10,8 @@ Tests cover:
 """
 
 import asyncio
+import logging
+import math
 from typing import List
 from unittest.mock import AsyncMock, Mock
 
@@ -539,7 +541,86 @@ class TestMultiTimeframeIndicatorEngine:
         m1_data = engine.timeframe_data[TimeFrame.M1]
         assert len(m1_data.candles) == 50
 
+    def test_liquidity_strength_on_swinging_prices(self, caplog):
+        """Test strength metrics are calculated for levels formed by real swings."""
+        engine = MultiTimeframeIndicatorEngine(timeframes=[TimeFrame.M1])
+
+        with caplog.at_level(logging.ERROR, logger="src.indicators.multi_timeframe_engine"):
+            for candle in self._create_swinging_candles(1704067200000, 120):
+                engine.add_candle(candle)
+
+        # Other tests may lower src logger levels, so count only error records
+        assert not [record for record in caplog.records if record.levelno >= logging.ERROR]
+        indicators = engine.timeframe_data[TimeFrame.M1].indicators
+        assert indicators.liquidity_levels
+        assert indicators.liquidity_strength_metrics
+        latest = engine.timeframe_data[TimeFrame.M1].get_latest_candle()
+        for metrics in indicators.liquidity_strength_metrics:
+            assert metrics.last_calculated == latest.timestamp
+
+    def test_breaker_detection_scans_only_new_candles(self):
+        """Test known Order Blocks are only checked against candles added since the last scan."""
+        engine = MultiTimeframeIndicatorEngine(timeframes=[TimeFrame.M1])
+        candles = self._create_swinging_candles(1704067200000, 60)
+        for candle in candles[:59]:
+            engine.add_candle(candle)
+
+        calls = []
+        detect = engine.bb_detector.detect_breaker_blocks
+
+        def spy(order_blocks, candles, start_index=0, order_block_index=None):
+            calls.append((start_index, order_block_index is not None))
+            return detect(order_blocks, candles, start_index, order_block_index)
+
+        engine.bb_detector.detect_breaker_blocks = spy
+        engine.add_candle(candles[59])
+
+        m1_data = engine.timeframe_data[TimeFrame.M1]
+        assert (len(m1_data.candles) - 1, True) in calls
+        assert m1_data.breaker_scan_total == m1_data.total_candles
+
+    def test_candle_window_is_trimmed_in_place(self):
+        """Test the candle list is trimmed in place instead of copied on overflow."""
+        engine = MultiTimeframeIndicatorEngine(
+            timeframes=[TimeFrame.M1], max_candles_per_timeframe=50
+        )
+        candles = self._create_swinging_candles(1704067200000, 61)
+        m1_data = engine.timeframe_data[TimeFrame.M1]
+        window = m1_data.candles
+
+        for candle in candles:
+            engine.add_candle(candle)
+
+        assert m1_data.candles is window
+        assert window == candles[-50:]
+        assert engine.get_statistics()[TimeFrame.M1.value]["candle_count"] == 50
+
     # Helper methods
+    def _create_swinging_candles(self, base_timestamp: int, count: int) -> List[Candle]:
+        """Create candles oscillating around 45000 with distinct swing highs and lows."""
+        candles = []
+        previous_close = 45000.0
+
+        for i in range(count):
+            close = 45000.0 + 500.0 * math.sin(2 * math.pi * (i + 0.25) / 20)
+            open_price = (previous_close + close) / 2
+            candles.append(
+                Candle(
+                    symbol="BTCUSDT",
+                    timeframe=TimeFrame.M1,
+                    timestamp=base_timestamp + (i * 60000),
+                    open=open_price,
+                    high=max(open_price, close) + 20.0,
+                    low=min(open_price, close) - 20.0,
+                    close=close,
+                    volume=150.0 if i % 7 == 0 else 100.0,
+                    is_closed=True,
+                )
+            )
+            previous_close = close
+
+        return candles
+
     def _create_test_candles_with_ob_pattern(self, base_timestamp: int, count: int) -> List[Candle]:
         """Create test candles with a pattern that triggers OB detection."""
         candles = []
@@ -634,6 +715,37 @@ class TestTimeframeIndicators:
         assert len(indicators.breaker_blocks) == 0
         assert indicators.last_update_timestamp is None
 
+    def test_prune_before_drops_only_spent_old_zones(self):
+        """Test pruning keeps live zones and spent zones formed after the cutoff."""
+        from src.indicators.order_block import OrderBlock
+
+        indicators = TimeframeIndicators(timeframe=TimeFrame.M1)
+
+        def order_block(timestamp: int, state: OrderBlockState) -> OrderBlock:
+            return OrderBlock(
+                type=OrderBlockType.BULLISH,
+                high=45100.0,
+                low=45000.0,
+                origin_timestamp=timestamp,
+                origin_candle_index=0,
+                symbol="BTCUSDT",
+                timeframe=TimeFrame.M1,
+                strength=75.0,
+                volume=100.0,
+                state=state,
+            )
+
+        old_broken = order_block(1000, OrderBlockState.BROKEN)
+        old_active = order_block(2000, OrderBlockState.ACTIVE)
+        new_broken = order_block(4000, OrderBlockState.BROKEN)
+        for ob in (old_broken, old_active, new_broken):
+            indicators.add_zone(ob)
+
+        indicators.prune_before(3000)
+
+        assert indicators.order_blocks == [old_active, new_broken]
+        assert indicators.order_block_index.containing(45050.0) == [old_active]
+
 
 class TestMultiTimeframeEventIntegration:
     """Test event bus integration with multi-timeframe engine."""
@@ -0,0 +1,177 @@
+"""
+Tests for streaming indicator primitives.
+"""
+
+import random
+from typing import List
+
+import pytest
+
+from src.core.constants import TimeFrame
+from src.indicators.multi_timeframe_engine import MultiTimeframeIndicatorEngine, TimeframeData
+from src.indicators.primitives import (
+    RollingATR,
+    RollingExtremes,
+    RollingMean,
+    StreamingPrimitives,
+)
+from src.indicators.trend_recognition import TrendRecognitionEngine
+from src.models.candle import Candle
+
+BASE_TS = 1704067200000
+
+
+def random_candles(count: int, seed: int = 0) -> List[Candle]:
+    """Generate a random walk of closed one-minute candles."""
+    rng = random.Random(seed)
+    candles = []
+    price = 100.0
+    for i in range(count):
+        open_price = price
+        price = max(1.0, price + rng.gauss(0, 1.0))
+        candles.append(
+            Candle(
+                symbol="BTCUSDT",
+                timeframe=TimeFrame.M1,
+                timestamp=BASE_TS + i * 60000,
+                open=open_price,
+                high=max(open_price, price) + rng.uniform(0, 1.0),
+                low=min(open_price, price) - rng.uniform(0, 1.0),
+                close=price,
+                volume=rng.uniform(10.0, 100.0),
+                is_closed=True,
+            )
+        )
+    return candles
+
+
+class TestRollingATR:
+    """Test the streaming ATR against the batch calculation."""
+
+    def test_matches_calculate_atr(self):
+        """Test the simple ATR equals TrendRecognitionEngine.calculate_atr."""
+        engine = TrendRecognitionEngine(atr_period=14)
+        atr = RollingATR(14)
+        candles = random_candles(200, seed=1)
+
+        for i, candle in enumerate(candles):
+            atr.update(candle.high, candle.low, candle.close)
+            window = candles[max(0, i - 99) : i + 1]
+            if len(window) < 14:
+                assert atr.value == 0.0
+            else:
+                assert atr.value == engine.calculate_atr(window)
+
+    def test_wilder_smoothing(self):
+        """Test Wilder's ATR is seeded with the simple average and then smoothed."""
+        atr = RollingATR(3)
+        for high, low, close in [(10, 8, 9), (11, 9, 10), (12, 10, 11), (13, 11, 12), (20, 12, 19)]:
+            atr.update(high, low, close)
+
+        # True ranges: 2, 2, 2, 8 -> seed 2.0, then (2 * 2 + 8) / 3
+        assert atr.wilder == pytest.approx(4.0)
+        assert atr.value == pytest.approx(4.0)
+
+        atr.reset()
+        assert atr.value == 0.0
+        assert atr.wilder == 0.0
+
+    def test_invalid_period_raises_error(self):
+        """Test non-positive periods are rejected."""
+        with pytest.raises(ValueError, match="period must be positive"):
+            RollingATR(0)
+        with pytest.raises(ValueError, match="period must be positive"):
+            RollingExtremes(-1)
+        with pytest.raises(ValueError, match="period must be positive"):
+            RollingMean(0)
+
+
+class TestRollingWindows:
+    """Test rolling high/low and mean against brute force."""
+
+    def test_extremes_match_window(self):
+        """Test rolling high and low over the last period candles."""
+        extremes = RollingExtremes(20)
+        candles = random_candles(300, seed=2)
+
+        assert extremes.high is None
+        for i, candle in enumerate(candles):
+            extremes.update(candle.high, candle.low)
+            window = candles[max(0, i - 19) : i + 1]
+            assert extremes.high == max(c.high for c in window)
+            assert extremes.low == min(c.low for c in window)
+
+    def test_mean_with_period_and_trim(self):
+        """Test the running mean drops old values by period and by trim."""
+        mean = RollingMean(3)
+        for value in (1.0, 2.0, 3.0, 4.0):
+            mean.append(value)
+        assert mean.mean == pytest.approx(3.0)
+        assert len(mean) == 3
+
+        mean.trim(1)
+        assert mean.mean == pytest.approx(4.0)
+        mean.trim(0)
+        assert mean.mean == 0.0
+
+
+class TestStreamingPrimitives:
+    """Test the per symbol-timeframe bundle."""
+
+    def test_volatility_levels(self):
+        """Test the ATR percentile maps to strategy volatility levels."""
+        primitives = StreamingPrimitives(atr_period=3, volatility_history=50)
+        assert primitives.volatility()["level"] == "NORMAL"
+
+        price = 100.0
+        for i in range(60):
+            # Ranges widen steadily, so the latest ATR is the highest seen
+            spread = 0.1 * (i + 1)
+            primitives.update(
+                Candle(
+                    symbol="BTCUSDT",
+                    timeframe=TimeFrame.M1,
+                    timestamp=BASE_TS + i * 60000,
+                    open=price,
+                    high=price + spread,
+                    low=price - spread,
+                    close=price,
+                    volume=10.0,
+                )
+            )
+
+        volatility = primitives.volatility(price)
+        assert volatility["level"] == "VERY_HIGH"
+        assert volatility["percentile"] == pytest.approx(100.0)
+        assert volatility["atr_pct"] == pytest.approx(primitives.atr.value / price * 100)
+        assert primitives.avg_volume == pytest.approx(10.0)
+
+    def test_timeframe_data_updates_primitives(self):
+        """Test TimeframeData feeds every candle and averages volume over its window."""
+        data = TimeframeData(timeframe=TimeFrame.M1, max_candles=50)
+        candles = random_candles(120, seed=3)
+        for candle in candles:
+            data.add_candle(candle)
+
+        assert data.primitives.avg_volume == pytest.approx(
+            sum(c.volume for c in data.candles) / len(data.candles)
+        )
+        assert data.primitives.last_timestamp == candles[-1].timestamp
+
+        data.clear_candles()
+        assert data.primitives.atr.value == 0.0
+        assert data.primitives.last_timestamp is None
+
+    def test_engine_exposes_primitives(self):
+        """Test the engine keeps primitives per timeframe with the trend ATR period."""
+        engine = MultiTimeframeIndicatorEngine(
+            timeframes=[TimeFrame.M1], trend_recognition_config={"atr_period": 10}
+        )
+        candles = random_candles(60, seed=4)
+        for candle in candles:
+            engine.add_candle(candle)
+
+        primitives = engine.get_primitives(TimeFrame.M1)
+        assert primitives.atr.period == 10
+        assert primitives.atr.value == engine.trend_recognition_engine.calculate_atr(candles)
+        assert engine.get_primitives(TimeFrame.H1) is None
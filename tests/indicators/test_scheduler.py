@@ -0,0 +1,176 @@
+"""
+Tests for indicator recompute scheduling.
+"""
+
+from typing import List
+
+import pytest
+
+from src.core.constants import TimeFrame
+from src.indicators.multi_timeframe_engine import MultiTimeframeIndicatorEngine
+from src.indicators.order_block import OrderBlock, OrderBlockType
+from src.indicators.scheduler import RecomputeScheduler
+from src.models.candle import Candle
+
+BASE_TS = 1704067200000
+
+
+class FakeClock:
+    """Manually advanced monotonic clock (seconds)."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_candles(count: int, is_closed: bool = True) -> List[Candle]:
+    candles = []
+    for i in range(count):
+        close = 100.0 + i
+        candles.append(
+            Candle(
+                symbol="BTCUSDT",
+                timeframe=TimeFrame.M1,
+                timestamp=BASE_TS + i * 60000,
+                open=close - 0.5,
+                high=close + 1.0,
+                low=close - 1.0,
+                close=close,
+                volume=100.0,
+                is_closed=is_closed,
+            )
+        )
+    return candles
+
+
+class TestRecomputeScheduler:
+    """Test scheduling decisions."""
+
+    def test_default_is_eager(self):
+        """Test every candle is recomputed by default."""
+        scheduler = RecomputeScheduler()
+        for _ in range(3):
+            assert scheduler.request(TimeFrame.M1, is_closed=False)
+            scheduler.completed(TimeFrame.M1)
+
+        assert scheduler.stats.executed == 3
+        assert scheduler.stats.skipped == 0
+
+    def test_close_only_skips_open_candles(self):
+        """Test in-progress candles are skipped and do not mark the key dirty."""
+        scheduler = RecomputeScheduler(close_only=True)
+
+        assert not scheduler.request(TimeFrame.M1, is_closed=False)
+        assert not scheduler.is_dirty(TimeFrame.M1)
+        assert scheduler.request(TimeFrame.M1, is_closed=True)
+        assert scheduler.stats.skipped_open == 1
+
+    def test_debounce_coalesces_bursts(self):
+        """Test candles inside the window stay dirty until the window passes."""
+        clock = FakeClock()
+        scheduler = RecomputeScheduler(debounce_ms=100, clock=clock)
+
+        assert scheduler.request(TimeFrame.M1)
+        scheduler.completed(TimeFrame.M1)
+        clock.now = 0.05
+        assert not scheduler.request(TimeFrame.M1)
+        assert not scheduler.request(TimeFrame.M1)
+        assert scheduler.pending() == [TimeFrame.M1]
+
+        clock.now = 0.2
+        assert scheduler.request(TimeFrame.M1)
+        assert scheduler.stats.to_dict()["debounced"] == 2
+
+    def test_invalid_configuration_raises_error(self):
+        """Test negative debounce and live tier without close_only are rejected."""
+        with pytest.raises(ValueError, match="debounce_ms"):
+            RecomputeScheduler(debounce_ms=-1)
+        with pytest.raises(ValueError, match="live_tier requires close_only"):
+            RecomputeScheduler(live_tier=True)
+
+
+class TestEngineScheduling:
+    """Test the engine routes updates through the scheduler."""
+
+    def test_default_engine_counts_every_update(self):
+        """Test the default configuration recomputes for every candle."""
+        engine = MultiTimeframeIndicatorEngine(timeframes=[TimeFrame.M1])
+        for candle in make_candles(12, is_closed=False):
+            engine.add_candle(candle)
+
+        stats = engine.get_statistics()["scheduler"]
+        assert stats["executed"] == 12
+        assert stats["skipped"] == 0
+        assert len(engine.timeframe_data[TimeFrame.M1].candles) == 12
+
+    def test_close_only_ignores_ticks(self):
+        """Test in-progress ticks are held as the forming candle, not appended."""
+        engine = MultiTimeframeIndicatorEngine(
+            timeframes=[TimeFrame.M1], scheduler_config={"close_only": True}
+        )
+        closed = make_candles(12)
+        for candle in closed:
+            for tick in range(3):
+                engine.add_candle(
+                    Candle(
+                        **{
+                            **candle.__dict__,
+                            "close": candle.close + tick * 0.1,
+                            "is_closed": False,
+                        }
+                    )
+                )
+            engine.add_candle(candle)
+
+        tf_data = engine.timeframe_data[TimeFrame.M1]
+        stats = engine.get_statistics()["scheduler"]
+        assert len(tf_data.candles) == 12
+        assert tf_data.forming_candle is None
+        assert stats["executed"] == 12
+        assert stats["skipped_open"] == 36
+
+    def test_live_tier_checks_containment(self):
+        """Test the forming candle's close is looked up in the zone index."""
+        engine = MultiTimeframeIndicatorEngine(
+            timeframes=[TimeFrame.M1],
+            scheduler_config={"close_only": True, "live_tier": True},
+        )
+        zone = OrderBlock(
+            type=OrderBlockType.BULLISH,
+            high=105.0,
+            low=99.0,
+            origin_timestamp=BASE_TS,
+            origin_candle_index=0,
+            symbol="BTCUSDT",
+            timeframe=TimeFrame.M1,
+            strength=50.0,
+            volume=100.0,
+        )
+        engine.timeframe_data[TimeFrame.M1].indicators.add_zone(zone)
+
+        engine.add_candle(make_candles(1, is_closed=False)[0])
+
+        assert engine.get_live_zones(TimeFrame.M1)["order_blocks"] == [zone]
+        assert engine.get_statistics()["scheduler"]["live_checks"] == 1
+
+    def test_debounced_updates_flush_on_read(self):
+        """Test deferred recomputations run on flush() or before a read."""
+        clock = FakeClock()
+        engine = MultiTimeframeIndicatorEngine(
+            timeframes=[TimeFrame.M1], scheduler_config={"debounce_ms": 1000, "clock": clock}
+        )
+        candles = make_candles(15)
+        for candle in candles:
+            engine.add_candle(candle)
+
+        stats = engine.get_statistics()["scheduler"]
+        assert stats["executed"] == 1
+        assert stats["debounced"] == 14
+        assert stats["pending"] == [TimeFrame.M1.value]
+
+        indicators = engine.get_indicators(TimeFrame.M1)
+        assert indicators.last_update_timestamp == candles[-1].timestamp
+        assert engine.flush() == 0
+        assert engine.get_statistics()["scheduler"]["executed"] == 2
@@ -0,0 +1,377 @@
+"""
+Tests for immutable indicator snapshots.
+"""
+
+import asyncio
+import math
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.core.constants import EventType, TimeFrame
+from src.indicators.fair_value_gap import FairValueGap, FVGType
+from src.indicators.liquidity_strength import LiquidityStrengthLevel, LiquidityStrengthMetrics
+from src.indicators.liquidity_zone import LiquidityLevel, LiquidityType
+from src.indicators.multi_timeframe_engine import (
+    MultiTimeframeIndicatorEngine,
+    TimeframeIndicators,
+)
+from src.indicators.order_block import OrderBlock, OrderBlockState, OrderBlockType
+from src.indicators.snapshot import (
+    IndicatorSnapshot,
+    SnapshotBuilder,
+    diff_snapshots,
+    serialize_payload,
+)
+from src.models.candle import Candle
+
+BASE_TS = 1704067200000
+
+
+def make_ob(i: int) -> OrderBlock:
+    """Create an Order Block formed at candle i."""
+    return OrderBlock(
+        type=OrderBlockType.BULLISH,
+        high=101.0 + i,
+        low=100.0 + i,
+        origin_timestamp=BASE_TS + i * 60000,
+        origin_candle_index=i,
+        symbol="BTCUSDT",
+        timeframe=TimeFrame.M1,
+        strength=50.0,
+        volume=100.0,
+    )
+
+
+def make_level(i: int) -> LiquidityLevel:
+    """Create a buy-side liquidity level formed at candle i."""
+    return LiquidityLevel(
+        type=LiquidityType.BUY_SIDE,
+        price=110.0 + i,
+        origin_timestamp=BASE_TS + i * 60000,
+        origin_candle_index=i,
+        symbol="BTCUSDT",
+        timeframe=TimeFrame.M1,
+        strength=60.0,
+        volume_profile=100.0,
+    )
+
+
+def make_indicators(count: int = 3) -> TimeframeIndicators:
+    indicators = TimeframeIndicators(timeframe=TimeFrame.M1)
+    for i in range(count):
+        indicators.add_zone(make_ob(i))
+    indicators.last_update_timestamp = BASE_TS
+    indicators.candle_count = 10
+    return indicators
+
+
+class TestSnapshotBuilder:
+    """Test structural sharing between consecutive snapshots."""
+
+    def test_unchanged_indicators_are_shared(self):
+        """Test a rebuild without changes reuses the frozen tuples."""
+        builder = SnapshotBuilder("BTCUSDT", TimeFrame.M1)
+        indicators = make_indicators()
+
+        first = builder.build(indicators)
+        second = builder.build(indicators)
+
+        assert (first.version, second.version) == (1, 2)
+        assert second.order_blocks is first.order_blocks
+        assert first.order_blocks[0] is not indicators.order_blocks[0]
+        assert first.order_blocks[0] == indicators.order_blocks[0]
+
+    def test_changed_indicator_is_copied_and_old_snapshot_kept(self):
+        """Test only the mutated zone is copied and earlier snapshots keep their state."""
+        builder = SnapshotBuilder("BTCUSDT", TimeFrame.M1)
+        indicators = make_indicators()
+        first = builder.build(indicators)
+
+        indicators.order_blocks[1].mark_tested(BASE_TS + 60000)
+        second = builder.build(indicators)
+
+        assert first.order_blocks[1].state == OrderBlockState.ACTIVE
+        assert second.order_blocks[1].state == OrderBlockState.TESTED
+        assert second.order_blocks[0] is first.order_blocks[0]
+        assert second.order_blocks[2] is first.order_blocks[2]
+        assert second.order_blocks[1] is not first.order_blocks[1]
+
+    def test_rebuilt_equal_objects_reuse_previous_copies(self):
+        """Test new but equal objects (e.g. rebuilt levels) share the previous copies."""
+        builder = SnapshotBuilder("BTCUSDT", TimeFrame.M1)
+        indicators = make_indicators(0)
+        indicators.liquidity_levels = [make_level(0), make_level(1)]
+        first = builder.build(indicators)
+
+        indicators.liquidity_levels = [make_level(0), make_level(1)]
+        second = builder.build(indicators)
+
+        assert second.liquidity_levels is first.liquidity_levels
+
+    def test_nested_indicators_are_frozen(self):
+        """Test a strength metric's level is frozen together with the metric."""
+        builder = SnapshotBuilder("BTCUSDT", TimeFrame.M1)
+        level = make_level(0)
+        metric = LiquidityStrengthMetrics(
+            level=level,
+            base_strength=60.0,
+            touch_strength=0.0,
+            volume_strength=50.0,
+            recency_strength=100.0,
+            total_strength=55.0,
+            strength_level=LiquidityStrengthLevel.MODERATE,
+            last_calculated=BASE_TS,
+        )
+        indicators = make_indicators(0)
+        indicators.liquidity_strength_metrics = [metric]
+        snapshot = builder.build(indicators)
+
+        level.mark_touched(BASE_TS + 60000)
+
+        assert snapshot.liquidity_strength_metrics[0].level is not level
+        assert snapshot.liquidity_strength_metrics[0].level.touch_count == 0
+
+
+class TestIndicatorSnapshot:
+    """Test snapshot immutability and serialization."""
+
+    def test_snapshot_is_immutable(self):
+        """Test attributes cannot be set or added."""
+        snapshot = SnapshotBuilder("BTCUSDT", TimeFrame.M1).build(make_indicators())
+
+        with pytest.raises(AttributeError, match="immutable"):
+            snapshot.version = 10
+        with pytest.raises(AttributeError):
+            snapshot.extra = 1
+        assert isinstance(snapshot.order_blocks, tuple)
+
+    def test_to_dict_is_lazy_and_cached(self):
+        """Test serialization matches the indicators and is computed once."""
+        indicators = make_indicators()
+        snapshot = SnapshotBuilder("BTCUSDT", TimeFrame.M1).build(indicators)
+
+        data = snapshot.to_dict()
+        assert snapshot.to_dict() is data
+        assert data["version"] == 1
+        assert data["order_blocks"] == [
+            {"id": f"BULLISH:{ob.origin_timestamp}", **ob.to_dict()}
+            for ob in indicators.order_blocks
+        ]
+        assert snapshot.counts()["order_blocks"] == 3
+
+    def test_serialize_payload(self):
+        """Test nested payloads are converted to plain data."""
+        ob = make_ob(0)
+        payload = {"count": 1, "order_blocks": (ob,), "type": FVGType.BULLISH}
+
+        assert serialize_payload(payload) == {
+            "count": 1,
+            "order_blocks": [ob.to_dict()],
+            "type": "BULLISH",
+        }
+
+
+class TestIndicatorDelta:
+    """Test deltas between consecutive snapshots."""
+
+    def test_added_changed_removed(self):
+        """Test a delta reports ids of new, mutated and dropped indicators."""
+        builder = SnapshotBuilder("BTCUSDT", TimeFrame.M1)
+        indicators = make_indicators()
+        first = builder.build(indicators)
+
+        indicators.order_blocks[1].mark_tested(BASE_TS + 60000)
+        removed = indicators.order_blocks[0]
+        indicators.set_zones("order_blocks", indicators.order_blocks[1:] + [make_ob(5)])
+        second = builder.build(indicators)
+
+        delta = diff_snapshots(first, second, sequence=7)
+        assert delta.sequence == 7
+        assert delta.version == second.version
+        assert list(delta.added["order_blocks"]) == [f"BULLISH:{make_ob(5).origin_timestamp}"]
+        assert list(delta.changed["order_blocks"]) == [f"BULLISH:{BASE_TS + 60000}"]
+        assert delta.removed["order_blocks"] == (f"BULLISH:{removed.origin_timestamp}",)
+        assert "fair_value_gaps" not in delta.added
+        assert not delta.touches("liquidity_levels")
+
+    def test_apply_rebuilds_current_state(self):
+        """Test applying deltas in order reproduces the latest snapshot."""
+        builder = SnapshotBuilder("BTCUSDT", TimeFrame.M1)
+        indicators = make_indicators()
+        mirror = {}
+        previous = None
+
+        for step in range(4):
+            if step:
+                indicators.order_blocks[0].mark_tested(BASE_TS + step)
+                indicators.add_zone(make_ob(10 + step))
+            snapshot = builder.build(indicators)
+            diff_snapshots(previous, snapshot, sequence=step + 1).apply(mirror)
+            previous = snapshot
+
+        full = {key: item for key, item in previous.to_dict().items() if key in mirror}
+        assert {name: sorted(items) for name, items in mirror.items() if items} == {
+            name: sorted(item["id"] for item in items) for name, items in full.items() if items
+        }
+
+    def test_unchanged_snapshot_gives_empty_delta(self):
+        """Test shared collections produce an empty, compact delta."""
+        builder = SnapshotBuilder("BTCUSDT", TimeFrame.M1)
+        indicators = make_indicators()
+        first = builder.build(indicators)
+        delta = diff_snapshots(first, builder.build(indicators), sequence=2)
+
+        assert delta.is_empty
+        data = delta.to_dict()
+        assert data["sequence"] == 2
+        assert data["added"] == data["changed"] == data["removed"] == {}
+
+
+class TestEngineSnapshots:
+    """Test engine snapshot access."""
+
+    def _candles(self, count: int):
+        candles = []
+        for i in range(count):
+            close = 100.0 + i
+            candles.append(
+                Candle(
+                    symbol="BTCUSDT",
+                    timeframe=TimeFrame.M1,
+                    timestamp=BASE_TS + i * 60000,
+                    open=close - 0.5,
+                    high=close + 1.0,
+                    low=close - 1.0,
+                    close=close,
+                    volume=100.0,
+                )
+            )
+        return candles
+
+    def _swinging_candles(self, count: int):
+        """Candles oscillating around 100 so swing highs and lows form liquidity levels."""
+        candles = []
+        previous_close = 100.0
+        for i in range(count):
+            close = 100.0 + 10.0 * math.sin(2 * math.pi * (i + 0.25) / 20)
+            open_price = (previous_close + close) / 2
+            candles.append(
+                Candle(
+                    symbol="BTCUSDT",
+                    timeframe=TimeFrame.M1,
+                    timestamp=BASE_TS + i * 60000,
+                    open=open_price,
+                    high=max(open_price, close) + 0.5,
+                    low=min(open_price, close) - 0.5,
+                    close=close,
+                    volume=150.0 if i % 7 == 0 else 100.0,
+                )
+            )
+            previous_close = close
+        return candles
+
+    def test_get_snapshot_versions(self):
+        """Test the same snapshot is returned until the timeframe changes."""
+        engine = MultiTimeframeIndicatorEngine(timeframes=[TimeFrame.M1])
+        candles = self._candles(40)
+        for candle in candles[:30]:
+            engine.add_candle(candle)
+
+        snapshot = engine.get_snapshot(TimeFrame.M1)
+        assert isinstance(snapshot, IndicatorSnapshot)
+        assert snapshot.symbol == "BTCUSDT"
+        assert snapshot.timestamp == candles[29].timestamp
+        assert engine.get_snapshot(TimeFrame.M1) is snapshot
+
+        engine.add_candle(candles[30])
+        updated = engine.get_snapshot(TimeFrame.M1)
+        assert updated.version == snapshot.version + 1
+        assert updated.timestamp == candles[30].timestamp
+        assert engine.get_snapshot(TimeFrame.H1) is None
+
+    def test_fvg_payload_is_frozen(self):
+        """Test detection payload objects are frozen copies shared with the snapshot."""
+        engine = MultiTimeframeIndicatorEngine(timeframes=[TimeFrame.M1])
+        fvg = FairValueGap(
+            type=FVGType.BULLISH,
+            high=102.0,
+            low=101.0,
+            origin_timestamp=BASE_TS,
+            origin_candle_index=0,
+            symbol="BTCUSDT",
+            timeframe=TimeFrame.M1,
+            size_pips=1.0,
+            size_percentage=1.0,
+            volume=10.0,
+        )
+        engine.timeframe_data[TimeFrame.M1].indicators.add_zone(fvg)
+        engine.add_candle(self._candles(1)[0])
+
+        (frozen,) = engine._freeze(TimeFrame.M1, [fvg])
+        snapshot = engine.get_snapshot(TimeFrame.M1)
+
+        assert frozen is not fvg
+        assert snapshot.fair_value_gaps[0] is frozen
+
+    @pytest.mark.asyncio
+    async def test_updates_publish_sequenced_deltas(self):
+        """Test INDICATORS_UPDATED carries consecutive sequence numbers and deltas."""
+        event_bus = MagicMock()
+        event_bus.publish = AsyncMock()
+        engine = MultiTimeframeIndicatorEngine(timeframes=[TimeFrame.M1], event_bus=event_bus)
+        for candle in self._swinging_candles(60):
+            engine.add_candle(candle)
+        await asyncio.sleep(0)
+
+        events = [call[0][0] for call in event_bus.publish.call_args_list]
+        updates = [
+            event.data for event in events if event.event_type == EventType.INDICATORS_UPDATED
+        ]
+        strength_updates = [
+            event.data
+            for event in events
+            if event.event_type == EventType.LIQUIDITY_STRENGTH_CALCULATED
+        ]
+        assert len(updates) > 1
+        assert updates[-1]["liquidity_levels_count"] > 0
+        assert strength_updates
+        assert {data["sequence"] for data in strength_updates} <= {
+            data["sequence"] for data in updates
+        }
+        sequences = [data["sequence"] for data in updates]
+        assert sequences == list(range(sequences[0], sequences[0] + len(sequences)))
+        assert "snapshot" not in updates[-1]
+        assert updates[-1]["delta"].sequence == sequences[-1]
+        assert engine.get_snapshot(TimeFrame.M1).sequence == sequences[-1]
+
+    @pytest.mark.asyncio
+    async def test_clear_restarts_deltas_from_full_state(self):
+        """Test the first delta after a clear restarts the sequence and holds the full state."""
+        event_bus = MagicMock()
+        event_bus.publish = AsyncMock()
+        engine = MultiTimeframeIndicatorEngine(timeframes=[TimeFrame.M1], event_bus=event_bus)
+        candles = self._swinging_candles(60)
+        for candle in candles:
+            engine.add_candle(candle)
+        await asyncio.sleep(0)
+        assert engine.get_snapshot(TimeFrame.M1).liquidity_levels
+
+        engine.clear_timeframe(TimeFrame.M1)
+        event_bus.publish.reset_mock()
+        for candle in candles:
+            engine.add_candle(candle)
+        await asyncio.sleep(0)
+
+        deltas = [
+            call[0][0].data["delta"]
+            for call in event_bus.publish.call_args_list
+            if call[0][0].event_type == EventType.INDICATORS_UPDATED
+        ]
+        assert deltas[0].sequence == 1
+        assert not deltas[0].removed
+        applied: dict = {}
+        for delta in deltas:
+            delta.apply(applied)
+        snapshot = engine.get_snapshot(TimeFrame.M1)
+        assert len(applied["liquidity_levels"]) == len(snapshot.liquidity_levels)
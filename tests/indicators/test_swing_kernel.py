@@ -0,0 +1,169 @@
+"""
+Tests for the shared vectorized swing detection kernel.
+"""
+
+import random
+
+import numpy as np
+import pytest
+
+from src.core.constants import TimeFrame
+from src.indicators.liquidity_zone import LiquidityZoneDetector
+from src.indicators.order_block import OrderBlockDetector
+from src.indicators.swing_kernel import clear_swing_cache, find_swing_indices, get_swing_indices
+from src.indicators.trend_recognition import TrendRecognitionEngine
+from src.models.candle import Candle
+from src.models.candle_buffer import CandleBuffer
+
+
+def reference_swings(highs, lows, lookback):
+    """Straightforward loop implementation of the swing rule."""
+    swing_highs, swing_lows = [], []
+    for i in range(lookback, len(highs) - lookback):
+        neighbours = list(range(i - lookback, i)) + list(range(i + 1, i + lookback + 1))
+        if all(highs[i] > highs[j] for j in neighbours):
+            swing_highs.append(i)
+        if all(lows[i] < lows[j] for j in neighbours):
+            swing_lows.append(i)
+    return swing_highs, swing_lows
+
+
+def make_candles(count: int, seed: int = 0):
+    """Create candles on a coarse price grid so equal highs/lows occur."""
+    rnd = random.Random(seed)
+    price = 100.0
+    candles = []
+    for i in range(count):
+        open_price = price
+        close = max(10.0, open_price + rnd.choice([-1.0, -0.5, 0.0, 0.5, 1.0]))
+        candles.append(
+            Candle(
+                symbol="BTCUSDT",
+                timeframe=TimeFrame.M1,
+                timestamp=1704067200000 + i * 60000,
+                open=open_price,
+                high=max(open_price, close) + rnd.choice([0.0, 0.5]),
+                low=min(open_price, close) - rnd.choice([0.0, 0.5]),
+                close=close,
+                volume=100.0,
+                is_closed=True,
+            )
+        )
+        price = close
+    return candles
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    """Isolate memoized results between tests."""
+    clear_swing_cache()
+    yield
+    clear_swing_cache()
+
+
+class TestFindSwingIndices:
+    """Test the array kernel."""
+
+    @pytest.mark.parametrize("lookback", [1, 2, 3, 5, 8])
+    def test_matches_reference_with_ties(self, lookback):
+        """Test kernel output equals the loop rule, including equal prices."""
+        candles = make_candles(600, seed=lookback)
+        highs = np.array([c.high for c in candles])
+        lows = np.array([c.low for c in candles])
+
+        high_idx, low_idx = find_swing_indices(highs, lows, lookback)
+        expected_highs, expected_lows = reference_swings(highs, lows, lookback)
+
+        assert high_idx.tolist() == expected_highs
+        assert low_idx.tolist() == expected_lows
+
+    def test_insufficient_data_returns_empty(self):
+        """Test fewer than 2 * lookback + 1 values yields no swings."""
+        high_idx, low_idx = find_swing_indices(np.ones(4), np.ones(4), 2)
+
+        assert len(high_idx) == 0
+        assert len(low_idx) == 0
+
+    def test_invalid_lookback_raises_error(self):
+        """Test non-positive lookback is rejected."""
+        with pytest.raises(ValueError, match="lookback must be positive"):
+            find_swing_indices(np.ones(10), np.ones(10), 0)
+
+
+class TestSwingMemoization:
+    """Test buffer-version memoization."""
+
+    def test_shared_result_for_same_buffer_version(self):
+        """Test repeated calls on one snapshot reuse the computed arrays."""
+        buffer = CandleBuffer(capacity=100, keep_objects=True)
+        for candle in make_candles(50):
+            buffer.append(candle)
+        candles = buffer.snapshot()
+
+        first = get_swing_indices(candles, 3)
+        second = get_swing_indices(candles, 3)
+
+        assert first[0] is second[0]
+        assert first[1] is second[1]
+
+    def test_cache_invalidated_by_append(self):
+        """Test a new buffer version recomputes swings."""
+        buffer = CandleBuffer(capacity=100, keep_objects=True)
+        candles = make_candles(60)
+        for candle in candles[:50]:
+            buffer.append(candle)
+        before = get_swing_indices(buffer.snapshot(), 3)
+
+        for candle in candles[50:]:
+            buffer.append(candle)
+        snapshot = buffer.snapshot()
+        after = get_swing_indices(snapshot, 3)
+
+        assert after[0] is not before[0]
+        expected = find_swing_indices(
+            np.array([c.high for c in snapshot]), np.array([c.low for c in snapshot]), 3
+        )
+        assert after[0].tolist() == expected[0].tolist()
+        assert after[1].tolist() == expected[1].tolist()
+
+    def test_stale_snapshot_uses_its_own_candles(self):
+        """Test an outdated snapshot is not answered from the newer buffer."""
+        buffer = CandleBuffer(capacity=100, keep_objects=True)
+        candles = make_candles(60)
+        for candle in candles[:40]:
+            buffer.append(candle)
+        stale = buffer.snapshot()
+        for candle in candles[40:]:
+            buffer.append(candle)
+
+        assert not stale.is_current()
+        result = get_swing_indices(stale, 3)
+        expected = get_swing_indices(list(stale), 3)
+        assert result[0].tolist() == expected[0].tolist()
+        assert result[1].tolist() == expected[1].tolist()
+
+
+class TestDetectorsUseKernel:
+    """Test all swing detectors agree on shared candles."""
+
+    def test_detectors_agree_on_swing_indices(self):
+        """Test OB, liquidity and trend detectors return the same swings."""
+        buffer = CandleBuffer(capacity=500, keep_objects=True)
+        for candle in make_candles(400, seed=42):
+            buffer.append(candle)
+        candles = buffer.snapshot()
+
+        ob_highs = OrderBlockDetector().detect_swing_highs(candles, lookback=3)
+        lz_highs = LiquidityZoneDetector().detect_swing_highs(candles, lookback=3)
+        trend_lows = TrendRecognitionEngine().detect_swing_lows(candles, lookback=3)
+        lz_lows = LiquidityZoneDetector().detect_swing_lows(list(candles), lookback=3)
+
+        expected_highs, expected_lows = reference_swings(
+            [c.high for c in candles], [c.low for c in candles], 3
+        )
+        assert [s.candle_index for s in ob_highs] == expected_highs
+        assert [s.candle_index for s in lz_highs] == expected_highs
+        assert [s.candle_index for s in trend_lows] == expected_lows
+        assert [s.candle_index for s in lz_lows] == expected_lows
+        assert all(s.price == candles[s.candle_index].high for s in lz_highs)
+        assert all(s.volume == candles[s.candle_index].volume for s in trend_lows)
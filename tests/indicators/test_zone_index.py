@@ -0,0 +1,305 @@
+"""
+Tests for the zone price index and its use by detectors and expiration.
+"""
+
+import copy
+import random
+from typing import List
+
+import pytest
+
+from src.core.constants import TimeFrame
+from src.indicators.breaker_block import BreakerBlockDetector
+from src.indicators.expiration_manager import (
+    ExpirationConfig,
+    ExpirationRules,
+    ExpirationType,
+    IndicatorExpirationManager,
+)
+from src.indicators.fair_value_gap import FairValueGap, FVGDetector, FVGState, FVGType
+from src.indicators.multi_timeframe_engine import TimeframeIndicators
+from src.indicators.order_block import OrderBlock, OrderBlockState, OrderBlockType
+from src.indicators.zone_index import ZoneIndex
+from src.models.candle import Candle
+
+BASE_TS = 1704067200000
+
+
+def make_ob(low: float, high: float, i: int, bullish: bool = True) -> OrderBlock:
+    """Create an Order Block formed at candle i."""
+    return OrderBlock(
+        type=OrderBlockType.BULLISH if bullish else OrderBlockType.BEARISH,
+        high=high,
+        low=low,
+        origin_timestamp=BASE_TS + i * 60000,
+        origin_candle_index=i,
+        symbol="BTCUSDT",
+        timeframe=TimeFrame.M1,
+        strength=50.0,
+        volume=100.0,
+    )
+
+
+def make_fvg(low: float, high: float, i: int, bullish: bool = True) -> FairValueGap:
+    """Create a Fair Value Gap formed at candle i."""
+    return FairValueGap(
+        type=FVGType.BULLISH if bullish else FVGType.BEARISH,
+        high=high,
+        low=low,
+        origin_timestamp=BASE_TS + i * 60000,
+        origin_candle_index=i,
+        symbol="BTCUSDT",
+        timeframe=TimeFrame.M1,
+        size_pips=high - low,
+        size_percentage=0.1,
+        volume=100.0,
+    )
+
+
+def make_candle(i: int, low: float, high: float, close: float) -> Candle:
+    """Create the i-th closed one-minute candle."""
+    return Candle(
+        symbol="BTCUSDT",
+        timeframe=TimeFrame.M1,
+        timestamp=BASE_TS + i * 60000,
+        open=(low + high) / 2,
+        high=high,
+        low=low,
+        close=close,
+        volume=10.0,
+        is_closed=True,
+    )
+
+
+def random_zones(rng: random.Random, factory, count: int) -> List:
+    zones = []
+    for i in range(count):
+        low = rng.uniform(100.0, 200.0)
+        zones.append(factory(low, low + rng.uniform(0.5, 8.0), i, rng.random() < 0.5))
+    return zones
+
+
+def random_candles(rng: random.Random, start: int, count: int) -> List[Candle]:
+    candles = []
+    for i in range(start, start + count):
+        low = rng.uniform(95.0, 200.0)
+        high = low + rng.uniform(0.5, 15.0)
+        candles.append(make_candle(i, low, high, rng.uniform(low, high)))
+    return candles
+
+
+class TestZoneIndexQueries:
+    """Test index queries against linear scans."""
+
+    def test_containing_and_overlapping_match_scan(self):
+        """Test stabbing and range queries return the scanned zones in order."""
+        rng = random.Random(7)
+        zones = random_zones(rng, make_ob, 300)
+        index = ZoneIndex()
+        for zone in zones:
+            index.add(zone)
+
+        for _ in range(200):
+            price = rng.uniform(95.0, 210.0)
+            assert index.containing(price) == [z for z in zones if z.contains_price(price)]
+
+            low = rng.uniform(95.0, 210.0)
+            high = low + rng.uniform(0.0, 5.0)
+            assert index.overlapping(low, high, side="BEARISH") == [
+                z
+                for z in zones
+                if z.type == OrderBlockType.BEARISH and z.low <= high and z.high >= low
+            ]
+
+    def test_nearest_below_and_above(self):
+        """Test nearest queries match max/min over the filtered zones."""
+        rng = random.Random(11)
+        zones = random_zones(rng, make_ob, 200)
+        for zone in zones[::3]:
+            zone.mark_tested(BASE_TS)
+        index = ZoneIndex()
+        for zone in zones:
+            index.add(zone)
+
+        def is_active(ob):
+            return ob.state == OrderBlockState.ACTIVE
+
+        for _ in range(200):
+            price = rng.uniform(95.0, 210.0)
+            below = [
+                z
+                for z in zones
+                if z.type == OrderBlockType.BULLISH and is_active(z) and z.high < price
+            ]
+            above = [
+                z
+                for z in zones
+                if z.type == OrderBlockType.BEARISH and is_active(z) and z.low > price
+            ]
+
+            expected_below = max(below, key=lambda z: z.high) if below else None
+            expected_above = min(above, key=lambda z: z.low) if above else None
+            assert index.nearest_below(price, OrderBlockType.BULLISH, is_active) is expected_below
+            assert index.nearest_above(price, OrderBlockType.BEARISH, is_active) is expected_above
+
+    def test_reached_by_and_aged(self):
+        """Test invalidation and age candidate queries."""
+        support = make_ob(100.0, 102.0, 0)
+        resistance = make_ob(110.0, 112.0, 5, bullish=False)
+        inside = make_ob(104.0, 106.0, 9)
+        index = ZoneIndex()
+        for zone in (support, resistance, inside):
+            index.add(zone)
+
+        # Candle below every zone: bullish zones above it were traded through
+        assert index.reached_by(98.0, 99.0) == [support, inside]
+        # Candle between the zones reaches nothing
+        assert index.reached_by(107.0, 108.0) == []
+        # Candle through the resistance and into the upper support
+        assert index.reached_by(105.0, 113.0) == [resistance, inside]
+
+        assert index.aged(candle_index=5) == [support, resistance]
+        assert index.aged(timestamp=BASE_TS) == [support]
+        assert index.aged() == []
+
+    def test_dead_zones_are_pruned_lazily(self):
+        """Test zones changing state in place are dropped on the next query."""
+        ob = make_ob(100.0, 102.0, 0)
+        index = ZoneIndex(live=lambda z: z.state == OrderBlockState.ACTIVE)
+        index.add(ob)
+        assert len(index) == 1
+
+        ob.mark_broken()
+        assert index.containing(101.0) == []
+        assert ob not in index
+        assert index.add(ob) is False
+
+    def test_update_keeps_insertion_order(self):
+        """Test updating a live zone does not move it."""
+        first, second = make_ob(100.0, 102.0, 0), make_ob(100.5, 101.0, 1)
+        index = ZoneIndex()
+        index.add(first)
+        index.add(second)
+
+        index.update(first)
+        assert list(index) == [first, second]
+
+        assert index.discard(first) is True
+        assert index.discard(first) is False
+        assert index.containing(100.7) == [second]
+
+
+class TestTimeframeIndicatorsIndex:
+    """Test TimeframeIndicators keeps zone indexes in sync."""
+
+    def test_add_zone_and_lookup(self):
+        """Test added zones are queryable by price."""
+        indicators = TimeframeIndicators(timeframe=TimeFrame.M1)
+        ob = make_ob(100.0, 102.0, 0)
+        fvg = make_fvg(101.0, 103.0, 1)
+        indicators.add_zone(ob)
+        indicators.add_zone(fvg)
+
+        zones = indicators.get_zones_containing(101.5)
+        assert zones["order_blocks"] == [ob]
+        assert zones["fair_value_gaps"] == [fvg]
+        assert zones["breaker_blocks"] == []
+        assert indicators.order_blocks == [ob]
+
+        with pytest.raises(ValueError, match="Unsupported zone type"):
+            indicators.add_zone(object())
+
+    def test_direct_assignment_is_reindexed(self):
+        """Test lists assigned directly are picked up by the index."""
+        indicators = TimeframeIndicators(timeframe=TimeFrame.M1)
+        indicators.add_zone(make_ob(100.0, 102.0, 0))
+
+        replacement = make_ob(200.0, 202.0, 1)
+        indicators.order_blocks = [replacement]
+        assert indicators.order_block_index.containing(201.0) == [replacement]
+        assert indicators.order_block_index.containing(101.0) == []
+
+        indicators.clear()
+        assert len(indicators.order_block_index) == 0
+
+
+class TestIndexedStateUpdates:
+    """Test indexed state updates match the linear implementations."""
+
+    def test_update_fvg_states_matches_scan(self):
+        """Test indexed FVG updates produce the same states."""
+        rng = random.Random(3)
+        detector = FVGDetector()
+        fvgs = random_zones(rng, make_fvg, 200)
+        indexed = copy.deepcopy(fvgs)
+        index = ZoneIndex(live=lambda f: f.state in (FVGState.ACTIVE, FVGState.PARTIAL))
+        for fvg in indexed:
+            index.add(fvg)
+
+        for step in range(5):
+            candles = random_candles(rng, 200 + step * 10, 10)
+            detector.update_fvg_states(fvgs, candles)
+            detector.update_fvg_states(indexed, candles, fvg_index=index)
+
+            assert [(f.state, f.filled_percentage) for f in fvgs] == [
+                (f.state, f.filled_percentage) for f in indexed
+            ]
+            assert len(index) == sum(
+                f.state in (FVGState.ACTIVE, FVGState.PARTIAL) for f in indexed
+            )
+
+    @pytest.mark.parametrize("auto_remove", [True, False])
+    def test_expire_order_blocks_matches_scan(self, auto_remove):
+        """Test indexed expiration expires the same blocks with the same stats."""
+        rules = ExpirationRules(
+            order_block=ExpirationConfig(
+                max_age_candles=40,
+                price_breach_percentage=50.0,
+                expiration_type=ExpirationType.BOTH,
+            )
+        )
+        linear = IndicatorExpirationManager(rules, auto_remove_expired=auto_remove)
+        indexed = IndicatorExpirationManager(rules, auto_remove_expired=auto_remove)
+
+        rng = random.Random(5)
+        obs = random_zones(rng, make_ob, 150)
+        indexed_obs = copy.deepcopy(obs)
+        index = ZoneIndex(
+            live=lambda ob: ob.state in (OrderBlockState.ACTIVE, OrderBlockState.TESTED)
+        )
+        for ob in indexed_obs:
+            index.add(ob)
+
+        for candle in random_candles(rng, 150, 30):
+            obs = linear.expire_order_blocks(obs, candle, candle.timestamp // 60000 % 1000)
+            indexed_obs = indexed.expire_order_blocks(
+                indexed_obs, candle, candle.timestamp // 60000 % 1000, zone_index=index
+            )
+            assert [(ob.origin_candle_index, ob.state) for ob in obs] == [
+                (ob.origin_candle_index, ob.state) for ob in indexed_obs
+            ]
+
+        assert linear.get_statistics() == indexed.get_statistics()
+
+    def test_detect_breaker_blocks_matches_scan(self):
+        """Test indexed breach detection finds the same transitions."""
+        detector = BreakerBlockDetector()
+        rng = random.Random(9)
+        obs = random_zones(rng, make_ob, 120)
+        indexed_obs = copy.deepcopy(obs)
+        index = ZoneIndex(
+            live=lambda ob: ob.state in (OrderBlockState.ACTIVE, OrderBlockState.TESTED)
+        )
+        for ob in indexed_obs:
+            index.add(ob)
+        candles = random_candles(rng, 0, 200)
+
+        expected = detector.detect_breaker_blocks(obs, candles, start_index=100)
+        actual = detector.detect_breaker_blocks(
+            indexed_obs, candles, start_index=100, order_block_index=index
+        )
+
+        assert [bb.to_dict() for bb in actual] == [bb.to_dict() for bb in expected]
+        assert expected
+        assert [ob.state for ob in obs] == [ob.state for ob in indexed_obs]
+        assert all(ob.state != OrderBlockState.BROKEN for ob in index)
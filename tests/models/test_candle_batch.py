@@ -0,0 +1,117 @@
+"""
+Tests for vectorized CandleBatch construction.
+"""
+
+import time
+
+import numpy as np
+import pytest
+
+from src.core.constants import TimeFrame
+from src.models.candle import Candle
+from src.models.candle_batch import CandleBatch
+from src.models.candle_buffer import CandleArrays, CandleBuffer
+
+BASE_TS = 1704067200000
+
+
+def make_rows(count: int):
+    """Create valid CCXT OHLCV rows, one minute apart and 30s into each minute."""
+    rows = []
+    for i in range(count):
+        close = 100.0 + i
+        rows.append(
+            [BASE_TS + i * 60000 + 30000, close - 0.5, close + 1.0, close - 1.0, close, 10.0]
+        )
+    return rows
+
+
+class TestCandleBatch:
+    """Test validation and normalization against Candle."""
+
+    def test_matches_candle_construction(self):
+        """Test batch candles equal candles built one by one."""
+        rows = make_rows(20)
+        batch = CandleBatch.from_ohlcv("BTCUSDT", TimeFrame.M1, rows, is_closed=True)
+
+        expected = [Candle.from_ccxt_ohlcv("BTCUSDT", TimeFrame.M1, row, True) for row in rows]
+        assert len(batch) == 20
+        assert batch.rejected == 0
+        assert batch.to_candles() == expected
+        assert batch.arrays.timestamp[0] == BASE_TS
+
+    def test_reject_mask_and_errors(self):
+        """Test invalid rows are masked out with the reason Candle would raise."""
+        rows = make_rows(6)
+        rows[1][1] = -1.0  # non-positive open
+        rows[2][5] = -5.0  # negative volume
+        rows[3][1] = 500.0  # open above high
+        rows[4][4] = 1.0  # close below low
+        rows[5][2] = float("nan")  # NaN high
+
+        batch = CandleBatch.from_ohlcv("BTCUSDT", TimeFrame.M1, rows)
+
+        assert batch.valid.tolist() == [True, False, False, False, False, False]
+        assert batch.rejected == 5
+        assert [error["reason"] for error in batch.errors()] == [
+            "non_positive_price",
+            "negative_volume",
+            "open_outside_range",
+            "close_outside_range",
+            "non_positive_price",
+        ]
+        assert batch.errors(limit=1) == [{"index": 1, "reason": "non_positive_price"}]
+        for row in rows[1:]:
+            with pytest.raises(ValueError):
+                Candle.from_ccxt_ohlcv("BTCUSDT", TimeFrame.M1, row)
+
+    def test_invalid_shape_raises_error(self):
+        """Test rows with fewer than 6 columns are rejected as a whole."""
+        with pytest.raises(ValueError, match="Expected 6 columns"):
+            CandleBatch.from_ohlcv("BTCUSDT", TimeFrame.M1, [[BASE_TS, 1.0, 2.0]])
+        assert len(CandleBatch.from_ohlcv("BTCUSDT", TimeFrame.M1, [])) == 0
+
+    def test_bulk_load_one_million(self):
+        """Test a million rows are validated and stored well under a second."""
+        count = 1_000_000
+        close = np.linspace(100.0, 200.0, count)
+        ohlcv = np.column_stack(
+            (
+                BASE_TS + np.arange(count, dtype=np.float64) * 60000,
+                close - 0.5,
+                close + 1.0,
+                close - 1.0,
+                close,
+                np.full(count, 10.0),
+            )
+        )
+        buffer = CandleBuffer(capacity=count, symbol="BTCUSDT", timeframe=TimeFrame.M1)
+
+        started = time.perf_counter()
+        batch = CandleBatch.from_ohlcv("BTCUSDT", TimeFrame.M1, ohlcv, is_closed=True)
+        buffer.extend(batch.arrays)
+        elapsed = time.perf_counter() - started
+
+        assert len(buffer) == count
+        assert elapsed < 1.0
+
+
+class TestBulkStorage:
+    """Test columnar bulk appends."""
+
+    def test_extend_matches_append(self):
+        """Test extend evicts and orders rows exactly like repeated append."""
+        rows = make_rows(50)
+        batch = CandleBatch.from_ohlcv("BTCUSDT", TimeFrame.M1, rows, is_closed=True)
+
+        appended = CandleBuffer(capacity=8)
+        expected_evictions = sum(appended.append(candle) for candle in batch.to_candles())
+
+        extended = CandleBuffer(capacity=8, symbol="BTCUSDT", timeframe=TimeFrame.M1)
+        first = CandleArrays(*(column[:5] for column in batch.arrays))
+        rest = CandleArrays(*(column[5:] for column in batch.arrays))
+        evictions = extended.extend(first) + extended.extend(rest)
+
+        assert evictions == expected_evictions
+        assert extended.column("timestamp").tolist() == appended.column("timestamp").tolist()
+        assert extended.to_candles() == appended.to_candles()
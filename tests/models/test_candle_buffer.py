@@ -0,0 +1,184 @@
+"""
+Tests for the columnar CandleBuffer.
+"""
+
+import numpy as np
+import pytest
+
+from src.core.constants import TimeFrame
+from src.models.candle import Candle
+from src.models.candle_buffer import CandleBuffer
+
+
+def make_candle(i: int, symbol: str = "BTCUSDT") -> Candle:
+    """Create the i-th one-minute test candle."""
+    close = 100.0 + i
+    return Candle(
+        symbol=symbol,
+        timeframe=TimeFrame.M1,
+        timestamp=1704067200000 + i * 60000,
+        open=close - 0.5,
+        high=close + 1.0,
+        low=close - 1.0,
+        close=close,
+        volume=10.0 + i,
+        is_closed=i % 2 == 0,
+    )
+
+
+class TestCandleBufferBasics:
+    """Test append, eviction and views."""
+
+    def test_invalid_capacity_raises_error(self):
+        """Test non-positive capacity is rejected."""
+        with pytest.raises(ValueError, match="capacity must be positive"):
+            CandleBuffer(0)
+
+    def test_append_and_arrays(self):
+        """Test appended candles are exposed as columns."""
+        buffer = CandleBuffer(capacity=10)
+        for i in range(3):
+            assert buffer.append(make_candle(i)) is False
+
+        arrays = buffer.arrays()
+        assert len(buffer) == 3
+        assert len(arrays) == 3
+        assert arrays.timestamp.dtype == np.int64
+        assert arrays.close.tolist() == [100.0, 101.0, 102.0]
+        assert arrays.is_closed.tolist() == [True, False, True]
+        assert buffer.symbol == "BTCUSDT"
+        assert buffer.timeframe == TimeFrame.M1
+
+    def test_eviction_keeps_most_recent(self):
+        """Test the oldest rows are evicted beyond capacity across compactions."""
+        buffer = CandleBuffer(capacity=5)
+        evictions = sum(buffer.append(make_candle(i)) for i in range(200))
+
+        assert evictions == 195
+        assert len(buffer) == 5
+        assert buffer.column("close").tolist() == [295.0, 296.0, 297.0, 298.0, 299.0]
+        assert [c.close for c in buffer.to_candles()] == [295.0, 296.0, 297.0, 298.0, 299.0]
+
+    def test_views_are_zero_copy_and_read_only(self):
+        """Test tail views share memory with the buffer and reject writes."""
+        buffer = CandleBuffer(capacity=50)
+        for i in range(30):
+            buffer.append(make_candle(i))
+
+        tail = buffer.column("close", last=10)
+        assert tail.flags.c_contiguous
+        assert np.shares_memory(tail, buffer.column("close"))
+        assert tail.tolist() == [float(100 + i) for i in range(20, 30)]
+        with pytest.raises(ValueError):
+            tail[0] = 1.0
+
+    def test_last_bounds(self):
+        """Test last larger than size or non-positive."""
+        buffer = CandleBuffer(capacity=10)
+        for i in range(4):
+            buffer.append(make_candle(i))
+
+        assert len(buffer.arrays(last=100)) == 4
+        assert len(buffer.arrays(last=0)) == 0
+
+    def test_version_changes_on_mutation(self):
+        """Test version is bumped by append, removal and clear."""
+        buffer = CandleBuffer(capacity=10)
+        versions = [buffer.version]
+        buffer.append(make_candle(0))
+        versions.append(buffer.version)
+        buffer.remove_before(make_candle(1).timestamp)
+        versions.append(buffer.version)
+        buffer.clear()
+        versions.append(buffer.version)
+
+        assert len(set(versions)) == 4
+
+
+class TestCandleBufferMaterialization:
+    """Test conversion back to Candle objects."""
+
+    def test_materialized_candles_equal_originals(self):
+        """Test rebuilt candles equal the appended ones."""
+        buffer = CandleBuffer(capacity=10)
+        originals = [make_candle(i) for i in range(12)]
+        for candle in originals:
+            buffer.append(candle)
+
+        rebuilt = buffer.to_candles()
+        assert rebuilt == originals[-10:]
+        assert all(isinstance(c.close, float) for c in rebuilt)
+        assert buffer.latest() == originals[-1]
+
+    def test_keep_objects_returns_originals(self):
+        """Test buffers keeping objects return the same instances."""
+        buffer = CandleBuffer(capacity=3, keep_objects=True)
+        originals = [make_candle(i) for i in range(40)]
+        for candle in originals:
+            buffer.append(candle)
+
+        assert all(a is b for a, b in zip(buffer.to_candles(), originals[-3:]))
+        assert buffer.latest() is originals[-1]
+
+    def test_select_by_mask(self):
+        """Test selecting rows with a boolean mask."""
+        buffer = CandleBuffer(capacity=10)
+        for i in range(6):
+            buffer.append(make_candle(i))
+
+        selected = buffer.select(buffer.column("close") >= 103.0)
+        assert [c.close for c in selected] == [103.0, 104.0, 105.0]
+
+    def test_search_time_range(self):
+        """Test binary search for a timestamp range after eviction."""
+        buffer = CandleBuffer(capacity=5)
+        for i in range(8):
+            buffer.append(make_candle(i))
+
+        rows = buffer.search(make_candle(4).timestamp, make_candle(6).timestamp)
+        assert [c.timestamp for c in buffer.to_candles(rows.start, rows.stop)] == [
+            make_candle(i).timestamp for i in (4, 5, 6)
+        ]
+        assert buffer.search(end_time=make_candle(2).timestamp) == slice(0, 0)
+        assert buffer.is_sorted
+
+        buffer.append(make_candle(1))
+        assert not buffer.is_sorted
+
+    def test_empty_buffer(self):
+        """Test reads on an empty buffer."""
+        buffer = CandleBuffer(capacity=10)
+
+        assert buffer.latest() is None
+        assert buffer.to_candles() == []
+        assert len(buffer.arrays()) == 0
+
+
+class TestCandleBufferRemoval:
+    """Test removal operations."""
+
+    def test_remove_before(self):
+        """Test rows older than a timestamp are removed."""
+        buffer = CandleBuffer(capacity=10, keep_objects=True)
+        for i in range(8):
+            buffer.append(make_candle(i))
+
+        removed = buffer.remove_before(make_candle(5).timestamp)
+
+        assert removed == 5
+        assert [c.close for c in buffer.to_candles()] == [105.0, 106.0, 107.0]
+
+        buffer.append(make_candle(8))
+        assert buffer.column("close").tolist() == [105.0, 106.0, 107.0, 108.0]
+
+    def test_clear(self):
+        """Test clear empties the buffer but keeps it usable."""
+        buffer = CandleBuffer(capacity=10)
+        for i in range(5):
+            buffer.append(make_candle(i))
+
+        buffer.clear()
+        assert len(buffer) == 0
+
+        buffer.append(make_candle(9))
+        assert buffer.column("close").tolist() == [109.0]
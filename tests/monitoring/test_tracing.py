@@ -21,6 +21,7 @@ from src.monitoring.tracing import (
     get_tracer,
     init_tracing,
     shutdown_tracing,
+    suppress_tracing,
 )
 
 
@@ -135,6 +136,25 @@ class TestTradingTracer:
                 assert span is mock_span
                 mock_span.set_attribute.assert_called_with("test_key", "test_value")
 
+    @patch("src.monitoring.tracing.trace")
+    def test_span_context_manager_suppressed(self, mock_trace):
+        """Test no span is created while tracing is suppressed."""
+        config = TracingConfig(enabled=True)
+        mock_tracer = MagicMock()
+
+        with patch.object(TradingTracer, "_setup_tracing"):
+            tracer = TradingTracer(config)
+            tracer._tracer = mock_tracer
+
+            with suppress_tracing():
+                with tracer.start_span("test_span") as span:
+                    assert span is None
+
+            with tracer.start_span("test_span") as span:
+                assert span is not None
+
+        mock_tracer.start_as_current_span.assert_called_once()
+
     @patch("src.monitoring.tracing.trace")
     def test_span_exception_handling(self, mock_trace):
         """Test exception recording in spans."""
@@ -0,0 +1,439 @@
+"""
+Tests for the historical replay backtest engine.
+
+Tests cover:
+- Virtual clock monotonicity
+- Simulated exchange fills, fees, slippage and reduce-only handling
+- Performance metric calculation
+- End-to-end replay through the strategy, risk and order pipeline
+- Persisting reports as BacktestResult rows
+"""
+
+import logging
+import threading
+from decimal import Decimal
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+import pytest
+import pytest_asyncio
+from ccxt.base.errors import InvalidOrder
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.core.constants import TimeFrame
+from src.database.models import Base
+from src.models.candle import Candle
+from src.services.backtest import (
+    BacktestConfig,
+    BacktestEngine,
+    BacktestError,
+    SimulatedExchange,
+    VirtualClock,
+    calculate_performance_metrics,
+)
+from src.services.strategy.generator import SignalGenerator
+from src.services.strategy.signal import Signal, SignalDirection
+
+START_MS = 1_704_067_200_000  # 2024-01-01 00:00 UTC
+MINUTE_MS = 60_000
+
+
+class AlwaysLongGenerator(SignalGenerator):
+    """Emits a LONG signal with a 1% stop and 2% target on every candle."""
+
+    def __init__(self):
+        super().__init__("Test_Long")
+
+    def _generate_signal_impl(
+        self, symbol: str, current_price: Decimal, candles: pd.DataFrame, **kwargs
+    ) -> Optional[Signal]:
+        return Signal(
+            entry_price=current_price,
+            direction=SignalDirection.LONG,
+            confidence=0.8,
+            stop_loss=self.calculate_stop_loss(current_price, "LONG", candles),
+            take_profit=self.calculate_take_profit(current_price, Decimal("0"), "LONG"),
+            symbol=symbol,
+            strategy_name=self.strategy_name,
+        )
+
+    def calculate_stop_loss(
+        self, entry_price: Decimal, direction: str, candles: pd.DataFrame, **kwargs
+    ) -> Decimal:
+        return entry_price * Decimal("0.99")
+
+    def calculate_take_profit(
+        self, entry_price: Decimal, stop_loss: Decimal, direction: str, **kwargs
+    ) -> Decimal:
+        return entry_price * Decimal("1.02")
+
+    def calculate_confidence(self, candles: pd.DataFrame, **kwargs) -> float:
+        return 0.8
+
+
+class FailingGenerator(AlwaysLongGenerator):
+    """Records the candles it receives and raises on every candle."""
+
+    def __init__(self):
+        super().__init__()
+        self.received = []
+
+    def _generate_signal_impl(
+        self, symbol: str, current_price: Decimal, candles: pd.DataFrame, **kwargs
+    ) -> Optional[Signal]:
+        self.received.append(candles)
+        raise RuntimeError("generator failed")
+
+
+def make_candles(closes, symbol: str = "BTCUSDT", spread: float = 0.001):
+    """Build closed 1m candles with high/low a small spread around open/close."""
+    candles = []
+    previous = closes[0]
+    for i, close in enumerate(closes):
+        open_ = previous
+        candles.append(
+            Candle(
+                symbol=symbol,
+                timeframe=TimeFrame.M1,
+                timestamp=START_MS + i * MINUTE_MS,
+                open=open_,
+                high=max(open_, close) * (1 + spread),
+                low=min(open_, close) * (1 - spread),
+                close=close,
+                volume=10.0,
+                is_closed=True,
+            )
+        )
+        previous = close
+    return candles
+
+
+def make_engine(**overrides) -> BacktestEngine:
+    """Create an engine running only the test generator."""
+    config = BacktestConfig(timeframes=[TimeFrame.M1], max_candles_per_timeframe=100, **overrides)
+    engine = BacktestEngine(config)
+    engine.strategy_layer.strategies = {"Test_Long": AlwaysLongGenerator()}
+    engine.strategy_layer.strategy_enabled = {"Test_Long": True}
+    engine.strategy_layer.metrics["strategy_signals"] = {"Test_Long": 0}
+    return engine
+
+
+class TestVirtualClock:
+    """Test VirtualClock."""
+
+    def test_advance_and_datetime(self):
+        clock = VirtualClock()
+        clock.advance_to(START_MS)
+
+        assert clock.timestamp_ms == START_MS
+        assert clock.now().year == 2024
+        assert clock.now().tzinfo is not None
+        assert clock.utcnow().tzinfo is None
+
+    def test_cannot_move_backwards(self):
+        clock = VirtualClock(START_MS)
+
+        with pytest.raises(ValueError):
+            clock.advance_to(START_MS - 1)
+
+
+class TestSimulatedExchange:
+    """Test SimulatedExchange order fills."""
+
+    @pytest.fixture
+    def exchange(self):
+        exchange = SimulatedExchange(VirtualClock(START_MS), initial_balance=1000.0, fee_rate=0.001)
+        exchange.set_market_price("BTCUSDT", 100.0)
+        return exchange
+
+    @pytest.mark.asyncio
+    async def test_round_trip_realizes_pnl_and_fees(self, exchange):
+        await exchange.create_order("BTCUSDT", "market", "buy", 2.0)
+        exchange.set_market_price("BTCUSDT", 110.0)
+
+        assert exchange.unrealized_pnl() == pytest.approx(20.0)
+
+        response = await exchange.create_order(
+            "BTCUSDT", "market", "sell", 2.0, params={"reduceOnly": True}
+        )
+
+        assert response["info"]["realizedPnl"] == pytest.approx(20.0)
+        assert response["fee"]["cost"] == pytest.approx(0.22)
+        assert exchange.balance == pytest.approx(1000.0 + 20.0 - 0.2 - 0.22)
+        assert exchange.positions == {}
+
+    @pytest.mark.asyncio
+    async def test_short_position_pnl(self, exchange):
+        await exchange.create_order("BTCUSDT", "market", "sell", 1.0)
+        exchange.set_market_price("BTCUSDT", 90.0)
+
+        response = await exchange.create_order(
+            "BTCUSDT", "market", "buy", 1.0, params={"reduceOnly": True}
+        )
+
+        assert response["info"]["realizedPnl"] == pytest.approx(10.0)
+
+    @pytest.mark.asyncio
+    async def test_slippage_is_adverse(self):
+        exchange = SimulatedExchange(VirtualClock(), 1000.0, fee_rate=0.0, slippage_pct=1.0)
+        exchange.set_market_price("BTCUSDT", 100.0)
+
+        buy = await exchange.create_order("BTCUSDT", "market", "buy", 1.0)
+        sell = await exchange.create_order("BTCUSDT", "market", "sell", 1.0)
+
+        assert buy["average"] == pytest.approx(101.0)
+        assert sell["average"] == pytest.approx(99.0)
+
+    @pytest.mark.asyncio
+    async def test_reduce_only_without_position_rejected(self, exchange):
+        with pytest.raises(InvalidOrder):
+            await exchange.create_order(
+                "BTCUSDT", "market", "sell", 1.0, params={"reduceOnly": True}
+            )
+
+    @pytest.mark.asyncio
+    async def test_reduce_only_clamped_to_position(self, exchange):
+        await exchange.create_order("BTCUSDT", "market", "buy", 1.0)
+
+        response = await exchange.create_order(
+            "BTCUSDT", "market", "sell", 5.0, params={"reduceOnly": True}
+        )
+
+        assert response["filled"] == pytest.approx(1.0)
+        assert exchange.positions == {}
+
+    @pytest.mark.asyncio
+    async def test_fetch_balance_format(self, exchange):
+        balance = await exchange.fetch_balance()
+
+        assert balance["USDT"]["free"] == 1000.0
+        assert balance["total"]["USDT"] == 1000.0
+
+
+class TestPerformanceMetrics:
+    """Test calculate_performance_metrics."""
+
+    def test_trade_statistics(self):
+        timestamps = np.array([START_MS, START_MS + 86_400_000], dtype=np.int64)
+        equity = np.array([1000.0, 1010.0])
+
+        metrics = calculate_performance_metrics(timestamps, equity, [20.0, -5.0, -5.0], 1000.0)
+
+        assert metrics["total_trades"] == 3
+        assert metrics["winning_trades"] == 1
+        assert metrics["losing_trades"] == 2
+        assert metrics["win_rate"] == pytest.approx(100 / 3)
+        assert metrics["profit_factor"] == pytest.approx(2.0)
+        assert metrics["total_return"] == pytest.approx(1.0)
+        assert metrics["largest_loss"] == pytest.approx(-5.0)
+
+    def test_max_drawdown_and_duration(self):
+        hour = 3_600_000
+        timestamps = START_MS + np.arange(5, dtype=np.int64) * hour
+        equity = np.array([100.0, 120.0, 90.0, 110.0, 130.0])
+
+        metrics = calculate_performance_metrics(timestamps, equity, [], 100.0)
+
+        assert metrics["max_drawdown"] == pytest.approx(25.0)
+        assert metrics["max_drawdown_duration"] == 2
+        assert metrics["win_rate"] is None
+
+
+class TestBacktestEngine:
+    """Test end-to-end replay."""
+
+    @pytest.mark.asyncio
+    async def test_take_profit_trade(self):
+        engine = make_engine()
+        closes = [100.0] * 5 + [100.5, 101.0, 101.5, 102.5, 103.0]
+
+        report = await engine.run(make_candles(closes))
+
+        first = report.trades[0]
+        assert first.exit_reason == "take_profit"
+        assert first.entry_price == pytest.approx(100.0)
+        assert first.exit_price == pytest.approx(102.0)
+        assert first.net_pnl > 0
+        assert report.data_points == len(closes)
+        assert len(report.equity) == len(closes)
+        assert report.metrics["winning_trades"] >= 1
+
+    @pytest.mark.asyncio
+    async def test_stop_loss_trade_updates_daily_loss(self):
+        engine = make_engine()
+        closes = [100.0, 100.0, 98.5, 98.5]
+
+        report = await engine.run(make_candles(closes))
+
+        first = report.trades[0]
+        assert first.exit_reason == "stop_loss"
+        assert first.exit_price == pytest.approx(99.0)
+        assert first.net_pnl < 0
+        assert engine.daily_loss_monitor.current_session.realized_pnl < 0
+
+    @pytest.mark.asyncio
+    async def test_open_position_closed_at_end(self):
+        engine = make_engine()
+
+        report = await engine.run(make_candles([100.0, 100.2, 100.4]))
+
+        assert report.trades[-1].exit_reason == "end_of_data"
+        assert engine.exchange.positions == {}
+        assert report.metrics["final_capital"] == pytest.approx(engine.exchange.balance)
+
+    @pytest.mark.asyncio
+    async def test_signal_timestamps_follow_virtual_clock(self):
+        engine = make_engine()
+
+        await engine.run(make_candles([100.0, 100.2]))
+
+        recent = engine.strategy_layer.signal_filter.recent_signals
+        assert recent
+        assert all(signal.timestamp.year == 2024 for signal in recent)
+        assert engine.clock.timestamp_ms == START_MS + 2 * MINUTE_MS
+
+    @pytest.mark.asyncio
+    async def test_default_pipeline_runs_without_trades(self):
+        engine = BacktestEngine(BacktestConfig(timeframes=[TimeFrame.M1]))
+
+        report = await engine.run(make_candles([100.0 + i * 0.1 for i in range(30)]))
+
+        assert report.trades == []
+        assert report.metrics["final_capital"] == pytest.approx(10_000.0)
+
+    @pytest.mark.asyncio
+    async def test_quiet_replay_summarizes_errors(self, caplog):
+        engine = make_engine(quiet=True)
+        generator = FailingGenerator()
+        engine.strategy_layer.strategies = {"Test_Long": generator}
+
+        with caplog.at_level(logging.ERROR):
+            report = await engine.run(make_candles([100.0] * 5))
+
+        # Other tests may lower src logger levels, so count only error records
+        errors = [record for record in caplog.records if record.levelno >= logging.ERROR]
+        assert report.pipeline_errors == 5
+        assert len(errors) == 1
+        assert "5 pipeline errors" in errors[0].getMessage()
+        assert "generator failed" in errors[0].getMessage()
+        assert all(isinstance(candles, pd.DataFrame) for candles in generator.received)
+
+    @pytest.mark.asyncio
+    async def test_quiet_replay_leaves_other_components_logging(self, caplog):
+        package_logger = logging.getLogger("src")
+        state = (package_logger.level, package_logger.propagate, list(package_logger.handlers))
+        live_logger = logging.getLogger("src.services.strategy.integration_layer")
+
+        class LiveLoggingGenerator(FailingGenerator):
+            """Fails like FailingGenerator while a live component logs from another thread."""
+
+            def _generate_signal_impl(self, *args, **kwargs):
+                live = threading.Thread(target=live_logger.error, args=("live component error",))
+                live.start()
+                live.join()
+                return super()._generate_signal_impl(*args, **kwargs)
+
+        engine = make_engine(quiet=True)
+        engine.strategy_layer.strategies = {"Test_Long": LiveLoggingGenerator()}
+
+        with caplog.at_level(logging.ERROR):
+            report = await engine.run(make_candles([100.0] * 3))
+
+        messages = [r.getMessage() for r in caplog.records if r.levelno >= logging.ERROR]
+        assert report.pipeline_errors == 3
+        assert messages.count("live component error") == 3
+        assert not any("generator failed" in message for message in messages[:-1])
+        assert (package_logger.level, package_logger.propagate, package_logger.handlers) == state
+        assert not live_logger.filters
+
+    @pytest.mark.asyncio
+    async def test_replay_logs_errors_by_default(self, caplog):
+        engine = make_engine()
+        engine.strategy_layer.strategies = {"Test_Long": FailingGenerator()}
+
+        with caplog.at_level(logging.ERROR):
+            report = await engine.run(make_candles([100.0] * 3))
+
+        errors = [r for r in caplog.records if r.levelno >= logging.ERROR]
+        assert report.pipeline_errors == 0
+        assert sum("generator failed" in r.getMessage() for r in errors) >= 3
+
+    @pytest.mark.asyncio
+    async def test_strategy_adapters_skip_candle_frames(self):
+        engine = BacktestEngine(
+            BacktestConfig(timeframes=[TimeFrame.M1], strategies={"Strategy_B": {}})
+        )
+        received = []
+        generator = engine.strategy_layer.strategies["Strategy_B"]
+        original = generator._generate_signal_impl
+
+        def record(symbol, current_price, candles, **kwargs):
+            received.append((candles, kwargs["indicators"]))
+            return original(symbol, current_price, candles, **kwargs)
+
+        generator._generate_signal_impl = record
+        await engine.run(make_candles([100.0 + i * 0.1 for i in range(20)]))
+
+        assert len(received) == 20
+        assert all(candles is None for candles, _ in received)
+        indicators = received[-1][1]["1m"]
+        assert indicators["fair_value_gaps"] is indicators["fvg"]
+        assert indicators.get("market_structure", {}) == {}
+
+    @pytest.mark.asyncio
+    async def test_rejects_mismatched_candles(self):
+        engine = make_engine()
+
+        with pytest.raises(BacktestError):
+            await engine.run(make_candles([100.0], symbol="ETHUSDT"))
+
+    @pytest.mark.asyncio
+    async def test_requires_closed_candles(self):
+        engine = make_engine()
+        candles = make_candles([100.0])
+        candles[0].is_closed = False
+
+        with pytest.raises(BacktestError):
+            await engine.run(candles)
+
+    @pytest.mark.asyncio
+    async def test_single_run_per_engine(self):
+        engine = make_engine()
+        await engine.run(make_candles([100.0]))
+
+        with pytest.raises(BacktestError):
+            await engine.run(make_candles([100.0]))
+
+
+class TestBacktestPersistence:
+    """Test saving reports as BacktestResult rows."""
+
+    @pytest_asyncio.fixture
+    async def session(self):
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+        async with async_sessionmaker(
+            engine, class_=AsyncSession, expire_on_commit=False
+        )() as session:
+            yield session
+
+        await engine.dispose()
+
+    @pytest.mark.asyncio
+    async def test_save_result(self, session):
+        engine = make_engine(name="tp run")
+        report = await engine.run(make_candles([100.0] * 3 + [101.0, 102.5]))
+
+        result = await engine.save_result(report, session)
+        await session.commit()
+
+        assert result.id is not None
+        assert result.name == "tp run"
+        assert result.strategy == "Test_Long"
+        assert result.timeframe == TimeFrame.M1
+        assert result.total_trades == len(report.trades)
+        assert result.final_capital == Decimal(str(round(report.metrics["final_capital"], 8)))
+        assert '"symbol": "BTCUSDT"' in result.configuration
@@ -0,0 +1,325 @@
+"""
+Tests for parameter sweeps and the strategy adapters.
+
+Tests cover:
+- Grid and random search space expansion
+- Dotted parameter paths into config dictionaries
+- Memory-mapped candle sharing
+- Running sweeps on a process pool and bulk-saving results
+- Wrapping src.strategies classes as signal generators
+"""
+
+import json
+import multiprocessing
+import os
+import pickle
+from unittest.mock import Mock
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.core.constants import TimeFrame
+from src.database.models import Base
+from src.indicators.liquidity_sweep import LiquiditySweep, SweepDirection
+from src.indicators.liquidity_zone import LiquidityLevel, LiquidityType
+from src.indicators.multi_timeframe_engine import TimeframeIndicators
+from src.models.candle import Candle
+from src.services.backtest import (
+    BacktestConfig,
+    BacktestEngine,
+    BacktestError,
+    ParameterSweep,
+    ParameterSweepRunner,
+    SearchMode,
+    SharedCandleData,
+    StrategySignalGenerator,
+    SweepResult,
+    build_indicator_snapshot,
+)
+from src.strategies.strategy_a import StrategyA
+
+START_MS = 1_704_067_200_000
+MINUTE_MS = 60_000
+
+
+def make_candles(count: int = 60, symbol: str = "BTCUSDT"):
+    """Build a gently oscillating series of closed 1m candles."""
+    candles = []
+    price = 100.0
+    for i in range(count):
+        close = price * (1.002 if i % 7 < 4 else 0.997)
+        candles.append(
+            Candle(
+                symbol=symbol,
+                timeframe=TimeFrame.M1,
+                timestamp=START_MS + i * MINUTE_MS,
+                open=price,
+                high=max(price, close) * 1.001,
+                low=min(price, close) * 0.999,
+                close=close,
+                volume=5.0 + i % 3,
+                is_closed=True,
+            )
+        )
+        price = close
+    return candles
+
+
+class TestParameterSweep:
+    """Test search space expansion."""
+
+    def test_grid_expands_full_product(self):
+        sweep = ParameterSweep(
+            base_config=BacktestConfig(),
+            space={"risk_percentage": [1.0, 2.0], "leverage": [3, 5, 10]},
+        )
+
+        points = list(sweep.points())
+
+        assert len(sweep) == 6
+        assert len(points) == 6
+        assert {"risk_percentage": 2.0, "leverage": 10} in points
+
+    def test_random_is_seeded(self):
+        space = {"risk_percentage": [0.5, 1.0, 1.5, 2.0], "leverage": [1, 2, 3, 4, 5]}
+
+        first = ParameterSweep(BacktestConfig(), space, SearchMode.RANDOM, samples=5, seed=7)
+        second = ParameterSweep(BacktestConfig(), space, SearchMode.RANDOM, samples=5, seed=7)
+
+        assert len(first) == 5
+        assert list(first.points()) == list(second.points())
+
+    def test_random_requires_samples(self):
+        with pytest.raises(ValueError):
+            ParameterSweep(BacktestConfig(), {"leverage": [1]}, SearchMode.RANDOM)
+
+    def test_empty_values_rejected(self):
+        with pytest.raises(ValueError):
+            ParameterSweep(BacktestConfig(), {"leverage": []})
+
+    def test_dotted_paths_set_nested_values(self):
+        base = BacktestConfig(name="base", strategies={"Strategy_A": {}})
+        sweep = ParameterSweep(
+            base_config=base,
+            space={
+                "strategies.Strategy_A.min_confidence": [0.6, 0.8],
+                "indicator_config.fvg_detector_config.min_gap_percentage": [0.1],
+            },
+        )
+
+        configs = [config for _, config in sweep.configurations()]
+
+        assert [c.strategies["Strategy_A"]["min_confidence"] for c in configs] == [0.6, 0.8]
+        assert configs[0].indicator_config["fvg_detector_config"]["min_gap_percentage"] == 0.1
+        assert [c.name for c in configs] == ["base #0", "base #1"]
+        # Base config is left untouched
+        assert base.strategies == {"Strategy_A": {}}
+
+    def test_unknown_parameter_rejected(self):
+        sweep = ParameterSweep(BacktestConfig(), {"not_a_field": [1]})
+
+        with pytest.raises(ValueError):
+            list(sweep.configurations())
+
+
+class TestSharedCandleData:
+    """Test memory-mapped candle sharing."""
+
+    def test_round_trip(self):
+        candles = make_candles(10)
+
+        with SharedCandleData.create(candles) as shared:
+            restored = list(shared.iter_candles())
+            path = shared.path
+
+            assert len(shared) == 10
+            assert [c.close for c in restored] == [c.close for c in candles]
+            assert restored[-1].timestamp == candles[-1].timestamp
+            assert all(c.is_closed for c in restored)
+
+        assert not os.path.exists(path)
+
+    def test_unpickled_handle_does_not_own_file(self):
+        with SharedCandleData.create(make_candles(3)) as shared:
+            clone = pickle.loads(pickle.dumps(shared))
+            clone.close()
+
+            assert os.path.exists(shared.path)
+            assert len(clone) == 3
+
+    def test_rejects_mixed_symbols(self):
+        candles = make_candles(2) + make_candles(1, symbol="ETHUSDT")
+
+        with pytest.raises(ValueError):
+            SharedCandleData.create(candles)
+
+
+class TestParameterSweepRunner:
+    """Test running sweeps on a process pool."""
+
+    @pytest_asyncio.fixture
+    async def session(self):
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+        async with async_sessionmaker(
+            engine, class_=AsyncSession, expire_on_commit=False
+        )() as session:
+            yield session
+
+        await engine.dispose()
+
+    @pytest.mark.asyncio
+    async def test_run_and_save(self, session):
+        sweep = ParameterSweep(
+            base_config=BacktestConfig(
+                name="grid",
+                timeframes=[TimeFrame.M1],
+                max_candles_per_timeframe=100,
+                strategies={"Strategy_A": {}},
+            ),
+            space={
+                "strategies.Strategy_A.min_confidence": [0.6, 0.8],
+                "risk_percentage": [1.0, 2.0],
+            },
+        )
+        runner = ParameterSweepRunner(
+            max_workers=2, mp_context=multiprocessing.get_context("spawn")
+        )
+
+        results = await runner.run(sweep, make_candles())
+
+        assert [r.index for r in results] == [0, 1, 2, 3]
+        assert all(r.succeeded for r in results), [r.error for r in results]
+
+        rows = await runner.save_results(results, session)
+        await session.commit()
+
+        assert len(rows) == 4
+        assert all(row.id is not None for row in rows)
+        assert rows[0].strategy == "Strategy_A"
+        assert rows[0].data_points == 60
+        configuration = json.loads(rows[3].configuration)
+        assert configuration["sweep_parameters"] == {
+            "strategies.Strategy_A.min_confidence": 0.8,
+            "risk_percentage": 2.0,
+        }
+        assert configuration["risk_percentage"] == 2.0
+
+    @pytest.mark.asyncio
+    async def test_failed_configuration_reported(self):
+        sweep = ParameterSweep(
+            base_config=BacktestConfig(timeframes=[TimeFrame.M1]),
+            space={"strategies.Strategy_X.min_confidence": [0.5]},
+        )
+        runner = ParameterSweepRunner(max_workers=1)
+
+        results = await runner.run(sweep, make_candles(5))
+
+        assert not results[0].succeeded
+        assert "Strategy_X" in results[0].error
+
+    @pytest.mark.asyncio
+    async def test_save_results_skips_failed_configurations(self, session):
+        runner = ParameterSweepRunner(max_workers=1)
+        failed = SweepResult(index=0, parameters={}, error="BacktestError: boom")
+
+        assert await runner.save_results([failed], session) == []
+
+    def test_invalid_worker_count(self):
+        with pytest.raises(ValueError):
+            ParameterSweepRunner(max_workers=0)
+
+
+class TestStrategyAdapter:
+    """Test running src.strategies through the integration layer."""
+
+    def test_create_known_strategy(self):
+        generator = StrategySignalGenerator.create("Strategy_A", {"min_confidence": 0.9})
+
+        assert isinstance(generator.strategy, StrategyA)
+        assert generator.strategy.min_confidence == 0.9
+        assert generator.strategy_name == "Strategy_A"
+
+    def test_create_unknown_strategy(self):
+        with pytest.raises(ValueError):
+            StrategySignalGenerator.create("Strategy_X")
+
+    def test_engine_registers_configured_strategies(self):
+        engine = BacktestEngine(
+            BacktestConfig(strategies={"Strategy_B": {}, "Strategy_C": {"min_confidence": 0.8}})
+        )
+
+        assert set(engine.strategy_layer.strategies) == {"Strategy_B", "Strategy_C"}
+        assert engine.strategy_layer.strategies["Strategy_C"].strategy.min_confidence == 0.8
+
+    def test_engine_rejects_invalid_strategy_params(self):
+        with pytest.raises(BacktestError):
+            BacktestEngine(BacktestConfig(strategies={"Strategy_A": {"bogus": 1}}))
+
+    def test_engine_rejects_invalid_indicator_config(self):
+        with pytest.raises(BacktestError):
+            BacktestEngine(BacktestConfig(indicator_config={"bogus_config": {}}))
+
+    @pytest.mark.asyncio
+    async def test_indicator_snapshot_shape(self):
+        engine = BacktestEngine(BacktestConfig(timeframes=[TimeFrame.M1]))
+        await engine.run(make_candles(40))
+
+        snapshot = build_indicator_snapshot(engine.indicator_engine)
+
+        m1 = snapshot["1m"]
+        assert {"order_blocks", "fvg", "fair_value_gaps", "trend"} <= set(m1)
+        assert all(zone["type"] in ("bullish", "bearish") for zone in m1["fvg"])
+
+    @pytest.mark.asyncio
+    async def test_indicator_snapshot_reuses_unchanged_timeframes(self):
+        engine = BacktestEngine(BacktestConfig(timeframes=[TimeFrame.M1, TimeFrame.M15]))
+        candles = make_candles(42)
+        await engine.run(candles[:40])
+
+        first = build_indicator_snapshot(engine.indicator_engine)
+        engine.indicator_engine.add_candle(candles[40])
+        second = build_indicator_snapshot(engine.indicator_engine, previous=first)
+
+        # 1m was recomputed, the 15m bar is still forming
+        assert second["1m"] is not first["1m"]
+        assert second["15m"] is first["15m"]
+
+    def test_indicator_snapshot_adds_strategy_fields(self):
+        level = LiquidityLevel(
+            type=LiquidityType.SELL_SIDE,
+            price=99.0,
+            origin_timestamp=START_MS,
+            origin_candle_index=0,
+            symbol="BTCUSDT",
+            timeframe=TimeFrame.M1,
+        )
+        indicators = TimeframeIndicators(
+            timeframe=TimeFrame.M1,
+            liquidity_levels=[level],
+            liquidity_sweeps=[
+                LiquiditySweep(
+                    liquidity_level=level,
+                    direction=SweepDirection.BULLISH,
+                    breach_timestamp=START_MS + 5 * MINUTE_MS,
+                    breach_candle_index=5,
+                    reversal_timestamp=START_MS + 7 * MINUTE_MS,
+                    reversal_strength=60.0,
+                    timeframe=TimeFrame.M1,
+                )
+            ],
+            last_update_timestamp=START_MS + 10 * MINUTE_MS,
+        )
+        engine = Mock(timeframes=[TimeFrame.M1], get_indicators=lambda timeframe: indicators)
+
+        m1 = build_indicator_snapshot(engine)["1m"]
+
+        assert m1["liquidity_levels"][0]["side"] == "SELL"
+        sweep = m1["liquidity_sweeps"][0]
+        assert sweep["liquidity_side"] == "SELL"
+        assert sweep["price"] == 99.0
+        assert sweep["strength"] == pytest.approx(0.6)
+        assert sweep["candles_ago"] == 3
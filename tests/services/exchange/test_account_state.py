@@ -0,0 +1,234 @@
+"""
+Tests for the cached account state service.
+"""
+
+import asyncio
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.core.constants import EventType, OrderSide
+from src.core.events import Event, EventBus
+from src.services.exchange.account_state import AccountStateService
+from src.services.exchange.binance_manager import BinanceConnectionError, BinanceManager
+from src.services.exchange.order_executor import OrderExecutor
+
+
+def make_balance(free: float, used: float = 0.0) -> dict:
+    return {
+        "free": {"USDT": free},
+        "used": {"USDT": used},
+        "total": {"USDT": free + used},
+    }
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def binance_manager():
+    manager = MagicMock(spec=BinanceManager)
+    manager.fetch_balance = AsyncMock(return_value=make_balance(1000.0))
+    manager.watch_balance = AsyncMock()
+    return manager
+
+
+@pytest.fixture
+def account_state(binance_manager, clock):
+    return AccountStateService(
+        binance_manager, max_staleness=30.0, refresh_interval=10.0, leverage=5, clock=clock
+    )
+
+
+class TestCachedReads:
+    """Test staleness-bounded balance reads."""
+
+    def test_invalid_parameters(self, binance_manager):
+        """Test invalid bounds are rejected."""
+        with pytest.raises(ValueError, match="max_staleness"):
+            AccountStateService(binance_manager, max_staleness=0)
+        with pytest.raises(ValueError, match="leverage"):
+            AccountStateService(binance_manager, leverage=0)
+
+    @pytest.mark.asyncio
+    async def test_fresh_snapshot_served_from_memory(self, account_state, binance_manager, clock):
+        """Test reads within the staleness bound don't call the exchange."""
+        assert await account_state.get_free_balance() == Decimal("1000.0")
+        clock.now += 30.0
+        assert await account_state.get_free_balance() == Decimal("1000.0")
+        assert await account_state.get_free_balance("BTC") == Decimal("0")
+
+        binance_manager.fetch_balance.assert_awaited_once()
+        assert account_state.get_stats()["cache_hits"] == 2
+
+    @pytest.mark.asyncio
+    async def test_stale_snapshot_refreshed(self, account_state, binance_manager, clock):
+        """Test a read past the staleness bound refreshes over REST."""
+        await account_state.get_free_balance()
+        clock.now += 31.0
+        binance_manager.fetch_balance.return_value = make_balance(900.0)
+
+        assert account_state.get_cached_free_balance() is None
+        assert await account_state.get_free_balance() == Decimal("900.0")
+        assert binance_manager.fetch_balance.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_refreshes_share_one_request(self, account_state, binance_manager):
+        """Test concurrent reads of a stale snapshot issue a single fetch."""
+
+        async def slow_fetch():
+            await asyncio.sleep(0.01)
+            return make_balance(500.0)
+
+        binance_manager.fetch_balance.side_effect = slow_fetch
+        balances = await asyncio.gather(*(account_state.get_free_balance() for _ in range(5)))
+
+        assert balances == [Decimal("500.0")] * 5
+        binance_manager.fetch_balance.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_refresh_failure_propagates(self, account_state, binance_manager):
+        """Test a failing refresh raises and is counted."""
+        binance_manager.fetch_balance.side_effect = BinanceConnectionError("down")
+
+        with pytest.raises(BinanceConnectionError):
+            await account_state.get_free_balance()
+        assert account_state.get_stats()["failed_refreshes"] == 1
+
+
+class TestUpdates:
+    """Test stream updates, local fills and invalidation."""
+
+    @pytest.mark.asyncio
+    async def test_fill_adjusts_free_balance(self, account_state):
+        """Test an opening fill moves margin and fee out of the free balance."""
+        await account_state.get_free_balance()
+
+        await account_state.handle(
+            Event(
+                priority=8,
+                event_type=EventType.ORDER_FILLED,
+                data={"symbol": "BTCUSDT", "filled_quantity": 0.01, "average_price": 50000.0},
+            )
+        )
+
+        # Margin 500 / 5 = 100, fee 500 * 0.0004 = 0.2
+        assert account_state.get_cached_free_balance() == Decimal("899.8")
+        assert account_state.get_stats()["pending_local_adjustments"] == 1
+
+    @pytest.mark.asyncio
+    async def test_other_quote_currency_fill_ignored(self, account_state):
+        """Test fills settled in another currency leave the balance unchanged."""
+        await account_state.get_free_balance()
+        account_state.apply_fill("ETH/BTC", 1.0, 0.05)
+
+        assert account_state.get_cached_free_balance() == Decimal("1000.0")
+
+    @pytest.mark.asyncio
+    async def test_exchange_report_replaces_local_adjustments(self, account_state):
+        """Test a stream update supersedes locally applied fills."""
+        await account_state.get_free_balance()
+        account_state.apply_fill("BTC/USDT:USDT", 0.01, 50000.0)
+
+        account_state.apply_balance(make_balance(899.0, 100.0), source="stream")
+
+        assert account_state.get_cached_free_balance() == Decimal("899.0")
+        assert account_state.get_stats()["source"] == "stream"
+        assert account_state.get_stats()["pending_local_adjustments"] == 0
+
+    @pytest.mark.asyncio
+    async def test_position_closed_and_reducing_fill_invalidate(
+        self, account_state, binance_manager
+    ):
+        """Test events with unknown balance effects force the next read to refresh."""
+        await account_state.get_free_balance()
+        await account_state.handle(
+            Event(priority=8, event_type=EventType.POSITION_CLOSED, data={"symbol": "BTCUSDT"})
+        )
+        assert not account_state.is_fresh
+
+        await account_state.get_free_balance()
+        account_state.apply_fill("BTCUSDT", 0.01, 50000.0, reduce_only=True)
+        assert account_state.get_cached_free_balance() is None
+
+        await account_state.get_free_balance()
+        assert binance_manager.fetch_balance.await_count == 3
+        assert account_state.get_stats()["invalidations"] == 2
+
+    @pytest.mark.asyncio
+    async def test_start_consumes_stream(self, binance_manager):
+        """Test start() loads a snapshot and applies streamed balances."""
+        updates = asyncio.Queue()
+        binance_manager.watch_balance.side_effect = updates.get
+        account_state = AccountStateService(binance_manager, refresh_interval=60.0)
+
+        await account_state.start()
+        try:
+            assert account_state.get_cached_free_balance() == Decimal("1000.0")
+            await updates.put(make_balance(750.0))
+            await asyncio.sleep(0.01)
+
+            assert account_state.get_cached_free_balance() == Decimal("750.0")
+            assert account_state.get_stats()["stream_updates"] == 1
+        finally:
+            await account_state.stop()
+
+
+class TestOrderExecutorEvents:
+    """Test fills published by a real OrderExecutor reach the cached state."""
+
+    @pytest.fixture
+    async def event_bus(self, account_state):
+        bus = EventBus()
+        bus.subscribe(EventType.ORDER_FILLED, account_state)
+        await bus.start()
+        yield bus
+        await bus.stop()
+
+    @pytest.fixture
+    def order_executor(self, event_bus):
+        exchange = AsyncMock()
+        exchange.create_order.return_value = {
+            "id": "order-1",
+            "status": "closed",
+            "symbol": "BTCUSDT",
+            "type": "market",
+            "filled": 0.01,
+            "remaining": 0.0,
+            "average": 50000.0,
+            "timestamp": 1234567890000,
+        }
+        return OrderExecutor(exchange=exchange, event_bus=event_bus, retry_delay=0.01)
+
+    @pytest.mark.asyncio
+    async def test_opening_fill_debits_balance(self, account_state, order_executor, event_bus):
+        """Test an opening market fill is applied as a local adjustment."""
+        await account_state.get_free_balance()
+
+        await order_executor.execute_market_order("BTCUSDT", OrderSide.BUY, 0.01)
+        assert await event_bus.wait_empty(timeout=1.0)
+
+        assert account_state.get_cached_free_balance() == Decimal("899.8")
+        assert account_state.get_stats()["pending_local_adjustments"] == 1
+
+    @pytest.mark.asyncio
+    async def test_reduce_only_fill_invalidates(self, account_state, order_executor, event_bus):
+        """Test a reduce-only fill forces the next read to refresh."""
+        await account_state.get_free_balance()
+
+        await order_executor.execute_market_order("BTCUSDT", OrderSide.SELL, 0.01, reduce_only=True)
+        assert await event_bus.wait_empty(timeout=1.0)
+
+        assert account_state.get_cached_free_balance() is None
+        assert account_state.get_stats()["invalidations"] == 1
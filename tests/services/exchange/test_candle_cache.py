@@ -0,0 +1,133 @@
+"""
+Tests for CandleCache.
+
+Tests cover:
+- Month-partitioned storage and range reads
+- Merging and de-duplicating overlapping writes
+- Missing-range detection for resume and gap refill
+"""
+
+import pytest
+
+from src.core.constants import TimeFrame
+from src.models.candle import Candle
+from src.services.exchange.candle_cache import CandleCache
+
+INTERVAL_MS = 3_600_000
+# 2024-01-31 20:00 UTC, so a day of hourly candles spans two months
+START_MS = 1706731200000
+
+
+def make_candles(count: int, start_index: int = 0, close: float = 100.0):
+    return [
+        Candle(
+            symbol="BTCUSDT",
+            timeframe=TimeFrame.H1,
+            timestamp=START_MS + (start_index + i) * INTERVAL_MS,
+            open=100.0,
+            high=110.0,
+            low=90.0,
+            close=close,
+            volume=1.0,
+            is_closed=True,
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return CandleCache(tmp_path)
+
+
+class TestCandleCache:
+    """Test CandleCache."""
+
+    def test_write_partitions_by_month(self, cache, tmp_path):
+        cache.write("BTCUSDT", TimeFrame.H1, make_candles(24))
+
+        files = sorted(p.name for p in (tmp_path / "BTCUSDT" / "1h").glob("*.npz"))
+
+        assert files == ["2024-01.npz", "2024-02.npz"]
+
+    def test_read_range_across_months(self, cache):
+        cache.write("BTCUSDT", TimeFrame.H1, make_candles(24))
+
+        arrays = cache.read(
+            "BTCUSDT", TimeFrame.H1, START_MS + 2 * INTERVAL_MS, START_MS + 10 * INTERVAL_MS
+        )
+
+        assert len(arrays) == 8
+        assert arrays.timestamp[0] == START_MS + 2 * INTERVAL_MS
+        assert arrays.is_closed.all()
+
+    def test_read_empty(self, cache):
+        arrays = cache.read("BTCUSDT", TimeFrame.H1, START_MS, START_MS + INTERVAL_MS)
+
+        assert len(arrays) == 0
+
+    def test_overlapping_write_replaces_and_sorts(self, cache):
+        cache.write("BTCUSDT", TimeFrame.H1, make_candles(5, start_index=5))
+        cache.write("BTCUSDT", TimeFrame.H1, make_candles(8, close=105.0))
+
+        arrays = cache.read("BTCUSDT", TimeFrame.H1, START_MS, START_MS + 20 * INTERVAL_MS)
+
+        assert len(arrays) == 10
+        assert list(arrays.timestamp) == sorted(arrays.timestamp)
+        assert list(arrays.close[:8]) == [105.0] * 8
+        assert list(arrays.close[8:]) == [100.0] * 2
+
+    def test_last_timestamp(self, cache):
+        assert cache.last_timestamp("BTCUSDT", TimeFrame.H1) is None
+
+        cache.write("BTCUSDT", TimeFrame.H1, make_candles(24))
+
+        assert cache.last_timestamp("BTCUSDT", TimeFrame.H1) == START_MS + 23 * INTERVAL_MS
+
+    def test_missing_ranges(self, cache):
+        candles = make_candles(10)
+        cache.write("BTCUSDT", TimeFrame.H1, candles[:3] + candles[6:8])
+
+        missing = cache.missing_ranges(
+            "BTCUSDT", TimeFrame.H1, START_MS, START_MS + 10 * INTERVAL_MS
+        )
+
+        assert missing == [
+            (START_MS + 3 * INTERVAL_MS, START_MS + 6 * INTERVAL_MS),
+            (START_MS + 8 * INTERVAL_MS, START_MS + 10 * INTERVAL_MS),
+        ]
+
+    def test_mark_empty_merges_ranges(self, cache):
+        cache.mark_empty("BTCUSDT", TimeFrame.H1, [(START_MS, START_MS + 2 * INTERVAL_MS)])
+        cache.mark_empty(
+            "BTCUSDT",
+            TimeFrame.H1,
+            [
+                (START_MS + 2 * INTERVAL_MS, START_MS + 3 * INTERVAL_MS),
+                (START_MS + 5 * INTERVAL_MS, START_MS + 6 * INTERVAL_MS),
+            ],
+        )
+
+        assert cache.empty_ranges("BTCUSDT", TimeFrame.H1) == [
+            (START_MS, START_MS + 3 * INTERVAL_MS),
+            (START_MS + 5 * INTERVAL_MS, START_MS + 6 * INTERVAL_MS),
+        ]
+        assert cache.empty_ranges("ETHUSDT", TimeFrame.H1) == []
+
+    def test_missing_ranges_skip_empty_ranges(self, cache):
+        candles = make_candles(10)
+        cache.write("BTCUSDT", TimeFrame.H1, candles[5:])
+        cache.mark_empty("BTCUSDT", TimeFrame.H1, [(START_MS, START_MS + 5 * INTERVAL_MS)])
+
+        assert (
+            cache.missing_ranges("BTCUSDT", TimeFrame.H1, START_MS, START_MS + 10 * INTERVAL_MS)
+            == []
+        )
+
+    def test_missing_ranges_fully_cached(self, cache):
+        cache.write("BTCUSDT", TimeFrame.H1, make_candles(4))
+
+        assert (
+            cache.missing_ranges("BTCUSDT", TimeFrame.H1, START_MS, START_MS + 4 * INTERVAL_MS)
+            == []
+        )
@@ -19,6 +19,7 @@ from src.core.constants import TimeFrame
 from src.models.candle import Candle
 from src.services.candle_storage import CandleStorage
 from src.services.exchange.binance_manager import BinanceConnectionError, BinanceManager
+from src.services.exchange.candle_cache import CandleCache
 from src.services.exchange.historical_loader import HistoricalDataLoader
 
 
@@ -427,3 +428,171 @@ class TestRateLimiting:
             await loader._wait_for_rate_limit()
         elapsed = time.time() - start
         assert elapsed < 0.1  # Should be very fast
+
+
+class TestRangeDownload:
+    """Test paginated since/until downloads with the on-disk cache."""
+
+    INTERVAL_MS = 60_000
+    START_MS = 1704067200000  # 2024-01-01 00:00:00
+
+    @pytest.fixture
+    def exchange_manager(self):
+        """Mock BinanceManager serving a continuous 1m series and counting requests."""
+        manager = Mock(spec=BinanceManager)
+        manager.in_flight = 0
+        manager.max_in_flight = 0
+
+        async def fetch_ohlcv(symbol, timeframe, since=None, limit=None):
+            manager.in_flight += 1
+            manager.max_in_flight = max(manager.max_in_flight, manager.in_flight)
+            await asyncio.sleep(0)
+            manager.in_flight -= 1
+            return [
+                [since + i * self.INTERVAL_MS, 100.0, 101.0, 99.0, 100.5, 10.0]
+                for i in range(limit)
+            ]
+
+        manager.fetch_ohlcv = AsyncMock(side_effect=fetch_ohlcv)
+        return manager
+
+    def make_loader(self, manager, cache=None, max_concurrent_requests=5):
+        return HistoricalDataLoader(
+            binance_manager=manager,
+            candle_storage=CandleStorage(max_candles=1000),
+            enable_rate_limiting=False,
+            candle_cache=cache,
+            max_concurrent_requests=max_concurrent_requests,
+        )
+
+    @pytest.mark.asyncio
+    async def test_download_paginates_beyond_request_limit(self, exchange_manager):
+        loader = self.make_loader(exchange_manager, max_concurrent_requests=2)
+        until = self.START_MS + 2500 * self.INTERVAL_MS
+
+        candles = await loader.download_range("BTCUSDT", TimeFrame.M1, self.START_MS, until)
+
+        assert len(candles) == 2500
+        assert candles[0].timestamp == self.START_MS
+        assert candles[-1].timestamp == until - self.INTERVAL_MS
+        assert exchange_manager.fetch_ohlcv.call_count == 3
+        limits = sorted(
+            call.kwargs["limit"] for call in exchange_manager.fetch_ohlcv.call_args_list
+        )
+        assert limits == [500, 1000, 1000]
+        assert exchange_manager.max_in_flight <= 2
+
+    @pytest.mark.asyncio
+    async def test_warm_cache_skips_exchange(self, exchange_manager, tmp_path):
+        cache = CandleCache(tmp_path)
+        until = self.START_MS + 1500 * self.INTERVAL_MS
+
+        await self.make_loader(exchange_manager, cache).download_range(
+            "BTCUSDT", TimeFrame.M1, self.START_MS, until
+        )
+        exchange_manager.fetch_ohlcv.reset_mock()
+
+        loader = self.make_loader(exchange_manager, CandleCache(tmp_path))
+        candles = await loader.download_range("BTCUSDT", TimeFrame.M1, self.START_MS, until)
+
+        assert len(candles) == 1500
+        exchange_manager.fetch_ohlcv.assert_not_called()
+        assert loader.get_stats()["cached_candles_served"] == 1500
+
+    @pytest.mark.asyncio
+    async def test_resume_fetches_only_new_tail(self, exchange_manager, tmp_path):
+        cache = CandleCache(tmp_path)
+        loader = self.make_loader(exchange_manager, cache)
+        first_until = self.START_MS + 100 * self.INTERVAL_MS
+
+        await loader.download_range("BTCUSDT", TimeFrame.M1, self.START_MS, first_until)
+        exchange_manager.fetch_ohlcv.reset_mock()
+
+        candles = await loader.download_range(
+            "BTCUSDT", TimeFrame.M1, self.START_MS, first_until + 50 * self.INTERVAL_MS
+        )
+
+        assert len(candles) == 150
+        exchange_manager.fetch_ohlcv.assert_called_once()
+        assert exchange_manager.fetch_ohlcv.call_args.kwargs["since"] == first_until
+        assert exchange_manager.fetch_ohlcv.call_args.kwargs["limit"] == 50
+
+    @pytest.mark.asyncio
+    async def test_interior_gap_is_refilled(self, exchange_manager, tmp_path):
+        cache = CandleCache(tmp_path)
+        loader = self.make_loader(exchange_manager, cache)
+        until = self.START_MS + 30 * self.INTERVAL_MS
+        candles = await loader.download_range("BTCUSDT", TimeFrame.M1, self.START_MS, until)
+
+        # Rewrite the cache without candles 10..14
+        for path in tmp_path.rglob("*.npz"):
+            path.unlink()
+        cache.write("BTCUSDT", TimeFrame.M1, candles[:10] + candles[15:])
+        exchange_manager.fetch_ohlcv.reset_mock()
+
+        refilled = await loader.download_range("BTCUSDT", TimeFrame.M1, self.START_MS, until)
+
+        assert len(refilled) == 30
+        exchange_manager.fetch_ohlcv.assert_called_once()
+        assert exchange_manager.fetch_ohlcv.call_args.kwargs["since"] == candles[10].timestamp
+        assert exchange_manager.fetch_ohlcv.call_args.kwargs["limit"] == 5
+
+    @pytest.mark.asyncio
+    async def test_range_before_listing_not_refetched(self, exchange_manager, tmp_path):
+        listed_ms = self.START_MS + 40 * self.INTERVAL_MS
+
+        async def fetch_ohlcv(symbol, timeframe, since=None, limit=None):
+            return [
+                [ts, 100.0, 101.0, 99.0, 100.5, 10.0]
+                for ts in range(since, since + limit * self.INTERVAL_MS, self.INTERVAL_MS)
+                if ts >= listed_ms
+            ]
+
+        exchange_manager.fetch_ohlcv.side_effect = fetch_ohlcv
+        until = self.START_MS + 60 * self.INTERVAL_MS
+
+        candles = await self.make_loader(exchange_manager, CandleCache(tmp_path)).download_range(
+            "BTCUSDT", TimeFrame.M1, self.START_MS, until
+        )
+        exchange_manager.fetch_ohlcv.reset_mock()
+
+        loader = self.make_loader(exchange_manager, CandleCache(tmp_path))
+        cached = await loader.download_range("BTCUSDT", TimeFrame.M1, self.START_MS, until)
+
+        assert len(candles) == len(cached) == 20
+        exchange_manager.fetch_ohlcv.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_forming_candle_excluded(self, exchange_manager):
+        loader = self.make_loader(exchange_manager)
+        now_ms = int(time.time() * 1000)
+        forming_ms = now_ms - now_ms % self.INTERVAL_MS
+
+        candles = await loader.download_range(
+            "BTCUSDT",
+            TimeFrame.M1,
+            forming_ms - 5 * self.INTERVAL_MS,
+            forming_ms + 10 * self.INTERVAL_MS,
+        )
+
+        assert candles[-1].timestamp == forming_ms - self.INTERVAL_MS
+
+    @pytest.mark.asyncio
+    async def test_invalid_range(self, exchange_manager):
+        loader = self.make_loader(exchange_manager)
+
+        with pytest.raises(ValueError):
+            await loader.download_range("BTCUSDT", TimeFrame.M1, self.START_MS, self.START_MS)
+
+    @pytest.mark.asyncio
+    async def test_download_multiple_symbols(self, exchange_manager, tmp_path):
+        loader = self.make_loader(exchange_manager, CandleCache(tmp_path))
+        until = self.START_MS + 20 * self.INTERVAL_MS
+
+        results = await loader.download_multiple_symbols(
+            ["BTCUSDT", "ETHUSDT"], [TimeFrame.M1], self.START_MS, until
+        )
+
+        assert len(results["BTCUSDT"][TimeFrame.M1]) == 20
+        assert len(results["ETHUSDT"][TimeFrame.M1]) == 20
+        assert results["ETHUSDT"][TimeFrame.M1][0].symbol == "ETHUSDT"
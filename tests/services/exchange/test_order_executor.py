@@ -50,7 +50,7 @@ def mock_exchange():
 def event_bus():
     """Mock EventBus."""
     bus = MagicMock(spec=EventBus)
-    bus.emit = AsyncMock()
+    bus.publish = AsyncMock()
     return bus
 
 
@@ -333,7 +333,7 @@ class TestOrderExecutorMarketOrder:
         assert call_args.kwargs["amount"] == 0.01
 
         # 이벤트 발행 확인
-        assert event_bus.emit.call_count >= 1
+        assert event_bus.publish.call_count >= 1
 
     async def test_execute_market_order_with_position_side(self, order_executor, mock_exchange):
         """시장가 주문 실행 - 포지션 방향 지정."""
@@ -721,7 +721,7 @@ class TestOrderExecutorEvents:
         )
 
         # ORDER_PLACED 이벤트가 발행되었는지 확인
-        event_calls = [call[0][0] for call in event_bus.emit.call_args_list]
+        event_calls = [call[0][0].event_type for call in event_bus.publish.call_args_list]
         assert EventType.ORDER_PLACED in event_calls
 
     async def test_order_filled_event_emitted(self, order_executor, mock_exchange, event_bus):
@@ -746,7 +746,7 @@ class TestOrderExecutorEvents:
         )
 
         # ORDER_FILLED 이벤트가 발행되었는지 확인
-        event_calls = [call[0][0] for call in event_bus.emit.call_args_list]
+        event_calls = [call[0][0].event_type for call in event_bus.publish.call_args_list]
         assert EventType.ORDER_FILLED in event_calls
 
     async def test_order_cancelled_event_on_error(self, order_executor, mock_exchange, event_bus):
@@ -761,5 +761,5 @@ class TestOrderExecutorEvents:
             )
 
         # ORDER_CANCELLED 이벤트가 발행되었는지 확인
-        event_calls = [call[0][0] for call in event_bus.emit.call_args_list]
+        event_calls = [call[0][0].event_type for call in event_bus.publish.call_args_list]
         assert EventType.ORDER_CANCELLED in event_calls
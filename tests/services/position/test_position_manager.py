@@ -11,10 +11,11 @@ import pytest
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
-from src.core.constants import EventType, PositionSide
+from src.core.constants import EventType, OrderSide, PositionSide
 from src.core.events import EventBus
 from src.database.models import Base
 from src.database.models import Position as PositionModel
+from src.database.write_behind import WriteBehindQueue
 from src.services.position.position_manager import (
     PositionInfo,
     PositionManager,
@@ -475,6 +476,70 @@ class TestPositionManager:
 
         eth_position = position_manager.get_position("ETHUSDT")
         assert eth_position.current_price == Decimal("3100")
+        assert position_manager.get_stats()["persistence"]["flushes"] == 1
+
+    @pytest.mark.asyncio
+    async def test_write_behind_updates_flushed_on_close(self, db_session, event_bus):
+        """write-behind 큐 사용 시 가격 업데이트 병합 및 종료 시 즉시 커밋 테스트."""
+        manager = PositionManager(
+            db_session=db_session,
+            event_bus=event_bus,
+            write_queue=WriteBehindQueue(db_session, flush_interval=60.0),
+        )
+        await manager.open_position(
+            symbol="BTCUSDT",
+            strategy="test",
+            side=PositionSide.LONG,
+            size=Decimal("0.1"),
+            entry_price=Decimal("50000"),
+        )
+
+        for price in ("50100", "50200", "50300"):
+            await manager.update_position("BTCUSDT", Decimal(price))
+
+        db_session.expire_all()
+        db_position = db_session.query(PositionModel).filter_by(symbol="BTCUSDT").first()
+        assert db_position.current_price == Decimal("50000")
+        assert manager.write_queue.depth == 1
+
+        await manager.close_position("BTCUSDT", exit_price=Decimal("51000"))
+
+        db_session.expire_all()
+        db_position = db_session.query(PositionModel).filter_by(symbol="BTCUSDT").first()
+        assert db_position.status == "CLOSED"
+        assert db_position.realized_pnl == Decimal("100")
+
+        stats = manager.get_stats()["persistence"]
+        assert (stats["depth"], stats["coalesced"], stats["flushes"]) == (0, 3, 1)
+
+    @pytest.mark.asyncio
+    async def test_stop_flushes_pending_updates(self, db_session, event_bus):
+        """start/stop 시 주기적 flush 시작 및 대기 중인 업데이트 기록 테스트."""
+        manager = PositionManager(
+            db_session=db_session,
+            event_bus=event_bus,
+            write_queue=WriteBehindQueue(db_session, flush_interval=60.0),
+        )
+        await manager.start()
+        assert manager.write_queue._task is not None
+
+        await manager.open_position(
+            symbol="BTCUSDT",
+            strategy="test",
+            side=PositionSide.LONG,
+            size=Decimal("0.1"),
+            entry_price=Decimal("50000"),
+        )
+        await manager.update_position("BTCUSDT", Decimal("50500"))
+        assert manager.write_queue.depth == 1
+
+        await manager.stop()
+
+        db_session.expire_all()
+        db_position = db_session.query(PositionModel).filter_by(symbol="BTCUSDT").first()
+        assert db_position.current_price == Decimal("50500")
+        assert manager.write_queue._task is None
+        assert manager.write_queue.depth == 0
 
     def test_get_stats(self, position_manager):
         """통계 조회 테스트."""
@@ -502,3 +567,59 @@ class TestPositionManager:
 
         assert position is not None
         assert position.symbol == "BTCUSDT"
+
+
+class TestApplyFill:
+    """체결 반영 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_fill_opens_and_increases_position(self, position_manager, db_session):
+        """체결 시 포지션 열기 및 같은 방향 체결의 진입가 가중 평균 테스트."""
+        await position_manager.apply_fill("BTCUSDT", OrderSide.BUY, Decimal("1"), Decimal("100"))
+        position = await position_manager.apply_fill(
+            "BTCUSDT", OrderSide.BUY, Decimal("3"), Decimal("120")
+        )
+
+        assert position.side == PositionSide.LONG
+        assert position.size == Decimal("4")
+        assert position.entry_price == Decimal("115")
+
+        db_session.expire_all()
+        db_position = db_session.query(PositionModel).filter_by(symbol="BTCUSDT").first()
+        assert (db_position.size, db_position.entry_price) == (Decimal("4"), Decimal("115"))
+
+    @pytest.mark.asyncio
+    async def test_opposite_fill_reduces_closes_and_reverses(self, position_manager):
+        """반대 방향 체결의 부분 축소, 종료 및 반대 포지션 열기 테스트."""
+        await position_manager.apply_fill("BTCUSDT", OrderSide.BUY, Decimal("2"), Decimal("100"))
+
+        position = await position_manager.apply_fill(
+            "BTCUSDT", OrderSide.SELL, Decimal("0.5"), Decimal("110")
+        )
+        assert position.size == Decimal("1.5")
+
+        position = await position_manager.apply_fill(
+            "BTCUSDT", OrderSide.SELL, Decimal("2"), Decimal("120")
+        )
+        assert position.side == PositionSide.SHORT
+        assert position.size == Decimal("0.5")
+        assert position_manager.get_stats()["total_closed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_reduce_only_fill_never_opens(self, position_manager):
+        """reduce_only 체결은 포지션을 열거나 반대로 뒤집지 않음 테스트."""
+        assert (
+            await position_manager.apply_fill(
+                "BTCUSDT", OrderSide.SELL, Decimal("1"), Decimal("100"), reduce_only=True
+            )
+            is None
+        )
+
+        await position_manager.apply_fill("BTCUSDT", OrderSide.BUY, Decimal("1"), Decimal("100"))
+        closed = await position_manager.apply_fill(
+            "BTCUSDT", OrderSide.SELL, Decimal("2"), Decimal("110"), reduce_only=True
+        )
+
+        assert closed.status == PositionStatus.CLOSED
+        assert closed.realized_pnl == Decimal("10")
+        assert position_manager.get_position("BTCUSDT") is None
@@ -15,6 +15,7 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from src.services.exchange.account_state import AccountStateService
 from src.services.exchange.binance_manager import BinanceConnectionError, BinanceManager
 from src.services.risk.position_sizer import PositionSizer, PositionSizingError
 
@@ -138,6 +139,25 @@ class TestAccountBalanceRetrieval:
         with pytest.raises(PositionSizingError, match="Failed to fetch account balance"):
             await position_sizer.get_account_balance("USDT")
 
+    @pytest.mark.asyncio
+    async def test_get_account_balance_from_account_state(self, mock_binance_manager):
+        """Test repeated calculations read the cached account state."""
+        mock_binance_manager.fetch_balance.return_value = {
+            "free": {"USDT": 1000.0},
+            "used": {"USDT": 0.0},
+            "total": {"USDT": 1000.0},
+        }
+        sizer = PositionSizer(
+            binance_manager=mock_binance_manager,
+            account_state=AccountStateService(mock_binance_manager, max_staleness=60.0),
+        )
+
+        for _ in range(3):
+            result = await sizer.calculate_position_size()
+
+        assert result["balance"] == 1000.0
+        mock_binance_manager.fetch_balance.assert_called_once()
+
 
 class TestRiskCalculations:
     """Test risk amount and leverage calculations."""
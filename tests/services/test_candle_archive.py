@@ -0,0 +1,192 @@
+"""
+Tests for the memory-mapped CandleArchive.
+"""
+
+import numpy as np
+import pytest
+
+from src.core.constants import TimeFrame
+from src.models.candle import Candle
+from src.services.candle_archive import CandleArchive
+
+BASE_TS = 1704067200000  # 2024-01-01 00:00:00 UTC
+MINUTE = 60000
+
+
+def make_candle(i: int, symbol: str = "BTCUSDT", is_closed: bool = True) -> Candle:
+    """Create the i-th one-minute test candle."""
+    close = 100.0 + i
+    return Candle(
+        symbol=symbol,
+        timeframe=TimeFrame.M1,
+        timestamp=BASE_TS + i * MINUTE,
+        open=close - 0.5,
+        high=close + 1.0,
+        low=close - 1.0,
+        close=close,
+        volume=10.0 + i,
+        is_closed=is_closed,
+    )
+
+
+@pytest.fixture
+def archive(tmp_path):
+    """Archive with a small index stride so ranges span several blocks."""
+    archive = CandleArchive(tmp_path, index_stride=8)
+    yield archive
+    archive.close()
+
+
+class TestCandleArchiveAppend:
+    """Test appending candles."""
+
+    def test_invalid_index_stride(self, tmp_path):
+        """Test non-positive index stride is rejected."""
+        with pytest.raises(ValueError, match="index_stride must be positive"):
+            CandleArchive(tmp_path, index_stride=0)
+
+    def test_append_and_read_all(self, archive):
+        """Test appended candles are read back in order."""
+        assert archive.append(make_candle(i) for i in range(20)) == 20
+
+        arrays = archive.read("BTCUSDT", TimeFrame.M1)
+        assert len(arrays) == 20
+        assert arrays.timestamp[0] == BASE_TS
+        assert arrays.close[-1] == 119.0
+        assert arrays.is_closed.all()
+        assert archive.count("BTCUSDT", TimeFrame.M1) == 20
+        assert archive.last_timestamp("BTCUSDT", TimeFrame.M1) == BASE_TS + 19 * MINUTE
+
+    def test_skips_open_and_stale_candles(self, archive):
+        """Test open candles and candles not newer than the archive are skipped."""
+        archive.append([make_candle(i) for i in range(5)])
+
+        written = archive.append([make_candle(3), make_candle(5, is_closed=False), make_candle(6)])
+
+        assert written == 1
+        assert archive.read("BTCUSDT", TimeFrame.M1).timestamp.tolist() == [
+            BASE_TS + i * MINUTE for i in (0, 1, 2, 3, 4, 6)
+        ]
+
+    def test_unsorted_batch_is_sorted_and_deduplicated(self, archive):
+        """Test a batch is written in timestamp order without duplicates."""
+        archive.append([make_candle(2), make_candle(0), make_candle(1), make_candle(2)])
+
+        assert archive.read("BTCUSDT", TimeFrame.M1).timestamp.tolist() == [
+            BASE_TS,
+            BASE_TS + MINUTE,
+            BASE_TS + 2 * MINUTE,
+        ]
+
+    def test_pairs_are_separate(self, archive):
+        """Test each symbol has its own file."""
+        archive.append([make_candle(0, "BTCUSDT"), make_candle(0, "ETHUSDT"), make_candle(1)])
+
+        assert archive.count("BTCUSDT", TimeFrame.M1) == 2
+        assert archive.count("ethusdt", TimeFrame.M1) == 1
+        assert archive.count("BTCUSDT", TimeFrame.H1) == 0
+
+
+class TestCandleArchiveRead:
+    """Test time-range reads."""
+
+    @pytest.fixture
+    def filled(self, archive):
+        archive.append(make_candle(i) for i in range(100))
+        return archive
+
+    @pytest.mark.parametrize("start,end", [(0, 99), (5, 40), (8, 16), (7, 7), (63, 99), (0, 0)])
+    def test_range_matches_linear_filter(self, filled, start, end):
+        """Test indexed range reads match a linear scan."""
+        arrays = filled.read(
+            "BTCUSDT",
+            TimeFrame.M1,
+            start_time=BASE_TS + start * MINUTE,
+            end_time=BASE_TS + end * MINUTE,
+        )
+        assert arrays.timestamp.tolist() == [BASE_TS + i * MINUTE for i in range(start, end + 1)]
+
+    def test_unaligned_bounds(self, filled):
+        """Test bounds between candle open times."""
+        arrays = filled.read(
+            "BTCUSDT",
+            TimeFrame.M1,
+            start_time=BASE_TS + 10 * MINUTE + 1,
+            end_time=BASE_TS + 12 * MINUTE - 1,
+        )
+        assert arrays.timestamp.tolist() == [BASE_TS + 11 * MINUTE]
+
+    def test_range_outside_archive(self, filled):
+        """Test ranges before and after the archive are empty."""
+        assert len(filled.read("BTCUSDT", TimeFrame.M1, end_time=BASE_TS - 1)) == 0
+        assert len(filled.read("BTCUSDT", TimeFrame.M1, start_time=BASE_TS + 100 * MINUTE)) == 0
+
+    def test_limit_returns_most_recent(self, filled):
+        """Test limit keeps the newest rows of the range."""
+        arrays = filled.read("BTCUSDT", TimeFrame.M1, end_time=BASE_TS + 49 * MINUTE, limit=3)
+        assert arrays.timestamp.tolist() == [BASE_TS + i * MINUTE for i in (47, 48, 49)]
+
+    def test_get_candles(self, filled):
+        """Test archived rows are materialised as closed candles."""
+        candles = filled.get_candles("btcusdt", TimeFrame.M1, limit=2)
+
+        assert [c.close for c in candles] == [198.0, 199.0]
+        assert candles[0].symbol == "BTCUSDT"
+        assert candles[0].timeframe == TimeFrame.M1
+        assert candles[0].is_closed
+
+    def test_missing_pair_is_empty(self, archive, tmp_path):
+        """Test reading an unknown pair returns nothing and creates no files."""
+        assert len(archive.read("XRPUSDT", TimeFrame.M1)) == 0
+        assert not (tmp_path / "XRPUSDT").exists()
+
+
+class TestCandleArchivePersistence:
+    """Test reopening archives from disk."""
+
+    def test_reopen_restores_data_and_index(self, tmp_path):
+        """Test a new archive instance sees previously appended candles."""
+        archive = CandleArchive(tmp_path, index_stride=8)
+        archive.append(make_candle(i) for i in range(50))
+        archive.close()
+
+        reopened = CandleArchive(tmp_path, index_stride=8)
+        arrays = reopened.read(
+            "BTCUSDT",
+            TimeFrame.M1,
+            start_time=BASE_TS + 20 * MINUTE,
+            end_time=BASE_TS + 29 * MINUTE,
+        )
+        assert len(arrays) == 10
+        assert reopened.append([make_candle(49), make_candle(50)]) == 1
+        assert reopened.count("BTCUSDT", TimeFrame.M1) == 51
+        reopened.close()
+
+    def test_torn_record_is_truncated(self, tmp_path):
+        """Test a partially written trailing record is discarded on open."""
+        archive = CandleArchive(tmp_path, index_stride=8)
+        archive.append(make_candle(i) for i in range(10))
+        archive.close()
+
+        data_path = tmp_path / "BTCUSDT" / "1m.bin"
+        with open(data_path, "ab") as f:
+            f.write(b"\x00" * 13)
+
+        reopened = CandleArchive(tmp_path, index_stride=8)
+        assert reopened.count("BTCUSDT", TimeFrame.M1) == 10
+        assert data_path.stat().st_size == 10 * 48
+        reopened.close()
+
+    def test_missing_index_is_rebuilt(self, tmp_path):
+        """Test the sparse index is rebuilt when it does not match the data file."""
+        archive = CandleArchive(tmp_path, index_stride=8)
+        archive.append(make_candle(i) for i in range(30))
+        archive.close()
+        (tmp_path / "BTCUSDT" / "1m.idx").unlink()
+
+        reopened = CandleArchive(tmp_path, index_stride=8)
+        arrays = reopened.read("BTCUSDT", TimeFrame.M1, start_time=BASE_TS + 17 * MINUTE, limit=2)
+        assert arrays.timestamp.tolist() == [BASE_TS + 28 * MINUTE, BASE_TS + 29 * MINUTE]
+        index = np.fromfile(tmp_path / "BTCUSDT" / "1m.idx", dtype="<i8")
+        assert index.tolist() == [BASE_TS + i * MINUTE for i in (0, 8, 16, 24)]
+        reopened.close()
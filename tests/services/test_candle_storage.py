@@ -16,6 +16,8 @@ import pytest
 
 from src.core.constants import TimeFrame
 from src.models.candle import Candle
+from src.models.candle_batch import CandleBatch
+from src.services.candle_archive import CandleArchive
 
 # Test fixtures
 
@@ -165,6 +167,39 @@ class TestBasicOperations:
         assert len(candles) == 4  # Timestamps 3, 4, 5, 6
         assert all(start_time <= c.timestamp <= end_time for c in candles)
 
+    def test_get_candles_with_time_range_and_limit(self, storage):
+        """Test limit applies to the most recent candles inside the time range."""
+        base_time = 1704067200000
+        for i in range(10):
+            storage.add_candle(create_test_candle(timestamp=base_time + i * 60000))
+        candles = storage.get_candles(
+            "BTCUSDT",
+            TimeFrame.M1,
+            limit=2,
+            start_time=base_time + 2 * 60000,
+            end_time=base_time + 7 * 60000,
+        )
+        assert [c.timestamp for c in candles] == [base_time + 6 * 60000, base_time + 7 * 60000]
+
+    def test_get_arrays(self, storage):
+        """Test getting OHLCV columns without Candle objects."""
+        base_time = 1704067200000
+        for i in range(12):
+            storage.add_candle(
+                create_test_candle(timestamp=base_time + i * 60000, close=42000.0 + i)
+            )
+        arrays = storage.get_arrays("BTCUSDT", TimeFrame.M1, limit=3)
+        assert arrays.close.tolist() == [42009.0, 42010.0, 42011.0]
+        assert arrays.timestamp[-1] == base_time + 11 * 60000
+
+        # Returned arrays are detached from later writes
+        storage.add_candle(create_test_candle(timestamp=base_time + 12 * 60000, close=1000.0))
+        assert arrays.close.tolist() == [42009.0, 42010.0, 42011.0]
+
+    def test_get_arrays_missing_pair(self, storage):
+        """Test get_arrays returns None for unknown pairs."""
+        assert storage.get_arrays("BTCUSDT", TimeFrame.M1) is None
+
     def test_remove_candles_before_timestamp(self, storage):
         """Test removing candles before a timestamp."""
         base_time = 1704067200000
@@ -510,3 +545,98 @@ class TestEdgeCases:
             end_time=1704240000000,
         )
         assert len(candles) == 0
+
+
+class TestArchiveFallThrough:
+    """Test reads falling through to a CandleArchive beyond the in-memory window."""
+
+    @pytest.fixture
+    def archived_storage(self, tmp_path):
+        archive = CandleArchive(tmp_path, index_stride=4)
+        storage = CandleStorage(max_candles=10, archive=archive)
+        for i in range(30):
+            storage.add_candle(create_test_candle(timestamp=1704067200000 + i * 60000))
+        yield storage
+        archive.close()
+
+    def test_closed_candles_written_through(self, archived_storage):
+        """Test closed candles are archived while memory keeps max_candles."""
+        assert archived_storage.get_candle_count() == 10
+        assert archived_storage.archive.count("BTCUSDT", TimeFrame.M1) == 30
+
+    def test_time_range_before_window(self, archived_storage):
+        """Test a range spanning archive and memory is merged without duplicates."""
+        candles = archived_storage.get_candles(
+            "BTCUSDT",
+            TimeFrame.M1,
+            start_time=1704067200000 + 15 * 60000,
+            end_time=1704067200000 + 24 * 60000,
+        )
+        assert [c.timestamp for c in candles] == [1704067200000 + i * 60000 for i in range(15, 25)]
+
+    def test_limit_beyond_window(self, archived_storage):
+        """Test a limit larger than memory reads older candles from the archive."""
+        candles = archived_storage.get_candles("BTCUSDT", TimeFrame.M1, limit=25)
+        assert [c.timestamp for c in candles] == [1704067200000 + i * 60000 for i in range(5, 30)]
+
+    def test_in_window_reads_skip_archive(self, archived_storage):
+        """Test reads covered by memory return the same as without an archive."""
+        assert len(archived_storage.get_candles("BTCUSDT", TimeFrame.M1)) == 10
+        candles = archived_storage.get_candles(
+            "BTCUSDT", TimeFrame.M1, start_time=1704067200000 + 25 * 60000, limit=2
+        )
+        assert [c.timestamp for c in candles] == [
+            1704067200000 + 28 * 60000,
+            1704067200000 + 29 * 60000,
+        ]
+
+    def test_load_from_archive_after_restart(self, archived_storage, tmp_path):
+        """Test a fresh storage warm-starts from the archive."""
+        archived_storage.archive.close()
+        archive = CandleArchive(tmp_path, index_stride=4)
+        storage = CandleStorage(max_candles=10, archive=archive)
+
+        assert storage.load_from_archive("BTCUSDT", TimeFrame.M1) == 10
+        assert storage.load_from_archive("BTCUSDT", TimeFrame.M1) == 0
+        latest = storage.get_latest_candle("BTCUSDT", TimeFrame.M1)
+        assert latest.timestamp == 1704067200000 + 29 * 60000
+        assert len(storage.get_candles("BTCUSDT", TimeFrame.M1, limit=30)) == 30
+        archive.close()
+
+    def test_load_from_archive_requires_archive(self, storage):
+        """Test warm start without an archive is rejected."""
+        with pytest.raises(RuntimeError):
+            storage.load_from_archive("BTCUSDT", TimeFrame.M1)
+
+    def test_out_of_order_appends_use_mask(self, storage):
+        """Test time filters stay exact after out-of-order appends."""
+        for i in (3, 1, 2, 0):
+            storage.add_candle(create_test_candle(timestamp=1704067200000 + i * 60000))
+        candles = storage.get_candles(
+            "BTCUSDT",
+            TimeFrame.M1,
+            start_time=1704067200000 + 60000,
+            end_time=1704067200000 + 2 * 60000,
+        )
+        assert sorted(c.timestamp for c in candles) == [
+            1704067200000 + 60000,
+            1704067200000 + 2 * 60000,
+        ]
+
+    def test_add_batch_writes_through(self, tmp_path):
+        """Test a CandleBatch is stored in memory and archived like single candles."""
+        archive = CandleArchive(tmp_path / "batch", index_stride=4)
+        storage = CandleStorage(max_candles=10, archive=archive)
+        candles = [create_test_candle(timestamp=1704067200000 + i * 60000) for i in range(30)]
+        batch = CandleBatch.from_ohlcv(
+            "BTCUSDT",
+            TimeFrame.M1,
+            [[c.timestamp, c.open, c.high, c.low, c.close, c.volume] for c in candles],
+            is_closed=True,
+        )
+
+        assert storage.add_batch(batch) == 30
+        assert storage.get_candles("BTCUSDT", TimeFrame.M1) == candles[-10:]
+        assert archive.count("BTCUSDT", TimeFrame.M1) == 30
+        assert storage.get_stats().evictions == 20
+        archive.close()
@@ -17,7 +17,18 @@ from typing import List
 import pytest
 
 from src.core.constants import EventType
-from src.core.events import Event, EventBus, EventHandler, EventQueue
+from src.core.events import (
+    DEFAULT_EVENT_POLICIES,
+    Event,
+    EventBus,
+    EventHandler,
+    EventQueue,
+    LatencyHistogram,
+    OverflowPolicy,
+    QueuePolicy,
+    forming_candle_key,
+)
+from src.core.orchestrator import BackpressureMonitor
 
 
 class TestEvent:
@@ -493,6 +504,418 @@ class TestEventBus:
         # All events should be processed
         assert len(handler.handled_events) == 30
 
+    @pytest.mark.asyncio
+    async def test_bus_dispatch_wakes_without_polling(self):
+        """Test a published event is dispatched within a few loop iterations."""
+        bus = EventBus()
+        handler = MockHandler()
+        bus.subscribe(EventType.CANDLE_RECEIVED, handler)
+
+        await bus.start()
+        # Let the dispatcher go idle on the empty queue
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+        await bus.publish(Event(priority=5, event_type=EventType.CANDLE_RECEIVED))
+        for _ in range(10):
+            await asyncio.sleep(0)
+
+        assert len(handler.handled_events) == 1
+        await bus.stop()
+
+    @pytest.mark.asyncio
+    async def test_bus_stop_wakes_idle_dispatcher(self):
+        """Test stop() returns promptly when the dispatcher is idle."""
+        bus = EventBus()
+        await bus.start()
+        await asyncio.sleep(0)
+
+        await asyncio.wait_for(bus.stop(), timeout=1.0)
+
+    @pytest.mark.asyncio
+    async def test_bus_wait_empty_timeout(self):
+        """Test wait_empty times out when nothing consumes the queue."""
+        bus = EventBus()
+        await bus.publish(Event(priority=5, event_type=EventType.CANDLE_RECEIVED))
+
+        assert await bus.wait_empty(timeout=0.05) is False
+
+    @pytest.mark.asyncio
+    async def test_bus_latency_statistics(self):
+        """Test latency histograms are exposed through get_stats."""
+        bus = EventBus()
+        bus.subscribe(EventType.CANDLE_RECEIVED, MockHandler())
+
+        await bus.start()
+        for _ in range(4):
+            await bus.publish(Event(priority=5, event_type=EventType.CANDLE_RECEIVED))
+        await bus.wait_empty(timeout=1.0)
+        await bus.stop()
+
+        latency = bus.get_stats()["latency"]
+        assert latency["publish_to_dispatch"]["count"] == 4
+        assert latency["dispatch_to_done"]["count"] == 4
+        assert latency["publish_to_dispatch"]["p99_ms"] >= latency["publish_to_dispatch"]["p50_ms"]
+
+        bus.reset_latency_stats()
+        assert bus.get_stats()["latency"]["dispatch_to_done"]["count"] == 0
+
+
+class SymbolRecordingHandler(EventHandler):
+    """Records handled symbols, sleeping for symbols marked as slow."""
+
+    def __init__(self, slow_symbols=()):
+        super().__init__("SymbolRecorder")
+        self.slow_symbols = set(slow_symbols)
+        self.handled: List[tuple] = []
+
+    async def handle(self, event: Event) -> None:
+        if event.data["symbol"] in self.slow_symbols:
+            await asyncio.sleep(0.2)
+        self.handled.append((event.data["symbol"], event.data["seq"]))
+
+
+class TestPartitionedDispatch:
+    """Test multi-worker dispatch partitioned by ordering key."""
+
+    def test_invalid_worker_count(self):
+        """Test worker count must be positive."""
+        with pytest.raises(ValueError, match="num_workers must be at least 1"):
+            EventBus(num_workers=0)
+
+    @pytest.mark.asyncio
+    async def test_slow_symbol_does_not_block_others(self):
+        """Test a slow handler only delays events of its own symbol."""
+        bus = EventBus(num_workers=4, partition_key=lambda e: e.data.get("symbol"))
+        assert bus._get_partition(
+            Event(priority=5, event_type=EventType.CANDLE_RECEIVED, data={"symbol": "SLOW"})
+        ) is not bus._get_partition(
+            Event(priority=5, event_type=EventType.CANDLE_RECEIVED, data={"symbol": "FAST"})
+        )
+        handler = SymbolRecordingHandler(slow_symbols={"SLOW"})
+        bus.subscribe(EventType.CANDLE_RECEIVED, handler)
+        await bus.start()
+
+        await bus.publish(
+            Event(
+                priority=5,
+                event_type=EventType.CANDLE_RECEIVED,
+                data={"symbol": "SLOW", "seq": 0},
+            )
+        )
+        for seq in range(3):
+            await bus.publish(
+                Event(
+                    priority=5,
+                    event_type=EventType.CANDLE_RECEIVED,
+                    data={"symbol": "FAST", "seq": seq},
+                )
+            )
+        await asyncio.sleep(0.05)
+
+        assert handler.handled == [("FAST", 0), ("FAST", 1), ("FAST", 2)]
+        await bus.stop()
+        assert ("SLOW", 0) in handler.handled
+
+    @pytest.mark.asyncio
+    async def test_per_symbol_order_preserved(self):
+        """Test events of one symbol are handled in publish order."""
+        bus = EventBus(num_workers=3)
+        handler = SymbolRecordingHandler()
+        bus.subscribe(EventType.CANDLE_RECEIVED, handler)
+        await bus.start()
+
+        symbols = ["BTCUSDT", "ETHUSDT", "SOLUSDT", "XRPUSDT", "ADAUSDT"]
+        for seq in range(20):
+            for symbol in symbols:
+                await bus.publish(
+                    Event(
+                        priority=5,
+                        event_type=EventType.CANDLE_RECEIVED,
+                        data={"symbol": symbol, "seq": seq},
+                    )
+                )
+        await bus.wait_empty(timeout=2.0)
+        await bus.stop()
+
+        assert len(handler.handled) == 100
+        for symbol in symbols:
+            assert [seq for s, seq in handler.handled if s == symbol] == list(range(20))
+
+    @pytest.mark.asyncio
+    async def test_partition_statistics(self):
+        """Test per-partition queue depth metrics."""
+        bus = EventBus(num_workers=2)
+        await bus.publish(Event(priority=5, event_type=EventType.SYSTEM_START))
+        await bus.publish(Event(priority=5, event_type=EventType.SYSTEM_START))
+
+        stats = bus.get_stats()
+        assert stats["num_workers"] == 2
+        assert stats["queue_size"] == 2
+        # Events without a symbol go to partition 0
+        assert stats["partitions"][0]["queue_size"] == 2
+        assert stats["partitions"][0]["high_watermark"] == 2
+        assert stats["partitions"][1]["queue_size"] == 0
+
+        await bus.start()
+        await bus.wait_empty(timeout=1.0)
+        await bus.stop()
+
+        stats = bus.get_stats()
+        assert stats["queue_size"] == 0
+        assert stats["partitions"][0]["processed"] == 2
+
+
+def candle_event(timestamp: int, close: float, symbol: str = "BTCUSDT") -> Event:
+    """Create a forming candle update."""
+    return Event(
+        priority=6,
+        event_type=EventType.CANDLE_RECEIVED,
+        data={"symbol": symbol, "timeframe": "1m", "timestamp": timestamp, "close": close},
+    )
+
+
+class TestQueueEntries:
+    """Test in-place replacement and lazy deletion of queue entries."""
+
+    def test_replace_keeps_position(self):
+        """Test a replaced entry is dispatched at the original position."""
+        queue = EventQueue()
+        first = queue.put_nowait(Event(priority=5, event_type=EventType.CANDLE_RECEIVED))
+        queue.put_nowait(Event(priority=5, event_type=EventType.SYSTEM_START))
+        replacement = Event(priority=5, event_type=EventType.CANDLE_CLOSED)
+
+        assert queue.replace(first, replacement)
+        assert queue.size() == 2
+        assert queue.pop_nowait()[0] is replacement
+
+    def test_discard_skips_entry(self):
+        """Test discarded entries are not returned and not counted."""
+        queue = EventQueue()
+        first = queue.put_nowait(Event(priority=9, event_type=EventType.CANDLE_RECEIVED))
+        queue.put_nowait(Event(priority=5, event_type=EventType.SYSTEM_START))
+
+        assert queue.discard(first)
+        assert not queue.discard(first)
+        assert queue.size() == 1
+        assert queue.pop_nowait()[0].event_type == EventType.SYSTEM_START
+        assert queue.empty()
+
+    def test_consumed_entry_cannot_be_replaced(self):
+        """Test replace and discard are no-ops after the entry is popped."""
+        queue = EventQueue()
+        entry = queue.put_nowait(Event(priority=5, event_type=EventType.SYSTEM_START))
+        queue.pop_nowait()
+
+        assert not queue.replace(entry, Event(priority=5, event_type=EventType.SYSTEM_STOP))
+        assert not queue.discard(entry)
+        assert queue.size() == 0
+
+
+class TestQueuePolicies:
+    """Test per-event-type queueing policies."""
+
+    def test_coalesce_requires_key(self):
+        """Test a COALESCE policy without a key function is rejected."""
+        with pytest.raises(ValueError, match="requires a coalesce_key"):
+            QueuePolicy(overflow=OverflowPolicy.COALESCE)
+
+    def test_invalid_max_queued(self):
+        """Test the per-type bound must be positive."""
+        with pytest.raises(ValueError, match="max_queued must be at least 1"):
+            QueuePolicy(overflow=OverflowPolicy.DROP_OLDEST, max_queued=0)
+
+    def test_forming_candle_key(self):
+        """Test closed candles and symbol-less events are not coalesced."""
+        assert forming_candle_key(candle_event(1000, 1.0)) == ("BTCUSDT", "1m", 1000)
+        closed = candle_event(1000, 1.0)
+        closed.data["is_closed"] = True
+        assert forming_candle_key(closed) is None
+        assert forming_candle_key(Event(priority=6, event_type=EventType.CANDLE_RECEIVED)) is None
+
+    @pytest.mark.asyncio
+    async def test_coalesce_keeps_latest_forming_candle(self):
+        """Test updates of one candle collapse to the latest while queued."""
+        bus = EventBus(policies=DEFAULT_EVENT_POLICIES)
+        handler = MockHandler()
+        bus.subscribe(EventType.CANDLE_RECEIVED, handler)
+
+        for close in (100.0, 101.0, 102.0):
+            assert await bus.publish(candle_event(60000, close))
+        # A new candle period is queued separately, preserving the previous final update
+        await bus.publish(candle_event(120000, 103.0))
+        await bus.publish(candle_event(60000, 100.5, symbol="ETHUSDT"))
+
+        stats = bus.get_stats()
+        assert stats["queue_size"] == 3
+        assert stats["coalesced"] == 2
+
+        await bus.start()
+        await bus.wait_empty(timeout=1.0)
+        await bus.stop()
+
+        assert [(e.data["symbol"], e.data["close"]) for e in handler.handled_events] == [
+            ("BTCUSDT", 102.0),
+            ("BTCUSDT", 103.0),
+            ("ETHUSDT", 100.5),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_coalesce_after_dispatch_queues_again(self):
+        """Test an update arriving after dispatch is queued, not lost."""
+        bus = EventBus(policies=DEFAULT_EVENT_POLICIES)
+        handler = MockHandler()
+        bus.subscribe(EventType.CANDLE_RECEIVED, handler)
+        await bus.start()
+
+        await bus.publish(candle_event(60000, 100.0))
+        await bus.wait_empty(timeout=1.0)
+        await bus.publish(candle_event(60000, 101.0))
+        await bus.wait_empty(timeout=1.0)
+        await bus.stop()
+
+        assert [e.data["close"] for e in handler.handled_events] == [100.0, 101.0]
+        assert bus._coalesce_index == {}
+
+    @pytest.mark.asyncio
+    async def test_never_drop_survives_tick_storm(self):
+        """Test order and risk events are queued even when the bus is full."""
+        bus = EventBus(max_queue_size=5, policies=DEFAULT_EVENT_POLICIES)
+        for i in range(5):
+            await bus.publish(Event(priority=5, event_type=EventType.SIGNAL_GENERATED))
+
+        assert not await bus.publish(Event(priority=5, event_type=EventType.SIGNAL_GENERATED))
+        assert await bus.publish(Event(priority=9, event_type=EventType.ORDER_FILLED))
+        assert await bus.publish(Event(priority=10, event_type=EventType.DAILY_LOSS_LIMIT_REACHED))
+
+        stats = bus.get_stats()
+        assert stats["queue_size"] == 7
+        assert stats["dropped_by_type"] == {"signal_generated": 1}
+
+    @pytest.mark.asyncio
+    async def test_drop_oldest_per_type_bound(self):
+        """Test a bounded type evicts its own oldest event."""
+        bus = EventBus(
+            policies={
+                EventType.INDICATORS_UPDATED: QueuePolicy(
+                    overflow=OverflowPolicy.DROP_OLDEST, max_queued=2
+                )
+            }
+        )
+        handler = MockHandler()
+        bus.subscribe_all(handler)
+
+        await bus.publish(Event(priority=5, event_type=EventType.SYSTEM_START))
+        for seq in range(4):
+            assert await bus.publish(
+                Event(priority=5, event_type=EventType.INDICATORS_UPDATED, data={"seq": seq})
+            )
+
+        stats = bus.get_stats()
+        assert stats["queue_size"] == 3
+        assert stats["dropped_by_type"] == {"indicators_updated": 2}
+
+        await bus.start()
+        await bus.wait_empty(timeout=1.0)
+        await bus.stop()
+
+        assert [e.data.get("seq") for e in handler.handled_events] == [None, 2, 3]
+        assert bus._type_counts[EventType.INDICATORS_UPDATED] == 0
+
+    @pytest.mark.asyncio
+    async def test_drop_oldest_when_bus_full(self):
+        """Test a full bus evicts an old event of the same type instead of the new one."""
+        policy = QueuePolicy(overflow=OverflowPolicy.DROP_OLDEST)
+        bus = EventBus(max_queue_size=3, policies={EventType.INDICATORS_UPDATED: policy})
+        await bus.publish(Event(priority=5, event_type=EventType.SYSTEM_START))
+        for seq in range(3):
+            await bus.publish(
+                Event(priority=5, event_type=EventType.INDICATORS_UPDATED, data={"seq": seq})
+            )
+
+        assert bus.get_stats()["queue_size"] == 3
+        assert bus.get_stats()["dropped"] == 1
+
+    @pytest.mark.asyncio
+    async def test_shed_under_backpressure(self):
+        """Test sheddable types are dropped only while backpressure is active."""
+        bus = EventBus(policies=DEFAULT_EVENT_POLICIES)
+        book = Event(priority=4, event_type=EventType.ORDERBOOK_UPDATE, data={"symbol": "BTC"})
+
+        bus.set_backpressure(True)
+        assert not await bus.publish(book)
+        assert await bus.publish(candle_event(60000, 100.0))
+
+        bus.set_backpressure(False)
+        assert await bus.publish(book)
+        assert bus.get_stats()["dropped_by_type"] == {"orderbook_update": 1}
+
+    def test_policy_lookup(self):
+        """Test unconfigured types fall back to drop-new."""
+        bus = EventBus()
+        assert bus.get_policy(EventType.ORDER_FILLED).overflow == OverflowPolicy.DROP_NEW
+
+        bus.set_policy(EventType.ORDER_FILLED, QueuePolicy(overflow=OverflowPolicy.NEVER_DROP))
+        assert bus.get_policy(EventType.ORDER_FILLED).overflow == OverflowPolicy.NEVER_DROP
+
+        bus.set_policy(EventType.ORDER_FILLED, None)
+        assert bus.get_policy(EventType.ORDER_FILLED).overflow == OverflowPolicy.DROP_NEW
+
+
+class TestBackpressureIntegration:
+    """Test BackpressureMonitor toggles load shedding on the bus."""
+
+    @pytest.mark.asyncio
+    async def test_monitor_toggles_bus_backpressure(self):
+        """Test throttling enables shedding and relief disables it."""
+        bus = EventBus(max_queue_size=10, policies=DEFAULT_EVENT_POLICIES)
+        monitor = BackpressureMonitor(bus, max_queue_threshold=0.5)
+
+        for _ in range(6):
+            await bus.publish(Event(priority=5, event_type=EventType.SIGNAL_GENERATED))
+        assert monitor.check_backpressure()
+        assert bus.backpressure_active
+
+        await bus.start()
+        await bus.wait_empty(timeout=1.0)
+        await bus.stop()
+
+        assert not monitor.check_backpressure()
+        assert not bus.backpressure_active
+        stats = monitor.get_stats()
+        assert stats["throttle_count"] == 1
+        assert stats["dropped_by_type"] == {}
+
+
+class TestLatencyHistogram:
+    """Test LatencyHistogram percentile tracking."""
+
+    def test_empty_histogram(self):
+        """Test an empty histogram reports zeros."""
+        summary = LatencyHistogram().to_dict()
+
+        assert summary["count"] == 0
+        assert summary["p50_ms"] == 0.0
+        assert summary["p99_ms"] == 0.0
+
+    def test_percentiles_within_bucket(self):
+        """Test percentiles are bucket upper bounds close to the true value."""
+        histogram = LatencyHistogram()
+        for value in range(1, 101):
+            histogram.record(float(value))
+
+        assert 50.0 <= histogram.percentile(50) <= 50.0 * 2**0.5
+        assert 99.0 <= histogram.percentile(99) <= 100.0
+        assert histogram.percentile(100) == 100.0
+        assert histogram.to_dict()["mean_ms"] == pytest.approx(50.5)
+
+    def test_overflow_bucket_uses_max(self):
+        """Test samples beyond the largest bucket report the observed maximum."""
+        histogram = LatencyHistogram()
+        histogram.record(60000.0)
+
+        assert histogram.percentile(50) == 60000.0
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])